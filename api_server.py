@@ -2,6 +2,7 @@
 """FastAPI server for AI-backed research platform."""
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -10,11 +11,14 @@ import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from dataclasses import asdict
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Callable, Tuple
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -28,11 +32,31 @@ from research_cli.models.expert import ExpertConfig
 from research_cli.models.author import AuthorRole, WriterTeam
 from research_cli.utils.citation_manager import CitationManager
 from research_cli import db as appdb
+from research_cli.job_scheduler import JobScheduler, ScheduledJob, SHORT_LANE, LONG_LANE
+from research_cli.run_predictor import RunPredictor, RunPrediction, RunSample, current_model_tier, sample_from_workflow
+from research_cli.project_index import ProjectIndex, WorkflowStatusStore, compact_status
+from research_cli.request_dedup import TopicSimilarityIndex, normalize_topic, workflow_fingerprint
+from research_cli.activity_log import ActivityLogStore
+from research_cli.budget import BUDGET_POLICIES, WorkflowBudget, effective_budget, resumed_budget
+from research_cli.cancellation import CancellationToken, use_token
+from research_cli.worker_pool import ScalingDecision, WorkerPoolController, process_rss_mb, provider_health
+from research_cli.llm.base import add_call_listener
+from research_cli.utils.http_cache import cached_response
+from research_cli.utils.http_session import close_shared_sessions
+from research_cli.utils.rate_limit import rate_limit_stats
+from research_cli.utils.reference_cache import reference_cache
+from research_cli.utils.reference_corpus import reference_corpus
+from research_cli.utils.memo import clear_memo_caches, memo_cache, memo_key, memo_stats
+from research_cli.utils.source_retriever import search_stats, source_prefetcher
 from research_cli.model_config import get_role_config, get_reviewer_models, get_pricing, get_all_pricing, create_llm_for_role
 
 
 app = FastAPI(title="Autonomous Research Press API")
 
+# Compress other responses (static files, JSON); file-backed project endpoints
+# set their own Content-Encoding via cached_response and are left untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Enable CORS for local development
 app.add_middleware(
     CORSMiddleware,
@@ -44,44 +68,354 @@ app.add_middleware(
 
 
 # --- Job Queue ---
-MAX_CONCURRENT_WORKERS = 3
-job_queue: asyncio.Queue = asyncio.Queue()
+MAX_CONCURRENT_WORKERS = 3  # Initial general pool size; the pool then scales between the bounds below
+SHORT_LANE_WORKERS = 1  # Extra workers reserved for short jobs (submission reviews, resumes), not counted in the pool
+MIN_JOB_WORKERS = max(1, int(os.environ.get("JOB_WORKERS_MIN", "2")))
+MAX_JOB_WORKERS = max(MIN_JOB_WORKERS, int(os.environ.get("JOB_WORKERS_MAX", "6")))
+JOB_WORKERS_RSS_LIMIT_MB = float(os.environ.get("JOB_WORKERS_RSS_LIMIT_MB", "0")) or None
+WORKER_POOL_ADJUST_SECONDS = 15
+MAX_JOB_PRIORITY = 10
+job_queue: JobScheduler = JobScheduler()
+worker_pool = WorkerPoolController(MIN_JOB_WORKERS, MAX_JOB_WORKERS, rss_limit_mb=JOB_WORKERS_RSS_LIMIT_MB)
 _active_worker_count = 0  # Track how many workers are currently processing a job
+_running_jobs: Dict[str, dict] = {}  # project_id → {"job", "token", "task"} for running jobs
+_worker_tasks: Dict[int, asyncio.Task] = {}  # worker_id → task
+_retiring_workers: set = set()  # workers that exit after their current job
+_short_lane_workers: set = set()  # reserved workers serving only the short lane
+
+
+def _record_provider_health(provider: str, latency: float, error: Optional[BaseException] = None):
+    """LLM call listener feeding the pool's provider signals (429s, latency)."""
+    provider_health.observe_llm_call(provider, latency, error)
+
 
+add_call_listener(_record_provider_health)
 
-async def job_worker(worker_id: int):
-    """Worker: pull jobs from queue and execute."""
+
+async def job_worker(worker_id: int, lanes: Tuple[str, ...] = (LONG_LANE, SHORT_LANE)):
+    """Worker: pull jobs from the scheduler's ``lanes`` and execute until retired."""
     global _active_worker_count
+    job_queue.register_worker(worker_id, lanes)
     print(f"  Worker {worker_id} started")
-    while True:
-        job = await job_queue.get()
-        _active_worker_count += 1
-        pid = job.get("project_id", "?")
-        db_job_id = job.pop("_db_job_id", None)
-        print(f"  Worker {worker_id} picked up job: {pid[:50]}")
-        if db_job_id:
-            try:
-                appdb.mark_job_running(db_job_id)
-            except Exception:
-                pass
-        try:
-            job_fn = job.pop("_fn")
-            await job_fn(**job)
+    try:
+        while worker_id not in _retiring_workers:
+            scheduled = await job_queue.get(worker_id)
+            _active_worker_count += 1
+            job = dict(scheduled.payload)
+            pid = job.get("project_id", "?")
+            db_job_id = scheduled.job_id
+            print(f"  Worker {worker_id} picked up job: {pid[:50]}")
             if db_job_id:
                 try:
-                    appdb.complete_job(db_job_id, "completed")
+                    appdb.mark_job_running(db_job_id)
                 except Exception:
                     pass
+            token = CancellationToken()
+            try:
+                job_fn = job.pop("_fn")
+                # The token is current inside the job task, so orchestrators, agents
+                # and LLM retries can check it; cancelling it also cancels the task.
+                with use_token(token):
+                    task = asyncio.create_task(job_fn(**job))
+                token.add_callback(lambda reason: task.cancel(reason))
+                _running_jobs[pid] = {"job": scheduled, "token": token, "task": task}
+                await task
+                if db_job_id:
+                    try:
+                        appdb.complete_job(db_job_id, "completed")
+                    except Exception:
+                        pass
+            except asyncio.CancelledError:
+                if not token.cancelled:
+                    raise  # the worker itself is shutting down
+                print(f"  Worker {worker_id} cancelled job: {pid[:50]}")
+                _mark_workflow_cancelled(scheduled, token.reason)
+                if db_job_id:
+                    try:
+                        appdb.complete_job(db_job_id, "cancelled")
+                    except Exception:
+                        pass
+            except Exception as e:
+                print(f"  Worker {worker_id} error: {e}")
+                if db_job_id:
+                    try:
+                        appdb.complete_job(db_job_id, "failed")
+                    except Exception:
+                        pass
+            finally:
+                _running_jobs.pop(pid, None)
+                _run_predictions.pop(pid, None)  # every terminal path: done, rejected, interrupted, cancelled
+                activity_logs.retire(pid)  # flush to JSONL so seqs continue after a restart
+                _active_worker_count -= 1
+                job_queue.task_done(scheduled)
+                if job.get("batch_id") in _batches:
+                    asyncio.create_task(_release_batch(job["batch_id"]))
+    finally:
+        job_queue.unregister_worker(worker_id)
+        print(f"  Worker {worker_id} stopped")
+
+
+def _worker_pool_size() -> int:
+    """General workers currently serving the queue (excluding reserved and retiring ones)."""
+    return len(set(_worker_tasks) - _short_lane_workers - _retiring_workers)
+
+
+def _start_worker(reserved: bool = False) -> int:
+    """Start a general worker, or with ``reserved`` a short-lane-only one outside the pool."""
+    worker_id = max(_worker_tasks, default=-1) + 1
+    lanes = (SHORT_LANE,) if reserved else (LONG_LANE, SHORT_LANE)
+    task = asyncio.create_task(job_worker(worker_id, lanes))
+    _worker_tasks[worker_id] = task
+    if reserved:
+        _short_lane_workers.add(worker_id)
+
+    def _forget(_):
+        # Also runs for tasks cancelled before their first step
+        if _worker_tasks.get(worker_id) is task:
+            del _worker_tasks[worker_id]
+        _retiring_workers.discard(worker_id)
+        _short_lane_workers.discard(worker_id)
+
+    task.add_done_callback(_forget)
+    return worker_id
+
+
+def _retire_worker() -> Optional[int]:
+    """Retire one general worker: an idle one immediately, else a busy one after its job.
+
+    Reserved short-lane workers are never retired.
+    """
+    busy = job_queue.busy_workers()
+    candidates = [
+        w for w in sorted(_worker_tasks, reverse=True)
+        if w not in _short_lane_workers and w not in _retiring_workers
+    ]
+    if not candidates:
+        return None
+    idle = [w for w in candidates if w not in busy]
+    worker_id = idle[0] if idle else candidates[0]
+    _retiring_workers.add(worker_id)
+    if worker_id not in busy:
+        _worker_tasks[worker_id].cancel()  # waiting in job_queue.get(), nothing to lose
+    return worker_id
+
+
+def adjust_worker_pool(now: Optional[float] = None) -> Optional[ScalingDecision]:
+    """Resize the pool from queue depth, provider 429s/latency and process RSS."""
+    decision = worker_pool.decide(
+        current=_worker_pool_size(),
+        queue_depth=job_queue.qsize(),
+        busy=len(job_queue.busy_workers() - _short_lane_workers),
+        provider_stats=provider_health.stats(now),
+        rss_mb=process_rss_mb(),
+        now=now,
+    )
+    if decision is None:
+        return None
+    for _ in range(decision.target - decision.previous):
+        _start_worker()
+    for _ in range(decision.previous - decision.target):
+        _retire_worker()
+    logger.info("Worker pool %d → %d (%s)", decision.previous, decision.target, decision.reason)
+    return decision
+
+
+async def worker_pool_loop():
+    """Periodically re-evaluate the worker pool size."""
+    while True:
+        await asyncio.sleep(WORKER_POOL_ADJUST_SECONDS)
+        try:
+            adjust_worker_pool()
         except Exception as e:
-            print(f"  Worker {worker_id} error: {e}")
-            if db_job_id:
-                try:
-                    appdb.complete_job(db_job_id, "failed")
-                except Exception:
-                    pass
-        finally:
-            _active_worker_count -= 1
-            job_queue.task_done()
+            logger.warning("Worker pool adjustment failed: %s", e)
+
+
+def _mark_workflow_cancelled(job: ScheduledJob, reason: Optional[str]):
+    """Reflect a cancelled job in status and activity. Checkpoints are kept for resume."""
+    project_id = job.project_id
+    reason = reason or "Cancelled"
+    _run_predictions.pop(project_id, None)
+    if job.job_type == "submission_review":
+        try:
+            appdb.update_submission_status(job.payload["submission_id"], "cancelled")
+        except Exception:
+            pass
+    if project_id not in workflow_status:
+        return
+    resumable = (Path("results") / project_id / "workflow_checkpoint.json").exists()
+    workflow_status[project_id].update({
+        "status": "cancelled",
+        "message": f"{reason} — Resume available" if resumable else reason,
+        "error": None,
+        "estimated_time_remaining_seconds": 0,
+        "can_resume": resumable,
+    })
+    add_activity_log(project_id, "warning", f"{reason}. " + (
+        "Checkpoint preserved — resume available." if resumable else "No checkpoint was saved yet."
+    ))
+    activity_logs.retire(project_id)
+
+
+def _job_priority(api_key: str, requested: int = 0) -> int:
+    """Clamp a requested job priority. Only the admin key may raise priority."""
+    priority = max(-MAX_JOB_PRIORITY, min(MAX_JOB_PRIORITY, requested))
+    if ADMIN_API_KEY and api_key != ADMIN_API_KEY:
+        priority = min(priority, 0)
+    return priority
+
+
+def _queue_weight(api_key: str) -> float:
+    """Fair-share weight stored on the key (admin-set, default 1.0)."""
+    try:
+        key_info = appdb.get_api_key_cached(api_key) or {}
+    except Exception:
+        return 1.0
+    return float(key_info.get("queue_weight") or 1.0)
+
+
+async def _enqueue_job(fn, job_type: str, payload: dict, api_key: Optional[str] = None,
+                       priority: int = 0, db_payload: Optional[dict] = None,
+                       estimated_seconds: Optional[float] = None,
+                       fingerprint: Optional[str] = None, hold: bool = False) -> Optional[ScheduledJob]:
+    """Persist a job to the DB queue and hand it to the scheduler.
+
+    With ``hold=True`` (batch items over their concurrency cap) the job is
+    only persisted; its scheduler arguments are parked in ``_held_jobs``
+    under the payload's batch_id and None is returned.
+    """
+    db_job_id = str(uuid.uuid4())
+    try:
+        appdb.enqueue_job(
+            db_job_id, payload["project_id"], job_type,
+            db_payload if db_payload is not None else payload,
+            api_key=api_key, priority=priority, fingerprint=fingerprint,
+            batch_id=payload.get("batch_id"),
+        )
+    except Exception:
+        pass
+    if api_key:
+        job_queue.set_weight(api_key, _queue_weight(api_key))
+    put_kwargs = dict(
+        payload={"_fn": fn, **payload},
+        job_id=db_job_id, job_type=job_type, api_key=api_key, priority=priority,
+        estimated_seconds=estimated_seconds,
+    )
+    if hold:
+        _held_jobs.setdefault(payload["batch_id"], deque()).append(put_kwargs)
+        return None
+    return await job_queue.put(**put_kwargs)
+
+
+_held_jobs: Dict[str, Deque[dict]] = {}  # batch_id → held job_queue.put kwargs (see _release_batch)
+
+
+# --- Source Prefetch ---
+SOURCE_PREFETCH_ENABLED = os.environ.get("SOURCE_PREFETCH", "1") != "0"
+
+
+# --- Duplicate Requests ---
+DUPLICATE_POLICIES = ("reuse", "attach", "new")
+DUPLICATE_REUSE_HOURS = 24 * 7  # completed projects younger than this are reused
+SIMILAR_TOPIC_MIN_SCORE = 0.6
+_topic_index = TopicSimilarityIndex()
+
+
+def _find_duplicate_workflow(fingerprint: str, policy: str, api_key: str,
+                             records: Optional[Dict[str, dict]] = None) -> Optional[dict]:
+    """Find a queued/running (or, for "reuse", recently completed) identical workflow.
+
+    Only workflows submitted with the same API key are considered, so one
+    key never receives (or rides free on) another key's run. ``records``
+    is a ``project_index.refresh()`` result the caller already holds.
+    Returns {"project_id", "reused"} where reused is "in_flight" or "completed".
+    """
+    if policy == "new":
+        return None
+    since = (_utcnow() - timedelta(hours=DUPLICATE_REUSE_HOURS)).isoformat()
+    try:
+        jobs = appdb.find_jobs_by_fingerprint(fingerprint, since, api_key=api_key)
+    except Exception:
+        return None
+    for job in jobs:
+        project_id = job["project_id"]
+        if project_id in _running_jobs or job_queue.find(project_id) is not None:
+            return {"project_id": project_id, "reused": "in_flight"}
+        if policy == "reuse" and job["status"] == "completed":
+            if records is None:
+                records = project_index.refresh()
+            record = records.get(project_id)
+            # Only accepted articles are reused; a rejected run is worth retrying
+            if record and record["project"].get("status") == "completed":
+                return {"project_id": project_id, "reused": "completed"}
+    return None
+
+
+def _sync_topic_index(records: Dict[str, dict]):
+    """Make the TF-IDF index hold exactly the existing projects and live workflows."""
+    topics = {project_id: record["project"].get("topic") or "" for project_id, record in records.items()}
+    for project_id, entry in list(workflow_status.items()):
+        if project_id not in topics and entry.get("topic"):
+            topics[project_id] = entry["topic"]
+    for project_id in list(_topic_index):
+        if project_id not in topics:
+            _topic_index.remove(project_id)  # deleted since it was indexed
+    for project_id, text in topics.items():
+        if project_id not in _topic_index:
+            _topic_index.add(project_id, text)
+
+
+def _similar_topics(topic: str, exclude: Optional[str] = None,
+                    records: Optional[Dict[str, dict]] = None) -> List[dict]:
+    """Past projects whose topics are near-duplicates of ``topic`` (TF-IDF cosine).
+
+    ``records`` is a ``project_index.refresh()`` result the caller already holds.
+    """
+    _sync_topic_index(records if records is not None else project_index.refresh())
+    return [
+        {"project_id": project_id, "topic": text, "score": score}
+        for project_id, text, score in _topic_index.most_similar(
+            topic, min_score=SIMILAR_TOPIC_MIN_SCORE, exclude=exclude)
+    ]
+
+
+# --- Run Predictor (ETA / cost from historical workflow_complete.json) ---
+RUN_PREDICTOR_REFRESH_SECONDS = 600
+_run_predictor: Optional[RunPredictor] = None
+_run_predictor_loaded_at = 0.0
+_run_predictions: Dict[str, RunPrediction] = {}  # project_id → prediction for live ETA
+
+
+def _get_run_predictor() -> RunPredictor:
+    """Return the historical predictor, retraining from results/ periodically."""
+    global _run_predictor, _run_predictor_loaded_at
+    now = time.time()
+    if _run_predictor is None or now - _run_predictor_loaded_at > RUN_PREDICTOR_REFRESH_SECONDS:
+        _run_predictor = RunPredictor(
+            RunSample(**record["sample"])
+            for record in project_index.refresh().values()
+            if record.get("sample")
+        )
+        _run_predictor_loaded_at = now
+    return _run_predictor
+
+
+def _predict_run(workflow_mode: Optional[str], article_length: Optional[str],
+                 research_type: Optional[str]) -> RunPrediction:
+    return _get_run_predictor().predict(
+        workflow_mode or "standard", article_length or "full",
+        research_type or "survey", current_model_tier(),
+    )
+
+
+def _remaining_rounds_seconds(rounds_left: int, config: Optional[dict] = None) -> int:
+    """Estimated seconds for the given number of review rounds.
+
+    ``config`` is the checkpoint or job payload of the run; its workflow_mode,
+    article_length and research_type select the matching historical runs.
+    """
+    config = config or {}
+    prediction = _predict_run(config.get("workflow_mode"), config.get("article_length"), config.get("research_type"))
+    return int(max(0, rounds_left) * prediction.round_seconds[1])
 
 
 # --- API Key Auth ---
@@ -107,7 +441,7 @@ async def verify_api_key(request: Request) -> str:
     if key in ALLOWED_API_KEYS:
         return key
     # Check SQLite
-    db_key = appdb.get_api_key(key)
+    db_key = appdb.get_api_key_cached(key)
     if db_key:
         return key
     raise HTTPException(status_code=403, detail="Invalid or missing API key")
@@ -190,6 +524,16 @@ def _check_provider_api_keys():
         logger.info("API keys verified for %d provider(s): %s", len(required_providers), ", ".join(sorted(required_providers)))
 
 
+async def index_reference_corpus():
+    """Add references from previously saved results to the local reference corpus."""
+    try:
+        added = await asyncio.to_thread(reference_corpus().index_results, "results")
+        if added:
+            logger.info("Indexed %d saved references into the local corpus", added)
+    except Exception as e:
+        logger.warning("Reference corpus backfill failed: %s", e)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize DB, scan for interrupted workflows, recover pending jobs, start workers."""
@@ -197,8 +541,35 @@ async def startup_event():
     _check_provider_api_keys()
     await scan_interrupted_workflows()
     await recover_pending_jobs()
-    for i in range(MAX_CONCURRENT_WORKERS):
-        asyncio.create_task(job_worker(i))
+    for _ in range(SHORT_LANE_WORKERS):
+        _start_worker(reserved=True)
+    for _ in range(max(MIN_JOB_WORKERS, min(MAX_JOB_WORKERS, MAX_CONCURRENT_WORKERS))):
+        _start_worker()
+    asyncio.create_task(worker_pool_loop())
+    asyncio.create_task(usage_flush_loop())
+    asyncio.create_task(index_reference_corpus())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write buffered usage events and activity logs, stop source prefetches and close pooled HTTP sessions."""
+    source_prefetcher.cancel_all()
+    await close_shared_sessions()
+    activity_logs.flush_all()
+    try:
+        appdb.flush_usage()
+    except Exception as e:
+        logger.warning("Failed to flush usage events on shutdown: %s", e)
+
+
+async def usage_flush_loop():
+    """Periodically write deferred usage events (see appdb.record_usage(defer=True))."""
+    while True:
+        await asyncio.sleep(appdb.USAGE_FLUSH_INTERVAL)
+        try:
+            appdb.flush_usage()
+        except Exception as e:
+            logger.warning("Failed to flush usage events: %s", e)
 
 
 async def recover_pending_jobs():
@@ -222,37 +593,56 @@ async def recover_pending_jobs():
             continue
 
         if job_type == "workflow":
-            await job_queue.put({
-                "_fn": run_workflow_background,
-                "_db_job_id": job_id,
-                **payload,
-            })
+            job_fn = run_workflow_background
         elif job_type == "submission_review":
-            await job_queue.put({
-                "_fn": run_submission_review_background,
-                "_db_job_id": job_id,
-                **payload,
-            })
+            job_fn = run_submission_review_background
         elif job_type == "resume":
             # Convert project_dir back to Path
             payload["project_dir"] = Path(payload["project_dir"])
-            await job_queue.put({
-                "_fn": resume_workflow_background,
-                "_db_job_id": job_id,
-                **payload,
-            })
+            job_fn = resume_workflow_background
         else:
             appdb.complete_job(job_id, "failed")
             continue
 
+        if job_row.get("api_key"):
+            job_queue.set_weight(job_row["api_key"], _queue_weight(job_row["api_key"]))
+        await job_queue.put(
+            {"_fn": job_fn, **payload},
+            job_id=job_id,
+            job_type=job_type,
+            api_key=job_row.get("api_key"),
+            priority=job_row.get("priority") or 0,
+        )
+
         print(f"    Recovered job {job_id[:8]}... ({job_type}, project: {payload.get('project_id', '?')[:40]})")
 
 
+def _load_completed_status(project_id: str) -> Optional[dict]:
+    """Load the full status entry of a completed project (WorkflowStatusStore loader)."""
+    try:
+        with open(Path("results") / project_id / "workflow_complete.json") as f:
+            return _completed_workflow_status(json.load(f))
+    except Exception as e:
+        print(f"  Error loading completed workflow {project_id}: {e}")
+        return None
+
+
+def _summarize_project(project_dir: Path, data: dict) -> dict:
+    """Manifest record for one completed project (see ProjectIndex)."""
+    sample = sample_from_workflow(data)
+    return {
+        "project": _project_summary_from_data(project_dir, data),
+        "status": compact_status(_completed_workflow_status(data)),
+        "sample": asdict(sample) if sample else None,
+    }
+
+
 async def scan_interrupted_workflows():
     """Scan results directory and restore all workflow states from disk.
 
     Restores three categories:
-    1. Completed — workflow_complete.json exists
+    1. Completed — workflow_complete.json exists (compact summaries from the
+       project index manifest; full entries load lazily on access)
     2. Interrupted — checkpoint exists but no complete file
     3. Orphan/Failed — has files but neither checkpoint nor complete
     """
@@ -263,7 +653,13 @@ async def scan_interrupted_workflows():
     # Skip test/benchmark directories from queue
     SKIP_PATTERNS = ['benchmark-', '-test', 'test-']
 
-    completed_count = 0
+    records = project_index.refresh()
+    workflow_status.set_summaries({
+        project_id: record["status"]
+        for project_id, record in records.items()
+        if not any(pattern in project_id for pattern in SKIP_PATTERNS)
+    })
+    completed_count = workflow_status.cache_info()["completed"]
     interrupted_count = 0
     for project_dir in results_dir.iterdir():
         if not project_dir.is_dir():
@@ -277,96 +673,8 @@ async def scan_interrupted_workflows():
         checkpoint_file = project_dir / "workflow_checkpoint.json"
         complete_file = project_dir / "workflow_complete.json"
 
-        # --- Completed workflows ---
+        # --- Completed workflows: served lazily from the project index ---
         if complete_file.exists():
-            try:
-                with open(complete_file) as f:
-                    wf_data = json.load(f)
-
-                passed = wf_data.get("passed", False)
-                final_status = "completed" if passed else "rejected"
-                total_rounds = wf_data.get("total_rounds", 0)
-                final_score = wf_data.get("final_score", 0)
-                perf = wf_data.get("performance", {})
-                topic = wf_data.get("topic", "")
-
-                # Build expert_status from expert_team
-                expert_team = wf_data.get("expert_team", [])
-                expert_status = [
-                    {
-                        "expert_id": exp.get("id", f"expert-{i+1}"),
-                        "expert_name": exp.get("name", f"Expert {i+1}"),
-                        "status": "completed",
-                        "progress": 100,
-                        "message": "Review complete",
-                        "score": final_score
-                    }
-                    for i, exp in enumerate(expert_team)
-                ]
-
-                # Build cost_estimate from performance data
-                cost_estimate = None
-                if perf:
-                    cost_estimate = {
-                        "total_tokens": perf.get("total_tokens", 0),
-                        "estimated_cost_usd": perf.get("estimated_cost", 0),
-                        "tokens_by_model": perf.get("tokens_by_model", {}),
-                    }
-
-                generated_at = wf_data.get("generated_at") or wf_data.get("timestamp", _utcnow().isoformat())
-
-                # Build round summaries for frontend milestones
-                raw_rounds = wf_data.get("rounds", [])
-                rounds_summary = []
-                final_decision = "PENDING"
-                for rd in raw_rounds:
-                    decision = rd.get("moderator_decision", {}).get("decision", "")
-                    rounds_summary.append({
-                        "round": rd.get("round", 0),
-                        "score": rd.get("overall_average", 0),
-                        "decision": decision,
-                        "passed": rd.get("passed", False),
-                    })
-                    final_decision = decision
-                if not raw_rounds and passed:
-                    final_decision = "UPLOADED" if wf_data.get("uploaded") else "ACCEPT"
-
-                # Word count from last round
-                word_count = raw_rounds[-1].get("word_count", 0) if raw_rounds else 0
-
-                # Total tokens (prefer performance.total_tokens)
-                total_tokens = perf.get("total_tokens", 0)
-
-                workflow_status[project_id] = {
-                    "topic": topic,
-                    "status": final_status,
-                    "current_round": total_rounds,
-                    "total_rounds": total_rounds,
-                    "progress_percentage": 100,
-                    "message": f"Score {final_score:.1f}/10 — {'Accepted' if passed else 'Rejected'} after {total_rounds} round(s)",
-                    "error": None,
-                    "expert_status": expert_status,
-                    "cost_estimate": cost_estimate,
-                    "start_time": generated_at,
-                    "elapsed_time_seconds": int(perf.get("total_duration", 0)),
-                    "estimated_time_remaining_seconds": 0,
-                    "research_type": wf_data.get("research_type", "survey"),
-                    # Fields required by frontend for score/milestone display
-                    "final_score": final_score,
-                    "final_decision": final_decision,
-                    "passed": passed,
-                    "rounds": rounds_summary,
-                    "category": wf_data.get("category"),
-                    "word_count": word_count,
-                    "total_tokens": total_tokens,
-                    "estimated_cost": round(perf.get("estimated_cost", 0), 4),
-                    "expert_team": expert_team,
-                }
-
-                completed_count += 1
-
-            except Exception as e:
-                print(f"  Error loading completed workflow {project_id}: {e}")
             continue
 
         # --- Interrupted: has checkpoint but no complete ---
@@ -398,7 +706,7 @@ async def scan_interrupted_workflows():
                     "cost_estimate": None,
                     "start_time": checkpoint.get("checkpoint_time", _utcnow().isoformat()),
                     "elapsed_time_seconds": 0,
-                    "estimated_time_remaining_seconds": (checkpoint.get("max_rounds", 3) - checkpoint.get("current_round", 0)) * 180,
+                    "estimated_time_remaining_seconds": _remaining_rounds_seconds(checkpoint.get("max_rounds", 3) - checkpoint.get("current_round", 0), checkpoint),
                     "can_resume": True
                 }
 
@@ -445,11 +753,94 @@ async def scan_interrupted_workflows():
             print(f"  Found orphan workflow: {project_id} (no checkpoint, has files)")
 
     if completed_count > 0:
-        print(f"✓ Restored {completed_count} completed workflow(s) from disk")
+        print(f"✓ Indexed {completed_count} completed workflow(s) (loaded on demand)")
     if interrupted_count > 0:
         print(f"✓ Found {interrupted_count} interrupted/orphan workflow(s) - available for resume")
 
 
+def _completed_workflow_status(wf_data: dict) -> dict:
+    """Build the full workflow_status entry for a completed workflow_complete.json."""
+    passed = wf_data.get("passed", False)
+    final_status = "completed" if passed else "rejected"
+    total_rounds = wf_data.get("total_rounds", 0)
+    final_score = wf_data.get("final_score", 0)
+    perf = wf_data.get("performance", {})
+    topic = wf_data.get("topic", "")
+
+    # Build expert_status from expert_team
+    expert_team = wf_data.get("expert_team", [])
+    expert_status = [
+        {
+            "expert_id": exp.get("id", f"expert-{i+1}"),
+            "expert_name": exp.get("name", f"Expert {i+1}"),
+            "status": "completed",
+            "progress": 100,
+            "message": "Review complete",
+            "score": final_score
+        }
+        for i, exp in enumerate(expert_team)
+    ]
+
+    # Build cost_estimate from performance data
+    cost_estimate = None
+    if perf:
+        cost_estimate = {
+            "total_tokens": perf.get("total_tokens", 0),
+            "estimated_cost_usd": perf.get("estimated_cost", 0),
+            "tokens_by_model": perf.get("tokens_by_model", {}),
+        }
+
+    generated_at = wf_data.get("generated_at") or wf_data.get("timestamp", _utcnow().isoformat())
+
+    # Build round summaries for frontend milestones
+    raw_rounds = wf_data.get("rounds", [])
+    rounds_summary = []
+    final_decision = "PENDING"
+    for rd in raw_rounds:
+        decision = rd.get("moderator_decision", {}).get("decision", "")
+        rounds_summary.append({
+            "round": rd.get("round", 0),
+            "score": rd.get("overall_average", 0),
+            "decision": decision,
+            "passed": rd.get("passed", False),
+        })
+        final_decision = decision
+    if not raw_rounds and passed:
+        final_decision = "UPLOADED" if wf_data.get("uploaded") else "ACCEPT"
+
+    # Word count from last round
+    word_count = raw_rounds[-1].get("word_count", 0) if raw_rounds else 0
+
+    # Total tokens (prefer performance.total_tokens)
+    total_tokens = perf.get("total_tokens", 0)
+
+    return {
+        "topic": topic,
+        "status": final_status,
+        "current_round": total_rounds,
+        "total_rounds": total_rounds,
+        "progress_percentage": 100,
+        "message": f"Score {final_score:.1f}/10 — {'Accepted' if passed else 'Rejected'} after {total_rounds} round(s)",
+        "error": None,
+        "expert_status": expert_status,
+        "cost_estimate": cost_estimate,
+        "start_time": generated_at,
+        "elapsed_time_seconds": int(perf.get("total_duration", 0)),
+        "estimated_time_remaining_seconds": 0,
+        "research_type": wf_data.get("research_type", "survey"),
+        # Fields required by frontend for score/milestone display
+        "final_score": final_score,
+        "final_decision": final_decision,
+        "passed": passed,
+        "rounds": rounds_summary,
+        "category": wf_data.get("category"),
+        "word_count": word_count,
+        "total_tokens": total_tokens,
+        "estimated_cost": round(perf.get("estimated_cost", 0), 4),
+        "expert_team": expert_team,
+    }
+
+
 # Request/Response Models
 class ExpertContext(BaseModel):
     type: str  # "description", "url", "pdf"
@@ -470,6 +861,11 @@ class ProposeTeamRequest(BaseModel):
     num_experts: Optional[int] = None
     research_type: Optional[str] = "research"  # "survey", "research", or "explainer"
     expert_context: Optional[ExpertContext] = None
+    # Used only for the time/cost estimate
+    max_rounds: Optional[int] = 3
+    article_length: Optional[str] = "full"
+    workflow_mode: Optional[str] = "standard"
+    fresh: bool = False  # Skip memoized proposals (e.g. "Regenerate")
 
 
 class ExpertProposalResponse(BaseModel):
@@ -494,6 +890,7 @@ class TeamProposalResponse(BaseModel):
     estimated_time_minutes: int
     estimated_rounds: int
     cost_estimate: Optional[CostEstimate] = None
+    estimate_range: Optional[dict] = None
 
 
 class CategoryInfo(BaseModel):
@@ -513,6 +910,11 @@ class StartWorkflowRequest(BaseModel):
     workflow_mode: Optional[str] = "standard"  # "standard" or "collaborative"
     audience_level: Optional[str] = "professional"  # "beginner", "intermediate", "professional"
     research_type: Optional[str] = "survey"  # "survey", "research", or "explainer"
+    priority: int = 0  # Higher runs first; only the admin key may go above 0
+    on_duplicate: Optional[str] = "new"  # "new", "attach" (own in-flight run) or "reuse" (own in-flight or completed run)
+    budget_usd: Optional[float] = None  # Per-run cost limit (the key's own limit still applies)
+    token_budget: Optional[int] = None  # Per-run token limit
+    budget_policy: Optional[str] = "downgrade"  # Near the limit: "downgrade", "cap_rounds" or "stop"
 
 
 class SubmitArticleRequest(BaseModel):
@@ -550,9 +952,25 @@ class WorkflowStatusResponse(BaseModel):
     estimated_time_remaining_seconds: Optional[int] = None
 
 
-# In-memory workflow status tracking
-workflow_status: Dict[str, dict] = {}
-activity_logs: Dict[str, List[dict]] = {}
+# Workflow status tracking: active jobs in memory, completed projects lazily
+# from the results/ manifest (bounded LRU of full entries)
+WORKFLOW_STATUS_CACHE_SIZE = int(os.environ.get("WORKFLOW_STATUS_CACHE_SIZE", "128"))
+project_index = ProjectIndex(Path("results"), _summarize_project)
+workflow_status: WorkflowStatusStore = WorkflowStatusStore(_load_completed_status, max_cached=WORKFLOW_STATUS_CACHE_SIZE)
+
+
+def _activity_spill_path(project_id: str) -> Path:
+    """JSONL file that receives activity entries evicted from memory."""
+    match = re.match(r'^sub-(.+?)(-r\d+)?$', project_id)
+    if match:
+        return Path("results/submissions") / match.group(1) / f"activity_log{match.group(2) or ''}.jsonl"
+    return Path("results") / project_id / "activity_log.jsonl"
+
+
+# Activity logs: per-workflow ring buffers, older entries spill to JSONL
+ACTIVITY_LOG_MAX_ENTRIES = int(os.environ.get("ACTIVITY_LOG_MAX_ENTRIES", "200"))
+ACTIVITY_STREAM_HEARTBEAT_SECONDS = 15
+activity_logs: ActivityLogStore = ActivityLogStore(ACTIVITY_LOG_MAX_ENTRIES, _activity_spill_path)
 
 
 @app.get("/api/health")
@@ -563,11 +981,19 @@ async def health():
 
 @app.get("/api/queue-status")
 async def queue_status():
-    """Return current job queue size and running job info."""
+    """Return queue sizes per lane, running jobs, estimated start times and worker pool state."""
     return {
         "queued_jobs": job_queue.qsize(),
+        **job_queue.snapshot(),
         "active_workers": _active_worker_count,
-        "max_workers": MAX_CONCURRENT_WORKERS,
+        "max_workers": _worker_pool_size() + len(_short_lane_workers),  # current worker count
+        "worker_pool": {
+            "size": _worker_pool_size(),
+            "reserved_short_lane": sorted(_short_lane_workers),
+            "retiring": sorted(_retiring_workers),
+            **worker_pool.snapshot(),
+            "providers": provider_health.stats(),
+        },
         "active_workflows": sum(
             1 for s in workflow_status.values()
             if s["status"] in ("queued", "composing_team", "writing", "desk_screening", "reviewing", "revising", "research", "writing_sections")
@@ -623,13 +1049,23 @@ Use ONLY the exact major_id and subfield_id values from the category list above.
 
         data = repair_json(response.content)
 
-        return ClassifyTopicResponse(
+        result = ClassifyTopicResponse(
             primary_major=data.get("primary_major", "computer_science"),
             primary_subfield=data.get("primary_subfield", "ai_ml"),
             secondary_major=data.get("secondary_major"),
             secondary_subfield=data.get("secondary_subfield"),
             confidence=data.get("confidence", 0.8),
         )
+        if SOURCE_PREFETCH_ENABLED:
+            # Search sources while the user reviews the team; the workflow's
+            # search_all picks the result up (see SourcePrefetcher)
+            source_prefetcher.start(request.topic, category={
+                "major": result.primary_major,
+                "subfield": result.primary_subfield,
+                "secondary_major": result.secondary_major,
+                "secondary_subfield": result.secondary_subfield,
+            })
+        return result
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Classification failed: {str(e)}")
@@ -666,7 +1102,7 @@ async def propose_team(request: ProposeTeamRequest, api_key: str = Depends(verif
                 additional_context += f"Reference PDF uploaded: {ctx.content}\nPlease consider the research focus and methodology of the referenced paper when proposing reviewers.\n\n"
 
         # Secondary category context is handled via suggest_category_llm below
-        proposals = await composer.propose_team(request.topic, num_experts, additional_context)
+        proposals = await composer.propose_team(request.topic, num_experts, additional_context, fresh=request.fresh)
 
         # Suggest category based on topic (LLM-based, works for any language)
         suggested_category = await suggest_category_llm(request.topic)
@@ -693,6 +1129,17 @@ async def propose_team(request: ProposeTeamRequest, api_key: str = Depends(verif
             "model_breakdown": {"blended": {"input_cost": round(blended_cost * 0.6, 4), "output_cost": round(blended_cost * 0.4, 4)}}
         }
 
+        # Prefer calibrated ranges from completed workflows when history exists
+        max_rounds = request.max_rounds or 3
+        prediction = _predict_run(request.workflow_mode, request.article_length, request.research_type)
+        estimate_range = prediction.to_dict(max_rounds)
+        if prediction.sample_count:
+            estimated_time = max(1, round(prediction.duration_range(max_rounds)[1] / 60))
+            estimated_rounds = max(1, round(prediction.expected_rounds(max_rounds)))
+            historical_cost = prediction.cost_range(max_rounds)[1]
+            cost_info["estimated_cost_usd"] = round(historical_cost, 4)
+            cost_info["model_breakdown"] = {"historical": {"input_cost": round(historical_cost * 0.6, 4), "output_cost": round(historical_cost * 0.4, 4)}}
+
         # Build response with suggested category
         response_data = {
             "topic": request.topic,
@@ -707,7 +1154,8 @@ async def propose_team(request: ProposeTeamRequest, api_key: str = Depends(verif
             "recommended_num_experts": len(proposals),
             "estimated_time_minutes": estimated_time,
             "estimated_rounds": estimated_rounds,
-            "cost_estimate": CostEstimate(**cost_info)
+            "cost_estimate": CostEstimate(**cost_info),
+            "estimate_range": estimate_range,
         }
 
         # Return as dict to include suggested_category (not in model)
@@ -728,104 +1176,396 @@ async def propose_team(request: ProposeTeamRequest, api_key: str = Depends(verif
         raise HTTPException(status_code=500, detail=f"Failed to propose team: {str(e)}")
 
 
+def _request_fingerprint(request: StartWorkflowRequest) -> str:
+    return workflow_fingerprint(
+        request.topic, request.article_length, request.audience_level, request.research_type,
+        request.category.dict() if request.category else None, request.workflow_mode,
+    )
+
+
+def _duplicate_response(fingerprint: str, policy: str, api_key: str,
+                        records: Optional[Dict[str, dict]] = None) -> Optional[dict]:
+    """Response for a request identical to one of the key's in-flight or reusable workflows, else None."""
+    duplicate = _find_duplicate_workflow(fingerprint, policy, api_key, records)
+    if not duplicate:
+        return None
+    existing_id = duplicate["project_id"]
+    if duplicate["reused"] == "in_flight":
+        queued = job_queue.find(existing_id)
+        queue_position = job_queue.position(queued.job_id) if queued else 0
+        add_activity_log(existing_id, "info", "Identical workflow request attached to this job")
+        return {
+            "project_id": existing_id,
+            "status": workflow_status[existing_id]["status"] if existing_id in workflow_status else "queued",
+            "message": "Identical workflow already in progress; attached to it",
+            "queue_position": queue_position or 0,
+            "duplicate": "in_flight",
+        }
+    return {
+        "project_id": existing_id,
+        "status": "completed",
+        "message": "Identical workflow completed recently; returning its result",
+        "queue_position": 0,
+        "duplicate": "completed",
+    }
+
+
+def _check_workflow_quota(api_key: str, needed: int = 1):
+    """Raise 429 unless the key can start ``needed`` more workflows (SQLite keys only)."""
+    if api_key in ("anonymous", ADMIN_API_KEY) or not appdb.get_api_key_cached(api_key):
+        return
+    quota = appdb.check_quota(api_key)
+    if quota["used"] + needed > quota["limit"]:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Quota exceeded ({quota['used']}/{quota['limit']} papers used). Contact admin for more."
+        )
+
+
+def _validate_budget(request: StartWorkflowRequest):
+    if request.budget_policy and request.budget_policy not in BUDGET_POLICIES:
+        raise HTTPException(status_code=400, detail=f"budget_policy must be one of {', '.join(BUDGET_POLICIES)}")
+    if (request.budget_usd is not None and request.budget_usd <= 0) or (
+            request.token_budget is not None and request.token_budget <= 0):
+        raise HTTPException(status_code=400, detail="Budgets must be positive")
+
+
+def _key_budget_limits(api_key: str) -> tuple:
+    """(job_budget_usd, job_token_budget) set on the key record, if any."""
+    key_info = appdb.get_api_key_cached(api_key) if api_key not in ("anonymous", ADMIN_API_KEY) else None
+    return (key_info or {}).get("job_budget_usd"), (key_info or {}).get("job_token_budget")
+
+
+def _workflow_budget(request: StartWorkflowRequest, api_key: str) -> Optional[dict]:
+    """Per-run limits from the request and the key record, as stored in the job payload."""
+    budget = effective_budget(
+        request.budget_usd, request.token_budget, *_key_budget_limits(api_key), request.budget_policy,
+    )
+    if budget is None:
+        return None
+    return {"max_cost_usd": budget.max_cost_usd, "max_tokens": budget.max_tokens, "policy": budget.policy}
+
+
+def _new_project_id(topic: str) -> str:
+    """Slug of the topic plus a timestamp, suffixed if that ID is already taken."""
+    # Sanitize: lowercase, hyphens, strip control chars
+    slug = re.sub(r'[^a-z0-9\-]', '-', topic.lower().replace(" ", "-"))
+    slug = re.sub(r'-{2,}', '-', slug).strip('-')
+    # Truncate overly long slugs, add timestamp for uniqueness
+    project_id = f"{slug[:80]}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    suffix = 2
+    candidate = project_id
+    while candidate in workflow_status or Path("results", candidate).exists():
+        candidate = f"{project_id}-{suffix}"
+        suffix += 1
+    return candidate
+
+
+async def _create_workflow(request: StartWorkflowRequest, api_key: str, fingerprint: str,
+                           batch_id: Optional[str] = None, hold: bool = False) -> dict:
+    """Register status, usage and ownership for a new workflow and enqueue it.
+
+    With ``hold=True`` the job is persisted but kept out of the scheduler
+    until ``_release_batch`` admits it (batch concurrency caps).
+    """
+    project_id = _new_project_id(request.topic)
+
+    # Record usage and ownership in SQLite
+    if api_key not in ("anonymous",):
+        try:
+            appdb.record_usage(api_key, "/api/start-workflow", project_id)
+            appdb.record_ownership(project_id, api_key)
+        except Exception:
+            pass  # Non-critical
+
+    # Initialize status
+    workflow_status[project_id] = {
+        "topic": request.topic,
+        "status": "queued",
+        "current_round": 0,
+        "total_rounds": request.max_rounds,
+        "progress_percentage": 0,
+        "message": "Workflow queued",
+        "error": None,
+        "expert_status": [
+            {
+                "expert_id": f"expert-{i+1}",
+                "expert_name": exp.get("expert_domain", f"Expert {i+1}"),
+                "status": "waiting",
+                "progress": 0,
+                "message": "Waiting to start",
+                "score": None
+            }
+            for i, exp in enumerate(request.experts)
+        ],
+        "cost_estimate": None,
+        "start_time": _utcnow().isoformat(),
+        "elapsed_time_seconds": 0,
+        "estimated_time_remaining_seconds": request.max_rounds * max(len(request.experts), 3) * 120,
+        "research_type": request.research_type or "survey"
+    }
+    if batch_id:
+        workflow_status[project_id]["batch_id"] = batch_id
+    prediction = _predict_run(request.workflow_mode, request.article_length, request.research_type)
+    _run_predictions[project_id] = prediction
+    workflow_status[project_id]["estimated_time_remaining_seconds"] = int(prediction.duration_range(request.max_rounds)[1])
+    workflow_status[project_id]["estimate_range"] = prediction.to_dict(request.max_rounds)
+
+    # Initialize activity log
+    activity_logs[project_id] = []
+    add_activity_log(project_id, "info", f"Workflow created for topic: {request.topic[:50]}...")
+
+    # Persist job to DB and enqueue
+    job_payload = {
+        "project_id": project_id,
+        "topic": request.topic,
+        "experts": request.experts,
+        "max_rounds": request.max_rounds,
+        "threshold": request.threshold,
+        "research_cycles": request.research_cycles,
+        "category": request.category.dict() if request.category else None,
+        "article_length": request.article_length or "full",
+        "workflow_mode": request.workflow_mode or "standard",
+        "audience_level": request.audience_level or "professional",
+        "research_type": request.research_type or "survey",
+    }
+    budget = _workflow_budget(request, api_key)
+    if budget:
+        job_payload["budget"] = budget
+        workflow_status[project_id]["budget"] = budget
+    if batch_id:
+        job_payload["batch_id"] = batch_id
+    scheduled = await _enqueue_job(
+        run_workflow_background, "workflow", job_payload,
+        api_key=api_key, priority=_job_priority(api_key, request.priority),
+        estimated_seconds=prediction.duration_range(request.max_rounds)[1],
+        fingerprint=fingerprint, hold=hold,
+    )
+    queue_position = job_queue.position(scheduled.job_id) if not hold else None
+    if queue_position:
+        workflow_status[project_id]["message"] = f"Workflow queued (position {queue_position})"
+    elif hold:
+        workflow_status[project_id]["message"] = "Waiting for a batch slot"
+
+    cost = prediction.cost_range(request.max_rounds)
+    return {
+        "project_id": project_id,
+        "status": "queued",
+        "message": "Workflow started",
+        "queue_position": queue_position or 0,
+        "estimated_cost": round(cost[1], 4) if cost else None,
+    }
+
+
 @app.post("/api/start-workflow")
 async def start_workflow(request: StartWorkflowRequest, api_key: str = Depends(verify_api_key)):
-    """Start workflow via job queue (sequential execution)."""
+    """Start workflow via job queue (sequential execution).
+
+    With ``on_duplicate`` "attach" or "reuse", a request identical to one
+    this key already made (same normalized topic, length, audience, research
+    type, category and mode) attaches to that queued/running job or, for
+    "reuse", returns the recently completed project. The default "new"
+    always starts a fresh run.
+    """
     # Rate limit check
     await check_rate_limit(api_key)
 
-    # Quota check (SQLite keys only; legacy/anonymous keys skip quota)
-    if api_key not in ("anonymous", ADMIN_API_KEY):
-        db_key = appdb.get_api_key(api_key)
-        if db_key:
-            quota = appdb.check_quota(api_key)
-            if not quota["allowed"]:
-                raise HTTPException(
-                    status_code=429,
-                    detail=f"Quota exceeded ({quota['used']}/{quota['limit']} papers used). Contact admin for more."
-                )
+    policy = request.on_duplicate or "new"
+    if policy not in DUPLICATE_POLICIES:
+        raise HTTPException(status_code=400, detail=f"on_duplicate must be one of {', '.join(DUPLICATE_POLICIES)}")
+    _validate_budget(request)
+    fingerprint = _request_fingerprint(request)
+    records = project_index.refresh()  # one scan serves duplicate and similar-topic checks
+    duplicate = _duplicate_response(fingerprint, policy, api_key, records)
+    if duplicate:
+        return duplicate
+
+    _check_workflow_quota(api_key)
 
     try:
-        # Generate unique project ID (sanitize: lowercase, hyphens, strip control chars)
-        project_id = re.sub(r'[^a-z0-9\-]', '-', request.topic.lower().replace(" ", "-"))
-        project_id = re.sub(r'-{2,}', '-', project_id).strip('-')
-        # Truncate overly long slugs, add timestamp for uniqueness
-        project_id = f"{project_id[:80]}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        response = await _create_workflow(request, api_key, fingerprint)
+        response.pop("estimated_cost", None)
+        try:
+            similar = _similar_topics(request.topic, exclude=response["project_id"], records=records)
+        except Exception:
+            similar = []  # Advisory only
+        if similar:
+            response["similar_projects"] = similar
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to start workflow: {str(e)}")
 
-        # Record usage and ownership in SQLite
-        if api_key not in ("anonymous",):
-            try:
-                appdb.record_usage(api_key, "/api/start-workflow", project_id)
-                appdb.record_ownership(project_id, api_key)
-            except Exception:
-                pass  # Non-critical
 
-        # Initialize status
-        workflow_status[project_id] = {
-            "topic": request.topic,
-            "status": "queued",
-            "current_round": 0,
-            "total_rounds": request.max_rounds,
-            "progress_percentage": 0,
-            "message": f"Workflow queued (position {job_queue.qsize() + 1})",
-            "error": None,
-            "expert_status": [
-                {
-                    "expert_id": f"expert-{i+1}",
-                    "expert_name": exp.get("expert_domain", f"Expert {i+1}"),
-                    "status": "waiting",
-                    "progress": 0,
-                    "message": "Waiting to start",
-                    "score": None
-                }
-                for i, exp in enumerate(request.experts)
-            ],
-            "cost_estimate": None,
-            "start_time": _utcnow().isoformat(),
-            "elapsed_time_seconds": 0,
-            "estimated_time_remaining_seconds": request.max_rounds * len(request.experts) * 120,
-            "research_type": request.research_type or "survey"
-        }
+# --- Batch Workflows ---
+BATCH_MAX_ITEMS = 20
 
-        # Initialize activity log
-        activity_logs[project_id] = []
-        add_activity_log(project_id, "info", f"Workflow created for topic: {request.topic[:50]}...")
 
-        # Persist job to DB and enqueue
-        db_job_id = str(uuid.uuid4())
-        job_payload = {
-            "project_id": project_id,
-            "topic": request.topic,
-            "experts": request.experts,
-            "max_rounds": request.max_rounds,
-            "threshold": request.threshold,
-            "research_cycles": request.research_cycles,
-            "category": request.category.dict() if request.category else None,
-            "article_length": request.article_length or "full",
-            "workflow_mode": request.workflow_mode or "standard",
-            "audience_level": request.audience_level or "professional",
-            "research_type": request.research_type or "survey",
+class BatchWorkflowItem(StartWorkflowRequest):
+    experts: List[dict] = []  # Empty: the team is composed when the job starts
+
+
+class BatchWorkflowRequest(BaseModel):
+    items: List[BatchWorkflowItem]
+    budget_usd: Optional[float] = None  # Shared estimated-cost budget; items past it are skipped
+    max_concurrency: Optional[int] = None  # Max items of this batch queued/running at once
+    priority: int = 0
+    on_duplicate: Optional[str] = "new"
+
+
+_batches: Dict[str, dict] = {}  # batch_id → {"max_concurrency", "held": deque of held job kwargs}
+
+
+async def _release_batch(batch_id: str):
+    """Move held jobs of a batch into the scheduler while it is under its cap."""
+    batch = _batches.get(batch_id)
+    if not batch:
+        return
+    while batch["held"]:
+        active = sum(
+            1 for pid in batch["project_ids"]
+            if pid in _running_jobs or job_queue.find(pid) is not None
+        )
+        if active >= batch["max_concurrency"]:
+            return
+        held = batch["held"].popleft()
+        project_id = held["payload"]["project_id"]
+        if project_id in workflow_status:
+            workflow_status[project_id]["message"] = "Workflow queued"
+        await job_queue.put(**held)
+    _batches.pop(batch_id, None)
+
+
+def _find_held_job(project_id: str) -> Optional[ScheduledJob]:
+    """A batch job still waiting for a slot, as the job it will become."""
+    for batch in _batches.values():
+        for held in batch["held"]:
+            if held["payload"]["project_id"] == project_id:
+                return ScheduledJob(
+                    job_id=held["job_id"], job_type=held["job_type"], payload=held["payload"],
+                    api_key=held["api_key"] or "anonymous", priority=held["priority"],
+                )
+    return None
+
+
+def _drop_held_job(project_id: str):
+    """Remove a batch job that is still waiting for a slot."""
+    for batch in _batches.values():
+        for held in list(batch["held"]):
+            if held["payload"]["project_id"] == project_id:
+                batch["held"].remove(held)
+
+
+@app.post("/api/workflows/batch")
+async def start_workflow_batch(request: BatchWorkflowRequest, api_key: str = Depends(verify_api_key)):
+    """Enqueue several workflows at once under a shared cost budget.
+
+    Counts as one request for rate limiting; each new workflow uses one unit
+    of quota. Items run through the shared worker pool, optionally at most
+    ``max_concurrency`` at a time, and can omit ``experts`` to have the team
+    composed when the job starts.
+    """
+    if not request.items:
+        raise HTTPException(status_code=400, detail="Batch has no items")
+    if len(request.items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_ITEMS} items per batch")
+    policy = request.on_duplicate or "new"
+    if policy not in DUPLICATE_POLICIES:
+        raise HTTPException(status_code=400, detail=f"on_duplicate must be one of {', '.join(DUPLICATE_POLICIES)}")
+    if request.max_concurrency is not None and request.max_concurrency < 1:
+        raise HTTPException(status_code=400, detail="max_concurrency must be at least 1")
+
+    await check_rate_limit(api_key)
+
+    # Plan: duplicates reuse existing runs; new runs are admitted while the budget lasts
+    plan = []
+    spent = 0.0
+    seen_fingerprints: Dict[str, int] = {}
+    records = project_index.refresh() if policy == "reuse" else None
+    for index, item in enumerate(request.items):
+        item.priority = request.priority
+        _validate_budget(item)
+        fingerprint = _request_fingerprint(item)
+        duplicate = _duplicate_response(fingerprint, policy, api_key, records)
+        if duplicate is None and policy != "new" and fingerprint in seen_fingerprints:
+            duplicate = {"status": "duplicate", "duplicate": "batch", "duplicate_of_item": seen_fingerprints[fingerprint]}
+        if duplicate:
+            plan.append((index, item, fingerprint, "duplicate", duplicate))
+            continue
+        seen_fingerprints[fingerprint] = index
+        cost = _predict_run(item.workflow_mode, item.article_length, item.research_type).cost_range(item.max_rounds)
+        expected = cost[1] if cost else 0.0
+        if request.budget_usd is not None and spent + expected > request.budget_usd:
+            plan.append((index, item, fingerprint, "skipped", {"status": "skipped", "reason": "budget"}))
+            continue
+        spent += expected
+        plan.append((index, item, fingerprint, "new", None))
+
+    _check_workflow_quota(api_key, needed=sum(1 for entry in plan if entry[3] == "new"))
+
+    batch_id = f"batch-{uuid.uuid4().hex[:12]}"
+    cap = request.max_concurrency
+    results = []
+    admitted = 0
+    for index, item, fingerprint, kind, response in plan:
+        if kind == "new":
+            hold = cap is not None and admitted >= cap
+            response = await _create_workflow(item, api_key, fingerprint, batch_id=batch_id, hold=hold)
+            admitted += 1
+        results.append({"index": index, "topic": item.topic, **response})
+    new_items = [r for r in results if r.get("status") == "queued" and "duplicate" not in r]
+    if _held_jobs.get(batch_id):
+        _batches[batch_id] = {
+            "project_ids": [r["project_id"] for r in new_items],
+            "max_concurrency": cap,
+            "held": _held_jobs.pop(batch_id),
         }
-        try:
-            appdb.enqueue_job(db_job_id, project_id, "workflow", job_payload)
-        except Exception:
-            pass
-        await job_queue.put({
-            "_fn": run_workflow_background,
-            "_db_job_id": db_job_id,
-            **job_payload,
-        })
+        await _release_batch(batch_id)  # in case an admitted item already finished
 
-        return {
+    return {
+        "batch_id": batch_id,
+        "items": results,
+        "queued": len(new_items),
+        "estimated_cost": round(spent, 4),
+        "budget_usd": request.budget_usd,
+    }
+
+
+_TERMINAL_WORKFLOW_STATUSES = {"completed", "failed", "rejected", "cancelled", "interrupted"}
+
+
+@app.get("/api/workflows/batch/{batch_id}")
+async def get_workflow_batch(batch_id: str, api_key: str = Depends(verify_api_key)):
+    """Status and results of every workflow in a batch."""
+    jobs = appdb.get_batch_jobs(batch_id)
+    if not jobs:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    if api_key != ADMIN_API_KEY and any(job.get("api_key") != api_key for job in jobs):
+        raise HTTPException(status_code=403, detail="Not your batch")
+
+    records = project_index.refresh()
+    items = []
+    for job in jobs:
+        project_id = job["project_id"]
+        status = workflow_status[project_id] if project_id in workflow_status else {}
+        project = (records.get(project_id) or {}).get("project", {})
+        items.append({
             "project_id": project_id,
-            "status": "queued",
-            "message": "Workflow started",
-            "queue_position": job_queue.qsize()
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to start workflow: {str(e)}")
+            "topic": status.get("topic") or project.get("topic"),
+            "status": project.get("status") or status.get("status") or job["status"],
+            "final_score": project.get("final_score"),
+            "passed": project.get("passed"),
+            "estimated_cost": project.get("estimated_cost"),
+            "elapsed_time_seconds": project.get("elapsed_time_seconds") or status.get("elapsed_time_seconds"),
+            "message": status.get("message"),
+        })
+    return {
+        "batch_id": batch_id,
+        "items": items,
+        "done": all(item["status"] in _TERMINAL_WORKFLOW_STATUSES for item in items),
+        "total_cost": round(sum(item["estimated_cost"] or 0 for item in items), 4),
+    }
 
 
 @app.get("/api/workflow-status/{project_id}", response_model=WorkflowStatusResponse)
@@ -862,7 +1602,7 @@ async def list_workflows():
     for pid, status in workflow_status.items():
         entry = {"project_id": pid, **status}
         # Dynamically calculate elapsed time for active workflows
-        if status.get("status") not in ("completed", "failed", "interrupted", "rejected"):
+        if status.get("status") not in ("completed", "failed", "interrupted", "rejected", "cancelled"):
             try:
                 start_time = _parse_start_time(status.get("start_time", _utcnow().isoformat()))
                 entry["elapsed_time_seconds"] = int((_utcnow() - start_time).total_seconds())
@@ -873,19 +1613,120 @@ async def list_workflows():
 
 
 @app.get("/api/workflow-activity/{project_id}")
-async def get_workflow_activity(project_id: str, limit: int = 50):
-    """Get activity log for a workflow."""
+async def get_workflow_activity(project_id: str, limit: int = 50,
+                                before_seq: Optional[int] = None, after_seq: Optional[int] = None):
+    """Get activity log for a workflow (newest first).
+
+    Page backwards by passing the previous response's ``next_before_seq`` as
+    ``before_seq``, or poll for new entries with ``after_seq``.
+    """
     if project_id not in workflow_status:
         raise HTTPException(status_code=404, detail="Workflow not found")
 
-    logs = activity_logs.get(project_id, [])
-    # Return latest logs (newest first)
-    return {"activity": logs[-limit:][::-1]}
+    log = activity_logs.load(project_id)
+    entries = log.page(limit, before_seq=before_seq, after_seq=after_seq)
+    oldest = entries[0]["seq"] if entries else None
+    return {
+        "activity": entries[::-1],
+        "latest_seq": log.latest_seq,
+        "next_before_seq": oldest if oldest is not None and oldest > log.oldest_seq else None,
+    }
+
+
+@app.get("/api/workflow-activity/{project_id}/stream")
+async def stream_workflow_activity(project_id: str, request: Request, after_seq: Optional[int] = None):
+    """Server-sent events for a workflow's activity log.
+
+    Each event id is the entry seq, so a client reconnecting with
+    ``Last-Event-ID`` resumes exactly where it left off.
+    """
+    if project_id not in workflow_status:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+
+    last_event_id = request.headers.get("Last-Event-ID", "")
+    if last_event_id.isdigit():
+        after_seq = int(last_event_id)
+    terminal_statuses = {"completed", "failed", "rejected", "interrupted", "cancelled"}
+
+    async def events():
+        cursor = after_seq or 0
+        while True:
+            status = workflow_status.get(project_id, {}).get("status")
+            # Live workflows share the in-memory log (its Event wakes us on append);
+            # finished ones are read once from the spill file
+            finished = status in terminal_statuses
+            log = activity_logs.load(project_id) if finished else activity_logs.log_for(project_id)
+            for entry in log.page(limit=500, after_seq=cursor):
+                cursor = entry["seq"]
+                yield f"id: {cursor}\nevent: activity\ndata: {json.dumps(entry, ensure_ascii=False)}\n\n"
+            if log.latest_seq > cursor:
+                continue
+            if finished:
+                yield f"event: end\ndata: {json.dumps({'status': status})}\n\n"
+                return
+            if await request.is_disconnected():
+                return
+            if not await log.wait_for(cursor, ACTIVITY_STREAM_HEARTBEAT_SECONDS):
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/workflows/{project_id}/cancel")
+async def cancel_workflow(project_id: str, api_key: str = Depends(verify_api_key)):
+    """Cancel a queued or running job (admin, or the key that started it).
+
+    Queued jobs are dropped from the scheduler. Running jobs have their
+    cancellation token cancelled, which aborts in-flight LLM calls and frees
+    the worker slot; the last checkpoint is kept so the run can be resumed.
+    """
+    running = _running_jobs.get(project_id)
+    job = running["job"] if running else (job_queue.find(project_id) or _find_held_job(project_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="No queued or running job for this workflow")
+    if ADMIN_API_KEY and api_key not in (ADMIN_API_KEY, job.api_key):
+        raise HTTPException(status_code=403, detail="Not authorized to cancel this workflow")
+
+    reason = "Cancelled by admin" if ADMIN_API_KEY and api_key == ADMIN_API_KEY else "Cancelled by user"
+    if running:
+        running["token"].cancel(reason)
+        return {"project_id": project_id, "status": "cancelling", "message": f"{reason}; stopping the running job"}
+
+    removed = job_queue.remove(job.job_id)
+    if removed is None:
+        _drop_held_job(project_id)
+    try:
+        appdb.complete_job(job.job_id, "cancelled")
+    except Exception:
+        pass
+    _mark_workflow_cancelled(job, reason)
+    if removed is not None and job.payload.get("batch_id"):
+        # An admitted batch item gave up its slot: let the next held item in
+        await _release_batch(job.payload["batch_id"])
+    return {"project_id": project_id, "status": "cancelled", "message": f"{reason} before it started"}
+
+
+class ResumeWorkflowRequest(BaseModel):
+    budget_usd: Optional[float] = None  # Raise (or lower) the run's saved cost limit
+    token_budget: Optional[int] = None  # Raise (or lower) the run's saved token limit
 
 
 @app.post("/api/workflows/{project_id}/resume")
-async def resume_workflow(project_id: str, api_key: str = Depends(verify_api_key)):
-    """Resume a workflow from checkpoint via job queue."""
+async def resume_workflow(project_id: str, body: Optional[ResumeWorkflowRequest] = None,
+                          api_key: str = Depends(verify_api_key)):
+    """Resume a workflow from checkpoint via job queue.
+
+    A run keeps its saved budget and spend; one stopped at its limit is only
+    resumed when the body raises the limit (within the key's own limits).
+    """
+    body = body or ResumeWorkflowRequest()
+    if (body.budget_usd is not None and body.budget_usd <= 0) or (
+            body.token_budget is not None and body.token_budget <= 0):
+        raise HTTPException(status_code=400, detail="Budgets must be positive")
     try:
         # Find project directory
         results_dir = Path("results")
@@ -935,7 +1776,7 @@ async def resume_workflow(project_id: str, api_key: str = Depends(verify_api_key
                 "cost_estimate": None,
                 "start_time": _utcnow().isoformat(),
                 "elapsed_time_seconds": 0,
-                "estimated_time_remaining_seconds": payload.get("max_rounds", 3) * 180,
+                "estimated_time_remaining_seconds": _remaining_rounds_seconds(payload.get("max_rounds", 3), payload),
                 "research_type": payload.get("research_type", "survey"),
             }
 
@@ -946,18 +1787,9 @@ async def resume_workflow(project_id: str, api_key: str = Depends(verify_api_key
                 add_activity_log(project_id, "warning", f"Another workflow is running ({active_workflows[0][:40]}...). This restart is queued.")
 
             # Enqueue as a fresh workflow run
-            db_job_id = str(uuid.uuid4())
-            try:
-                appdb.enqueue_job(db_job_id, project_id, "workflow", payload)
-            except Exception:
-                pass
-            await job_queue.put({
-                "_fn": run_workflow_background,
-                "_db_job_id": db_job_id,
-                **payload,
-            })
+            scheduled = await _enqueue_job(run_workflow_background, "workflow", payload, api_key=api_key)
 
-            queue_position = job_queue.qsize()
+            queue_position = job_queue.position(scheduled.job_id) or 0
             return {
                 "project_id": project_id,
                 "status": "queued",
@@ -972,6 +1804,14 @@ async def resume_workflow(project_id: str, api_key: str = Depends(verify_api_key
         with open(checkpoint_file) as f:
             checkpoint = json.load(f)
 
+        budget = resumed_budget(checkpoint.get("budget"), body.budget_usd, body.token_budget,
+                                *_key_budget_limits(api_key))
+        if budget is not None and budget.exhausted:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Budget exhausted ({budget.describe()}); pass a higher budget_usd or token_budget to resume",
+            )
+
         # Reset workflow status to queued (handles both new and failed/interrupted)
         workflow_status[project_id] = {
             "project_id": project_id,
@@ -986,7 +1826,7 @@ async def resume_workflow(project_id: str, api_key: str = Depends(verify_api_key
             "cost_estimate": None,
             "start_time": _utcnow().isoformat(),
             "elapsed_time_seconds": 0,
-            "estimated_time_remaining_seconds": (checkpoint["max_rounds"] - checkpoint["current_round"]) * 180
+            "estimated_time_remaining_seconds": _remaining_rounds_seconds(checkpoint["max_rounds"] - checkpoint["current_round"], checkpoint)
         }
 
         # Detailed resume info
@@ -1005,23 +1845,15 @@ async def resume_workflow(project_id: str, api_key: str = Depends(verify_api_key
             add_activity_log(project_id, "warning", f"Another workflow is running ({active_workflows[0][:40]}...). This resume is queued.")
 
         # Persist job to DB and enqueue
-        db_job_id = str(uuid.uuid4())
-        job_payload_for_db = {
-            "project_id": project_id,
-            "project_dir": str(project_dir),
-        }
-        try:
-            appdb.enqueue_job(db_job_id, project_id, "resume", job_payload_for_db)
-        except Exception:
-            pass
-        await job_queue.put({
-            "_fn": resume_workflow_background,
-            "_db_job_id": db_job_id,
-            "project_id": project_id,
-            "project_dir": project_dir,
-        })
+        budget_payload = budget.to_dict() if budget else None
+        scheduled = await _enqueue_job(
+            resume_workflow_background, "resume",
+            {"project_id": project_id, "project_dir": project_dir, "budget": budget_payload},
+            api_key=api_key,
+            db_payload={"project_id": project_id, "project_dir": str(project_dir), "budget": budget_payload},
+        )
 
-        queue_position = job_queue.qsize()
+        queue_position = job_queue.position(scheduled.job_id) or 0
         return {
             "project_id": project_id,
             "status": "queued",
@@ -1057,17 +1889,14 @@ def _parse_start_time(iso_str: str) -> datetime:
 
 
 def add_activity_log(project_id: str, level: str, message: str, details: dict = None):
-    """Add entry to activity log."""
-    if project_id not in activity_logs:
-        activity_logs[project_id] = []
-
+    """Add entry to activity log (bounded; older entries spill to JSONL)."""
     entry = {
         "timestamp": _utcnow().isoformat(),
         "level": level,
         "message": message,
         "details": details or {}
     }
-    activity_logs[project_id].append(entry)
+    activity_logs.append(project_id, entry)
 
 
 def calculate_cost_estimate(input_tokens: int, output_tokens: int, model: str = "claude-opus-4.5") -> dict:
@@ -1090,8 +1919,12 @@ def calculate_cost_estimate(input_tokens: int, output_tokens: int, model: str =
     }
 
 
-async def resume_workflow_background(project_id: str, project_dir: Path):
-    """Resume workflow from checkpoint in background."""
+async def resume_workflow_background(project_id: str, project_dir: Path, budget: Optional[dict] = None):
+    """Resume workflow from checkpoint in background.
+
+    ``budget`` is the resumed run's WorkflowBudget state (limits and spend);
+    without it the budget saved in the checkpoint applies.
+    """
     try:
         from research_cli.workflow.orchestrator import WorkflowOrchestrator
         import json
@@ -1125,7 +1958,8 @@ async def resume_workflow_background(project_id: str, project_dir: Path):
         # Resume from checkpoint
         result = await WorkflowOrchestrator.resume_from_checkpoint(
             output_dir=project_dir,
-            status_callback=status_update
+            status_callback=status_update,
+            budget=WorkflowBudget(**budget) if budget else None,
         )
 
         # Mark as completed or rejected based on actual result
@@ -1146,6 +1980,7 @@ async def resume_workflow_background(project_id: str, project_dir: Path):
         # Checkpoint still exists (resume didn't finish) → mark as interrupted
         checkpoint_file = project_dir / "workflow_checkpoint.json"
         if checkpoint_file.exists():
+            cp = {}
             try:
                 with open(checkpoint_file) as f:
                     cp = json.load(f)
@@ -1165,7 +2000,7 @@ async def resume_workflow_background(project_id: str, project_dir: Path):
                     "message": display_msg,
                     "error": clean_error,
                     "error_stage": stage_label,
-                    "estimated_time_remaining_seconds": (cp_max - cp_round) * 180,
+                    "estimated_time_remaining_seconds": _remaining_rounds_seconds(cp_max - cp_round, cp),
                     "can_resume": True,
                 })
             add_activity_log(project_id, "warning", f"Resume interrupted during {stage_label or f'round {cp_round}'}: {clean_error}. Checkpoint preserved — try again.")
@@ -1178,18 +2013,42 @@ async def resume_workflow_background(project_id: str, project_dir: Path):
                 workflow_status[project_id]["error_stage"] = stage_label
 
 
+_reviewer_panel_cache = memo_cache("reviewer_panels", ttl=24 * 3600, max_entries=256)
+
+
+def _reviewer_configs(reviewer_list: List[dict], reviewer_model_list: List[dict]) -> List[ExpertConfig]:
+    """Build reviewer ExpertConfigs from the LLM's reviewer list."""
+    reviewers = []
+    for i, rev in enumerate(reviewer_list[:3]):
+        rm = reviewer_model_list[i % len(reviewer_model_list)]
+        reviewers.append(ExpertConfig(
+            id=f"reviewer-{i+1}",
+            name=rev.get("name", f"Reviewer {i+1}"),
+            domain=rev.get("domain", "General Research"),
+            focus_areas=rev.get("focus_areas", []),
+            system_prompt="",
+            provider=rm["provider"],
+            model=rm["model"],
+            fallback=rm.get("fallback", []),
+        ))
+    return reviewers
+
+
 async def _generate_reviewers_from_category(
-    category: dict, topic: str, secondary_category: Optional[dict] = None
+    category: dict, topic: str, secondary_category: Optional[dict] = None, fresh: bool = False
 ) -> List[ExpertConfig]:
     """Generate reviewer ExpertConfigs using LLM based on topic and category.
 
     The LLM creates 3 reviewers with expertise tailored to the specific
     research topic, rather than using a fixed expert pool per category.
+    The LLM's reviewer list is memoized by normalized topic and category pair;
+    models are assigned fresh from the current config on every call.
 
     Args:
         category: Dict with 'major' and 'subfield' keys.
         topic: Research topic for reviewer specialization.
         secondary_category: Optional dict with 'major' and 'subfield' for interdisciplinary topics.
+        fresh: Ignore a cached panel and ask the LLM again.
 
     Returns:
         List of 3 ExpertConfig reviewer objects.
@@ -1203,10 +2062,19 @@ async def _generate_reviewers_from_category(
     category_name = get_category_name(category["major"], category["subfield"])
     reviewer_model_list = get_reviewer_models()
 
+    cache_key = memo_key(
+        normalize_topic(topic), category["major"], category["subfield"],
+        (secondary_category or {}).get("major"), (secondary_category or {}).get("subfield"),
+    )
+
     # Try LLM-based generation
     try:
         from research_cli.utils.json_repair import repair_json
 
+        reviewer_list = None if fresh else _reviewer_panel_cache.get(cache_key)
+        if reviewer_list is not None:
+            return _reviewer_configs(reviewer_list, reviewer_model_list)
+
         # Build secondary category context
         secondary_context = ""
         if secondary_category and secondary_category.get("major") and secondary_category.get("subfield"):
@@ -1252,20 +2120,8 @@ Now generate 3 reviewers for the topic above. Respond with ONLY valid JSON:"""
         if len(reviewer_list) < 3:
             raise ValueError(f"LLM returned {len(reviewer_list)} reviewers, expected 3")
 
-        reviewers = []
-        for i, rev in enumerate(reviewer_list[:3]):
-            rm = reviewer_model_list[i % len(reviewer_model_list)]
-            config = ExpertConfig(
-                id=f"reviewer-{i+1}",
-                name=rev.get("name", f"Reviewer {i+1}"),
-                domain=rev.get("domain", "General Research"),
-                focus_areas=rev.get("focus_areas", []),
-                system_prompt="",
-                provider=rm["provider"],
-                model=rm["model"],
-                fallback=rm.get("fallback", []),
-            )
-            reviewers.append(config)
+        _reviewer_panel_cache.put(cache_key, reviewer_list[:3])
+        reviewers = _reviewer_configs(reviewer_list, reviewer_model_list)
 
         logger.info(f"LLM generated reviewers for '{topic}': {[r.name for r in reviewers]}")
         return reviewers
@@ -1313,8 +2169,14 @@ async def run_workflow_background(
     workflow_mode: str = "standard",
     audience_level: str = "professional",
     research_type: str = "survey",
+    batch_id: Optional[str] = None,
+    budget: Optional[dict] = None,
 ):
-    """Run workflow in background and update status."""
+    """Run workflow in background and update status.
+
+    Empty ``experts`` (batch items) get a proposed team; ``budget`` holds
+    WorkflowBudget limits.
+    """
     try:
         # Reset start_time to actual work start (excludes queue wait time)
         if project_id in workflow_status:
@@ -1328,6 +2190,14 @@ async def run_workflow_background(
         })
         add_activity_log(project_id, "info", f"Starting {workflow_mode} workflow - team composition")
 
+        if not experts:
+            proposals = await TeamComposerAgent().propose_team(topic, 3)
+            experts = [
+                {"expert_domain": p.expert_domain, "focus_areas": p.focus_areas}
+                for p in proposals
+            ]
+            add_activity_log(project_id, "info", f"Composed a team of {len(experts)} experts for the topic")
+
         # Convert expert dicts to ExpertConfig objects
         # Reviewers use Sonnet for speed; writer (WriterAgent) uses Opus separately
         reviewer_model_list = get_reviewer_models()
@@ -1436,6 +2306,7 @@ async def run_workflow_background(
                 research_type=research_type,
                 secondary_major=secondary_major,
                 secondary_subfield=secondary_subfield,
+                budget=WorkflowBudget(**budget) if budget else None,
             )
 
             add_activity_log(project_id, "info", "Starting collaborative workflow execution")
@@ -1455,6 +2326,7 @@ async def run_workflow_background(
                 article_length=article_length,
                 audience_level=audience_level,
                 research_type=research_type,
+                budget=WorkflowBudget(**budget) if budget else None,
             )
 
             add_activity_log(project_id, "info", "Starting standard workflow execution")
@@ -1493,6 +2365,7 @@ async def run_workflow_background(
         # Check if a checkpoint exists — if so, mark as "interrupted" (resumable)
         checkpoint_file = Path(f"results/{project_id}/workflow_checkpoint.json")
         if checkpoint_file.exists():
+            cp = {}
             try:
                 with open(checkpoint_file) as f:
                     cp = json.load(f)
@@ -1523,7 +2396,7 @@ async def run_workflow_background(
                 "message": display_msg,
                 "error": clean_error,
                 "error_stage": stage_label,
-                "estimated_time_remaining_seconds": (cp_max - cp_round) * 180,
+                "estimated_time_remaining_seconds": _remaining_rounds_seconds(cp_max - cp_round, cp),
                 "can_resume": True,
             })
             add_activity_log(project_id, "warning", f"Workflow interrupted during {stage_label or f'round {cp_round}'}: {clean_error}. Checkpoint saved — resume available.")
@@ -1627,7 +2500,11 @@ def update_workflow_status(project_id: str, status: str, round_num: int, total_r
     start_time = _parse_start_time(workflow_status[project_id].get("start_time", _utcnow().isoformat()))
     elapsed = (_utcnow() - start_time).total_seconds()
 
-    if progress > 5 and progress < 100:  # Only estimate if we have meaningful progress
+    prediction = _run_predictions.get(project_id)
+    if prediction is not None and status != "failed":
+        # Phase-aware estimate from historical runs
+        estimated_remaining = prediction.remaining_seconds(status, round_num, total_rounds, elapsed)
+    elif progress > 5 and progress < 100:  # Only estimate if we have meaningful progress
         estimated_total = (elapsed / progress) * 100
         estimated_remaining = max(0, int(estimated_total - elapsed))
     elif progress >= 100:
@@ -1643,6 +2520,8 @@ def update_workflow_status(project_id: str, status: str, round_num: int, total_r
         "message": message,
         "estimated_time_remaining_seconds": estimated_remaining
     })
+    if status in _TERMINAL_WORKFLOW_STATUSES:
+        _run_predictions.pop(project_id, None)
 
 
 # --- Projects API: serve directly from results/ ---
@@ -1656,22 +2535,66 @@ def _extract_title(markdown_text: str) -> Optional[str]:
     return None
 
 
+def _manuscript_files(project_dir: Path) -> Dict[str, Path]:
+    """Map manuscript version keys (file stems) to their paths without reading them."""
+    return {f.stem: f for f in project_dir.glob("manuscript_*.md")}
+
+
+def _manuscript_version_number(key: str) -> Optional[int]:
+    """Return N for keys like ``manuscript_vN`` / ``manuscript_final_vN``, else None."""
+    match = re.search(r'_v(\d+)$', key)
+    return int(match.group(1)) if match else None
+
+
+def _latest_manuscript_key(keys: Iterable[str]) -> Optional[str]:
+    """Pick the latest version key from filenames alone.
+
+    The highest N wins; at equal N ``manuscript_final_vN`` beats
+    ``manuscript_vN`` (then the name decides), so the result never depends
+    on directory order.
+    """
+    keys = list(keys)
+    if not keys:
+        return None
+    versioned = [k for k in keys if _manuscript_version_number(k) is not None]
+    if versioned:
+        return max(versioned, key=lambda k: (_manuscript_version_number(k), k.startswith("manuscript_final"), k))
+    return 'manuscript_final' if 'manuscript_final' in keys else sorted(keys)[0]
+
+
+def _final_manuscript_key(keys: Iterable[str]) -> Optional[str]:
+    """``manuscript_final``, else the highest ``manuscript_final_vN``, else None."""
+    keys = list(keys)
+    if "manuscript_final" in keys:
+        return "manuscript_final"
+    finals = [k for k in keys if k.startswith("manuscript_final_v") and _manuscript_version_number(k) is not None]
+    return max(finals, key=_manuscript_version_number) if finals else None
+
+
+def _resolve_manuscript_key(version: str, keys: Iterable[str]) -> Optional[str]:
+    """Resolve a version path segment ("latest", "final", "v2", "2", "manuscript_v2")."""
+    keys = list(keys)
+    if version == "latest":
+        return _latest_manuscript_key(keys)
+    if version == "final":
+        return _final_manuscript_key(keys)
+    for candidate in (version, f"manuscript_{version}", f"manuscript_v{version}"):
+        if candidate in keys:
+            return candidate
+    return None
+
+
 def _get_latest_manuscript(project_dir: Path) -> tuple[Optional[str], Optional[str]]:
     """Get the latest manuscript text and its version key from a project dir.
 
+    Only the latest file is read; the version is resolved from filenames.
     Returns (manuscript_text, version_key) or (None, None).
     """
-    manuscripts = {}
-    for f in project_dir.glob("manuscript_*.md"):
-        manuscripts[f.stem] = f.read_text(encoding="utf-8")
-    if not manuscripts:
+    files = _manuscript_files(project_dir)
+    latest_key = _latest_manuscript_key(files)
+    if latest_key is None:
         return None, None
-    versioned = [k for k in manuscripts if '_v' in k]
-    if versioned:
-        latest_key = max(versioned, key=lambda x: int(x.split('_v')[1]))
-    else:
-        latest_key = 'manuscript_final' if 'manuscript_final' in manuscripts else list(manuscripts.keys())[0]
-    return manuscripts[latest_key], latest_key
+    return files[latest_key].read_text(encoding="utf-8"), latest_key
 
 
 def _build_project_summary(project_dir: Path) -> Optional[dict]:
@@ -1686,6 +2609,11 @@ def _build_project_summary(project_dir: Path) -> Optional[dict]:
     except (json.JSONDecodeError, IOError):
         return None
 
+    return _project_summary_from_data(project_dir, data)
+
+
+def _project_summary_from_data(project_dir: Path, data: dict) -> dict:
+    """Build a project summary dict from parsed workflow_complete.json data."""
     project_id = project_dir.name
 
     # Determine status from final round decision
@@ -1792,28 +2720,27 @@ def _build_project_summary(project_dir: Path) -> Optional[dict]:
 
 
 @app.get("/api/projects")
-async def list_projects():
+async def list_projects(request: Request):
     """List all completed projects from results/ directory."""
     results_dir = Path("results")
     if not results_dir.exists():
         return {"projects": [], "updated_at": datetime.now().isoformat()}
 
-    projects = []
-    for project_dir in results_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-        summary = _build_project_summary(project_dir)
-        if summary:
-            projects.append(summary)
+    # Manifest-backed: only projects whose workflow_complete.json changed are re-parsed.
+    # The manifest is rewritten on any change, so its mtime/size drive the ETag.
+    records = project_index.refresh()
 
-    # Sort by timestamp (newest first)
-    projects.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+    def build():
+        projects = [record["project"] for record in records.values()]
+        # Sort by timestamp (newest first)
+        projects.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        return {"projects": projects, "updated_at": datetime.now().isoformat()}
 
-    return {"projects": projects, "updated_at": datetime.now().isoformat()}
+    return cached_response(request, "projects", [project_index.manifest_path], build)
 
 
 @app.get("/api/projects/{project_id}")
-async def get_project(project_id: str):
+async def get_project(project_id: str, request: Request):
     """Get full workflow data for a project."""
     project_dir = Path("results") / project_id
     workflow_file = project_dir / "workflow_complete.json"
@@ -1821,33 +2748,102 @@ async def get_project(project_id: str):
     if not workflow_file.exists():
         raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
 
-    try:
-        with open(workflow_file) as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        raise HTTPException(status_code=500, detail=f"Error reading project data: {e}")
+    def build():
+        try:
+            with open(workflow_file) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            raise HTTPException(status_code=500, detail=f"Error reading project data: {e}")
 
-    return data
+    return cached_response(request, f"project:{project_id}", [workflow_file], build)
 
 
 @app.get("/api/projects/{project_id}/manuscripts")
-async def get_project_manuscripts(project_id: str):
+async def get_project_manuscripts(project_id: str, request: Request):
     """Get all manuscript versions for a project, with citation hyperlinks applied."""
     project_dir = Path("results") / project_id
     if not project_dir.exists():
         raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
 
-    manuscripts = {}
-    for f in project_dir.glob("manuscript_*.md"):
-        text = f.read_text(encoding="utf-8")
-        # Apply citation hyperlinks
-        text = CitationManager.add_citation_hyperlinks(text)
-        manuscripts[f.stem] = text
+    manuscript_files = list(project_dir.glob("manuscript_*.md"))
+    if not manuscript_files:
+        raise HTTPException(status_code=404, detail="No manuscripts found")
+
+    def build():
+        manuscripts = {}
+        for f in manuscript_files:
+            text = f.read_text(encoding="utf-8")
+            # Apply citation hyperlinks
+            text = CitationManager.add_citation_hyperlinks(text)
+            manuscripts[f.stem] = text
+        return manuscripts
 
-    if not manuscripts:
+    return cached_response(request, f"manuscripts:{project_id}", manuscript_files, build)
+
+
+# Word counts and hashes keyed by (path, mtime_ns, size), so listings never re-read unchanged files
+_manuscript_info_cache: Dict[tuple, dict] = {}
+
+
+def _manuscript_info(key: str, path: Path) -> dict:
+    stat = path.stat()
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    info = _manuscript_info_cache.get(cache_key)
+    if info is None:
+        data = path.read_bytes()
+        info = {
+            "word_count": len(data.decode("utf-8", errors="replace").split()),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        if len(_manuscript_info_cache) >= 1024:
+            _manuscript_info_cache.clear()
+        _manuscript_info_cache[cache_key] = info
+    return {
+        "version": key,
+        "number": _manuscript_version_number(key),
+        "size": stat.st_size,
+        "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        **info,
+    }
+
+
+@app.get("/api/projects/{project_id}/manuscripts/versions")
+async def list_project_manuscript_versions(project_id: str, request: Request):
+    """List manuscript versions (name, size, word count, hash) without their text."""
+    project_dir = Path("results") / project_id
+    if not project_dir.exists():
+        raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
+
+    files = _manuscript_files(project_dir)
+    if not files:
         raise HTTPException(status_code=404, detail="No manuscripts found")
 
-    return manuscripts
+    def build():
+        versions = [_manuscript_info(key, path) for key, path in files.items()]
+        versions.sort(key=lambda v: (v["number"] is None, v["number"] or 0, v["version"]))
+        return {"project_id": project_id, "latest": _latest_manuscript_key(files), "versions": versions}
+
+    return cached_response(request, f"manuscript-versions:{project_id}", files.values(), build)
+
+
+@app.get("/api/projects/{project_id}/manuscripts/{version}")
+async def get_project_manuscript(project_id: str, version: str, request: Request):
+    """Get a single manuscript version ("latest", "final", "v2", "manuscript_v2", ...)."""
+    project_dir = Path("results") / project_id
+    if not project_dir.exists():
+        raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
+
+    files = _manuscript_files(project_dir)
+    key = _resolve_manuscript_key(version, files)
+    if key is None:
+        raise HTTPException(status_code=404, detail=f"Manuscript version not found: {version}")
+    path = files[key]
+
+    def build():
+        text = CitationManager.add_citation_hyperlinks(path.read_text(encoding="utf-8"))
+        return {"project_id": project_id, "version": key, "content": text}
+
+    return cached_response(request, f"manuscript:{project_id}:{key}", [path], build)
 
 
 # --- Reviewer Enrichment ---
@@ -1858,6 +2854,7 @@ class ProposeReviewersRequest(BaseModel):
     subfield: str
     secondary_major_field: Optional[str] = None
     secondary_subfield: Optional[str] = None
+    fresh: bool = False  # Skip a memoized panel (e.g. "Regenerate")
 
 
 @app.post("/api/propose-reviewers")
@@ -1868,7 +2865,8 @@ async def propose_reviewers(request: ProposeReviewersRequest):
         secondary = None
         if request.secondary_major_field and request.secondary_subfield:
             secondary = {"major": request.secondary_major_field, "subfield": request.secondary_subfield}
-        reviewer_configs = await _generate_reviewers_from_category(category, request.topic, secondary_category=secondary)
+        reviewer_configs = await _generate_reviewers_from_category(
+            category, request.topic, secondary_category=secondary, fresh=request.fresh)
 
         if not reviewer_configs:
             raise HTTPException(status_code=500, detail="Failed to generate reviewers for this category")
@@ -1925,12 +2923,12 @@ async def check_admin(request: Request):
 
 @app.delete("/api/workflows/{project_id}")
 async def delete_workflow(project_id: str, api_key: str = Depends(verify_admin_key)):
-    """Delete a workflow (admin only). Only interrupted/completed/failed workflows can be deleted."""
+    """Delete a workflow (admin only). Only finished, interrupted or cancelled workflows can be deleted."""
     results_path = Path(f"results/{project_id}")
 
     if project_id in workflow_status:
         status = workflow_status[project_id]["status"]
-        deletable_statuses = {"interrupted", "completed", "failed", "rejected"}
+        deletable_statuses = {"interrupted", "completed", "failed", "rejected", "cancelled"}
         if status not in deletable_statuses:
             raise HTTPException(
                 status_code=400,
@@ -1974,6 +2972,41 @@ async def delete_workflow(project_id: str, api_key: str = Depends(verify_admin_k
     return {"message": f"Workflow '{project_id}' deleted", "project_id": project_id}
 
 
+# --- Admin: Caches ---
+
+@app.get("/api/admin/caches")
+async def cache_stats(api_key: str = Depends(verify_admin_key)):
+    """Hit/miss counters and sizes of the LLM memo caches, the reference search cache and corpus (admin only).
+
+    ``searches`` counts source searches served from cache, sent upstream, or coalesced
+    into an identical in-flight search.
+    """
+    return {
+        "memo": memo_stats(),
+        "references": reference_cache().stats(),
+        "corpus": reference_corpus().stats(),
+        "searches": search_stats(),
+    }
+
+
+@app.post("/api/admin/caches/clear")
+async def clear_caches(include_references: bool = False, api_key: str = Depends(verify_admin_key)):
+    """Drop memoized classifications, team proposals and reviewer panels (admin only).
+
+    The persistent reference search cache is only cleared with ``include_references=true``.
+    """
+    clear_memo_caches()
+    if include_references:
+        reference_cache().clear()
+    return {"message": "Caches cleared"}
+
+
+@app.get("/api/admin/rate-limits")
+async def rate_limit_status(api_key: str = Depends(verify_admin_key)):
+    """Per-API rate limits shared by all workflows, with call counts and queueing delay (admin only)."""
+    return {"limits": rate_limit_stats()}
+
+
 # --- Admin: Dynamic API Key Management ---
 
 @app.get("/api/admin/keys")
@@ -2266,7 +3299,7 @@ async def submit_manuscript(request: SubmitManuscriptRequest, api_key: str = Dep
         raise HTTPException(status_code=400, detail="Category (major + subfield) is required.")
 
     # Get researcher_id from api_key
-    db_key = appdb.get_api_key(api_key)
+    db_key = appdb.get_api_key_cached(api_key)
     researcher_id = db_key["researcher_id"] if db_key else None
 
     # Create DB record
@@ -2288,27 +3321,18 @@ async def submit_manuscript(request: SubmitManuscriptRequest, api_key: str = Dep
     # Record usage
     if api_key not in ("anonymous",):
         try:
-            appdb.record_usage(api_key, "/api/submit-manuscript", submission_id)
+            appdb.record_usage(api_key, "/api/submit-manuscript", submission_id, defer=True)
         except Exception:
             pass
 
     # Persist job to DB and enqueue
-    db_job_id = str(uuid.uuid4())
     job_payload = {
         "project_id": f"sub-{submission_id}",
         "submission_id": submission_id,
         "round_number": 1,
         "is_first_round": True,
     }
-    try:
-        appdb.enqueue_job(db_job_id, f"sub-{submission_id}", "submission_review", job_payload)
-    except Exception:
-        pass
-    await job_queue.put({
-        "_fn": run_submission_review_background,
-        "_db_job_id": db_job_id,
-        **job_payload,
-    })
+    await _enqueue_job(run_submission_review_background, "submission_review", job_payload, api_key=api_key)
 
     return {
         "submission_id": submission_id,
@@ -2421,22 +3445,13 @@ async def revise_submission(submission_id: str, request: ReviseManuscriptRequest
     appdb.update_submission_status(submission_id, "reviewing", current_round=next_round)
 
     # Persist job to DB and enqueue
-    db_job_id = str(uuid.uuid4())
     job_payload = {
         "project_id": f"sub-{submission_id}-r{next_round}",
         "submission_id": submission_id,
         "round_number": next_round,
         "is_first_round": False,
     }
-    try:
-        appdb.enqueue_job(db_job_id, f"sub-{submission_id}-r{next_round}", "submission_review", job_payload)
-    except Exception:
-        pass
-    await job_queue.put({
-        "_fn": run_submission_review_background,
-        "_db_job_id": db_job_id,
-        **job_payload,
-    })
+    await _enqueue_job(run_submission_review_background, "submission_review", job_payload, api_key=api_key)
 
     return {
         "submission_id": submission_id,
@@ -2815,7 +3830,7 @@ async def get_application_status(email: str):
 @app.get("/api/my-profile")
 async def get_my_profile(api_key: str = Depends(verify_api_key)):
     """Get profile for the authenticated researcher."""
-    db_key = appdb.get_api_key(api_key)
+    db_key = appdb.get_api_key_cached(api_key)
     if not db_key or not db_key.get("researcher_id"):
         raise HTTPException(status_code=404, detail="No researcher profile linked to this key")
     researcher = appdb.get_researcher(db_key["researcher_id"])
@@ -2829,7 +3844,7 @@ async def get_my_profile(api_key: str = Depends(verify_api_key)):
 @app.get("/api/my-workflows")
 async def get_my_workflows(api_key: str = Depends(verify_api_key)):
     """Get workflows owned by the authenticated researcher."""
-    db_key = appdb.get_api_key(api_key)
+    db_key = appdb.get_api_key_cached(api_key)
     if db_key and db_key.get("researcher_id"):
         workflows = appdb.get_researcher_workflows(db_key["researcher_id"])
     else:
@@ -2915,6 +3930,38 @@ async def update_key_quota(key_prefix: str, body: UpdateQuotaRequest, api_key: s
     return {"message": f"Quota updated to {body.total_quota}", "updated": updated}
 
 
+class UpdateBudgetRequest(BaseModel):
+    job_budget_usd: Optional[float] = None  # None removes the limit
+    job_token_budget: Optional[int] = None
+
+
+@app.put("/api/admin/keys/{key_prefix}/budget")
+async def update_key_budget(key_prefix: str, body: UpdateBudgetRequest, api_key: str = Depends(verify_admin_key)):
+    """Set per-workflow cost/token limits for a key (admin only)."""
+    if (body.job_budget_usd is not None and body.job_budget_usd <= 0) or (
+            body.job_token_budget is not None and body.job_token_budget <= 0):
+        raise HTTPException(status_code=400, detail="Budgets must be positive")
+    updated = appdb.update_key_budget(key_prefix, body.job_budget_usd, body.job_token_budget)
+    if not updated:
+        raise HTTPException(status_code=404, detail="No active key found with this prefix")
+    return {"message": "Budget updated", "updated": updated}
+
+
+class UpdateQueueWeightRequest(BaseModel):
+    queue_weight: float  # fair-share quantum relative to other keys (default 1.0)
+
+
+@app.put("/api/admin/keys/{key_prefix}/queue-weight")
+async def update_key_queue_weight(key_prefix: str, body: UpdateQueueWeightRequest, api_key: str = Depends(verify_admin_key)):
+    """Set a key's share of the job queue among same-priority jobs (admin only)."""
+    if body.queue_weight < 1:
+        raise HTTPException(status_code=400, detail="Queue weight must be at least 1")
+    updated = appdb.update_key_queue_weight(key_prefix, body.queue_weight)
+    if not updated:
+        raise HTTPException(status_code=404, detail="No active key found with this prefix")
+    return {"message": f"Queue weight updated to {body.queue_weight}", "updated": updated}
+
+
 @app.post("/api/admin/keys/{key_prefix}/revoke")
 async def revoke_key(key_prefix: str, api_key: str = Depends(verify_admin_key)):
     """Revoke an API key (admin only)."""
@@ -3088,8 +4135,9 @@ async def update_article(project_id: str, body: UpdateArticleRequest, api_key: s
 
         # Update the latest manuscript in results/ (source for article.html viewer)
         if results_dir.exists():
-            versioned = sorted(results_dir.glob("manuscript_v*.md"))
-            target = versioned[-1] if versioned else results_dir / "manuscript_final.md"
+            versioned = {k: f for k, f in _manuscript_files(results_dir).items() if k.startswith("manuscript_v")}
+            latest_key = _latest_manuscript_key(versioned)
+            target = versioned[latest_key] if latest_key else results_dir / "manuscript_final.md"
             target.write_text(body.content, encoding="utf-8")
     elif body.title or body.author:
         # Title/author-only change: regenerate static HTML with existing content
@@ -3281,11 +4329,32 @@ def _regenerate_article_html(project_id: str, title: str, content: str, author:
 # --- Report Download & Upload ---
 
 @app.get("/api/projects/{project_id}/report")
-async def download_report(project_id: str):
+async def download_report(project_id: str, request: Request):
     """Download full report (manuscript + peer review) as a single Markdown file."""
     project_dir = Path("results") / project_id
     workflow_file = project_dir / "workflow_complete.json"
 
+    if not workflow_file.exists():
+        raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
+
+    source_files = [
+        workflow_file,
+        *project_dir.glob("manuscript_*.md"),
+        *project_dir.glob("author_response_round_*.md"),
+    ]
+    return cached_response(
+        request, f"report:{project_id}", source_files,
+        lambda: _build_report_markdown(project_id),
+        media_type="text/markdown",
+        headers={"Content-Disposition": f'attachment; filename="{project_id}-report.md"'},
+    )
+
+
+def _build_report_markdown(project_id: str) -> str:
+    """Render manuscript + peer review report for a project as Markdown."""
+    project_dir = Path("results") / project_id
+    workflow_file = project_dir / "workflow_complete.json"
+
     if not workflow_file.exists():
         raise HTTPException(status_code=404, detail=f"Project not found: {project_id}")
 
@@ -3426,15 +4495,7 @@ async def download_report(project_id: str):
                 md_parts.append(ar_text)
                 md_parts.append("")
 
-    report_md = "\n".join(md_parts)
-
-    return Response(
-        content=report_md,
-        media_type="text/markdown",
-        headers={
-            "Content-Disposition": f'attachment; filename="{project_id}-report.md"'
-        }
-    )
+    return "\n".join(md_parts)
 
 
 class UploadReportRequest(BaseModel):
@@ -3507,7 +4568,28 @@ async def serve_index():
 
 
 # Serve web/ directory as static files (must be last — catches all unmatched routes)
-app.mount("/", StaticFiles(directory="web", html=True), name="static")
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with Cache-Control tuned per asset type.
+
+    Starlette already sends ETag / Last-Modified and answers 304s. CSS and JS
+    are referenced by fixed, unversioned paths from HTML, so like HTML they
+    must revalidate or a deploy would pair new pages with stale scripts;
+    only images are reused without asking.
+    """
+
+    LONG_LIVED_SUFFIXES = {".svg", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico"}
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if Path(full_path).suffix.lower() in self.LONG_LIVED_SUFFIXES:
+            response.headers["Cache-Control"] = f"public, max-age={STATIC_ASSET_MAX_AGE}"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+STATIC_ASSET_MAX_AGE = 86400
+app.mount("/", CachedStaticFiles(directory="web", html=True), name="static")
 
 if __name__ == "__main__":
     import uvicorn
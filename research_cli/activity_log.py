@@ -0,0 +1,221 @@
+"""Bounded per-workflow activity logs.
+
+Each workflow keeps its most recent entries in a fixed-size ring buffer.
+Entries pushed out of the ring are appended to a JSONL file (normally
+``results/<project>/activity_log.jsonl``) so nothing is lost, while memory
+stays constant for long-running servers.
+
+Every entry carries a monotonically increasing ``seq``; the same numbers
+drive pagination (``before_seq`` / ``after_seq``) and SSE resume
+(``Last-Event-ID``). Numbering continues from the JSONL file after a
+restart, so logs are flushed to it when a workflow finishes and on
+shutdown; only the ring of a process that crashes mid-run is lost.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 200
+
+
+class ActivityLog:
+    """Ring buffer of activity entries for one workflow, spilling to JSONL."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, spill_path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.spill_path = spill_path
+        self._entries: Deque[dict] = deque()
+        self._next_seq = 1
+        self._first_seq = 1  # seq of the oldest entry ever recorded (memory or spill)
+        self._spilled_seq = 0  # highest seq already written to the spill file
+        self._changed = asyncio.Event()
+
+        # Continue numbering after entries written by a previous server run
+        spilled = self._read_spilled()
+        if spilled:
+            self._first_seq = spilled[0].get("seq", 1)
+            self._spilled_seq = spilled[-1].get("seq", 0)
+            self._next_seq = self._spilled_seq + 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(list(self._entries))
+
+    def __getitem__(self, index):
+        return list(self._entries)[index]
+
+    @property
+    def latest_seq(self) -> int:
+        return self._next_seq - 1
+
+    @property
+    def oldest_seq(self) -> int:
+        return self._first_seq if self._next_seq > 1 else 0
+
+    def append(self, entry: dict) -> dict:
+        """Record an entry, assigning its seq. Returns the stored entry."""
+        entry = {**entry, "seq": self._next_seq}
+        self._next_seq += 1
+        self._entries.append(entry)
+        while len(self._entries) > self.max_entries:
+            self._spill(self._entries.popleft())
+        self.notify()
+        return entry
+
+    def notify(self):
+        """Wake every ``wait_for`` caller (new entry, or the log was retired)."""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def extend(self, entries: Iterable[dict]):
+        for entry in entries:
+            self.append(entry)
+
+    def flush(self) -> int:
+        """Write in-memory entries not yet in the spill file. Returns the count written."""
+        return self._write([e for e in self._entries if e["seq"] > self._spilled_seq])
+
+    def _spill(self, entry: dict):
+        if entry["seq"] > self._spilled_seq:  # flushed entries are already on disk
+            self._write([entry])
+
+    def _write(self, entries: List[dict]) -> int:
+        if self.spill_path is None or not entries:
+            return 0
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning("Could not spill activity log to %s: %s", self.spill_path, e)
+            return 0
+        self._spilled_seq = entries[-1]["seq"]
+        return len(entries)
+
+    def _read_spilled(self) -> List[dict]:
+        if self.spill_path is None or not self.spill_path.exists():
+            return []
+        entries = []
+        with open(self.spill_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def page(self, limit: int = 50, before_seq: Optional[int] = None,
+             after_seq: Optional[int] = None) -> List[dict]:
+        """Entries in ascending seq order.
+
+        - ``after_seq``: the oldest ``limit`` entries newer than it (forward paging)
+        - ``before_seq``: the newest ``limit`` entries older than it (backward paging)
+        - neither: the newest ``limit`` entries
+        """
+        limit = max(0, limit)
+        oldest_in_memory = self._entries[0]["seq"] if self._entries else self._next_seq
+
+        if after_seq is not None:
+            source = self._entries
+            if after_seq + 1 < oldest_in_memory:
+                spilled = [e for e in self._read_spilled() if e["seq"] < oldest_in_memory]
+                source = spilled + list(self._entries)
+            return [e for e in source if e["seq"] > after_seq][:limit]
+
+        upper = before_seq if before_seq is not None else self._next_seq
+        selected = [e for e in self._entries if e["seq"] < upper]
+        if len(selected) < limit and oldest_in_memory > self._first_seq and upper > self._first_seq:
+            spilled = [e for e in self._read_spilled() if e["seq"] < min(upper, oldest_in_memory)]
+            selected = spilled + selected
+        return selected[-limit:] if limit else []
+
+    async def wait_for(self, after_seq: int, timeout: float) -> bool:
+        """Wait until an entry newer than after_seq exists. Returns True if so."""
+        if self.latest_seq > after_seq:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.latest_seq > after_seq
+
+
+class ActivityLogStore(MutableMapping):
+    """``project_id → ActivityLog`` mapping with a shared cap and spill location.
+
+    Assigning a list (``store[pid] = [...]``) resets that workflow's log
+    with the given entries, which keeps existing call sites working.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 spill_path_for: Optional[Callable[[str], Optional[Path]]] = None):
+        self.max_entries = max_entries
+        self.spill_path_for = spill_path_for
+        self._logs: Dict[str, ActivityLog] = {}
+
+    def _new_log(self, project_id: str) -> ActivityLog:
+        spill_path = self.spill_path_for(project_id) if self.spill_path_for else None
+        return ActivityLog(self.max_entries, spill_path)
+
+    def load(self, project_id: str) -> ActivityLog:
+        """The live log, or a read-only view of a finished workflow's spill file.
+
+        Unlike ``log_for`` this does not keep a finished workflow in memory.
+        """
+        log = self._logs.get(project_id)
+        return log if log is not None else self._new_log(project_id)
+
+    def retire(self, project_id: str):
+        """Flush a finished workflow's log to its spill file and drop it from memory.
+
+        Later entries (e.g. after a resume) start a new ring that continues
+        the numbering from the file.
+        """
+        log = self._logs.pop(project_id, None)
+        if log is not None:
+            log.flush()
+            log.notify()  # streams waiting on it switch to the spill file
+
+    def flush_all(self) -> int:
+        """Flush every in-memory log (on shutdown). Returns the entries written."""
+        return sum(log.flush() for log in list(self._logs.values()))
+
+    def log_for(self, project_id: str) -> ActivityLog:
+        log = self._logs.get(project_id)
+        if log is None:
+            log = self._logs[project_id] = self._new_log(project_id)
+        return log
+
+    def append(self, project_id: str, entry: dict) -> dict:
+        return self.log_for(project_id).append(entry)
+
+    def __getitem__(self, project_id: str) -> ActivityLog:
+        return self._logs[project_id]
+
+    def __setitem__(self, project_id: str, entries: Iterable[dict]):
+        log = self._new_log(project_id)
+        previous = self._logs.get(project_id)
+        if previous is not None:
+            # Keep seqs monotonic so pagination cursors and SSE clients stay valid
+            log._next_seq = max(log._next_seq, previous._next_seq)
+        log.extend(entries)
+        self._logs[project_id] = log
+
+    def __delitem__(self, project_id: str):
+        del self._logs[project_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._logs))
+
+    def __len__(self) -> int:
+        return len(self._logs)
@@ -3,6 +3,8 @@
 from typing import List, Dict
 from ..model_config import create_llm_for_role
 from ..utils.json_repair import repair_json
+from ..utils.reference_index import ReferenceIndex
+from ..utils.source_retriever import SourceRetriever
 from ..models.collaborative_research import (
     ResearchTask,
     ResearchContribution,
@@ -190,27 +192,19 @@ Return your research in JSON format:
         generated: List[Reference],
         verified: List[Reference],
     ) -> List[Reference]:
-        """Keep only references that match a verified source by title similarity.
+        """Keep only references that match a verified source.
 
-        Uses normalized title comparison: lowercase, stripped of punctuation,
-        checking if one is a substring of the other (handles truncation).
+        Matches by DOI or arXiv ID, else by title: exact, near-identical, or
+        one contained in the other (LLMs often truncate titles). Missing DOI,
+        year or authors are filled in from the matched verified source.
         """
-        import re as _re
-
-        def _normalize(title: str) -> str:
-            return _re.sub(r'[^a-z0-9 ]', '', title.lower()).strip()
-
-        verified_titles = [_normalize(r.title) for r in verified]
+        index = ReferenceIndex(verified)
         kept = []
         for ref in generated:
-            norm = _normalize(ref.title)
-            if not norm:
-                continue
-            for vt in verified_titles:
-                # Substring match in either direction (handles truncation)
-                if norm in vt or vt in norm:
-                    kept.append(ref)
-                    break
+            match = index.find(ref, containment=True)
+            if match is not None:
+                SourceRetriever.fill_missing_metadata(ref, match)
+                kept.append(ref)
         return kept
 
     async def provide_plan_feedback(
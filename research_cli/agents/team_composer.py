@@ -4,6 +4,11 @@ from typing import List
 
 from ..model_config import create_llm_for_role, get_role_config
 from ..models.expert import ExpertProposal
+from ..request_dedup import normalize_topic
+from ..utils.memo import memo_cache, memo_key
+
+# Raw "experts" lists from the LLM, keyed by normalized topic and parameters
+_proposal_cache = memo_cache("team_proposals", ttl=24 * 3600, max_entries=256)
 
 
 class TeamComposerAgent:
@@ -29,36 +34,45 @@ class TeamComposerAgent:
         num_experts: int = 3,
         additional_context: str = "",
         secondary_category: str = "",
+        fresh: bool = False,
     ) -> List[ExpertProposal]:
         """Analyze topic and propose optimal expert team.
 
+        Proposals are memoized by normalized topic and parameters, so UI
+        retries and repeated topics skip the LLM call.
+
         Args:
             topic: Research topic to analyze
             num_experts: Number of expert reviewers to propose
             additional_context: Optional additional context about requirements
             secondary_category: Optional secondary domain description for interdisciplinary topics
+            fresh: Ignore a cached proposal and ask the LLM again
 
         Returns:
             List of ExpertProposal objects
         """
-        prompt = self._build_proposal_prompt(topic, num_experts, additional_context, secondary_category)
-        system_prompt = self._get_system_prompt()
-
-        response = await self.llm.generate(
-            prompt=prompt,
-            system=system_prompt,
-            temperature=0.7,  # Allow creative team composition
-            max_tokens=2048,
-            json_mode=True
-        )
+        cache_key = memo_key(normalize_topic(topic), num_experts, additional_context, secondary_category, self.model)
+        experts = None if fresh else _proposal_cache.get(cache_key)
+        if experts is None:
+            prompt = self._build_proposal_prompt(topic, num_experts, additional_context, secondary_category)
+            system_prompt = self._get_system_prompt()
+
+            response = await self.llm.generate(
+                prompt=prompt,
+                system=system_prompt,
+                temperature=0.7,  # Allow creative team composition
+                max_tokens=2048,
+                json_mode=True
+            )
 
-        # Parse JSON response
-        from ..utils.json_repair import repair_json
-        proposals_data = repair_json(response.content)
+            # Parse JSON response
+            from ..utils.json_repair import repair_json
+            experts = repair_json(response.content)["experts"]
+            _proposal_cache.put(cache_key, experts)
 
         # Convert to ExpertProposal objects
         proposals = []
-        for p in proposals_data["experts"]:
+        for p in experts:
             # Use configured model if suggestion is missing or generic
             model = p.get("suggested_model", self.reviewer_model)
 
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from typing import Optional, List, Dict
-from ..llm.base import LLMResponse
+from ..llm.base import LLMResponse, discard_shared_client
 from ..model_config import create_llm_for_role, create_fallback_llm_for_role
 from ..models.section import WritingContext, SectionOutput
 from ..models.collaborative_research import Reference
@@ -136,11 +136,10 @@ class WriterAgent:
             fallback_name = self._fallback_llm.model if self._fallback_llm else "same model"
             logger.warning(f"Primary LLM ({self.model}) failed: {reason} — falling back to {fallback_name}")
 
-            # Force-close the primary client to release proxy connections
-            try:
-                await self.llm.client.close()
-            except Exception:
-                pass
+            # The timed-out request's connection was dropped on cancellation;
+            # retire the (shared) client so future calls start on a new pool
+            # without closing it under other jobs' in-flight calls
+            discard_shared_client(self.llm.client)
             # Recreate primary client for future calls
             self.llm = create_llm_for_role(self.role)
 
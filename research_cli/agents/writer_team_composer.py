@@ -2,7 +2,11 @@
 
 from typing import Dict
 from ..model_config import create_llm_for_role
+from ..request_dedup import normalize_topic
 from ..utils.json_repair import repair_json
+from ..utils.memo import memo_cache, memo_key
+
+_writer_team_cache = memo_cache("writer_teams", ttl=24 * 3600, max_entries=256)
 
 
 class WriterTeamComposerAgent:
@@ -28,9 +32,13 @@ class WriterTeamComposerAgent:
         num_coauthors: int = 2,
         secondary_major: str = None,
         secondary_subfield: str = None,
+        fresh: bool = False,
     ) -> Dict:
         """Propose writer team for research topic.
 
+        Proposals are memoized by normalized topic, fields and team size
+        (``fresh=True`` asks the LLM again).
+
         Args:
             topic: Research topic
             major_field: Major academic field
@@ -42,6 +50,12 @@ class WriterTeamComposerAgent:
         Returns:
             Dictionary with lead_author and coauthors proposals
         """
+        cache_key = memo_key(normalize_topic(topic), major_field, subfield, num_coauthors,
+                             secondary_major, secondary_subfield, self.model)
+        if not fresh:
+            cached = _writer_team_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         system_prompt = """You are an academic research advisor specializing in team composition.
 
@@ -128,6 +142,8 @@ Return JSON format:
 
         # Parse response
         team_proposal = repair_json(response.content)
+        if team_proposal.get("lead_author"):
+            _writer_team_cache.put(cache_key, team_proposal)
 
         return team_proposal
 
@@ -0,0 +1,155 @@
+"""Per-workflow cost and token budgets.
+
+A ``WorkflowBudget`` is charged live by ``PerformanceTracker`` as token usage
+is recorded. Once usage reaches ``warn_fraction`` of either limit the
+budget's policy fires once:
+
+- ``downgrade``:  the orchestrator moves remaining roles to the ``light`` tier
+- ``cap_rounds``: the current review round becomes the last one
+- ``stop``:       the run stops; its last checkpoint is kept for resume
+
+Reaching the limit itself always stops the run, whatever the policy. A stop
+cancels the job's cancellation token (so the API worker records the job as
+cancelled with resume available) and raises ``OperationCancelled``.
+
+The budget (limits, policy and spend so far) is saved with the workflow
+checkpoint; ``resumed_budget`` rebuilds it so a resumed run keeps counting
+against the same limits.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from .cancellation import OperationCancelled, current_token
+
+BUDGET_POLICIES = ("downgrade", "cap_rounds", "stop")
+DEFAULT_WARN_FRACTION = 0.8
+DOWNGRADE_TIER = "light"
+
+
+@dataclass
+class WorkflowBudget:
+    """Cost (USD) and/or token limits for one workflow run."""
+    max_cost_usd: Optional[float] = None
+    max_tokens: Optional[int] = None
+    policy: str = "downgrade"
+    warn_fraction: float = DEFAULT_WARN_FRACTION
+    spent_usd: float = 0.0
+    spent_tokens: int = 0
+    triggered: Optional[str] = None  # policy that has fired, if any
+    _listeners: List[Callable[[str], None]] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        if self.policy not in BUDGET_POLICIES:
+            raise ValueError(f"budget policy must be one of {', '.join(BUDGET_POLICIES)}")
+
+    @property
+    def limited(self) -> bool:
+        return self.max_cost_usd is not None or self.max_tokens is not None
+
+    def used_fraction(self) -> float:
+        """Largest fraction used across the configured limits."""
+        fractions = [0.0]
+        if self.max_cost_usd is not None:
+            fractions.append(self.spent_usd / self.max_cost_usd if self.max_cost_usd > 0 else float("inf"))
+        if self.max_tokens is not None:
+            fractions.append(self.spent_tokens / self.max_tokens if self.max_tokens > 0 else float("inf"))
+        return max(fractions)
+
+    def on_trigger(self, listener: Callable[[str], None]):
+        """Call ``listener(policy)`` when the policy fires (immediately if it already has)."""
+        if self.triggered:
+            listener(self.triggered)
+        else:
+            self._listeners.append(listener)
+
+    def charge(self, cost_usd: float, tokens: int):
+        """Add usage; fire the policy near the limit and stop at it."""
+        self.spent_usd += cost_usd
+        self.spent_tokens += tokens
+        if not self.limited:
+            return
+        used = self.used_fraction()
+        if used >= 1.0:
+            self._stop("Budget exhausted")
+        if used >= self.warn_fraction and not self.triggered:
+            self.triggered = self.policy
+            if self.policy == "stop":
+                self._stop("Budget nearly exhausted")
+            for listener in self._listeners:
+                listener(self.policy)
+
+    def _stop(self, reason: str):
+        reason = f"{reason} ({self.describe()})"
+        token = current_token()
+        if token is not None:
+            token.cancel(reason)
+        raise OperationCancelled(reason)
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether a limit has been reached (a resumed run would stop at once)."""
+        return self.limited and self.used_fraction() >= 1.0
+
+    def describe(self) -> str:
+        parts = []
+        if self.max_cost_usd is not None:
+            parts.append(f"${self.spent_usd:.2f} of ${self.max_cost_usd:.2f}")
+        if self.max_tokens is not None:
+            parts.append(f"{self.spent_tokens:,} of {self.max_tokens:,} tokens")
+        return ", ".join(parts) or "unlimited"
+
+    def to_dict(self) -> dict:
+        return {
+            "max_cost_usd": self.max_cost_usd,
+            "max_tokens": self.max_tokens,
+            "policy": self.policy,
+            "spent_usd": round(self.spent_usd, 4),
+            "spent_tokens": self.spent_tokens,
+            "triggered": self.triggered,
+        }
+
+
+def effective_budget(
+    request_cost: Optional[float] = None,
+    request_tokens: Optional[int] = None,
+    key_cost: Optional[float] = None,
+    key_tokens: Optional[int] = None,
+    policy: Optional[str] = None,
+) -> Optional[WorkflowBudget]:
+    """Tightest of the request's and the API key's limits, or None if neither sets one."""
+    def tightest(*values):
+        values = [v for v in values if v is not None]
+        return min(values) if values else None
+
+    cost = tightest(request_cost, key_cost)
+    tokens = tightest(request_tokens, key_tokens)
+    if cost is None and tokens is None:
+        return None
+    return WorkflowBudget(max_cost_usd=cost, max_tokens=tokens, policy=policy or "downgrade")
+
+
+def resumed_budget(
+    saved: Optional[dict],
+    request_cost: Optional[float] = None,
+    request_tokens: Optional[int] = None,
+    key_cost: Optional[float] = None,
+    key_tokens: Optional[int] = None,
+) -> Optional[WorkflowBudget]:
+    """Budget for resuming a run from its checkpoint.
+
+    The saved limits apply unless the caller passes higher (or lower) ones;
+    the API key's current limits still cap them. Spend so far carries over,
+    and so does a policy that already fired unless the limits were changed.
+    """
+    saved = saved or {}
+    cost = request_cost if request_cost is not None else saved.get("max_cost_usd")
+    tokens = request_tokens if request_tokens is not None else saved.get("max_tokens")
+    budget = effective_budget(cost, tokens, key_cost, key_tokens, saved.get("policy"))
+    if budget is None:
+        return None
+    budget.spent_usd = saved.get("spent_usd") or 0.0
+    budget.spent_tokens = saved.get("spent_tokens") or 0
+    if (budget.max_cost_usd, budget.max_tokens) == (saved.get("max_cost_usd"), saved.get("max_tokens")):
+        budget.triggered = saved.get("triggered")
+    return budget
@@ -0,0 +1,88 @@
+"""Cooperative cancellation for long-running workflows.
+
+A ``CancellationToken`` is created per job by the API server worker and made
+current for the job's task via a context variable, so orchestrators, agents
+and ``retry_llm_call`` can see it without every signature carrying it.
+
+Cancelling a token runs its callbacks; the worker registers one that
+cancels the job's asyncio task, which aborts in-flight LLM requests and
+streams at their next await. Code between awaits (stage boundaries, retry
+loops) calls ``check_cancelled()`` to stop promptly and cleanly.
+
+``OperationCancelled`` subclasses ``asyncio.CancelledError`` so the many
+``except Exception`` fallbacks in the agents never swallow it.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+
+class OperationCancelled(asyncio.CancelledError):
+    """Raised by ``check_cancelled`` once the current job's token is cancelled."""
+
+    def __init__(self, reason: str = "cancelled"):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class CancellationToken:
+    """One-shot cancellation flag with callbacks."""
+
+    def __init__(self):
+        self._reason: Optional[str] = None
+        self._callbacks: List[Callable[[str], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._reason is not None
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel the token. Returns False if it was already cancelled."""
+        if self._reason is not None:
+            return False
+        self._reason = reason
+        for callback in self._callbacks:
+            callback(reason)
+        return True
+
+    def add_callback(self, callback: Callable[[str], None]):
+        """Call ``callback(reason)`` on cancel (immediately if already cancelled)."""
+        if self._reason is not None:
+            callback(self._reason)
+        else:
+            self._callbacks.append(callback)
+
+    def raise_if_cancelled(self):
+        if self._reason is not None:
+            raise OperationCancelled(self._reason)
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("cancellation_token", default=None)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Token of the job running in this context, if any."""
+    return _current_token.get()
+
+
+def check_cancelled():
+    """Raise ``OperationCancelled`` if the current job has been cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextmanager
+def use_token(token: Optional[CancellationToken]):
+    """Make ``token`` current for the enclosed code (and tasks it creates)."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
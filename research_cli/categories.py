@@ -410,12 +410,21 @@ async def suggest_category_llm(topic: str) -> dict:
     """Classify a research topic into an academic category using LLM.
 
     Works for any language — the LLM translates and understands the topic.
-    Falls back to keyword matching if the LLM call fails.
+    Falls back to keyword matching if the LLM call fails. Successful LLM
+    classifications are memoized by normalized topic.
     """
     import json as _json
     import logging
+    from .request_dedup import normalize_topic
+    from .utils.memo import memo_cache, memo_key
     logger = logging.getLogger(__name__)
 
+    cache = memo_cache("topic_categories", ttl=7 * 24 * 3600, max_entries=1024)
+    cache_key = memo_key(normalize_topic(topic))
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         from .model_config import create_llm_for_role
         llm = create_llm_for_role("categorizer")
@@ -448,6 +457,7 @@ Example: social_sciences/anthropology"""
                 major = parts[0].strip()
                 subfield = parts[1].strip()
                 if major in ACADEMIC_CATEGORIES and subfield in ACADEMIC_CATEGORIES[major]["subfields"]:
+                    cache.put(cache_key, {"major": major, "subfield": subfield})
                     return {"major": major, "subfield": subfield}
 
         logger.warning(f"LLM returned unparseable category '{content}', falling back to keywords")
@@ -1019,5 +1019,112 @@ async def _run_backfill_titles(dry_run: bool, results_dir: str, project_ids: tup
     return 0
 
 
+
+def _load_batch_topics(path: Path) -> List[dict]:
+    """Read batch items from JSONL: one object with a ``topic`` (or a bare string) per line."""
+    import json
+
+    items = []
+    for line_no, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise click.ClickException(f"{path}:{line_no}: invalid JSON ({e.msg})")
+        if isinstance(item, str):
+            item = {"topic": item}
+        if not isinstance(item, dict) or not item.get("topic"):
+            raise click.ClickException(f"{path}:{line_no}: each line needs a \"topic\"")
+        items.append(item)
+    return items
+
+
+def _batch_summary_table(batch: dict) -> Table:
+    table = Table(title=f"Batch {batch['batch_id']}")
+    table.add_column("Topic", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Score", style="yellow", justify="right")
+    table.add_column("Passed", justify="center")
+    table.add_column("Cost", justify="right")
+    table.add_column("Project", style="dim")
+    for item in batch["items"]:
+        score = item.get("final_score")
+        cost = item.get("estimated_cost")
+        passed = item.get("passed")
+        table.add_row(
+            (item.get("topic") or "")[:60],
+            item.get("status") or "?",
+            f"{score:.1f}" if isinstance(score, (int, float)) else "-",
+            "-" if passed is None else ("✓" if passed else "✗"),
+            f"${cost:.2f}" if isinstance(cost, (int, float)) else "-",
+            item.get("project_id") or "",
+        )
+    return table
+
+
+async def _run_batch(api_url: str, api_key: str, body: dict, poll_interval: float, wait: bool):
+    import aiohttp
+
+    headers = {"X-API-Key": api_key} if api_key else {}
+    async with aiohttp.ClientSession(headers=headers) as session:
+        async with session.post(f"{api_url}/api/workflows/batch", json=body) as resp:
+            data = await resp.json(content_type=None)
+            if resp.status != 200:
+                raise click.ClickException(f"Batch rejected ({resp.status}): {data.get('detail', data)}")
+
+        console.print(
+            f"[green]✓[/green] Batch {data['batch_id']}: {data['queued']} queued, "
+            f"estimated ${data['estimated_cost']:.2f}"
+        )
+        for item in data["items"]:
+            if item.get("status") in ("skipped", "duplicate") or item.get("duplicate"):
+                console.print(f"  [yellow]~[/yellow] {item['topic'][:60]}: {item.get('duplicate') or item.get('reason') or item['status']}")
+        if not wait:
+            return data
+
+        batch_url = f"{api_url}/api/workflows/batch/{data['batch_id']}"
+        with Progress(SpinnerColumn(), TextColumn("{task.description}"), console=console) as progress:
+            task = progress.add_task("Waiting for batch...", total=None)
+            while True:
+                async with session.get(batch_url) as resp:
+                    batch = await resp.json(content_type=None)
+                    if resp.status != 200:
+                        raise click.ClickException(f"Batch status failed ({resp.status}): {batch.get('detail', batch)}")
+                finished = sum(1 for item in batch["items"] if item["status"] in ("completed", "failed", "rejected", "cancelled", "interrupted"))
+                progress.update(task, description=f"{finished}/{len(batch['items'])} workflows finished")
+                if batch["done"]:
+                    break
+                await asyncio.sleep(poll_interval)
+
+        console.print(_batch_summary_table(batch))
+        console.print(f"[bold]Total cost:[/bold] ${batch['total_cost']:.2f}")
+        return batch
+
+
+@cli.command()
+@click.argument("topics_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--api-url", envvar="RESEARCH_API_URL", default="http://localhost:8000", help="API server URL")
+@click.option("--api-key", envvar="RESEARCH_API_KEY", default="", help="API key (or RESEARCH_API_KEY)")
+@click.option("--budget", type=float, default=None, help="Shared estimated-cost budget in USD; items past it are skipped")
+@click.option("--max-concurrency", type=int, default=None, help="Max workflows of this batch queued/running at once")
+@click.option("--on-duplicate", type=click.Choice(["reuse", "attach", "new"]), default="new", help="How to treat topics identical to your existing runs")
+@click.option("--poll-interval", type=float, default=30.0, help="Seconds between status checks")
+@click.option("--wait/--no-wait", default=True, help="Wait for the batch to finish and print a summary")
+def batch(topics_file: Path, api_url: str, api_key: str, budget: Optional[float], max_concurrency: Optional[int],
+          on_duplicate: str, poll_interval: float, wait: bool):
+    """Submit a JSONL file of topics to the API server as one batch.
+
+    Each line is a JSON object with a "topic" and optionally any
+    start-workflow field (article_length, research_type, max_rounds, ...).
+    """
+    items = _load_batch_topics(topics_file)
+    if not items:
+        raise click.ClickException(f"No topics in {topics_file}")
+    body = {"items": items, "budget_usd": budget, "max_concurrency": max_concurrency, "on_duplicate": on_duplicate}
+    asyncio.run(_run_batch(api_url.rstrip("/"), api_key, body, poll_interval, wait))
+
+
 if __name__ == "__main__":
     cli()
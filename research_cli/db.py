@@ -6,7 +6,9 @@ import os
 import secrets
 import sqlite3
 import threading
-from datetime import datetime, timezone
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -132,9 +134,54 @@ def init_db():
         CREATE INDEX IF NOT EXISTS idx_submissions_status ON submissions(status);
         CREATE INDEX IF NOT EXISTS idx_submission_rounds_sub ON submission_rounds(submission_id);
         CREATE INDEX IF NOT EXISTS idx_job_queue_status ON job_queue(status);
+
+        -- Rolling usage counters maintained by record_usage, so quota checks
+        -- read one row instead of counting key_usage history.
+        -- bucket: 'day:YYYY-MM-DD' (all endpoints) or 'endpoint:<path>' (all time)
+        CREATE TABLE IF NOT EXISTS key_usage_counters (
+            api_key TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (api_key, bucket)
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_key_usage_key_endpoint ON key_usage(api_key, endpoint);
+        CREATE INDEX IF NOT EXISTS idx_job_queue_status_created ON job_queue(status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_job_queue_project_type ON job_queue(project_id, job_type, created_at);
+        CREATE INDEX IF NOT EXISTS idx_workflow_ownership_key ON workflow_ownership(api_key, created_at);
+        CREATE INDEX IF NOT EXISTS idx_submissions_key_created ON submissions(api_key, created_at);
+        CREATE INDEX IF NOT EXISTS idx_submissions_status_deadline ON submissions(status, revision_deadline);
+
+        -- Generation counters other processes poll to drop stale in-memory caches
+        CREATE TABLE IF NOT EXISTS cache_epochs (
+            name TEXT PRIMARY KEY,
+            epoch INTEGER NOT NULL DEFAULT 0
+        );
     """)
     conn.commit()
 
+    # Migration: build usage counters from existing key_usage history. The
+    # check and both inserts share one write transaction, so processes
+    # starting together backfill once and a crash leaves nothing half-done.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        has_counters = conn.execute("SELECT 1 FROM key_usage_counters LIMIT 1").fetchone()
+        has_usage = conn.execute("SELECT 1 FROM key_usage LIMIT 1").fetchone()
+        if has_usage and not has_counters:
+            conn.execute(
+                """INSERT OR IGNORE INTO key_usage_counters (api_key, bucket, count)
+                   SELECT api_key, 'day:' || substr(timestamp, 1, 10), COUNT(*) FROM key_usage GROUP BY 1, 2"""
+            )
+            conn.execute(
+                """INSERT OR IGNORE INTO key_usage_counters (api_key, bucket, count)
+                   SELECT api_key, 'endpoint:' || endpoint, COUNT(*) FROM key_usage GROUP BY 1, 2"""
+            )
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    prune_usage_counters()
+
     # Migration: add total_quota column
     try:
         conn.execute("ALTER TABLE api_keys ADD COLUMN total_quota INTEGER DEFAULT 3")
@@ -142,6 +189,21 @@ def init_db():
     except sqlite3.OperationalError:
         pass  # Column already exists
 
+    # Migration: add per-workflow budget columns
+    for column in ("job_budget_usd REAL", "job_token_budget INTEGER"):
+        try:
+            conn.execute(f"ALTER TABLE api_keys ADD COLUMN {column}")
+            conn.commit()
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+
+    # Migration: add fair-share scheduling weight
+    try:
+        conn.execute("ALTER TABLE api_keys ADD COLUMN queue_weight REAL DEFAULT 1.0")
+        conn.commit()
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
     # Migration: add password_hash column
     try:
         conn.execute("ALTER TABLE researchers ADD COLUMN password_hash TEXT")
@@ -149,6 +211,42 @@ def init_db():
     except sqlite3.OperationalError:
         pass  # Column already exists
 
+    # Migration: add scheduling and dedup columns to job_queue
+    for column in ("api_key TEXT", "priority INTEGER DEFAULT 0", "fingerprint TEXT", "batch_id TEXT"):
+        try:
+            conn.execute(f"ALTER TABLE job_queue ADD COLUMN {column}")
+            conn.commit()
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_queue_fingerprint ON job_queue(fingerprint, created_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_queue_batch ON job_queue(batch_id)")
+    conn.commit()
+    _backfill_job_fingerprints(conn)
+
+
+def _backfill_job_fingerprints(conn: sqlite3.Connection):
+    """Fingerprint workflow jobs queued before fingerprints were recorded."""
+    from .request_dedup import workflow_fingerprint
+
+    rows = conn.execute(
+        "SELECT id, payload_json FROM job_queue WHERE job_type = 'workflow' AND fingerprint IS NULL"
+    ).fetchall()
+    updates = []
+    for row in rows:
+        try:
+            payload = json.loads(row["payload_json"])
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if not payload.get("topic"):
+            continue
+        updates.append((workflow_fingerprint(
+            payload["topic"], payload.get("article_length"), payload.get("audience_level"),
+            payload.get("research_type"), payload.get("category"), payload.get("workflow_mode"),
+        ), row["id"]))
+    if updates:
+        conn.executemany("UPDATE job_queue SET fingerprint = ? WHERE id = ?", updates)
+        conn.commit()
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -214,7 +312,9 @@ def create_researcher(
                VALUES (?, ?, ?, ?, 10, 3, FALSE)""",
             (api_key, researcher_id, f"{name.strip()} - auto", now),
         )
+        _bump_epoch(conn, "api_keys")
         conn.commit()
+        invalidate_api_key_cache(signal=False)
     except sqlite3.IntegrityError as e:
         conn.rollback()
         if "UNIQUE constraint" in str(e) and "email" in str(e):
@@ -341,7 +441,9 @@ def approve_application(application_id: str, reviewed_by: str = "admin", admin_n
            VALUES (?, ?, ?, ?, 10, 3, FALSE)""",
         (api_key, app["researcher_id"], f"{app['name']} - auto", now),
     )
+    _bump_epoch(conn, "api_keys")
     conn.commit()
+    invalidate_api_key_cache(signal=False)
 
     return {"api_key": api_key, "researcher_id": app["researcher_id"]}
 
@@ -384,11 +486,85 @@ def get_api_key(key: str) -> Optional[dict]:
     return _row_to_dict(row)
 
 
+# In-process cache of key lookups so authentication is a dict lookup.
+# Key mutations bump the 'api_keys' epoch in the same transaction; every
+# process compares it at most once per AUTH_EPOCH_CHECK_INTERVAL and drops
+# its cache when it moved, so revocations propagate across workers.
+AUTH_CACHE_TTL = 60.0  # seconds
+AUTH_EPOCH_CHECK_INTERVAL = 1.0  # seconds
+AUTH_CACHE_MAX_ENTRIES = 10000
+
+_auth_cache_lock = threading.Lock()
+_auth_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key → (expires_at, row or None)
+_auth_epoch_seen: Optional[int] = None
+_auth_epoch_checked_at = float("-inf")
+
+
+def _read_epoch(conn: sqlite3.Connection, name: str) -> int:
+    row = conn.execute("SELECT epoch FROM cache_epochs WHERE name = ?", (name,)).fetchone()
+    return row["epoch"] if row else 0
+
+
+def _bump_epoch(conn: sqlite3.Connection, name: str):
+    """Advance a cache epoch. Call inside the mutating transaction, before commit."""
+    conn.execute(
+        """INSERT INTO cache_epochs (name, epoch) VALUES (?, 1)
+           ON CONFLICT(name) DO UPDATE SET epoch = epoch + 1""",
+        (name,),
+    )
+
+
+def _sync_auth_epoch():
+    """Drop the auth cache if api_keys changed in this or another process."""
+    global _auth_epoch_seen, _auth_epoch_checked_at
+    now = time.monotonic()
+    if now - _auth_epoch_checked_at < AUTH_EPOCH_CHECK_INTERVAL:
+        return
+    _auth_epoch_checked_at = now
+    epoch = _read_epoch(get_connection(), "api_keys")
+    if epoch != _auth_epoch_seen:
+        with _auth_cache_lock:
+            _auth_cache.clear()
+        _auth_epoch_seen = epoch
+
+
+def invalidate_api_key_cache(signal: bool = True):
+    """Drop cached key lookups; with signal=True other processes drop theirs too."""
+    global _auth_epoch_checked_at
+    if signal:
+        conn = get_connection()
+        _bump_epoch(conn, "api_keys")
+        conn.commit()
+    with _auth_cache_lock:
+        _auth_cache.clear()
+    _auth_epoch_checked_at = float("-inf")
+
+
+def get_api_key_cached(key: str) -> Optional[dict]:
+    """Like get_api_key, but served from a TTL cache (misses are cached too)."""
+    _sync_auth_epoch()
+    now = time.monotonic()
+    with _auth_cache_lock:
+        cached = _auth_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _auth_cache.move_to_end(key)
+            return dict(cached[1]) if cached[1] is not None else None
+
+    row = get_api_key(key)
+    with _auth_cache_lock:
+        _auth_cache[key] = (now + AUTH_CACHE_TTL, row)
+        _auth_cache.move_to_end(key)
+        while len(_auth_cache) > AUTH_CACHE_MAX_ENTRIES:
+            _auth_cache.popitem(last=False)
+    return dict(row) if row is not None else None
+
+
 def list_api_keys() -> list:
     """List all API keys (for admin)."""
     conn = get_connection()
     rows = conn.execute("""
         SELECT k.key, k.label, k.created_at, k.revoked_at, k.daily_quota, k.total_quota, k.is_admin, k.researcher_id,
+               k.job_budget_usd, k.job_token_budget,
                r.name, r.email
         FROM api_keys k
         LEFT JOIN researchers r ON k.researcher_id = r.id
@@ -406,7 +582,9 @@ def revoke_api_key(key_prefix: str, reason: str = "") -> int:
            WHERE key LIKE ? AND revoked_at IS NULL""",
         (now, reason, key_prefix + "%"),
     )
+    _bump_epoch(conn, "api_keys")
     conn.commit()
+    invalidate_api_key_cache(signal=False)
     return cursor.rowcount
 
 
@@ -417,7 +595,35 @@ def update_key_quota(key_prefix: str, total_quota: int) -> int:
         "UPDATE api_keys SET total_quota=? WHERE key LIKE ? AND revoked_at IS NULL",
         (total_quota, key_prefix + "%"),
     )
+    _bump_epoch(conn, "api_keys")
+    conn.commit()
+    invalidate_api_key_cache(signal=False)
+    return cursor.rowcount
+
+
+def update_key_budget(key_prefix: str, job_budget_usd: Optional[float], job_token_budget: Optional[int]) -> int:
+    """Set per-workflow cost/token limits for keys matching prefix (None = unlimited)."""
+    conn = get_connection()
+    cursor = conn.execute(
+        "UPDATE api_keys SET job_budget_usd=?, job_token_budget=? WHERE key LIKE ? AND revoked_at IS NULL",
+        (job_budget_usd, job_token_budget, key_prefix + "%"),
+    )
+    _bump_epoch(conn, "api_keys")
+    conn.commit()
+    invalidate_api_key_cache(signal=False)
+    return cursor.rowcount
+
+
+def update_key_queue_weight(key_prefix: str, queue_weight: float) -> int:
+    """Set the job-queue fair-share weight for keys matching prefix (1.0 = equal share)."""
+    conn = get_connection()
+    cursor = conn.execute(
+        "UPDATE api_keys SET queue_weight=? WHERE key LIKE ? AND revoked_at IS NULL",
+        (queue_weight, key_prefix + "%"),
+    )
+    _bump_epoch(conn, "api_keys")
     conn.commit()
+    invalidate_api_key_cache(signal=False)
     return cursor.rowcount
 
 
@@ -431,7 +637,9 @@ def create_legacy_key(key: str, label: str = "", is_admin: bool = False):
                VALUES (?, NULL, ?, ?, 10, ?)""",
             (key, label, now, is_admin),
         )
+        _bump_epoch(conn, "api_keys")
         conn.commit()
+        invalidate_api_key_cache(signal=False)
     except sqlite3.IntegrityError:
         pass
 
@@ -446,46 +654,134 @@ def create_api_key_direct(label: str = "", daily_quota: int = 10) -> dict:
            VALUES (?, NULL, ?, ?, ?, FALSE)""",
         (key, label, now, daily_quota),
     )
+    _bump_epoch(conn, "api_keys")
     conn.commit()
+    invalidate_api_key_cache(signal=False)
     return {"key": key, "label": label, "created_at": now}
 
 
 # --- Quota ---
 
-def record_usage(api_key: str, endpoint: str, project_id: str = None):
-    """Record an API key usage event."""
+# Usage events recorded with defer=True are buffered and written in batches.
+# The buffer is per process: quota reads add this process's pending events
+# only, and events still buffered when a process crashes are lost (a clean
+# shutdown flushes them).
+USAGE_BATCH_SIZE = 50
+USAGE_FLUSH_INTERVAL = 2.0  # seconds
+USAGE_COUNTER_KEEP_DAYS = 90
+
+_usage_lock = threading.Lock()
+_usage_buffer: list = []  # (api_key, endpoint, timestamp, project_id)
+_usage_last_flush = time.monotonic()
+
+
+def _write_usage(events: list):
+    """Insert usage events and bump their counters in one transaction."""
+    counters = Counter()
+    for api_key, endpoint, timestamp, _ in events:
+        counters[(api_key, f"day:{timestamp[:10]}")] += 1
+        counters[(api_key, f"endpoint:{endpoint}")] += 1
+
     conn = get_connection()
-    conn.execute(
-        "INSERT INTO key_usage (api_key, endpoint, timestamp, project_id) VALUES (?, ?, ?, ?)",
-        (api_key, endpoint, _now(), project_id),
-    )
-    conn.commit()
+    try:
+        conn.executemany(
+            "INSERT INTO key_usage (api_key, endpoint, timestamp, project_id) VALUES (?, ?, ?, ?)",
+            events,
+        )
+        conn.executemany(
+            """INSERT INTO key_usage_counters (api_key, bucket, count) VALUES (?, ?, ?)
+               ON CONFLICT(api_key, bucket) DO UPDATE SET count = count + excluded.count""",
+            [(api_key, bucket, n) for (api_key, bucket), n in counters.items()],
+        )
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
 
 
-def get_daily_usage(api_key: str) -> int:
-    """Count today's usage for a key."""
+def record_usage(api_key: str, endpoint: str, project_id: str = None, defer: bool = False):
+    """Record an API key usage event.
+
+    With defer=True the event is buffered and written with others once
+    USAGE_BATCH_SIZE events are pending or USAGE_FLUSH_INTERVAL has passed.
+    Deferred events live only in this process until then: other processes
+    do not count them against the quota, and a crash loses them.
+    """
+    global _usage_last_flush
+    event = (api_key, endpoint, _now(), project_id)
+    if not defer:
+        _write_usage([event])
+        return
+    with _usage_lock:
+        _usage_buffer.append(event)
+        due = (len(_usage_buffer) >= USAGE_BATCH_SIZE
+               or time.monotonic() - _usage_last_flush >= USAGE_FLUSH_INTERVAL)
+    if due:
+        flush_usage()
+
+
+def flush_usage() -> int:
+    """Write all buffered usage events. Returns the number written."""
+    global _usage_last_flush
+    with _usage_lock:
+        events = list(_usage_buffer)
+        _usage_buffer.clear()
+        _usage_last_flush = time.monotonic()
+    if not events:
+        return 0
+    try:
+        _write_usage(events)
+    except sqlite3.Error:
+        with _usage_lock:
+            _usage_buffer[:0] = events  # keep them for the next flush
+        raise
+    return len(events)
+
+
+def _pending_usage(api_key: str, endpoint: str = None, since: str = None) -> int:
+    with _usage_lock:
+        return sum(
+            1 for key, ep, ts, _ in _usage_buffer
+            if key == api_key and (endpoint is None or ep == endpoint) and (since is None or ts >= since)
+        )
+
+
+def _usage_counter(api_key: str, bucket: str) -> int:
     conn = get_connection()
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     row = conn.execute(
-        "SELECT COUNT(*) as cnt FROM key_usage WHERE api_key=? AND timestamp >= ?",
-        (api_key, today),
+        "SELECT count FROM key_usage_counters WHERE api_key=? AND bucket=?",
+        (api_key, bucket),
     ).fetchone()
-    return row["cnt"] if row else 0
+    return row["count"] if row else 0
+
+
+def get_daily_usage(api_key: str) -> int:
+    """Count today's usage for a key."""
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return _usage_counter(api_key, f"day:{today}") + _pending_usage(api_key, since=today)
 
 
 def get_total_usage(api_key: str) -> int:
     """Count total workflow usage (all time) for a key."""
+    endpoint = "/api/start-workflow"
+    return _usage_counter(api_key, f"endpoint:{endpoint}") + _pending_usage(api_key, endpoint=endpoint)
+
+
+def prune_usage_counters(keep_days: int = USAGE_COUNTER_KEEP_DAYS) -> int:
+    """Drop daily counter rows older than keep_days. Returns rows deleted."""
     conn = get_connection()
-    row = conn.execute(
-        "SELECT COUNT(*) as cnt FROM key_usage WHERE api_key=? AND endpoint='/api/start-workflow'",
-        (api_key,),
-    ).fetchone()
-    return row["cnt"] if row else 0
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=keep_days)).strftime("%Y-%m-%d")
+    cursor = conn.execute(
+        "DELETE FROM key_usage_counters WHERE bucket LIKE 'day:%' AND bucket < ?",
+        (f"day:{cutoff}",),
+    )
+    conn.commit()
+    return cursor.rowcount
 
 
 def check_quota(api_key: str) -> dict:
     """Check if a key has remaining total quota. Returns {allowed, used, limit}."""
-    key_info = get_api_key(api_key)
+    key_info = get_api_key_cached(api_key)
     if not key_info:
         return {"allowed": False, "used": 0, "limit": 0, "reason": "Invalid key"}
     total_limit = key_info.get("total_quota") or 3
@@ -743,18 +1039,51 @@ def expire_overdue_submissions() -> int:
 
 # --- Job Queue ---
 
-def enqueue_job(job_id: str, project_id: str, job_type: str, payload: dict):
-    """Persist a job to the DB queue."""
+def enqueue_job(job_id: str, project_id: str, job_type: str, payload: dict,
+                api_key: str = None, priority: int = 0, fingerprint: str = None,
+                batch_id: str = None):
+    """Persist a job to the DB queue.
+
+    api_key and priority are kept so recovered jobs keep their fair-share
+    owner and priority after a restart. fingerprint identifies identical
+    workflow requests (see research_cli.request_dedup); batch_id groups jobs
+    submitted together through the batch API.
+    """
     conn = get_connection()
     now = _now()
     conn.execute(
-        """INSERT INTO job_queue (id, project_id, job_type, payload_json, status, created_at)
-           VALUES (?, ?, ?, ?, 'queued', ?)""",
-        (job_id, project_id, job_type, json.dumps(payload), now),
+        """INSERT INTO job_queue (id, project_id, job_type, payload_json, status, created_at, api_key, priority,
+                                  fingerprint, batch_id)
+           VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, ?, ?)""",
+        (job_id, project_id, job_type, json.dumps(payload), now, api_key, priority, fingerprint, batch_id),
     )
     conn.commit()
 
 
+def find_jobs_by_fingerprint(fingerprint: str, since: str = None, api_key: str = None) -> list:
+    """Workflow jobs with this request fingerprint, newest first (optionally only one key's)."""
+    conn = get_connection()
+    query = """SELECT id, project_id, status, created_at, completed_at FROM job_queue
+               WHERE fingerprint = ? AND created_at >= ?"""
+    params = [fingerprint, since or ""]
+    if api_key is not None:
+        query += " AND api_key = ?"
+        params.append(api_key)
+    rows = conn.execute(query + " ORDER BY created_at DESC", params).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_batch_jobs(batch_id: str) -> list:
+    """Jobs submitted in one batch, in submission order."""
+    conn = get_connection()
+    rows = conn.execute(
+        """SELECT id, project_id, status, api_key, created_at, completed_at FROM job_queue
+           WHERE batch_id = ? ORDER BY created_at, rowid""",
+        (batch_id,),
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
 def mark_job_running(job_id: str):
     """Mark a queued job as running."""
     conn = get_connection()
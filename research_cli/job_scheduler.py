@@ -0,0 +1,319 @@
+"""Priority and fair-share scheduler for the API server job queue.
+
+Drop-in replacement for the FIFO ``asyncio.Queue`` the worker pool used to
+pull from. Jobs are routed into two lanes:
+
+- short: submission reviews and checkpoint resumes (minutes)
+- long:  full research workflows (tens of minutes)
+
+Within a lane, higher ``priority`` jobs always run first. Among jobs of the
+same priority, API keys are served with deficit round-robin (weighted by
+the key's ``queue_weight``) so one submitter queueing ten topics cannot
+starve everyone else. Workers declare which lanes they serve, which lets a
+reserved worker, kept in addition to the general pool, move short jobs
+while long workflows occupy every general worker.
+"""
+
+import asyncio
+import bisect
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+SHORT_LANE = "short"
+LONG_LANE = "long"
+LANES = (SHORT_LANE, LONG_LANE)
+
+SHORT_JOB_TYPES = {"submission_review", "resume"}
+
+# Fallback durations (seconds) used for start-time estimates
+DEFAULT_JOB_SECONDS = {
+    "submission_review": 240,
+    "resume": 900,
+    "workflow": 1500,
+    "workflow:collaborative": 2400,
+}
+
+
+def lane_for(job_type: str) -> str:
+    """Return the lane a job type is scheduled in."""
+    return SHORT_LANE if job_type in SHORT_JOB_TYPES else LONG_LANE
+
+
+def estimate_job_seconds(job_type: str, payload: Optional[dict] = None) -> float:
+    """Rough run-time estimate for a job, used only for queue ETAs."""
+    payload = payload or {}
+    if job_type == "workflow":
+        key = "workflow:collaborative" if payload.get("workflow_mode") == "collaborative" else "workflow"
+        seconds = DEFAULT_JOB_SECONDS[key] * max(1, payload.get("max_rounds", 3)) / 3
+        if payload.get("article_length") == "short":
+            seconds *= 0.6
+        return seconds
+    return DEFAULT_JOB_SECONDS.get(job_type, DEFAULT_JOB_SECONDS["workflow"])
+
+
+@dataclass
+class ScheduledJob:
+    """A queued unit of work plus the metadata used to schedule it."""
+    job_id: str
+    job_type: str
+    payload: dict
+    api_key: str = "anonymous"
+    priority: int = 0
+    estimated_seconds: float = 0.0
+    lane: str = LONG_LANE
+    seq: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+
+    @property
+    def project_id(self) -> str:
+        return self.payload.get("project_id", "?")
+
+    def sort_key(self) -> Tuple[int, int]:
+        return (-self.priority, self.seq)
+
+
+class _LaneState:
+    """Per-lane queues: one priority-ordered list per API key plus a DRR ring."""
+
+    def __init__(self):
+        self.queues: Dict[str, List[ScheduledJob]] = {}
+        self.ring: Deque[str] = deque()
+        self.deficit: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self.queues.values())
+
+    def copy(self) -> "_LaneState":
+        clone = _LaneState()
+        clone.queues = {k: list(q) for k, q in self.queues.items()}
+        clone.ring = deque(self.ring)
+        clone.deficit = dict(self.deficit)
+        return clone
+
+    def push(self, job: ScheduledJob):
+        queue = self.queues.get(job.api_key)
+        if queue is None:
+            queue = self.queues[job.api_key] = []
+            self.ring.append(job.api_key)
+        bisect.insort(queue, job, key=ScheduledJob.sort_key)
+
+    def pop(self, weights: Dict[str, float]) -> Optional[ScheduledJob]:
+        """Deficit round-robin over keys holding a job at the top priority."""
+        if not self.ring:
+            return None
+        top = max(self.queues[k][0].priority for k in self.ring)
+        while True:
+            key = self.ring[0]
+            queue = self.queues[key]
+            if queue[0].priority != top:
+                self.ring.rotate(-1)
+                continue
+            if self.deficit.get(key, 0.0) < 1:
+                self.deficit[key] = self.deficit.get(key, 0.0) + max(1.0, weights.get(key, 1.0))
+            job = queue.pop(0)
+            self.deficit[key] -= 1
+            if not queue:
+                del self.queues[key]
+                self.ring.popleft()
+                self.deficit.pop(key, None)
+            elif self.deficit[key] < 1:
+                self.ring.rotate(-1)
+            return job
+
+    def remove(self, job_id: str) -> Optional[ScheduledJob]:
+        for key, queue in self.queues.items():
+            for i, job in enumerate(queue):
+                if job.job_id == job_id:
+                    queue.pop(i)
+                    if not queue:
+                        del self.queues[key]
+                        self.ring.remove(key)
+                        self.deficit.pop(key, None)
+                    return job
+        return None
+
+
+class JobScheduler:
+    """Lane-aware, priority-ordered, fair-share job queue.
+
+    Keeps the ``put`` / ``get`` / ``qsize`` / ``task_done`` shape of
+    ``asyncio.Queue`` so the worker loop stays simple. Workers register the
+    lanes they serve; ``get`` tries those lanes in order.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None):
+        self._lanes: Dict[str, _LaneState] = {lane: _LaneState() for lane in LANES}
+        self._weights: Dict[str, float] = dict(weights or {})
+        self._workers: Dict[int, Tuple[str, ...]] = {}
+        self._running: Dict[str, Tuple[ScheduledJob, int, float]] = {}
+        self._seq = itertools.count()
+        self._cond = asyncio.Condition()
+
+    # --- Configuration ---
+
+    def register_worker(self, worker_id: int, lanes: Sequence[str]):
+        """Declare which lanes a worker pulls from, in preference order."""
+        self._workers[worker_id] = tuple(lanes)
+
+    def unregister_worker(self, worker_id: int):
+        self._workers.pop(worker_id, None)
+
+    def set_weight(self, api_key: str, weight: float):
+        """Give an API key a larger fair-share quantum (default 1.0)."""
+        self._weights[api_key] = weight
+
+    # --- Queue interface ---
+
+    async def put(
+        self,
+        payload: dict,
+        *,
+        job_id: str,
+        job_type: str,
+        api_key: Optional[str] = None,
+        priority: int = 0,
+        estimated_seconds: Optional[float] = None,
+    ) -> ScheduledJob:
+        """Enqueue a job and wake waiting workers."""
+        job = ScheduledJob(
+            job_id=job_id,
+            job_type=job_type,
+            payload=payload,
+            api_key=api_key or "anonymous",
+            priority=priority,
+            estimated_seconds=(
+                estimated_seconds if estimated_seconds is not None
+                else estimate_job_seconds(job_type, payload)
+            ),
+            lane=lane_for(job_type),
+            seq=next(self._seq),
+        )
+        async with self._cond:
+            self._lanes[job.lane].push(job)
+            self._cond.notify_all()
+        return job
+
+    async def get(self, worker_id: int) -> ScheduledJob:
+        """Wait for the next job in one of this worker's lanes."""
+        lanes = self._workers.get(worker_id, LANES)
+        async with self._cond:
+            while True:
+                for lane in lanes:
+                    job = self._lanes[lane].pop(self._weights)
+                    if job is not None:
+                        self._running[job.job_id] = (job, worker_id, time.time())
+                        return job
+                await self._cond.wait()
+
+    def task_done(self, job: ScheduledJob):
+        """Mark a job returned by ``get`` as finished."""
+        self._running.pop(job.job_id, None)
+
+    def remove(self, job_id: str) -> Optional[ScheduledJob]:
+        """Drop a queued (not yet running) job. Returns it if found."""
+        for state in self._lanes.values():
+            job = state.remove(job_id)
+            if job is not None:
+                return job
+        return None
+
+    def find(self, project_id: str) -> Optional[ScheduledJob]:
+        """Return the queued (not running) job for a project, if any."""
+        for state in self._lanes.values():
+            for queue in state.queues.values():
+                for job in queue:
+                    if job.project_id == project_id:
+                        return job
+        return None
+
+    def qsize(self, lane: Optional[str] = None) -> int:
+        if lane is not None:
+            return len(self._lanes[lane])
+        return sum(len(state) for state in self._lanes.values())
+
+    def running_count(self) -> int:
+        return len(self._running)
+
+    def busy_workers(self) -> set:
+        """IDs of workers currently running a job."""
+        return {worker_id for _, worker_id, _ in self._running.values()}
+
+    # --- Introspection ---
+
+    def plan(self, now: Optional[float] = None) -> List[dict]:
+        """Simulate dispatch of every queued job and estimate its start time.
+
+        Replays the same lane preferences and DRR decisions the workers will
+        make, on a copy of the queue state, with each worker becoming free
+        when its current job's estimate runs out.
+        """
+        now = now if now is not None else time.time()
+        lanes = {name: state.copy() for name, state in self._lanes.items()}
+        free_at: Dict[int, float] = {wid: now for wid in self._workers}
+        for job, worker_id, started in self._running.values():
+            if worker_id in free_at:
+                free_at[worker_id] = max(now, started + job.estimated_seconds)
+
+        plan: List[dict] = []
+        remaining = sum(len(state) for state in lanes.values())
+        while remaining and free_at:
+            worker_id = min(free_at, key=lambda w: (free_at[w], w))
+            job = None
+            for lane in self._workers[worker_id]:
+                job = lanes[lane].pop(self._weights)
+                if job is not None:
+                    break
+            if job is None:
+                # Nothing left this worker can serve
+                del free_at[worker_id]
+                continue
+            start = free_at[worker_id]
+            free_at[worker_id] = start + job.estimated_seconds
+            remaining -= 1
+            plan.append({
+                "job_id": job.job_id,
+                "project_id": job.project_id,
+                "job_type": job.job_type,
+                "lane": job.lane,
+                "priority": job.priority,
+                "position": len(plan) + 1,
+                "estimated_start_in_seconds": int(start - now),
+                "estimated_duration_seconds": int(job.estimated_seconds),
+            })
+        return plan
+
+    def position(self, job_id: str) -> Optional[int]:
+        """1-based dispatch position of a queued job, or None if not queued."""
+        for entry in self.plan():
+            if entry["job_id"] == job_id:
+                return entry["position"]
+        return None
+
+    def snapshot(self, now: Optional[float] = None) -> dict:
+        """Queue state for the status endpoint (API keys are not exposed)."""
+        now = now if now is not None else time.time()
+        return {
+            "lanes": {
+                lane: {
+                    "queued": len(self._lanes[lane]),
+                    "workers": sorted(w for w, ls in self._workers.items() if lane in ls),
+                }
+                for lane in LANES
+            },
+            "running": [
+                {
+                    "job_id": job.job_id,
+                    "project_id": job.project_id,
+                    "job_type": job.job_type,
+                    "lane": job.lane,
+                    "worker_id": worker_id,
+                    "elapsed_seconds": int(now - started),
+                    "estimated_remaining_seconds": max(0, int(started + job.estimated_seconds - now)),
+                }
+                for job, worker_id, started in self._running.values()
+            ],
+            "queue": self.plan(now),
+        }
@@ -2,10 +2,16 @@
 
 import asyncio
 import logging
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional
 from dataclasses import dataclass
 
+from ..cancellation import check_cancelled
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration
@@ -13,15 +19,100 @@ LLM_MAX_RETRIES = 3
 LLM_BASE_DELAY = 10  # seconds
 LLM_MAX_DELAY = 60   # seconds
 
+# Called as listener(provider, latency_seconds, error_or_None) after every
+# call attempt; the API server registers its provider-health tracker here.
+CallListener = Callable[[str, float, Optional[BaseException]], None]
+_call_listeners: List[CallListener] = []
+
+
+def add_call_listener(listener: CallListener):
+    """Observe the latency and outcome of every LLM call attempt."""
+    if listener not in _call_listeners:
+        _call_listeners.append(listener)
+
+
+def remove_call_listener(listener: CallListener):
+    if listener in _call_listeners:
+        _call_listeners.remove(listener)
+
+
+def _notify_call(provider: str, latency: float, error: Optional[BaseException] = None):
+    for listener in list(_call_listeners):
+        try:
+            listener(provider, latency, error)
+        except Exception as e:
+            logger.debug("LLM call listener failed: %s", e)
+
+
+# Receives the LLMResponse of every successful call made in the current
+# context (and the tasks it starts); see ``report_usage_to``.
+UsageListener = Callable[["LLMResponse"], None]
+_usage_listener: ContextVar[Optional[UsageListener]] = ContextVar("llm_usage_listener", default=None)
+
 
-async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=LLM_BASE_DELAY, max_delay=LLM_MAX_DELAY):
+@contextmanager
+def report_usage_to(listener: Optional[UsageListener]):
+    """Pass the response of every LLM call made inside the block to ``listener``.
+
+    Used where agents don't hand their token counts back to the caller. The
+    listener may raise (e.g. ``OperationCancelled`` from a budget stop).
+    """
+    reset = _usage_listener.set(listener)
+    try:
+        yield
+    finally:
+        _usage_listener.reset(reset)
+
+
+# SDK clients (and their HTTP connection pools) shared by every LLM object
+# created on the same event loop with the same provider, key and base URL,
+# so concurrent jobs reuse warm connections instead of opening their own.
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, Any]]" = weakref.WeakKeyDictionary()
+
+
+def shared_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the running loop's client for ``key``, creating it with ``factory``.
+
+    Clients are bound to the loop that first uses them, so outside a running
+    loop a fresh, unshared client is returned.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return factory()
+    clients = _shared_clients.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None or getattr(client, "is_closed", lambda: False)():
+        client = clients[key] = factory()
+    return client
+
+
+def discard_shared_client(client: Any):
+    """Stop handing out ``client``; LLM objects created afterwards get a new one.
+
+    The client itself is left open for any calls other jobs still have in
+    flight on it.
+    """
+    for clients in _shared_clients.values():
+        for key, value in list(clients.items()):
+            if value is client:
+                del clients[key]
+
+
+async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=LLM_BASE_DELAY, max_delay=LLM_MAX_DELAY,
+                         provider: str = "unknown"):
     """Retry an async LLM call with exponential backoff.
 
+    Every attempt's latency and outcome is passed to the registered call
+    listeners (see ``add_call_listener``), and a successful response to the
+    context's usage listener (see ``report_usage_to``).
+
     Args:
         coro_factory: Callable that returns a coroutine (called fresh each retry)
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds before first retry
         max_delay: Maximum delay cap in seconds
+        provider: Provider name for health tracking
 
     Returns:
         The result of the coroutine
@@ -31,9 +122,17 @@ async def retry_llm_call(coro_factory, max_retries=LLM_MAX_RETRIES, base_delay=L
     """
     last_exception = None
     for attempt in range(max_retries + 1):
+        check_cancelled()  # don't start (or retry) a call for a cancelled job
+        started = time.monotonic()
         try:
-            return await coro_factory()
+            result = await coro_factory()
+            _notify_call(provider, time.monotonic() - started)
+            listener = _usage_listener.get()
+            if listener is not None and isinstance(result, LLMResponse):
+                listener(result)
+            return result
         except Exception as e:
+            _notify_call(provider, time.monotonic() - started, e)
             last_exception = e
             error_name = type(e).__name__
             error_str = str(e)[:200]
@@ -3,7 +3,7 @@
 from typing import AsyncIterator, Optional
 from anthropic import AsyncAnthropic
 
-from .base import BaseLLM, LLMResponse, retry_llm_call
+from .base import BaseLLM, LLMResponse, retry_llm_call, shared_client
 
 
 class ClaudeLLM(BaseLLM):
@@ -25,7 +25,7 @@ class ClaudeLLM(BaseLLM):
         client_kwargs = {"api_key": api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
-        self.client = AsyncAnthropic(**client_kwargs)
+        self.client = shared_client(("AsyncAnthropic", api_key, base_url), lambda: AsyncAnthropic(**client_kwargs))
 
     async def generate(
         self,
@@ -73,7 +73,7 @@ class ClaudeLLM(BaseLLM):
                 stop_reason=response.stop_reason,
             )
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, provider=self.provider_name)
 
     async def generate_streaming(
         self,
@@ -116,7 +116,7 @@ class ClaudeLLM(BaseLLM):
                 stop_reason=message.stop_reason,
             )
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, provider=self.provider_name)
 
     async def stream(
         self,
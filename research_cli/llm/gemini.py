@@ -5,7 +5,7 @@ from typing import AsyncIterator, Optional
 from google import genai
 from google.genai import types
 
-from .base import BaseLLM, LLMResponse, retry_llm_call
+from .base import BaseLLM, LLMResponse, retry_llm_call, shared_client
 
 
 class GeminiLLM(BaseLLM):
@@ -18,10 +18,10 @@ class GeminiLLM(BaseLLM):
 
     def __init__(self, api_key: str, model: str = "gemini-3-flash-preview"):
         super().__init__(api_key, model)
-        self.client = genai.Client(
+        self.client = shared_client(("genai", api_key), lambda: genai.Client(
             api_key=api_key,
             http_options=types.HttpOptions(timeout=300_000),  # 5 min
-        )
+        ))
 
     @property
     def _is_thinking_model(self) -> bool:
@@ -75,7 +75,7 @@ class GeminiLLM(BaseLLM):
             )
             return self._parse_response(response)
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, provider=self.provider_name)
 
     async def generate_streaming(
         self,
@@ -107,7 +107,7 @@ class GeminiLLM(BaseLLM):
             content = "".join(chunks_text)
             return self._parse_response(last_chunk, content_override=content)
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, provider=self.provider_name)
 
     async def stream(
         self,
@@ -127,7 +127,7 @@ class GeminiLLM(BaseLLM):
                 yield chunk.text
 
     async def close(self):
-        """No-op for compatibility — writer.py calls self.llm.client.close()."""
+        """No-op kept for compatibility with the other providers."""
         pass
 
     def _parse_response(self, response, *, content_override: Optional[str] = None) -> LLMResponse:
@@ -3,7 +3,7 @@
 from typing import AsyncIterator, Optional
 from openai import AsyncOpenAI
 
-from .base import BaseLLM, LLMResponse, retry_llm_call
+from .base import BaseLLM, LLMResponse, retry_llm_call, shared_client
 
 
 class OpenAILLM(BaseLLM):
@@ -25,7 +25,7 @@ class OpenAILLM(BaseLLM):
         client_kwargs = {"api_key": api_key}
         if base_url:
             client_kwargs["base_url"] = base_url
-        self.client = AsyncOpenAI(**client_kwargs)
+        self.client = shared_client(("AsyncOpenAI", api_key, base_url), lambda: AsyncOpenAI(**client_kwargs))
 
     async def generate(
         self,
@@ -77,7 +77,7 @@ class OpenAILLM(BaseLLM):
                 stop_reason=response.choices[0].finish_reason,
             )
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, provider=self.provider_name)
 
     async def generate_streaming(
         self,
@@ -137,7 +137,7 @@ class OpenAILLM(BaseLLM):
                 stop_reason=finish_reason,
             )
 
-        return await retry_llm_call(_call)
+        return await retry_llm_call(_call, provider=self.provider_name)
 
     async def stream(
         self,
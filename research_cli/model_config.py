@@ -9,6 +9,8 @@ Reads config/models.json and provides:
 import json
 import logging
 import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -23,6 +25,9 @@ _CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "models.json"
 # Cached config data
 _config_data: Optional[dict] = None
 
+# Tier that replaces every tiered role's own tier in this context (budget downgrades)
+_tier_override: ContextVar[Optional[str]] = ContextVar("model_tier_override", default=None)
+
 
 @dataclass
 class ModelSpec:
@@ -59,6 +64,25 @@ def reload_config():
     _load_config()
 
 
+@contextmanager
+def use_tier(tier: Optional[str]):
+    """Resolve tiered roles to ``tier`` inside the block (None restores role tiers)."""
+    reset = _tier_override.set(tier)
+    try:
+        yield
+    finally:
+        _tier_override.reset(reset)
+
+
+def get_tier_config(tier: str) -> List[ModelSpec]:
+    """Primary followed by fallback models of a tier."""
+    tiers = _load_config().get("tiers", {})
+    if tier not in tiers:
+        raise KeyError(f"Unknown tier '{tier}'")
+    tier_data = tiers[tier]
+    return [ModelSpec(**tier_data["primary"])] + [ModelSpec(**f) for f in tier_data.get("fallback", [])]
+
+
 def get_role_config(role: str) -> RoleConfig:
     """Get model configuration for a role.
 
@@ -80,7 +104,7 @@ def get_role_config(role: str) -> RoleConfig:
 
     # Handle tiered configuration
     if "tier" in role_data:
-        tier_name = role_data["tier"]
+        tier_name = _tier_override.get() or role_data["tier"]
         tiers = config.get("tiers", {})
         if tier_name not in tiers:
             raise KeyError(f"Unknown tier '{tier_name}' referenced by role '{role}'")
@@ -19,9 +19,10 @@ class Reference:
     url: Optional[str] = None
     doi: Optional[str] = None
     summary: str = ""  # Why this is cited
+    cited_by_count: Optional[int] = None  # as reported by the source API, if any
 
     def to_dict(self) -> dict:
-        return {
+        data = {
             "id": self.id,
             "authors": self.authors,
             "title": self.title,
@@ -31,6 +32,9 @@ class Reference:
             "doi": self.doi,
             "summary": self.summary
         }
+        if self.cited_by_count is not None:
+            data["cited_by_count"] = self.cited_by_count
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "Reference":
@@ -42,7 +46,8 @@ class Reference:
             year=data["year"],
             url=data.get("url"),
             doi=data.get("doi"),
-            summary=data.get("summary", "")
+            summary=data.get("summary", ""),
+            cited_by_count=data.get("cited_by_count"),
         )
 
 
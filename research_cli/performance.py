@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from contextlib import contextmanager
 
+from .budget import WorkflowBudget
 from .model_config import get_all_pricing, get_pricing
 
 
@@ -60,6 +61,12 @@ MODEL_PRICING = _load_model_pricing()
 _DEFAULT_PRICING = {"input": 3.0, "output": 15.0}
 
 
+def _model_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """USD cost of a model's input/output tokens."""
+    pricing = MODEL_PRICING.get(model, _DEFAULT_PRICING)
+    return (input_tokens / 1_000_000) * pricing["input"] + (output_tokens / 1_000_000) * pricing["output"]
+
+
 @dataclass
 class RoundMetrics:
     """Performance metrics for a single review round."""
@@ -117,6 +124,9 @@ class PerformanceMetrics:
     desk_editor_tokens: int = 0
     moderator_tokens: int = 0
 
+    # Research and writing phases of the collaborative workflow
+    collaboration_tokens: int = 0
+
     # Per round metrics
     rounds: List[RoundMetrics] = field(default_factory=list)
 
@@ -142,6 +152,7 @@ class PerformanceMetrics:
             "author_response_tokens": self.author_response_tokens,
             "desk_editor_tokens": self.desk_editor_tokens,
             "moderator_tokens": self.moderator_tokens,
+            "collaboration_tokens": self.collaboration_tokens,
             "rounds": [r.to_dict() for r in self.rounds],
             "tokens_by_model": self.tokens_by_model,
             "total_tokens": self.total_tokens,
@@ -152,8 +163,13 @@ class PerformanceMetrics:
 class PerformanceTracker:
     """Tracks performance metrics for the research workflow."""
 
-    def __init__(self):
-        """Initialize performance tracker."""
+    def __init__(self, budget: Optional[WorkflowBudget] = None):
+        """Initialize performance tracker.
+
+        Args:
+            budget: Optional budget charged as model tokens are recorded
+        """
+        self.budget = budget
         self._timers: Dict[str, float] = {}
         self._workflow_start: Optional[float] = None
         self._current_round: Optional[RoundMetrics] = None
@@ -169,18 +185,25 @@ class PerformanceTracker:
         self._author_response_tokens: int = 0
         self._desk_editor_tokens: int = 0
         self._moderator_tokens: int = 0
+        self._collaboration_tokens: int = 0
 
         # Model-level input/output tracking for accurate cost calculation
         self._tokens_by_model: Dict[str, dict] = {}
 
     def _track_model_tokens(self, model: str, input_tokens: int, output_tokens: int):
-        """Track input/output tokens per model for cost calculation."""
+        """Track input/output tokens per model for cost calculation.
+
+        Also charges the budget, which may fire its policy or stop the run
+        (raising ``OperationCancelled``) once the usage is recorded.
+        """
         if not model:
             return
         if model not in self._tokens_by_model:
             self._tokens_by_model[model] = {"input": 0, "output": 0}
         self._tokens_by_model[model]["input"] += input_tokens
         self._tokens_by_model[model]["output"] += output_tokens
+        if self.budget is not None:
+            self.budget.charge(_model_cost(model, input_tokens, output_tokens), input_tokens + output_tokens)
 
     def start_workflow(self):
         """Start tracking the entire workflow."""
@@ -290,6 +313,17 @@ class PerformanceTracker:
         self._moderator_tokens += tokens
         self._track_model_tokens(model, input_tokens, output_tokens)
 
+    def record_collaboration(self, response):
+        """Record one research/writing-phase LLMResponse (collaborative workflow).
+
+        Registered with ``report_usage_to`` by those phases, whose agents
+        don't return token counts.
+        """
+        input_tokens = response.input_tokens or 0
+        output_tokens = response.output_tokens or 0
+        self._collaboration_tokens += input_tokens + output_tokens
+        self._track_model_tokens(response.model, input_tokens, output_tokens)
+
     def start_round(self, round_number: int):
         """Start tracking a review round.
 
@@ -356,13 +390,10 @@ class PerformanceTracker:
 
     def _calculate_cost(self) -> float:
         """Calculate estimated cost from model-level token tracking."""
-        total_cost = 0.0
-        for model, usage in self._tokens_by_model.items():
-            pricing = MODEL_PRICING.get(model, _DEFAULT_PRICING)
-            input_cost = (usage["input"] / 1_000_000) * pricing["input"]
-            output_cost = (usage["output"] / 1_000_000) * pricing["output"]
-            total_cost += input_cost + output_cost
-        return total_cost
+        return sum(
+            _model_cost(model, usage["input"], usage["output"])
+            for model, usage in self._tokens_by_model.items()
+        )
 
     def export_metrics(self) -> PerformanceMetrics:
         """Generate final performance metrics.
@@ -385,6 +416,7 @@ class PerformanceTracker:
             self._author_response_tokens +
             self._desk_editor_tokens +
             self._moderator_tokens +
+            self._collaboration_tokens +
             sum(r.round_tokens for r in self._rounds)
         )
 
@@ -408,6 +440,7 @@ class PerformanceTracker:
             author_response_tokens=self._author_response_tokens,
             desk_editor_tokens=self._desk_editor_tokens,
             moderator_tokens=self._moderator_tokens,
+            collaboration_tokens=self._collaboration_tokens,
             rounds=self._rounds,
             tokens_by_model=self._tokens_by_model,
             total_tokens=total_tokens,
@@ -0,0 +1,221 @@
+"""Manifest-backed index of completed projects and a lazy workflow status store.
+
+``ProjectIndex`` keeps one compact summary per ``results/<project>/`` in a
+manifest file (``results/.project_index.json``), keyed by the mtime and size
+of its ``workflow_complete.json``. Refreshing only stats files; a project is
+re-parsed only when its file changed, so startup and ``/api/projects`` no
+longer parse every report ever produced.
+
+``WorkflowStatusStore`` is the dict-like ``workflow_status`` used by the API
+server. Active and interrupted jobs live in memory; completed projects are
+listed from compact summaries and their full status entries are loaded on
+demand into an LRU-bounded cache.
+"""
+
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".project_index.json"
+MANIFEST_VERSION = 1
+
+# Heavy fields left out of compact status summaries (loaded lazily instead)
+HEAVY_STATUS_FIELDS = ("expert_status", "expert_team", "cost_estimate")
+
+
+def compact_status(entry: dict) -> dict:
+    """Strip heavy fields from a completed workflow status entry."""
+    return {k: v for k, v in entry.items() if k not in HEAVY_STATUS_FIELDS}
+
+
+class ProjectIndex:
+    """Incrementally maintained manifest of completed project summaries.
+
+    Args:
+        results_dir: Directory holding one sub-directory per project.
+        summarize: Builds the manifest record for a project from its directory
+            and parsed workflow_complete.json. Returns None to skip it.
+    """
+
+    def __init__(self, results_dir: Path, summarize: Callable[[Path, dict], Optional[dict]]):
+        self.results_dir = Path(results_dir)
+        self.summarize = summarize
+        self._records: Dict[str, dict] = {}
+        self._loaded = False
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.results_dir / MANIFEST_NAME
+
+    def _load_manifest(self):
+        self._loaded = True
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self._records = data.get("projects", {})
+
+    def _save_manifest(self):
+        tmp = self.manifest_path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump({"version": MANIFEST_VERSION, "projects": self._records}, f)
+            os.replace(tmp, self.manifest_path)
+        except OSError as e:
+            logger.warning("Could not write project manifest: %s", e)
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> Tuple[int, int]:
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def refresh(self) -> Dict[str, dict]:
+        """Sync the manifest with disk and return {project_id: record}."""
+        if not self._loaded:
+            self._load_manifest()
+        if not self.results_dir.exists():
+            return {}
+
+        changed = False
+        seen = set()
+        for project_dir in self.results_dir.iterdir():
+            if not project_dir.is_dir():
+                continue
+            try:
+                stat = (project_dir / "workflow_complete.json").stat()
+            except OSError:
+                continue
+            project_id = project_dir.name
+            seen.add(project_id)
+            signature = list(self._signature(stat))
+            cached = self._records.get(project_id)
+            if cached and cached.get("signature") == signature:
+                continue
+            record = self._build(project_dir)
+            if record is None:
+                self._records.pop(project_id, None)
+            else:
+                self._records[project_id] = {"signature": signature, **record}
+            changed = True
+
+        for project_id in list(self._records):
+            if project_id not in seen:
+                del self._records[project_id]
+                changed = True
+
+        if changed:
+            self._save_manifest()
+        return dict(self._records)
+
+    def _build(self, project_dir: Path) -> Optional[dict]:
+        try:
+            with open(project_dir / "workflow_complete.json") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        try:
+            return self.summarize(project_dir, data)
+        except Exception as e:
+            logger.warning("Could not index %s: %s", project_dir.name, e)
+            return None
+
+    def get(self, project_id: str) -> Optional[dict]:
+        if not self._loaded:
+            self._load_manifest()
+        return self._records.get(project_id)
+
+    def invalidate(self, project_id: str):
+        """Forget a project so the next refresh re-parses it."""
+        self._records.pop(project_id, None)
+
+
+class WorkflowStatusStore(MutableMapping):
+    """Dict-like workflow status with lazily loaded completed entries.
+
+    - Entries assigned with ``store[pid] = {...}`` are held in memory.
+    - Completed projects registered via ``set_summaries`` are iterated as
+      compact summaries; ``store[pid]`` loads the full entry through
+      ``loader`` and keeps at most ``max_cached`` of them.
+    """
+
+    def __init__(self, loader: Callable[[str], Optional[dict]], max_cached: int = 128):
+        self._active: Dict[str, dict] = {}
+        self._summaries: Dict[str, dict] = {}
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._loader = loader
+        self.max_cached = max_cached
+
+    def set_summaries(self, summaries: Dict[str, dict]):
+        """Replace the compact summaries of completed projects."""
+        self._summaries = {pid: s for pid, s in summaries.items() if pid not in self._active}
+        for pid in list(self._cache):
+            if pid not in self._summaries:
+                del self._cache[pid]
+
+    def __getitem__(self, project_id: str) -> dict:
+        if project_id in self._active:
+            return self._active[project_id]
+        if project_id in self._cache:
+            self._cache.move_to_end(project_id)
+            return self._cache[project_id]
+        if project_id in self._summaries:
+            entry = self._loader(project_id) or dict(self._summaries[project_id])
+            self._cache[project_id] = entry
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+            return entry
+        raise KeyError(project_id)
+
+    def __setitem__(self, project_id: str, entry: dict):
+        self._active[project_id] = entry
+        self._summaries.pop(project_id, None)
+        self._cache.pop(project_id, None)
+
+    def __delitem__(self, project_id: str):
+        found = project_id in self._active or project_id in self._summaries
+        self._active.pop(project_id, None)
+        self._summaries.pop(project_id, None)
+        self._cache.pop(project_id, None)
+        if not found:
+            raise KeyError(project_id)
+
+    def __contains__(self, project_id) -> bool:
+        return project_id in self._active or project_id in self._summaries
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._active)
+        yield from list(self._summaries)
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._summaries)
+
+    def items(self):
+        """(project_id, entry) pairs without loading completed projects from disk."""
+        for project_id, entry in list(self._active.items()):
+            yield project_id, entry
+        for project_id, summary in list(self._summaries.items()):
+            yield project_id, self._cache.get(project_id, summary)
+
+    def values(self):
+        for _, entry in self.items():
+            yield entry
+
+    def clear(self):
+        self._active.clear()
+        self._summaries.clear()
+        self._cache.clear()
+
+    def cache_info(self) -> dict:
+        return {
+            "active": len(self._active),
+            "completed": len(self._summaries),
+            "cached": len(self._cache),
+            "max_cached": self.max_cached,
+        }
@@ -0,0 +1,132 @@
+"""Duplicate detection for workflow requests.
+
+``workflow_fingerprint`` hashes the parameters that determine what a
+workflow produces (normalized topic, length, audience, research type,
+category and mode), so an identical request can attach to a job that is
+already queued or running, or reuse a recently completed project, instead
+of paying for another multi-round run.
+
+``TopicSimilarityIndex`` is a small in-process TF-IDF index over past
+topics, used to point users at near-duplicates that differ only in wording.
+"""
+
+import hashlib
+import json
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+FINGERPRINT_VERSION = 1
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Words too common in research topics to say anything about similarity
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is of on or the to with via using "
+    "towards toward its their this that these those how what why".split()
+)
+
+
+def normalize_topic(topic: str) -> str:
+    """Case-fold, strip accents and punctuation, and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", topic or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    return " ".join(_WORD_RE.findall(text))
+
+
+def workflow_fingerprint(
+    topic: str,
+    article_length: Optional[str] = "full",
+    audience_level: Optional[str] = "professional",
+    research_type: Optional[str] = "survey",
+    category: Optional[dict] = None,
+    workflow_mode: Optional[str] = "standard",
+) -> str:
+    """Stable hash of the request parameters that determine a workflow's output."""
+    category = category or {}
+    canonical = {
+        "v": FINGERPRINT_VERSION,
+        "topic": normalize_topic(topic),
+        "length": article_length or "full",
+        "audience": audience_level or "professional",
+        "type": research_type or "survey",
+        "category": [category.get(k) or "" for k in ("major", "subfield", "secondary_major", "secondary_subfield")],
+        "mode": workflow_mode or "standard",
+    }
+    blob = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _tokens(text: str) -> List[str]:
+    return [t for t in normalize_topic(text).split() if t not in STOPWORDS]
+
+
+class TopicSimilarityIndex:
+    """TF-IDF cosine similarity over short topic strings.
+
+    Documents are added incrementally; IDF weights and vectors are rebuilt
+    lazily on the next query after the corpus changes.
+    """
+
+    def __init__(self):
+        self._terms: Dict[str, Counter] = {}
+        self._texts: Dict[str, str] = {}
+        self._vectors: Optional[Dict[str, Dict[str, float]]] = None
+        self._idf: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._terms
+
+    def __iter__(self):
+        return iter(list(self._terms))
+
+    def add(self, doc_id: str, text: str):
+        terms = Counter(_tokens(text))
+        if not terms:
+            return
+        self._terms[doc_id] = terms
+        self._texts[doc_id] = text
+        self._vectors = None
+
+    def remove(self, doc_id: str):
+        if self._terms.pop(doc_id, None) is not None:
+            self._texts.pop(doc_id, None)
+            self._vectors = None
+
+    def _rebuild(self):
+        n = len(self._terms)
+        df = Counter(term for terms in self._terms.values() for term in terms)
+        # Smoothed IDF keeps terms shared by every document from zeroing out
+        self._idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+        self._vectors = {doc_id: self._vector(terms) for doc_id, terms in self._terms.items()}
+
+    def _vector(self, terms: Counter) -> Dict[str, float]:
+        default_idf = math.log(1 + len(self._terms)) + 1  # unseen terms are rare
+        weights = {t: (1 + math.log(c)) * self._idf.get(t, default_idf) for t, c in terms.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {t: w / norm for t, w in weights.items()}
+
+    def most_similar(
+        self, text: str, limit: int = 3, min_score: float = 0.5, exclude: Optional[str] = None
+    ) -> List[Tuple[str, str, float]]:
+        """Return up to ``limit`` (doc_id, text, score) with cosine ≥ ``min_score``."""
+        terms = Counter(_tokens(text))
+        if not terms or not self._terms:
+            return []
+        if self._vectors is None:
+            self._rebuild()
+        query = self._vector(terms)
+        scored = []
+        for doc_id, vector in self._vectors.items():
+            if doc_id == exclude:
+                continue
+            score = sum(w * vector.get(t, 0.0) for t, w in query.items())
+            if score >= min_score:
+                scored.append((doc_id, self._texts[doc_id], round(score, 3)))
+        scored.sort(key=lambda item: (-item[2], item[0]))
+        return scored[:limit]
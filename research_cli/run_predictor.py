@@ -0,0 +1,240 @@
+"""Historical run-time and cost predictor.
+
+Learns from the ``performance`` blocks stored in every
+``workflow_complete.json`` (phase timings, per-round durations, token and
+cost totals) and predicts calibrated ranges for new runs.
+
+Samples are grouped by (workflow_mode, article_length, research_type,
+model_tier). When a group has too few samples the predictor backs off to
+coarser groups, ending with all runs and finally with fixed priors.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MIN_SAMPLES = 3
+
+# Priors used when there is no history at all
+DEFAULT_PRE_REVIEW_SECONDS = {"standard": 300.0, "collaborative": 900.0}
+DEFAULT_ROUND_SECONDS = 180.0
+
+PRE_REVIEW_STATUSES = {
+    "queued", "composing_team", "research", "writing", "writing_sections", "desk_screening",
+}
+
+Range = Tuple[float, float, float]  # (p10, p50, p90)
+
+
+def current_model_tier() -> str:
+    """Model tier key for new runs: the writer role's primary model."""
+    try:
+        from .model_config import get_role_config
+        return get_role_config("writer").primary.model
+    except Exception:
+        return "unknown"
+
+
+def _quantile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    pos = (len(ordered) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def _range(values: List[float]) -> Range:
+    """p10/p50/p90 of values, widened when there are only a few samples."""
+    p10, p50, p90 = (_quantile(values, q) for q in (0.1, 0.5, 0.9))
+    if len(values) < MIN_SAMPLES:
+        p10, p90 = min(p10, p50 * 0.7), max(p90, p50 * 1.5)
+    return (p10, p50, p90)
+
+
+@dataclass
+class RunSample:
+    """Timing and cost figures extracted from one completed workflow."""
+    workflow_mode: str
+    article_length: str
+    research_type: str
+    model_tier: str
+    pre_review_seconds: float
+    round_seconds: List[float]
+    max_rounds: int
+    base_cost: float
+    round_cost: float  # average cost of one review round
+    total_tokens: int = 0
+
+    def key(self) -> Tuple[str, str, str, str]:
+        return (self.workflow_mode, self.article_length, self.research_type, self.model_tier)
+
+
+def sample_from_workflow(data: dict) -> Optional[RunSample]:
+    """Build a RunSample from a parsed workflow_complete.json, or None."""
+    perf = data.get("performance") or {}
+    total = perf.get("total_duration") or 0
+    if total <= 0:
+        return None
+
+    rounds = perf.get("rounds") or []
+    round_seconds = [
+        (r.get("review_duration") or 0) + (r.get("revision_time") or 0)
+        for r in rounds
+    ]
+    round_seconds = [s for s in round_seconds if s > 0]
+
+    # Collaborative runs time research/writing outside the review tracker
+    phase_timings = data.get("phase_timings") or []
+    phase_seconds = sum((p or {}).get("total_duration", 0) or 0 for p in phase_timings)
+    pre_review = max(0.0, total - sum(round_seconds)) + phase_seconds
+
+    total_tokens = perf.get("total_tokens") or 0
+    cost = perf.get("estimated_cost") or 0.0
+    round_tokens = sum(r.get("round_tokens") or 0 for r in rounds)
+    round_share = min(1.0, round_tokens / total_tokens) if total_tokens else 0.0
+    n_rounds = max(1, len(round_seconds))
+
+    return RunSample(
+        workflow_mode=data.get("workflow_mode") or ("collaborative" if phase_timings else "standard"),
+        article_length=data.get("article_length") or "full",
+        research_type=data.get("research_type") or "survey",
+        model_tier=data.get("model_tier") or "unknown",
+        pre_review_seconds=pre_review,
+        round_seconds=round_seconds,
+        max_rounds=data.get("max_rounds") or n_rounds,
+        base_cost=cost * (1 - round_share),
+        round_cost=cost * round_share / n_rounds,
+        total_tokens=total_tokens,
+    )
+
+
+@dataclass
+class RunPrediction:
+    """Predicted duration and cost ranges for one workflow configuration."""
+    pre_review_seconds: Range
+    round_seconds: Range
+    rounds_fraction: float  # typical rounds used / max_rounds
+    base_cost: Optional[Range] = None
+    round_cost: Optional[Range] = None
+    sample_count: int = 0
+    basis: str = "prior"
+
+    def expected_rounds(self, max_rounds: int) -> float:
+        return max(1.0, min(float(max_rounds), self.rounds_fraction * max_rounds))
+
+    def duration_range(self, max_rounds: int) -> Range:
+        rounds = self.expected_rounds(max_rounds)
+        return (
+            self.pre_review_seconds[0] + rounds * self.round_seconds[0],
+            self.pre_review_seconds[1] + rounds * self.round_seconds[1],
+            self.pre_review_seconds[2] + max_rounds * self.round_seconds[2],
+        )
+
+    def cost_range(self, max_rounds: int) -> Optional[Range]:
+        if self.base_cost is None or self.round_cost is None:
+            return None
+        rounds = self.expected_rounds(max_rounds)
+        return (
+            self.base_cost[0] + rounds * self.round_cost[0],
+            self.base_cost[1] + rounds * self.round_cost[1],
+            self.base_cost[2] + max_rounds * self.round_cost[2],
+        )
+
+    def remaining_seconds(self, status: str, round_num: int, total_rounds: int, elapsed: float) -> int:
+        """Live estimate of seconds left given the current phase and elapsed time."""
+        if status == "completed":
+            return 0
+        pre = self.pre_review_seconds[1]
+        per_round = self.round_seconds[1]
+        rounds = max(self.expected_rounds(total_rounds), round_num)
+        if status in PRE_REVIEW_STATUSES or round_num <= 0:
+            return int(max(pre - elapsed, 0.1 * pre) + rounds * per_round)
+        into_round = max(0.0, elapsed - pre - (round_num - 1) * per_round)
+        current_left = max(per_round - into_round, 0.1 * per_round)
+        return int(current_left + max(0.0, rounds - round_num) * per_round)
+
+    def to_dict(self, max_rounds: int) -> dict:
+        lo, mid, hi = self.duration_range(max_rounds)
+        result = {
+            "duration_seconds": {"low": int(lo), "expected": int(mid), "high": int(hi)},
+            "expected_rounds": round(self.expected_rounds(max_rounds), 1),
+            "sample_count": self.sample_count,
+            "basis": self.basis,
+        }
+        cost = self.cost_range(max_rounds)
+        if cost:
+            result["cost_usd"] = {"low": round(cost[0], 4), "expected": round(cost[1], 4), "high": round(cost[2], 4)}
+        return result
+
+
+class RunPredictor:
+    """Groups historical RunSamples and answers predictions with back-off."""
+
+    def __init__(self, samples: Optional[Iterable[RunSample]] = None):
+        self.samples: List[RunSample] = []
+        self._groups: Dict[tuple, List[RunSample]] = {}
+        for sample in samples or []:
+            self.add(sample)
+
+    @staticmethod
+    def _levels(key: Tuple[str, str, str, str]) -> List[tuple]:
+        mode, length, rtype, tier = key
+        return [
+            (mode, length, rtype, tier),
+            (mode, length, rtype, None),
+            (mode, length, None, None),
+            (mode, None, None, None),
+            (None, None, None, None),
+        ]
+
+    def add(self, sample: RunSample):
+        self.samples.append(sample)
+        for level in self._levels(sample.key()):
+            self._groups.setdefault(level, []).append(sample)
+
+    def predict(
+        self,
+        workflow_mode: str = "standard",
+        article_length: str = "full",
+        research_type: str = "survey",
+        model_tier: str = "unknown",
+    ) -> RunPrediction:
+        """Predict ranges for a configuration, backing off to coarser groups."""
+        workflow_mode = workflow_mode or "standard"
+        key = (workflow_mode, article_length or "full", research_type or "survey", model_tier or "unknown")
+
+        chosen, level = None, None
+        for candidate in self._levels(key):
+            group = self._groups.get(candidate)
+            if not group:
+                continue
+            if chosen is None:
+                chosen, level = group, candidate  # best available, even if small
+            if len(group) >= MIN_SAMPLES:
+                chosen, level = group, candidate
+                break
+
+        if not chosen:
+            prior = DEFAULT_PRE_REVIEW_SECONDS.get(workflow_mode, DEFAULT_PRE_REVIEW_SECONDS["standard"])
+            return RunPrediction(
+                pre_review_seconds=(prior * 0.7, prior, prior * 1.5),
+                round_seconds=(DEFAULT_ROUND_SECONDS * 0.7, DEFAULT_ROUND_SECONDS, DEFAULT_ROUND_SECONDS * 1.5),
+                rounds_fraction=1.0,
+            )
+
+        round_seconds = [s for sample in chosen for s in sample.round_seconds]
+        fractions = [
+            len(sample.round_seconds) / sample.max_rounds
+            for sample in chosen if sample.max_rounds and sample.round_seconds
+        ]
+        return RunPrediction(
+            pre_review_seconds=_range([s.pre_review_seconds for s in chosen]),
+            round_seconds=_range(round_seconds) if round_seconds else
+            (DEFAULT_ROUND_SECONDS * 0.7, DEFAULT_ROUND_SECONDS, DEFAULT_ROUND_SECONDS * 1.5),
+            rounds_fraction=_quantile(fractions, 0.5) if fractions else 1.0,
+            base_cost=_range([s.base_cost for s in chosen]),
+            round_cost=_range([s.round_cost for s in chosen]),
+            sample_count=len(chosen),
+            basis="/".join(part or "*" for part in level),
+        )
@@ -0,0 +1,152 @@
+"""Conditional GET and compression helpers for file-backed API responses.
+
+ETags are derived from the mtime and size of the files a response is built
+from, so a cache hit never has to read or re-serialize anything. Built
+bodies are kept (with their gzip / brotli variants) in a small LRU keyed by
+ETag, so repeated views of the same project compress only once.
+
+Brotli is used when the optional ``brotli`` package is installed.
+"""
+
+import gzip
+import hashlib
+import json
+from collections import OrderedDict
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIN_COMPRESS_BYTES = 1024
+BODY_CACHE_SIZE = 64
+
+# Listings, projects, manuscripts and reports can change at any time, so
+# clients must revalidate every time; the ETag makes that a cheap 304. Only
+# images get a long max-age (see CachedStaticFiles).
+CACHE_CONTROL_REVALIDATE = "public, no-cache"
+
+_body_cache: "OrderedDict[Tuple[str, str], Dict[str, bytes]]" = OrderedDict()
+
+
+def file_fingerprint(paths: Iterable[Path]) -> Tuple[str, Optional[float]]:
+    """Return (etag, last_modified_timestamp) for a set of files.
+
+    Missing files are skipped. The ETag changes whenever any file's name,
+    mtime or size changes.
+    """
+    digest = hashlib.sha1()
+    latest = None
+    for path in sorted(Path(p) for p in paths):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+        latest = stat.st_mtime if latest is None else max(latest, stat.st_mtime)
+    return f'W/"{digest.hexdigest()[:20]}"', latest
+
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[float]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _choose_encoding(request: Request) -> Optional[str]:
+    accepted = {
+        part.split(";")[0].strip().lower()
+        for part in request.headers.get("accept-encoding", "").split(",")
+    }
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _encoded_body(cache_key: Tuple[str, str], build: Callable[[], bytes],
+                  encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """Return (body, applied_encoding), compressing at most once per ETag."""
+    variants = _body_cache.get(cache_key)
+    if variants is None:
+        variants = {"identity": build()}
+        _body_cache[cache_key] = variants
+        while len(_body_cache) > BODY_CACHE_SIZE:
+            _body_cache.popitem(last=False)
+    else:
+        _body_cache.move_to_end(cache_key)
+
+    if encoding is None or len(variants["identity"]) < MIN_COMPRESS_BYTES:
+        return variants["identity"], None
+    if encoding not in variants:
+        if encoding == "br":
+            variants[encoding] = brotli.compress(variants["identity"], quality=5)
+        else:
+            variants[encoding] = gzip.compress(variants["identity"], compresslevel=6)
+    return variants[encoding], encoding
+
+
+def cached_response(
+    request: Request,
+    key: str,
+    paths: Iterable[Path],
+    build: Callable[[], Union[bytes, str, dict, list]],
+    media_type: str = "application/json",
+    cache_control: str = CACHE_CONTROL_REVALIDATE,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Serve ``build()`` with ETag / Last-Modified, 304 handling and compression.
+
+    Args:
+        request: Incoming request (conditional and Accept-Encoding headers).
+        key: Identifies the resource (e.g. "manuscripts:<project_id>").
+        paths: Files the response is derived from; they define the ETag.
+        build: Produces the body. dict/list are JSON-encoded, str is UTF-8.
+        media_type: Response content type.
+        cache_control: Cache-Control header value.
+        headers: Extra headers (e.g. Content-Disposition).
+    """
+    etag, last_modified = file_fingerprint(paths)
+    response_headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if last_modified is not None:
+        response_headers["Last-Modified"] = format_datetime(
+            datetime.fromtimestamp(last_modified, tz=timezone.utc), usegmt=True
+        )
+
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=response_headers)
+
+    def build_bytes() -> bytes:
+        body = build()
+        if isinstance(body, (dict, list)):
+            return json.dumps(body, ensure_ascii=False).encode("utf-8")
+        if isinstance(body, str):
+            return body.encode("utf-8")
+        return body
+
+    content, applied = _encoded_body((key, etag), build_bytes, _choose_encoding(request))
+    if applied:
+        response_headers["Content-Encoding"] = applied
+    response_headers.update(headers or {})
+    return Response(content=content, media_type=media_type, headers=response_headers)
+
+
+def clear_cache():
+    """Drop all cached bodies (used by tests and after admin edits)."""
+    _body_cache.clear()
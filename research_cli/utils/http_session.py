@@ -0,0 +1,62 @@
+"""Process-wide pooled aiohttp sessions for outbound API calls.
+
+Opening a ``ClientSession`` per request costs a new connector, DNS lookup
+and TLS handshake every time. ``shared_session()`` instead returns one
+long-lived session per event loop with a tuned ``TCPConnector`` (per-host
+connection limits, keep-alive, DNS cache), reused by every workflow in the
+process. Responses are decompressed transparently; brotli is advertised
+only when a brotli decoder is installed.
+
+Call ``close_shared_sessions()`` at shutdown.
+"""
+
+import asyncio
+import os
+import weakref
+
+import aiohttp
+
+try:
+    import brotli  # noqa: F401  (lets aiohttp decode "br" responses)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+HTTP_POOL_LIMIT = int(os.environ.get("HTTP_POOL_LIMIT", "64"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get("HTTP_POOL_LIMIT_PER_HOST", "8"))
+HTTP_KEEPALIVE_SECONDS = 30.0
+HTTP_DNS_CACHE_SECONDS = 300
+
+# Sessions are bound to the loop that created them
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def new_session(**kwargs) -> aiohttp.ClientSession:
+    """A session with the pooled connector settings (caller closes it)."""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+        use_dns_cache=True,
+    )
+    return aiohttp.ClientSession(connector=connector, auto_decompress=True, **kwargs)
+
+
+def shared_session() -> aiohttp.ClientSession:
+    """The running loop's shared session, created (or recreated if closed) on demand."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = _sessions[loop] = new_session()
+    return session
+
+
+async def close_shared_sessions():
+    """Close the shared session of the running loop (sessions of other loops are dropped)."""
+    loop = asyncio.get_running_loop()
+    for session_loop, session in list(_sessions.items()):
+        if session_loop is loop and not session.closed:
+            await session.close()
+    _sessions.clear()
+
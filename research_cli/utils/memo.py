@@ -0,0 +1,97 @@
+"""Bounded TTL memoization for LLM-derived results.
+
+Topic classification, team proposals and reviewer panels are pure functions
+of the (normalized) topic and a few parameters, but each costs an LLM call.
+``memo_cache(name)`` returns a named, process-wide LRU cache with a TTL and
+an entry bound; callers store the raw parsed LLM output (plain JSON-like
+data) and rebuild their objects from it, so cached values never go stale
+with respect to model configuration.
+
+Set ``LLM_MEMO_CACHE=0`` to disable all memo caches.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+MEMO_ENABLED = os.environ.get("LLM_MEMO_CACHE", "1") != "0"
+
+DEFAULT_TTL = 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 512
+
+
+def memo_key(*parts: Any) -> str:
+    """Stable key for a tuple of JSON-serializable parts."""
+    blob = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+class MemoCache:
+    """LRU cache with per-entry expiry. Values are copied in and out."""
+
+    def __init__(self, name: str, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for ``key``, or None on a miss (or when disabled)."""
+        if not MEMO_ENABLED:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: str, value: Any):
+        if not MEMO_ENABLED or value is None:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def info(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_caches: Dict[str, MemoCache] = {}
+
+
+def memo_cache(name: str, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> MemoCache:
+    """Return the named cache, creating it on first use."""
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = MemoCache(name, ttl=ttl, max_entries=max_entries)
+    return cache
+
+
+def memo_stats() -> Dict[str, dict]:
+    return {name: cache.info() for name, cache in _caches.items()}
+
+
+def clear_memo_caches():
+    for cache in _caches.values():
+        cache.clear()
@@ -0,0 +1,111 @@
+"""Query planning for source retrieval.
+
+Long topic prompts make poor search queries. ``plan_queries`` derives a few
+focused keyword queries locally (no LLM call): the condensed topic, its
+clauses (split on ``:``, ``;``, "and", "vs" ...) and the lead author's
+research questions. ``allocate_requests`` then fans those queries out
+across sources under a global request budget, giving each source only as
+many queries as its shared rate limiter can serve before the search
+deadline, so slow APIs (arXiv, CORE) are not queued behind themselves.
+"""
+
+import math
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..request_dedup import STOPWORDS, normalize_topic
+from .rate_limit import rate_limiter
+
+MAX_QUERIES = 4
+MAX_QUERY_TERMS = 8
+MIN_QUERY_TERMS = 2
+# Queries sharing this much of their terms are redundant
+REDUNDANT_OVERLAP = 0.7
+SEARCH_REQUEST_BUDGET = 12
+
+# Words that make questions read well but do not help a search engine
+_QUESTION_WORDS = frozenset(
+    "do does did can could should would will which who whom whose when where "
+    "extent role roles impact impacts effect effects affect affects current key main "
+    "about between across within over under among".split()
+)
+_CLAUSE_SPLIT_RE = re.compile(r"\s*(?:[:;,?()–—]|\s-\s|\band\b|\bvs\.?|\bversus\b)\s*", re.IGNORECASE)
+
+
+def _query_terms(text: str) -> List[str]:
+    seen = []
+    for term in normalize_topic(text).split():
+        if term in STOPWORDS or term in _QUESTION_WORDS or len(term) < 2 or term in seen:
+            continue
+        seen.append(term)
+    return seen
+
+
+def condense(text: str, max_terms: int = MAX_QUERY_TERMS) -> str:
+    """Keyword query for ``text``: content words in order, capped at ``max_terms``."""
+    return " ".join(_query_terms(text)[:max_terms])
+
+
+def plan_queries(topic: str, research_questions: Optional[Sequence[str]] = None,
+                 max_queries: int = MAX_QUERIES) -> List[str]:
+    """Search queries for a topic; the first is always the topic itself.
+
+    A topic of up to ``MAX_QUERY_TERMS`` content words is already a focused
+    query: without research questions it yields just the topic, so simple
+    searches behave exactly as before.
+    """
+    queries = [topic]
+    topic_terms = set(_query_terms(topic))
+    candidates = []
+    if len(topic_terms) > MAX_QUERY_TERMS:
+        # A long topic is a poor query itself; its focused parts are the useful ones
+        chosen = []
+        candidates.append(condense(topic))
+    else:
+        chosen = [topic_terms]
+    candidates += [condense(clause) for clause in _CLAUSE_SPLIT_RE.split(topic)]
+    candidates += [condense(q) for q in research_questions or []]
+
+    for query in candidates:
+        if len(queries) >= max_queries:
+            break
+        terms = set(query.split())
+        if len(terms) < MIN_QUERY_TERMS:
+            continue
+        if any(len(terms & other) / min(len(terms), len(other) or 1) >= REDUNDANT_OVERLAP for other in chosen):
+            continue
+        queries.append(query)
+        chosen.append(terms)
+    return queries
+
+
+def allocate_requests(queries: List[str], apis: List[str], budget: int = SEARCH_REQUEST_BUDGET,
+                      deadline: Optional[float] = None,
+                      per_api_cap: Optional[Dict[str, int]] = None) -> List[Tuple[str, str]]:
+    """(api, query) pairs to send, at most ``budget`` of them.
+
+    Every API gets the first query. Further queries go round-robin (second
+    query to every API, then the third ...) to APIs whose rate limiter can
+    still serve them before ``deadline``, given the queue other workflows
+    have already built up. ``per_api_cap`` limits the queries of given APIs.
+    """
+    capacity: Dict[str, int] = {}
+    for api in apis:
+        if deadline is None:
+            capacity[api] = len(queries)
+            continue
+        limiter = rate_limiter(api)
+        slots = math.floor(max(0.0, deadline - limiter.backlog()) / limiter.interval) + limiter.burst
+        capacity[api] = max(1, min(len(queries), slots))
+    for api, cap in (per_api_cap or {}).items():
+        if api in capacity:
+            capacity[api] = max(1, min(capacity[api], cap))
+
+    plan = [(api, queries[0]) for api in apis]
+    for i, query in enumerate(queries[1:], start=1):
+        for api in apis:
+            if len(plan) >= max(budget, len(apis)):
+                return plan
+            if capacity[api] > i:
+                plan.append((api, query))
+    return plan
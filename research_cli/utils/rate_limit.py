@@ -0,0 +1,163 @@
+"""Process-global rate limiters for external APIs, keyed by API name.
+
+Every ``SourceRetriever`` (one per workflow) used to own its own limiters,
+so concurrent workflows each spent arXiv's or CORE's full budget. Limiters
+now come from a registry shared by the whole process, and optionally by
+every process using the same SQLite file (``RATE_LIMIT_DB``).
+
+Each limiter is a token bucket implemented as GCRA: a caller reserves the
+next free slot and sleeps until it. Reservations are handed out in arrival
+order, so waiting workflows are served first-come first-served and nobody
+holds a lock while sleeping. ``wait()`` returns the seconds the caller
+waited; per-API totals are kept for monitoring.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# API name → (requests per second, burst)
+API_RATES: Dict[str, tuple] = {
+    "openalex": (10.0, 5),          # 10 req/s
+    "arxiv": (1 / 3.0, 1),          # 1 req/3s (arxiv ToS)
+    "semantic_scholar": (1.0, 1),   # 1 req/s
+    "brave": (1.0, 1),              # 1 req/s
+    "pubmed": (3.0, 1),             # ~3 req/s (no key)
+    "europe_pmc": (2.0, 1),         # conservative
+    "core": (10 / 60.0, 1),         # 10 req/min
+    "crossref": (10.0, 5),          # 50 req/s (polite pool), kept well below
+}
+DEFAULT_RATE = (1.0, 1)
+
+RATE_LIMIT_DB = os.environ.get("RATE_LIMIT_DB", "")
+
+
+class RateLimiter:
+    """Token bucket (GCRA) with first-come first-served reservations."""
+
+    def __init__(self, name: str, rate: float, burst: int = 1, store: Optional["_SharedStore"] = None):
+        self.name = name
+        self.interval = 1.0 / rate
+        self.burst = max(1, burst)
+        self._store = store
+        self._tat = 0.0  # theoretical arrival time of the next request (in-process mode)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.waited_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def reserve(self) -> float:
+        """Reserve the next slot; returns seconds to wait before using it."""
+        tolerance = (self.burst - 1) * self.interval
+        if self._store is not None:
+            delay = self._store.reserve(self.name, self.interval, tolerance)
+        else:
+            with self._lock:
+                now = time.monotonic()
+                tat = max(self._tat, now)
+                delay = max(0.0, tat - tolerance - now)
+                self._tat = tat + self.interval
+        with self._lock:
+            self.calls += 1
+            self.waited_seconds += delay
+            self.max_wait_seconds = max(self.max_wait_seconds, delay)
+        return delay
+
+    def backlog(self) -> float:
+        """Seconds a caller arriving now would wait (queue already reserved by others)."""
+        tolerance = (self.burst - 1) * self.interval
+        if self._store is not None:
+            tat, now = self._store.peek(self.name), time.time()
+        else:
+            tat, now = self._tat, time.monotonic()
+        return max(0.0, tat - tolerance - now)
+
+    async def wait(self) -> float:
+        """Wait for this caller's turn. Returns the seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def stats(self) -> dict:
+        return {
+            "rate_per_second": round(1.0 / self.interval, 3),
+            "burst": self.burst,
+            "shared_across_processes": self._store is not None,
+            "calls": self.calls,
+            "waited_seconds": round(self.waited_seconds, 2),
+            "avg_wait_seconds": round(self.waited_seconds / self.calls, 3) if self.calls else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 2),
+        }
+
+
+class _SharedStore:
+    """Reservation state in SQLite, so processes sharing the file share the budget."""
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS rate_limits (api TEXT PRIMARY KEY, tat REAL NOT NULL)")
+        return conn
+
+    def peek(self, api: str) -> float:
+        row = self._connection().execute("SELECT tat FROM rate_limits WHERE api = ?", (api,)).fetchone()
+        return row[0] if row else 0.0
+
+    def reserve(self, api: str, interval: float, tolerance: float) -> float:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute("SELECT tat FROM rate_limits WHERE api = ?", (api,)).fetchone()
+            tat = max(row[0] if row else 0.0, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits (api, tat) VALUES (?, ?)", (api, tat + interval),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return max(0.0, tat - tolerance - now)
+
+
+_registry: Dict[str, RateLimiter] = {}
+_registry_lock = threading.Lock()
+_store: Optional[_SharedStore] = None
+
+
+def rate_limiter(api: str) -> RateLimiter:
+    """The process-wide limiter for ``api``, created on first use."""
+    global _store
+    with _registry_lock:
+        limiter = _registry.get(api)
+        if limiter is None:
+            if RATE_LIMIT_DB and _store is None:
+                _store = _SharedStore(RATE_LIMIT_DB)
+            rate, burst = API_RATES.get(api, DEFAULT_RATE)
+            limiter = _registry[api] = RateLimiter(api, rate, burst, store=_store)
+        return limiter
+
+
+def rate_limit_stats() -> Dict[str, dict]:
+    with _registry_lock:
+        return {name: limiter.stats() for name, limiter in _registry.items()}
+
+
+def reset_rate_limiters():
+    """Forget all limiters and their state (tests)."""
+    global _store
+    with _registry_lock:
+        _registry.clear()
+        _store = None
@@ -0,0 +1,239 @@
+"""Persistent, process-wide cache of reference search results.
+
+Results are keyed by (api, normalized query, max_results) and stored in
+SQLite, so repeat topics, resumed workflows and restarts skip the external
+API round-trip. Each API has its own freshness TTL (preprint servers change
+faster than CrossRef). Past its TTL an entry is still served for a stale
+window while a background refresh replaces it (stale-while-revalidate).
+The least recently used entries are evicted beyond ``max_entries``.
+
+``REFERENCE_CACHE_PATH`` selects the database file (``:memory:`` keeps the
+cache in-process only).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..models.collaborative_research import Reference
+from ..request_dedup import normalize_topic
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.environ.get("REFERENCE_CACHE_PATH", "data/reference_cache.db")
+DEFAULT_MAX_ENTRIES = int(os.environ.get("REFERENCE_CACHE_MAX_ENTRIES", "20000"))
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+# Freshness per API; entries stay servable (while refreshing) for STALE_FACTOR × TTL more
+API_TTLS: Dict[str, float] = {
+    "openalex": 7 * DAY,
+    "crossref": 7 * DAY,
+    "core": 7 * DAY,
+    "semantic_scholar": 3 * DAY,
+    "pubmed": 3 * DAY,
+    "europe_pmc": 3 * DAY,
+    "arxiv": 1 * DAY,
+    "brave": 12 * HOUR,
+    # Metadata enrichment lookups (see SourceRetriever.enrich_references)
+    "doi_metadata": 30 * DAY,
+    "title_metadata": 7 * DAY,
+}
+DEFAULT_TTL = 1 * DAY
+STALE_FACTOR = 4.0
+# Empty results may be transient failures (timeouts, rate limits): keep them briefly
+EMPTY_RESULT_TTL = 300.0
+
+EVICT_EVERY_PUTS = 50
+
+
+class ReferenceCache:
+    """SQLite-backed LRU cache of search results with stale-while-revalidate."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttls: Optional[Dict[str, float]] = None):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttls = {**API_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._refreshing: Dict[Tuple[str, str, int], asyncio.Task] = {}
+        self._puts = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS reference_cache (
+                    api TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    max_results INTEGER NOT NULL,
+                    refs_json TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    fresh_until REAL NOT NULL,
+                    stale_until REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (api, query, max_results)
+                );
+                CREATE INDEX IF NOT EXISTS idx_reference_cache_last_used ON reference_cache(last_used);
+            """)
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _key(api: str, query: str, max_results: int) -> Tuple[str, str, int]:
+        return (api, normalize_topic(query), int(max_results))
+
+    def get(self, api: str, query: str, max_results: int) -> Optional[Tuple[List[Reference], bool]]:
+        """Cached (references, is_fresh), or None if missing or past its stale window."""
+        key = self._key(api, query, max_results)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                """SELECT refs_json, fresh_until, stale_until FROM reference_cache
+                   WHERE api = ? AND query = ? AND max_results = ?""",
+                key,
+            ).fetchone()
+            if row is None or row[2] < now:
+                if row is not None:
+                    conn.execute("DELETE FROM reference_cache WHERE api = ? AND query = ? AND max_results = ?", key)
+                    conn.commit()
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE reference_cache SET last_used = ? WHERE api = ? AND query = ? AND max_results = ?",
+                (now, *key),
+            )
+            conn.commit()
+        fresh = row[1] >= now
+        if fresh:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return [Reference.from_dict(d) for d in json.loads(row[0])], fresh
+
+    def put(self, api: str, query: str, max_results: int, refs: List[Reference], keep_nonempty: bool = False):
+        """Store results. With ``keep_nonempty``, an empty result never replaces a non-empty one."""
+        key = self._key(api, query, max_results)
+        now = time.time()
+        ttl = self.ttls.get(api, DEFAULT_TTL) if refs else EMPTY_RESULT_TTL
+        with self._lock:
+            conn = self._connection()
+            if keep_nonempty and not refs:
+                row = conn.execute(
+                    "SELECT refs_json FROM reference_cache WHERE api = ? AND query = ? AND max_results = ?", key,
+                ).fetchone()
+                if row is not None and row[0] != "[]":
+                    return
+            conn.execute(
+                """INSERT OR REPLACE INTO reference_cache
+                   (api, query, max_results, refs_json, fetched_at, fresh_until, stale_until, last_used)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (*key, json.dumps([r.to_dict() for r in refs]), now, now + ttl,
+                 now + ttl * (1 + STALE_FACTOR) if refs else now + ttl, now),
+            )
+            self._puts += 1
+            if self._puts % EVICT_EVERY_PUTS == 0:
+                self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop the least recently used entries beyond ``max_entries``."""
+        excess = conn.execute("SELECT COUNT(*) FROM reference_cache").fetchone()[0] - self.max_entries
+        if excess > 0:
+            conn.execute(
+                """DELETE FROM reference_cache WHERE rowid IN (
+                       SELECT rowid FROM reference_cache ORDER BY last_used LIMIT ?)""",
+                (excess,),
+            )
+
+    def revalidate(self, api: str, query: str, max_results: int,
+                   fetch: Callable[[], Awaitable[List[Reference]]]) -> Optional[asyncio.Task]:
+        """Refresh a stale entry in the background (at most one refresh per key)."""
+        key = self._key(api, query, max_results)
+        if key in self._refreshing:
+            return self._refreshing[key]
+
+        async def refresh():
+            try:
+                self.put(api, query, max_results, await fetch(), keep_nonempty=True)
+            except Exception as e:
+                logger.debug("Reference cache refresh failed for %s: %s", key, e)
+            finally:
+                self._refreshing.pop(key, None)
+
+        task = asyncio.create_task(refresh())
+        self._refreshing[key] = task
+        return task
+
+    async def fetch(self, api: str, query: str, max_results: int,
+                    fetch: Callable[[], Awaitable[List[Reference]]]) -> List[Reference]:
+        """Serve from cache (refreshing stale entries) or fetch and store."""
+        cached = self.get(api, query, max_results)
+        if cached is not None:
+            refs, fresh = cached
+            if not fresh:
+                self.revalidate(api, query, max_results, fetch)
+            return refs
+        refs = await fetch()
+        self.put(api, query, max_results, refs)
+        return refs
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._connection().execute("SELECT COUNT(*) FROM reference_cache").fetchone()[0]
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshing": len(self._refreshing),
+        }
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM reference_cache")
+            conn.commit()
+        self.hits = self.stale_hits = self.misses = 0
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_shared: Optional[ReferenceCache] = None
+
+
+def reference_cache() -> ReferenceCache:
+    """The process-wide cache, opened on first use."""
+    global _shared
+    if _shared is None:
+        _shared = ReferenceCache()
+    return _shared
+
+
+def set_reference_cache(cache: Optional[ReferenceCache]):
+    """Replace the process-wide cache (tests, alternative paths); None reopens the default."""
+    global _shared
+    if _shared is not None and _shared is not cache:
+        _shared.close()
+    _shared = cache
@@ -0,0 +1,223 @@
+"""Local full-text corpus of every reference the system has retrieved.
+
+References that pass ``search_all``'s quality filters are added to a SQLite
+FTS5 index (title, venue, summary, authors) and ranked with BM25, so later
+workflows on related topics get validated references instantly and offline
+before any external API is asked. ``index_results`` backfills the corpus
+from research notes and round JSON already saved under ``results/``.
+
+``REFERENCE_CORPUS_PATH`` selects the database file (``:memory:`` keeps the
+corpus in-process only).
+"""
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from ..models.collaborative_research import Reference
+from ..request_dedup import STOPWORDS, normalize_topic
+from .normalize_ref import clean_doi, normalize_title
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS_PATH = os.environ.get("REFERENCE_CORPUS_PATH", "data/reference_corpus.db")
+
+# BM25 column weights: title, venue, summary, authors
+BM25_WEIGHTS = (10.0, 1.0, 3.0, 1.0)
+# Share of query terms a reference must contain to be returned
+MIN_TERM_COVERAGE = 0.6
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+def _terms(text: str) -> List[str]:
+    return [t for t in normalize_topic(text).split() if t not in STOPWORDS and len(t) > 1]
+
+
+def _ref_key(ref: Reference) -> Optional[str]:
+    doi = clean_doi(ref.doi)
+    if doi:
+        return f"doi:{doi.lower().strip()}"
+    title = normalize_title(ref.title)
+    if title and title != "untitled":
+        return f"title:{title}"
+    return None
+
+
+class ReferenceCorpus:
+    """SQLite FTS5 index of references with BM25 ranking."""
+
+    def __init__(self, path: str = DEFAULT_CORPUS_PATH):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS corpus (
+                    id INTEGER PRIMARY KEY,
+                    ref_key TEXT NOT NULL UNIQUE,
+                    title TEXT NOT NULL,
+                    venue TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    authors TEXT NOT NULL,
+                    ref_json TEXT NOT NULL,
+                    added_at REAL NOT NULL
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS corpus_fts USING fts5(
+                    title, venue, summary, authors, content='corpus', content_rowid='id'
+                );
+                CREATE TRIGGER IF NOT EXISTS corpus_ai AFTER INSERT ON corpus BEGIN
+                    INSERT INTO corpus_fts(rowid, title, venue, summary, authors)
+                    VALUES (new.id, new.title, new.venue, new.summary, new.authors);
+                END;
+                CREATE TRIGGER IF NOT EXISTS corpus_ad AFTER DELETE ON corpus BEGIN
+                    INSERT INTO corpus_fts(corpus_fts, rowid, title, venue, summary, authors)
+                    VALUES ('delete', old.id, old.title, old.venue, old.summary, old.authors);
+                END;
+                CREATE TABLE IF NOT EXISTS corpus_files (
+                    path TEXT PRIMARY KEY,
+                    mtime REAL NOT NULL
+                );
+            """)
+            self._conn.commit()
+        return self._conn
+
+    def add(self, refs: Iterable[Reference]) -> int:
+        """Index references not seen before (by DOI, else normalized title). Returns how many."""
+        rows = []
+        for ref in refs:
+            key = _ref_key(ref)
+            if key is None:
+                continue
+            data = ref.to_dict()
+            data["id"] = 0
+            rows.append((key, ref.title or "", ref.venue or "", ref.summary or "",
+                         ", ".join(ref.authors or []), json.dumps(data), time.time()))
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            before = conn.execute("SELECT COUNT(*) FROM corpus").fetchone()[0]
+            conn.executemany(
+                """INSERT OR IGNORE INTO corpus (ref_key, title, venue, summary, authors, ref_json, added_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            conn.commit()
+            return conn.execute("SELECT COUNT(*) FROM corpus").fetchone()[0] - before
+
+    def search(self, query: str, limit: int = 10) -> List[Reference]:
+        """Best BM25 matches covering most of the query's terms (ids are 0)."""
+        terms = list(dict.fromkeys(_terms(query)))
+        if not terms or limit <= 0:
+            return []
+        match = " OR ".join(f'"{t}"' for t in terms)
+        with self._lock:
+            rows = self._connection().execute(
+                f"""SELECT c.ref_json, c.title, c.venue, c.summary, c.authors
+                    FROM corpus_fts JOIN corpus c ON c.id = corpus_fts.rowid
+                    WHERE corpus_fts MATCH ?
+                    ORDER BY bm25(corpus_fts, {', '.join(map(str, BM25_WEIGHTS))})
+                    LIMIT ?""",
+                (match, limit * 5),
+            ).fetchall()
+        needed = math.ceil(MIN_TERM_COVERAGE * len(terms))
+        refs = []
+        for ref_json, *fields in rows:
+            present = set(_terms(" ".join(fields)))
+            if sum(1 for t in terms if t in present) >= needed:
+                refs.append(Reference.from_dict(json.loads(ref_json)))
+                if len(refs) == limit:
+                    break
+        if refs:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return refs
+
+    def index_results(self, results_dir: str = "results") -> int:
+        """Add references from saved JSON under ``results_dir`` (files changed since the last call)."""
+        added = 0
+        for path in Path(results_dir).rglob("*.json"):
+            try:
+                mtime = path.stat().st_mtime
+                with self._lock:
+                    row = self._connection().execute(
+                        "SELECT mtime FROM corpus_files WHERE path = ?", (str(path),)).fetchone()
+                if row is not None and row[0] >= mtime:
+                    continue
+                with open(path) as f:
+                    data = json.load(f)
+                added += self.add(_saved_references(data))
+                with self._lock:
+                    conn = self._connection()
+                    conn.execute("INSERT OR REPLACE INTO corpus_files (path, mtime) VALUES (?, ?)", (str(path), mtime))
+                    conn.commit()
+            except (OSError, ValueError) as e:
+                logger.debug("Skipping %s while indexing references: %s", path, e)
+        return added
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._connection().execute("SELECT COUNT(*) FROM corpus").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _saved_references(data, depth: int = 0) -> Iterator[Reference]:
+    """References found under any ``references`` key of a saved results document."""
+    if depth > 6:
+        return
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "references" and isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict) and item.get("title") and isinstance(item.get("authors"), list):
+                        try:
+                            yield Reference.from_dict({"id": 0, "venue": "", "year": 0, **item})
+                        except (KeyError, TypeError):
+                            continue
+            else:
+                yield from _saved_references(value, depth + 1)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _saved_references(item, depth + 1)
+
+
+_shared: Optional[ReferenceCorpus] = None
+
+
+def reference_corpus() -> ReferenceCorpus:
+    """The process-wide corpus, opened on first use."""
+    global _shared
+    if _shared is None:
+        _shared = ReferenceCorpus()
+    return _shared
+
+
+def set_reference_corpus(corpus: Optional[ReferenceCorpus]):
+    """Replace the process-wide corpus (tests, alternative paths); None reopens the default."""
+    global _shared
+    if _shared is not None and _shared is not corpus:
+        _shared.close()
+    _shared = corpus
@@ -0,0 +1,152 @@
+"""Reference matching index shared by deduplication and citation checks.
+
+``ReferenceIndex`` answers "is this the same paper as one we already have?"
+in near-constant time:
+
+- exact hash maps on cleaned DOI, arXiv ID and normalized title
+- a fuzzy lookup over character trigrams of the normalized title (an
+  inverted index, so only titles sharing trigrams are compared), which
+  catches preprint/published pairs, subtitle variants and small edits
+
+Two references with different journal DOIs are never matched fuzzily, so
+"Part I"/"Part II" style pairs stay distinct. Containment matching (one
+title inside the other) is opt-in for callers that must tolerate titles
+truncated by an LLM.
+"""
+
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..models.collaborative_research import Reference
+from .normalize_ref import clean_doi, normalize_title
+
+FUZZY_THRESHOLD = 0.8       # trigram Jaccard similarity for a fuzzy title match
+CONTAINMENT_THRESHOLD = 0.9  # share of the shorter title's trigrams found in the longer one
+MIN_FUZZY_LENGTH = 12        # shorter normalized titles only match exactly
+
+_ARXIV_ID_RE = re.compile(r"(?:arxiv[:./\s]*|arxiv\.org/(?:abs|pdf)/)(\d{4}\.\d{4,5})(?:v\d+)?", re.IGNORECASE)
+_ARXIV_TITLE_PREFIX_RE = re.compile(r"^\[(\d{4}\.\d{4,5})]")
+_DOI_RE = re.compile(r"10\.\d{4,9}/[^\s\]]+")
+
+
+def doi_key(doi: Optional[str]) -> Optional[str]:
+    """Comparable DOI (lowercase, no resolver prefix or trailing punctuation), or None."""
+    if not doi:
+        return None
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:\s*)", "", doi.strip(), flags=re.IGNORECASE)
+    doi = clean_doi(doi)
+    if not doi or not doi.startswith("10."):
+        return None
+    return doi.lower().rstrip(".,;")
+
+
+def arxiv_id(*texts: Optional[str]) -> Optional[str]:
+    """First arXiv identifier (without version) found in the given strings."""
+    for text in texts:
+        if not text:
+            continue
+        match = _ARXIV_ID_RE.search(text) or _ARXIV_TITLE_PREFIX_RE.match(text.strip())
+        if match:
+            return match.group(1)
+    return None
+
+
+def find_doi(text: str) -> Optional[str]:
+    """First DOI-looking substring of free text."""
+    match = _DOI_RE.search(text or "")
+    return match.group(0) if match else None
+
+
+def _trigrams(norm: str) -> Set[str]:
+    return {norm[i:i + 3] for i in range(len(norm) - 2)}
+
+
+def _is_arxiv_doi(doi: Optional[str]) -> bool:
+    return bool(doi) and doi.startswith("10.48550/")
+
+
+class ReferenceIndex:
+    """DOI, arXiv-ID and title lookups over a growing set of references."""
+
+    def __init__(self, refs: Iterable[Reference] = (), fuzzy_threshold: float = FUZZY_THRESHOLD):
+        self.fuzzy_threshold = fuzzy_threshold
+        self._refs: List[Reference] = []
+        self._dois: Dict[str, int] = {}
+        self._dois_by_ref: Dict[int, Optional[str]] = {}
+        self._arxiv: Dict[str, int] = {}
+        self._titles: Dict[str, int] = {}
+        self._title_grams: Dict[int, Set[str]] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for ref in refs:
+            self.add(ref)
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __iter__(self):
+        return iter(self._refs)
+
+    def add(self, ref: Reference) -> Reference:
+        """Index ``ref`` unless it is already known; returns the indexed reference."""
+        existing = self.find(ref)
+        if existing is not None:
+            return existing
+        slot = len(self._refs)
+        self._refs.append(ref)
+        doi = doi_key(ref.doi)
+        self._dois_by_ref[slot] = doi
+        if doi:
+            self._dois.setdefault(doi, slot)
+        arxiv = arxiv_id(ref.doi, ref.url, ref.title)
+        if arxiv:
+            self._arxiv.setdefault(arxiv, slot)
+        norm = normalize_title(ref.title or "")
+        if norm and norm != "untitled":
+            self._titles.setdefault(norm, slot)
+            grams = _trigrams(norm)
+            self._title_grams[slot] = grams
+            for gram in grams:
+                self._postings[gram].append(slot)
+        return ref
+
+    def find(self, ref: Reference, containment: bool = False) -> Optional[Reference]:
+        """The indexed reference that ``ref`` duplicates, if any."""
+        return self.lookup(doi=ref.doi, arxiv=arxiv_id(ref.doi, ref.url, ref.title),
+                           title=ref.title, containment=containment)
+
+    def lookup(self, doi: Optional[str] = None, arxiv: Optional[str] = None, title: Optional[str] = None,
+               containment: bool = False) -> Optional[Reference]:
+        """Match by DOI, then arXiv ID, then exact and fuzzy title."""
+        doi = doi_key(doi)
+        if doi and doi in self._dois:
+            return self._refs[self._dois[doi]]
+        arxiv = arxiv or arxiv_id(doi)
+        if arxiv and arxiv in self._arxiv:
+            return self._refs[self._arxiv[arxiv]]
+        norm = normalize_title(title or "")
+        if not norm or norm == "untitled":
+            return None
+        if norm in self._titles:
+            return self._refs[self._titles[norm]]
+        if len(norm) < MIN_FUZZY_LENGTH:
+            return None
+        slot = self._fuzzy(norm, doi, containment)
+        return self._refs[slot] if slot is not None else None
+
+    def _fuzzy(self, norm: str, doi: Optional[str], containment: bool) -> Optional[int]:
+        grams = _trigrams(norm)
+        overlap = Counter(slot for gram in grams for slot in self._postings.get(gram, ()))
+        best, best_score = None, 0.0
+        for slot, shared in overlap.most_common():
+            other_doi = self._dois_by_ref[slot]
+            if doi and other_doi and doi != other_doi and not (_is_arxiv_doi(doi) or _is_arxiv_doi(other_doi)):
+                continue  # two different published papers
+            other = self._title_grams[slot]
+            score = shared / (len(grams) + len(other) - shared)
+            if containment and min(len(grams), len(other)) >= MIN_FUZZY_LENGTH - 2:
+                if shared / min(len(grams), len(other)) >= CONTAINMENT_THRESHOLD:
+                    score = max(score, self.fuzzy_threshold)
+            if score >= self.fuzzy_threshold and score > best_score:
+                best, best_score = slot, score
+        return best
@@ -0,0 +1,96 @@
+"""Relevance ranking of retrieved references.
+
+``search_all`` collects candidates from several APIs in arrival order.
+``rank_references`` scores them all against the topic (and category) in one
+pass: BM25 over title, venue and summary, plus citation-count and recency
+features when the source API reported them. Callers keep only the top
+entries, so prompts carry fewer, more relevant references.
+"""
+
+import math
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from ..models.collaborative_research import Reference
+from ..request_dedup import STOPWORDS, normalize_topic
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_REPEAT = 2        # title terms count twice
+CATEGORY_WEIGHT = 0.5   # category terms matter less than the topic's own words
+
+# Final score = weighted sum of features scaled to [0, 1]
+TEXT_WEIGHT = 0.7
+CITATION_WEIGHT = 0.15
+RECENCY_WEIGHT = 0.15
+RECENCY_HALF_LIFE_YEARS = 8.0
+
+
+def _terms(text: str) -> List[str]:
+    return [t for t in normalize_topic(text).split() if t not in STOPWORDS and len(t) > 1]
+
+
+def _query_weights(topic: str, category: Optional[dict]) -> Dict[str, float]:
+    weights = {t: 1.0 for t in _terms(topic)}
+    for key in ("subfield", "major", "secondary_subfield"):
+        for term in _terms(((category or {}).get(key) or "").replace("_", " ")):
+            weights.setdefault(term, CATEGORY_WEIGHT)
+    return weights
+
+
+def bm25_scores(query: Dict[str, float], documents: List[List[str]]) -> List[float]:
+    """BM25 score of each tokenized document for weighted query terms."""
+    n = len(documents)
+    if not n or not query:
+        return [0.0] * n
+    lengths = [len(doc) for doc in documents]
+    avg_len = (sum(lengths) / n) or 1.0
+    counts = [Counter(doc) for doc in documents]
+    doc_freq = Counter(term for c in counts for term in c if term in query)
+    idf = {term: math.log(1 + (n - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+    scores = []
+    for c, length in zip(counts, lengths):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len)
+        scores.append(sum(
+            weight * idf[term] * c[term] * (BM25_K1 + 1) / (c[term] + norm)
+            for term, weight in query.items() if term in c
+        ))
+    return scores
+
+
+def relevance_scores(refs: List[Reference], topic: str, category: Optional[dict] = None,
+                     current_year: Optional[int] = None) -> List[float]:
+    """Combined relevance in [0, 1] for each reference, in input order."""
+    if not refs:
+        return []
+    current_year = current_year or datetime.now().year
+    documents = [
+        _terms(r.title) * TITLE_REPEAT + _terms(r.venue or "") + _terms(r.summary or "")
+        for r in refs
+    ]
+    text = bm25_scores(_query_weights(topic, category), documents)
+    top_text = max(text) or 1.0
+
+    citations = [math.log1p(max(r.cited_by_count or 0, 0)) for r in refs]
+    top_citations = max(citations) or 1.0
+
+    scores = []
+    for ref, text_score, citation_score in zip(refs, text, citations):
+        age = max(0, current_year - ref.year) if ref.year else None
+        recency = 0.5 ** (age / RECENCY_HALF_LIFE_YEARS) if age is not None else 0.0
+        scores.append(
+            TEXT_WEIGHT * text_score / top_text
+            + CITATION_WEIGHT * citation_score / top_citations
+            + RECENCY_WEIGHT * recency
+        )
+    return scores
+
+
+def rank_references(refs: List[Reference], topic: str, category: Optional[dict] = None,
+                    top_k: Optional[int] = None) -> List[Reference]:
+    """References sorted by relevance (ties keep arrival order), truncated to ``top_k``."""
+    scores = relevance_scores(refs, topic, category)
+    order = sorted(range(len(refs)), key=lambda i: -scores[i])
+    ranked = [refs[i] for i in order]
+    return ranked if top_k is None else ranked[:top_k]
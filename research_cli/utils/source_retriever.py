@@ -7,71 +7,113 @@ immediately; key-gated APIs activate when env vars are set.
 """
 
 import asyncio
+import copy
+import functools
+import inspect
 import logging
+import math
 import os
 import re
+import sqlite3
 import time
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 import aiohttp
 
 from ..models.collaborative_research import Reference
+from ..request_dedup import normalize_topic
+from .http_session import ACCEPT_ENCODING, new_session, shared_session
+from .rate_limit import rate_limiter
 from .normalize_ref import normalize_title, clean_doi
+from .reference_cache import ReferenceCache, reference_cache
+from .reference_corpus import ReferenceCorpus, reference_corpus
+from .reference_index import ReferenceIndex, arxiv_id, doi_key
+from .query_planner import SEARCH_REQUEST_BUDGET, allocate_requests, plan_queries
+from .relevance import rank_references
+
+
+SEARCH_DEADLINE_SECONDS = float(os.environ.get("SOURCE_SEARCH_DEADLINE", "20"))
+# Academic candidates fetched per kept reference, before relevance ranking
+RANK_OVERSAMPLE = 1.5
+# Metadata enrichment: DOIs per batched request, title lookups per search, time allowed
+ENRICH_BATCH_SIZE = 50
+ENRICH_MAX_TITLE_LOOKUPS = 10
+ENRICH_TIMEOUT_SECONDS = 10.0
 
 
 # ---------------------------------------------------------------------------
-# Rate limiter
+# Caching
 # ---------------------------------------------------------------------------
 
 @dataclass
-class _RateLimiter:
-    """Token-bucket style per-API rate limiter."""
+class _CacheEntry:
+    data: List[Reference]
+    expires: float
 
-    interval: float  # minimum seconds between requests
-    _last: float = field(default=0.0, repr=False)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
 
-    async def wait(self):
-        async with self._lock:
-            now = time.monotonic()
-            delay = self.interval - (now - self._last)
-            if delay > 0:
-                await asyncio.sleep(delay)
-            self._last = time.monotonic()
+# Set inside background refreshes of stale cache entries
+_revalidating: ContextVar[bool] = ContextVar("reference_cache_revalidating", default=False)
 
 
 # ---------------------------------------------------------------------------
-# In-memory cache with TTL
+# Single-flight coalescing
 # ---------------------------------------------------------------------------
 
-@dataclass
-class _CacheEntry:
-    data: List[Reference]
-    expires: float
+# (api, normalized query, max_results) → the in-flight search, shared process-wide
+_in_flight: Dict[Tuple[str, str, int], asyncio.Task] = {}
+_search_stats = {"hits": 0, "misses": 0, "coalesced": 0}
 
 
-class _TTLCache:
-    """Simple in-memory cache with per-key TTL."""
+def _single_flight(api: str):
+    """Let concurrent identical searches share one in-flight request.
 
-    def __init__(self, ttl: float = 1800.0):  # 30 min default
-        self._store: Dict[str, _CacheEntry] = {}
-        self._ttl = ttl
+    The first caller runs the search in a shared task; callers arriving before
+    it finishes await that task instead of issuing their own request. Each
+    joiner gets copies of the results, since callers renumber references.
+    """
+    def decorator(search):
+        signature = inspect.signature(search)
+
+        @functools.wraps(search)
+        async def wrapper(self, *args, **kwargs):
+            if _revalidating.get():
+                return await search(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (api, normalize_topic(bound.arguments["query"]), int(bound.arguments["max_results"]))
+            task = _in_flight.get(key)
+            if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+                _search_stats["coalesced"] += 1
+                return copy.deepcopy(await asyncio.shield(task))
+            task = asyncio.ensure_future(search(self, *args, **kwargs))
+            _in_flight[key] = task
+            task.add_done_callback(functools.partial(_land, key))
+            # Shielded: cancelling the first caller must not fail the searches that joined it
+            return await asyncio.shield(task)
+
+        return wrapper
+    return decorator
 
-    def get(self, key: str) -> Optional[List[Reference]]:
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        if time.monotonic() > entry.expires:
-            del self._store[key]
-            return None
-        return entry.data
 
-    def put(self, key: str, data: List[Reference]):
-        self._store[key] = _CacheEntry(data=data, expires=time.monotonic() + self._ttl)
+def _land(key: Tuple[str, str, int], task: asyncio.Task):
+    if _in_flight.get(key) is task:
+        del _in_flight[key]
+
+
+def search_stats() -> dict:
+    """Process-wide search counters: cache hits, misses (API requests) and coalesced joins."""
+    return {**_search_stats, "in_flight": sum(1 for t in _in_flight.values() if not t.done())}
+
+
+def reset_search_stats():
+    for name in _search_stats:
+        _search_stats[name] = 0
 
 
 # ---------------------------------------------------------------------------
@@ -86,13 +128,23 @@ class SourceRetriever:
       - SEMANTIC_SCHOLAR_API_KEY
       - BRAVE_API_KEY
       - CORE_API_KEY  (optional, enables CORE API)
+
+    HTTP requests go through the process-wide pooled session (see
+    ``utils.http_session``) unless a session is passed in. Used as an async
+    context manager with ``private_session=True``, the retriever opens its
+    own pooled session and closes it on exit.
     """
 
     _HEADERS = {
         "User-Agent": "AutonomousResearchPress/1.0 (research bot)",
-        "Accept-Encoding": "gzip, deflate",
+        "Accept-Encoding": ACCEPT_ENCODING,
     }
 
+    _OPENALEX_SELECT = "id,title,authorships,primary_location,publication_year,doi,cited_by_count"
+    _CROSSREF_SELECT = "DOI,title,author,container-title,published-print,published-online,URL,is-referenced-by-count"
+    # CrossRef's polite pool wants a contact address
+    _CROSSREF_POLITE = {"User-Agent": "AutonomousResearchPress/1.0 (mailto:research@autonomouspress.dev)"}
+
     # Domain → API combination mapping
     _DOMAIN_APIS: Dict[str, List[str]] = {
         "medicine_health": ["openalex", "pubmed", "europe_pmc", "semantic_scholar", "brave"],
@@ -106,89 +158,134 @@ class SourceRetriever:
         "engineering": ["openalex", "arxiv", "semantic_scholar", "crossref", "brave"],
     }
 
-    def __init__(self):
-        self._cache = _TTLCache()
-        self._limiters = {
-            "openalex": _RateLimiter(interval=0.1),         # 10 req/s
-            "arxiv": _RateLimiter(interval=3.0),             # 1 req/3s (arxiv ToS)
-            "semantic_scholar": _RateLimiter(interval=1.0),  # 1 req/s
-            "brave": _RateLimiter(interval=1.0),             # 1 req/s
-            "pubmed": _RateLimiter(interval=0.35),           # ~3 req/s (no key)
-            "europe_pmc": _RateLimiter(interval=0.5),        # conservative
-            "core": _RateLimiter(interval=6.0),              # 10 req/min
-            "crossref": _RateLimiter(interval=0.1),          # 50 req/s (polite pool)
-        }
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None, private_session: bool = False,
+                 cache: Optional[ReferenceCache] = None, corpus: Optional[ReferenceCorpus] = None):
+        self._own_session = session
+        self._private_session = private_session and session is None
+        self._cache = cache or reference_cache()
+        self._corpus = corpus or reference_corpus()
+        # Seconds this retriever spent waiting on the shared per-API rate limiters
+        self.rate_limit_waits: Dict[str, float] = {}
+        # Seconds from the start of the last search_all until each source answered
+        self.source_latencies: Dict[str, float] = {}
+
+    async def __aenter__(self) -> "SourceRetriever":
+        if self._private_session:
+            self._own_session = new_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._private_session and self._own_session is not None:
+            await self._own_session.close()
+            self._own_session = None
+
+    def _cached(self, api: str, query: str, max_results: int, search) -> Optional[List[Reference]]:
+        """Cached results for a search, or None to fetch. Stale hits refresh in the background."""
+        if _revalidating.get():
+            return None
+        cached = self._cache.get(api, query, max_results)
+        if cached is None:
+            _search_stats["misses"] += 1
+            return None
+        _search_stats["hits"] += 1
+        refs, fresh = cached
+        if not fresh:
+            async def refetch():
+                _revalidating.set(True)  # task-local: bypass the cache and let revalidate() store
+                return await search(query, max_results)
+            self._cache.revalidate(api, query, max_results, refetch)
+        return refs
+
+    def _store(self, api: str, query: str, max_results: int, refs: List[Reference]):
+        if not _revalidating.get():
+            self._cache.put(api, query, max_results, refs)
+
+    async def _throttle(self, api: str):
+        """Wait for ``api``'s process-wide rate limiter and record the wait."""
+        waited = await rate_limiter(api).wait()
+        self.rate_limit_waits[api] = self.rate_limit_waits.get(api, 0.0) + waited
+
+    @asynccontextmanager
+    async def _session(self):
+        """The session for one request; borrowed, so leaving the block keeps it open."""
+        session = self._own_session
+        if session is None or session.closed:
+            session = shared_session()
+        yield session
 
     # ------------------------------------------------------------------
     # OpenAlex  (free, no key)
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _parse_openalex_work(work: dict) -> Reference:
+        authors = []
+        for authorship in work.get("authorships", [])[:5]:
+            name = authorship.get("author", {}).get("display_name")
+            if name:
+                authors.append(name)
+
+        loc = work.get("primary_location") or {}
+        source = loc.get("source") or {}
+        venue = source.get("display_name", "")
+
+        doi_raw = work.get("doi") or ""
+        doi = doi_raw.replace("https://doi.org/", "") if doi_raw else None
+
+        return Reference(
+            id=0,  # assigned later during dedup
+            authors=authors or ["Unknown"],
+            title=work.get("title") or "Untitled",
+            venue=venue or "OpenAlex",
+            year=work.get("publication_year") or 0,
+            url=doi_raw or None,
+            doi=doi,
+            summary="",
+            cited_by_count=work.get("cited_by_count"),
+        )
+
+    @_single_flight("openalex")
     async def search_openalex(self, query: str, max_results: int = 5) -> List[Reference]:
-        cache_key = f"openalex:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("openalex", query, max_results, self.search_openalex)
         if cached is not None:
             return cached
 
-        await self._limiters["openalex"].wait()
+        await self._throttle("openalex")
 
         url = "https://api.openalex.org/works"
         params = {
             "search": query,
             "per_page": max_results,
             "sort": "relevance_score:desc",
-            "select": "id,title,authorships,primary_location,publication_year,doi",
+            "select": self._OPENALEX_SELECT,
         }
 
         refs: List[Reference] = []
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(url, params=params, headers=self._HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
                     data = await resp.json()
 
-            for i, work in enumerate(data.get("results", []), start=1):
-                authors = []
-                for authorship in work.get("authorships", [])[:5]:
-                    name = authorship.get("author", {}).get("display_name")
-                    if name:
-                        authors.append(name)
-
-                venue = ""
-                loc = work.get("primary_location") or {}
-                source = loc.get("source") or {}
-                venue = source.get("display_name", "")
-
-                doi_raw = work.get("doi") or ""
-                doi = doi_raw.replace("https://doi.org/", "") if doi_raw else None
-
-                refs.append(Reference(
-                    id=0,  # assigned later during dedup
-                    authors=authors or ["Unknown"],
-                    title=work.get("title") or "Untitled",
-                    venue=venue or "OpenAlex",
-                    year=work.get("publication_year") or 0,
-                    url=doi_raw or None,
-                    doi=doi,
-                    summary="",
-                ))
+            refs = [self._parse_openalex_work(work) for work in data.get("results", [])]
         except Exception:
             pass
 
-        self._cache.put(cache_key, refs)
+        self._store("openalex", query, max_results, refs)
         return refs
 
     # ------------------------------------------------------------------
     # arXiv  (free, no key)
     # ------------------------------------------------------------------
 
+    @_single_flight("arxiv")
     async def search_arxiv(self, query: str, max_results: int = 5) -> List[Reference]:
-        cache_key = f"arxiv:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("arxiv", query, max_results, self.search_arxiv)
         if cached is not None:
             return cached
 
-        await self._limiters["arxiv"].wait()
+        await self._throttle("arxiv")
 
         url = "http://export.arxiv.org/api/query"
         params = {
@@ -201,7 +298,7 @@ class SourceRetriever:
 
         refs: List[Reference] = []
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(url, params=params, headers=self._HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
@@ -248,36 +345,36 @@ class SourceRetriever:
         except Exception:
             pass
 
-        self._cache.put(cache_key, refs)
+        self._store("arxiv", query, max_results, refs)
         return refs
 
     # ------------------------------------------------------------------
     # Semantic Scholar  (key optional, higher rate limit with key)
     # ------------------------------------------------------------------
 
+    @_single_flight("semantic_scholar")
     async def search_semantic_scholar(self, query: str, max_results: int = 5) -> List[Reference]:
         api_key = os.environ.get("SEMANTIC_SCHOLAR_API_KEY")
         if not api_key:
             return []
 
-        cache_key = f"ss:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("semantic_scholar", query, max_results, self.search_semantic_scholar)
         if cached is not None:
             return cached
 
-        await self._limiters["semantic_scholar"].wait()
+        await self._throttle("semantic_scholar")
 
         url = "https://api.semanticscholar.org/graph/v1/paper/search"
         params = {
             "query": query,
             "limit": max_results,
-            "fields": "title,authors,year,venue,externalIds,url",
+            "fields": "title,authors,year,venue,externalIds,url,citationCount",
         }
         headers = {**self._HEADERS, "x-api-key": api_key}
 
         refs: List[Reference] = []
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
@@ -297,24 +394,25 @@ class SourceRetriever:
                     url=paper.get("url"),
                     doi=doi,
                     summary="",
+                    cited_by_count=paper.get("citationCount"),
                 ))
         except Exception:
             pass
 
-        self._cache.put(cache_key, refs)
+        self._store("semantic_scholar", query, max_results, refs)
         return refs
 
     # ------------------------------------------------------------------
     # PubMed / NCBI E-utilities  (free, no key required)
     # ------------------------------------------------------------------
 
+    @_single_flight("pubmed")
     async def search_pubmed(self, query: str, max_results: int = 5) -> List[Reference]:
-        cache_key = f"pubmed:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("pubmed", query, max_results, self.search_pubmed)
         if cached is not None:
             return cached
 
-        await self._limiters["pubmed"].wait()
+        await self._throttle("pubmed")
 
         refs: List[Reference] = []
         try:
@@ -327,7 +425,7 @@ class SourceRetriever:
                 "sort": "relevance",
                 "retmode": "json",
             }
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(esearch_url, params=esearch_params, headers=self._HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
@@ -338,14 +436,14 @@ class SourceRetriever:
                 return refs
 
             # Step 2: efetch to get article details
-            await self._limiters["pubmed"].wait()
+            await self._throttle("pubmed")
             efetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
             efetch_params = {
                 "db": "pubmed",
                 "id": ",".join(id_list),
                 "retmode": "xml",
             }
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(efetch_url, params=efetch_params, headers=self._HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
@@ -403,20 +501,20 @@ class SourceRetriever:
         except Exception as e:
             logger.warning(f"PubMed search failed: {e}")
 
-        self._cache.put(cache_key, refs)
+        self._store("pubmed", query, max_results, refs)
         return refs
 
     # ------------------------------------------------------------------
     # Europe PMC  (free, no key required)
     # ------------------------------------------------------------------
 
+    @_single_flight("europe_pmc")
     async def search_europe_pmc(self, query: str, max_results: int = 5) -> List[Reference]:
-        cache_key = f"europepmc:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("europe_pmc", query, max_results, self.search_europe_pmc)
         if cached is not None:
             return cached
 
-        await self._limiters["europe_pmc"].wait()
+        await self._throttle("europe_pmc")
 
         url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
         params = {
@@ -429,7 +527,7 @@ class SourceRetriever:
 
         refs: List[Reference] = []
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(url, params=params, headers=self._HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
@@ -467,28 +565,29 @@ class SourceRetriever:
                     url=result_url,
                     doi=doi,
                     summary="",
+                    cited_by_count=result.get("citedByCount"),
                 ))
         except Exception as e:
             logger.warning(f"Europe PMC search failed: {e}")
 
-        self._cache.put(cache_key, refs)
+        self._store("europe_pmc", query, max_results, refs)
         return refs
 
     # ------------------------------------------------------------------
     # CORE  (key required via CORE_API_KEY env var)
     # ------------------------------------------------------------------
 
+    @_single_flight("core")
     async def search_core(self, query: str, max_results: int = 5) -> List[Reference]:
         api_key = os.environ.get("CORE_API_KEY")
         if not api_key:
             return []
 
-        cache_key = f"core:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("core", query, max_results, self.search_core)
         if cached is not None:
             return cached
 
-        await self._limiters["core"].wait()
+        await self._throttle("core")
 
         url = "https://api.core.ac.uk/v3/search/works"
         params = {"q": query, "limit": max_results}
@@ -496,7 +595,7 @@ class SourceRetriever:
 
         refs: List[Reference] = []
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
@@ -544,100 +643,101 @@ class SourceRetriever:
         except Exception as e:
             logger.warning(f"CORE search failed: {e}")
 
-        self._cache.put(cache_key, refs)
+        self._store("core", query, max_results, refs)
         return refs
 
     # ------------------------------------------------------------------
     # CrossRef  (free, polite pool via mailto in User-Agent)
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _parse_crossref_item(item: dict) -> Reference:
+        authors = []
+        for author_info in (item.get("author") or [])[:5]:
+            given = author_info.get("given", "")
+            family = author_info.get("family", "")
+            name = f"{family} {given}".strip()
+            if name:
+                authors.append(name)
+
+        titles = item.get("title") or []
+        title = titles[0] if titles else "Untitled"
+
+        venues = item.get("container-title") or []
+        venue = venues[0] if venues else "CrossRef"
+
+        doi = item.get("DOI")
+        result_url = item.get("URL") or (f"https://doi.org/{doi}" if doi else None)
+
+        year = 0
+        for date_key in ("published-print", "published-online"):
+            date_parts = (item.get(date_key) or {}).get("date-parts", [[]])
+            if date_parts and date_parts[0]:
+                try:
+                    year = int(date_parts[0][0])
+                    break
+                except (ValueError, TypeError, IndexError):
+                    pass
+
+        return Reference(
+            id=0,
+            authors=authors or ["Unknown"],
+            title=title.strip() if isinstance(title, str) else "Untitled",
+            venue=venue,
+            year=year,
+            url=result_url,
+            doi=doi,
+            summary="",
+            cited_by_count=item.get("is-referenced-by-count"),
+        )
+
+    @_single_flight("crossref")
     async def search_crossref(self, query: str, max_results: int = 5) -> List[Reference]:
-        cache_key = f"crossref:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("crossref", query, max_results, self.search_crossref)
         if cached is not None:
             return cached
 
-        await self._limiters["crossref"].wait()
+        await self._throttle("crossref")
 
         url = "https://api.crossref.org/works"
         params = {
             "query": query,
             "rows": max_results,
             "sort": "relevance",
-            "select": "DOI,title,author,container-title,published-print,published-online,URL",
-        }
-        headers = {
-            **self._HEADERS,
-            "User-Agent": "AutonomousResearchPress/1.0 (mailto:research@autonomouspress.dev)",
+            "select": self._CROSSREF_SELECT,
         }
+        headers = {**self._HEADERS, **self._CROSSREF_POLITE}
 
         refs: List[Reference] = []
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
                     data = await resp.json()
 
-            for item in data.get("message", {}).get("items", []):
-                authors = []
-                for author_info in (item.get("author") or [])[:5]:
-                    given = author_info.get("given", "")
-                    family = author_info.get("family", "")
-                    name = f"{family} {given}".strip()
-                    if name:
-                        authors.append(name)
-
-                titles = item.get("title") or []
-                title = titles[0] if titles else "Untitled"
-
-                venues = item.get("container-title") or []
-                venue = venues[0] if venues else "CrossRef"
-
-                doi = item.get("DOI")
-                result_url = item.get("URL") or (f"https://doi.org/{doi}" if doi else None)
-
-                year = 0
-                for date_key in ("published-print", "published-online"):
-                    date_parts = (item.get(date_key) or {}).get("date-parts", [[]])
-                    if date_parts and date_parts[0]:
-                        try:
-                            year = int(date_parts[0][0])
-                            break
-                        except (ValueError, TypeError, IndexError):
-                            pass
-
-                refs.append(Reference(
-                    id=0,
-                    authors=authors or ["Unknown"],
-                    title=title.strip() if isinstance(title, str) else "Untitled",
-                    venue=venue,
-                    year=year,
-                    url=result_url,
-                    doi=doi,
-                    summary="",
-                ))
+            refs = [self._parse_crossref_item(item) for item in data.get("message", {}).get("items", [])]
         except Exception as e:
             logger.warning(f"CrossRef search failed: {e}")
 
-        self._cache.put(cache_key, refs)
+        self._store("crossref", query, max_results, refs)
         return refs
 
     # ------------------------------------------------------------------
     # Brave Search  (key required, 2000 free/month)
     # ------------------------------------------------------------------
 
+    @_single_flight("brave")
     async def search_brave(self, query: str, max_results: int = 4) -> List[Reference]:
         api_key = os.environ.get("BRAVE_API_KEY")
         if not api_key:
             return []
 
-        cache_key = f"brave:{query}:{max_results}"
-        cached = self._cache.get(cache_key)
+        cached = self._cached("brave", query, max_results, self.search_brave)
         if cached is not None:
             return cached
 
-        await self._limiters["brave"].wait()
+        await self._throttle("brave")
 
         url = "https://api.search.brave.com/res/v1/web/search"
         params = {"q": query, "count": max_results}
@@ -650,7 +750,7 @@ class SourceRetriever:
 
         refs: List[Reference] = []
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session() as session:
                 async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                     if resp.status != 200:
                         return refs
@@ -693,14 +793,159 @@ class SourceRetriever:
         except Exception:
             pass
 
-        self._cache.put(cache_key, refs)
+        self._store("brave", query, max_results, refs)
         return refs
 
+    # ------------------------------------------------------------------
+    # Metadata enrichment  (batched DOI lookups, then title lookups)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _needs_enrichment(ref: Reference) -> bool:
+        """Missing the metadata search_all's quality filters require, or any identifier."""
+        placeholder_authors = not ref.authors or ref.authors in (["Unknown"], ["Web Source"])
+        return not ref.year or placeholder_authors or not (doi_key(ref.doi) or arxiv_id(ref.doi, ref.url))
+
+    @staticmethod
+    def fill_missing_metadata(ref: Reference, found: Reference):
+        """Fill ``ref``'s missing fields from a resolved record of the same work."""
+        if found.authors and found.authors != ["Unknown"] and (
+                not ref.authors or ref.authors in (["Unknown"], ["Web Source"])):
+            ref.authors = list(found.authors)
+            ref.venue = found.venue or ref.venue
+        if not ref.year and found.year:
+            ref.year = found.year
+        if not clean_doi(ref.doi) and found.doi:
+            ref.doi = found.doi
+            ref.url = ref.url or found.url
+        if ref.cited_by_count is None:
+            ref.cited_by_count = found.cited_by_count
+
+    async def enrich_references(self, refs: List[Reference]) -> int:
+        """Complete references lacking DOI, year or authors in place. Returns how many were enriched.
+
+        DOIs are resolved in batches of up to ``ENRICH_BATCH_SIZE`` per request
+        (OpenAlex ``filter=doi:a|b``, then CrossRef ``filter=doi:a,doi:b`` for the
+        rest); references with no DOI are looked up by title on CrossRef. Every
+        answer, including "not found", is kept in the persistent reference cache.
+        """
+        by_doi: Dict[str, List[Reference]] = {}
+        by_title: List[Reference] = []
+        for ref in refs:
+            if not self._needs_enrichment(ref):
+                continue
+            key = doi_key(ref.doi)
+            if key:
+                by_doi.setdefault(key, []).append(ref)
+            elif normalize_title(ref.title or "") not in ("", "untitled"):
+                by_title.append(ref)
+
+        enriched = 0
+        found = await self._lookup_dois(list(by_doi)) if by_doi else {}
+        for key, matches in by_doi.items():
+            if key in found:
+                for ref in matches:
+                    self.fill_missing_metadata(ref, found[key])
+                    enriched += 1
+
+        by_title = by_title[:ENRICH_MAX_TITLE_LOOKUPS]
+        results = await asyncio.gather(*(self._lookup_title(r.title) for r in by_title), return_exceptions=True)
+        for ref, match in zip(by_title, results):
+            if isinstance(match, Reference):
+                self.fill_missing_metadata(ref, match)
+                enriched += 1
+        return enriched
+
+    async def _lookup_dois(self, dois: List[str]) -> Dict[str, Reference]:
+        found: Dict[str, Reference] = {}
+        missing: List[str] = []
+        for doi in dois:
+            cached = self._cache.get("doi_metadata", doi, 1)
+            if cached is None:
+                missing.append(doi)
+            elif cached[0] and doi_key(cached[0][0].doi) == doi:
+                found[doi] = cached[0][0]
+        # "|" and "," separate values in the batch filters
+        missing = [d for d in missing if "|" not in d and "," not in d]
+        if not missing:
+            return found
+
+        fetched: Dict[str, Reference] = {}
+        for i in range(0, len(missing), ENRICH_BATCH_SIZE):
+            fetched.update(await self._openalex_by_doi(missing[i:i + ENRICH_BATCH_SIZE]))
+        rest = [d for d in missing if d not in fetched]
+        for i in range(0, len(rest), ENRICH_BATCH_SIZE):
+            fetched.update(await self._crossref_by_doi(rest[i:i + ENRICH_BATCH_SIZE]))
+
+        for doi in missing:
+            self._cache.put("doi_metadata", doi, 1, [fetched[doi]] if doi in fetched else [])
+        found.update(fetched)
+        return found
+
+    async def _openalex_by_doi(self, dois: List[str]) -> Dict[str, Reference]:
+        await self._throttle("openalex")
+        params = {"filter": "doi:" + "|".join(dois), "per_page": len(dois), "select": self._OPENALEX_SELECT}
+        try:
+            async with self._session() as session:
+                async with session.get("https://api.openalex.org/works", params=params, headers=self._HEADERS,
+                                       timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                    if resp.status != 200:
+                        return {}
+                    data = await resp.json()
+        except Exception as e:
+            logger.debug("OpenAlex DOI batch failed: %s", e)
+            return {}
+        refs = (self._parse_openalex_work(work) for work in data.get("results", []))
+        return {doi_key(r.doi): r for r in refs if doi_key(r.doi)}
+
+    async def _crossref_by_doi(self, dois: List[str]) -> Dict[str, Reference]:
+        await self._throttle("crossref")
+        params = {"filter": ",".join(f"doi:{d}" for d in dois), "rows": len(dois), "select": self._CROSSREF_SELECT}
+        try:
+            async with self._session() as session:
+                async with session.get("https://api.crossref.org/works", params=params,
+                                       headers={**self._HEADERS, **self._CROSSREF_POLITE},
+                                       timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                    if resp.status != 200:
+                        return {}
+                    data = await resp.json()
+        except Exception as e:
+            logger.debug("CrossRef DOI batch failed: %s", e)
+            return {}
+        refs = (self._parse_crossref_item(item) for item in data.get("message", {}).get("items", []))
+        return {doi_key(r.doi): r for r in refs if doi_key(r.doi)}
+
+    async def _lookup_title(self, title: str) -> Optional[Reference]:
+        """The CrossRef record whose title matches ``title`` (exactly or nearly), if any."""
+        cached = self._cache.get("title_metadata", title, 1)
+        if cached is not None:
+            return cached[0][0] if cached[0] else None
+
+        await self._throttle("crossref")
+        params = {"query.bibliographic": title, "rows": 3, "select": self._CROSSREF_SELECT}
+        match = None
+        try:
+            async with self._session() as session:
+                async with session.get("https://api.crossref.org/works", params=params,
+                                       headers={**self._HEADERS, **self._CROSSREF_POLITE},
+                                       timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                    if resp.status != 200:
+                        return None
+                    data = await resp.json()
+            candidates = [self._parse_crossref_item(item) for item in data.get("message", {}).get("items", [])]
+            match = ReferenceIndex(candidates).lookup(title=title)
+        except Exception as e:
+            logger.debug("CrossRef title lookup failed: %s", e)
+            return None
+        self._cache.put("title_metadata", title, 1, [match] if match else [])
+        return match
+
     # ------------------------------------------------------------------
     # Unified search
     # ------------------------------------------------------------------
 
-    def _select_apis(self, category: Optional[dict] = None) -> List[str]:
+    @classmethod
+    def _select_apis(cls, category: Optional[dict] = None) -> List[str]:
         """Select which APIs to query based on the academic domain.
 
         Args:
@@ -718,76 +963,27 @@ class SourceRetriever:
 
         # Check subfield-specific mapping first (e.g. natural_sciences:biology)
         key_with_sub = f"{major}:{subfield}"
-        if key_with_sub in self._DOMAIN_APIS:
-            apis = list(self._DOMAIN_APIS[key_with_sub])
-        elif major in self._DOMAIN_APIS:
-            apis = list(self._DOMAIN_APIS[major])
+        if key_with_sub in cls._DOMAIN_APIS:
+            apis = list(cls._DOMAIN_APIS[key_with_sub])
+        elif major in cls._DOMAIN_APIS:
+            apis = list(cls._DOMAIN_APIS[major])
         else:
             apis = ["openalex", "arxiv", "semantic_scholar", "brave"]
 
         # Also include secondary domain APIs if present
         secondary = category.get("secondary_major")
-        if secondary and secondary in self._DOMAIN_APIS:
-            for api in self._DOMAIN_APIS[secondary]:
+        if secondary and secondary in cls._DOMAIN_APIS:
+            for api in cls._DOMAIN_APIS[secondary]:
                 if api not in apis:
                     apis.append(api)
 
         return apis
 
-    async def search_all(
-        self,
-        topic: str,
-        max_academic: int = 15,
-        max_web: int = 4,
-        category: Optional[dict] = None,
-    ) -> List[Reference]:
-        """Search domain-appropriate sources, deduplicate, and assign IDs.
-
-        Args:
-            topic: Research topic string
-            max_academic: Max academic results (split across sources)
-            max_web: Max web results from Brave
-            category: Optional dict with 'major' and 'subfield' for domain-aware
-                API selection
-
-        Returns:
-            Deduplicated list of References with sequential IDs starting at 1
-        """
-        selected_apis = self._select_apis(category)
-
-        # Count academic APIs (everything except 'brave')
-        academic_apis = [a for a in selected_apis if a != "brave"]
-        per_academic = max(2, max_academic // max(len(academic_apis), 1))
-
-        # Build coroutines based on selected APIs
-        _api_methods = {
-            "openalex": lambda: self.search_openalex(topic, max_results=per_academic),
-            "arxiv": lambda: self.search_arxiv(topic, max_results=per_academic),
-            "semantic_scholar": lambda: self.search_semantic_scholar(topic, max_results=per_academic),
-            "brave": lambda: self.search_brave(topic, max_results=max_web),
-            "pubmed": lambda: self.search_pubmed(topic, max_results=per_academic),
-            "europe_pmc": lambda: self.search_europe_pmc(topic, max_results=per_academic),
-            "core": lambda: self.search_core(topic, max_results=per_academic),
-            "crossref": lambda: self.search_crossref(topic, max_results=per_academic),
-        }
-
-        coros = []
-        for api_name in selected_apis:
-            factory = _api_methods.get(api_name)
-            if factory:
-                coros.append(factory())
-
-        # Launch all searches concurrently
-        results = await asyncio.gather(*coros, return_exceptions=True)
-
-        all_refs: List[Reference] = []
-        for result in results:
-            if isinstance(result, list):
-                all_refs.extend(result)
-
-        # Deduplicate: DOI first, then normalized title
-        seen_dois: set = set()
-        seen_titles: set = set()
+    @staticmethod
+    def _dedupe_and_filter(all_refs: List[Reference]) -> List[Reference]:
+        """Drop duplicates and references with unverifiable metadata."""
+        # Deduplicate: DOI, arXiv ID, then exact or near-identical title
+        index = ReferenceIndex()
         unique_refs: List[Reference] = []
         for ref in all_refs:
             # Clean bogus DOIs before comparison
@@ -798,17 +994,9 @@ class SourceRetriever:
             if not norm or norm == "untitled":
                 continue
 
-            # DOI-based dedup (strongest signal)
-            if ref.doi:
-                doi_key = ref.doi.lower().strip()
-                if doi_key in seen_dois:
-                    continue
-                seen_dois.add(doi_key)
-
-            # Title-based dedup (fallback)
-            if norm in seen_titles:
+            if index.find(ref) is not None:
                 continue
-            seen_titles.add(norm)
+            index.add(ref)
             unique_refs.append(ref)
 
         # ----------------------------------------------------------
@@ -832,11 +1020,174 @@ class SourceRetriever:
                 logger.debug("Dropping ref with Unknown author: %s", ref.title)
                 continue
             cleaned.append(ref)
-        unique_refs = cleaned
+        return cleaned
+
+    @classmethod
+    def _academic_count(cls, refs: List[Reference]) -> int:
+        """Usable academic references among ``refs`` (after dedup and quality filters)."""
+        return sum(1 for r in cls._dedupe_and_filter(refs) if r.doi or r.authors != ["Web Source"])
+
+    async def search_all(
+        self,
+        topic: str,
+        max_academic: int = 15,
+        max_web: int = 4,
+        category: Optional[dict] = None,
+        use_prefetch: bool = True,
+        deadline: Optional[float] = SEARCH_DEADLINE_SECONDS,
+        use_corpus: bool = True,
+        enrich: bool = True,
+        research_questions: Optional[List[str]] = None,
+        max_requests: int = SEARCH_REQUEST_BUDGET,
+    ) -> List[Reference]:
+        """Search domain-appropriate sources, deduplicate, and assign IDs.
+
+        Args:
+            topic: Research topic string
+            max_academic: Academic references to keep; sources are over-fetched
+                and the most relevant to the topic and category are kept
+            max_web: Max web results from Brave
+            category: Optional dict with 'major' and 'subfield' for domain-aware
+                API selection
+            use_prefetch: Reuse (or wait for) a speculative prefetch of the
+                same search started by ``source_prefetcher``. The prefetch
+                searched the topic alone, so with ``research_questions`` it
+                seeds the result and only the extra sub-queries are sent
+            deadline: Seconds to wait for sources. Returns early once
+                ``max_academic`` usable academic references are in; sources
+                still running are left to finish in the background (filling
+                the cache). None waits for every source.
+            use_corpus: Start from matching references in the local corpus of
+                previously retrieved sources; external APIs are skipped when
+                the corpus alone has ``max_academic`` of them
+            enrich: Resolve missing DOI, year and authors (see
+                ``enrich_references``) before filtering
+            research_questions: Questions to derive extra focused queries from
+                (see ``utils.query_planner``); long topics are split as well
+            max_requests: Total API requests this search may send across
+                sources and queries
+
+        Returns:
+            Deduplicated list of References with sequential IDs starting at 1
+        """
+        queries = plan_queries(topic, research_questions)
+        seed: List[Reference] = []
+        covered: set = set()
+        if use_prefetch:
+            prefetched = await source_prefetcher.get(topic, category, max_academic, max_web)
+            if prefetched is not None:
+                covered = set(plan_queries(topic))
+                if covered.issuperset(queries):
+                    logger.info("Using %d prefetched sources for %r", len(prefetched), topic[:60])
+                    return prefetched
+                logger.info("Seeding %r with %d prefetched sources", topic[:60], len(prefetched))
+                seed = prefetched
 
-        # Deprioritize web sources: put academic refs first, cap web sources
-        academic_refs = [r for r in unique_refs if r.doi or r.authors != ["Web Source"]]
-        web_refs = [r for r in unique_refs if not r.doi and r.authors == ["Web Source"]]
+        selected_apis = self._select_apis(category)
+
+        # Count academic APIs (everything except 'brave'); over-fetch so ranking has a choice
+        academic_apis = [a for a in selected_apis if a != "brave"]
+        per_academic = max(2, math.ceil(max_academic * RANK_OVERSAMPLE / max(len(academic_apis), 1)))
+
+        # Build coroutines based on selected APIs
+        _api_methods = {
+            "openalex": lambda q, n: self.search_openalex(q, max_results=n),
+            "arxiv": lambda q, n: self.search_arxiv(q, max_results=n),
+            "semantic_scholar": lambda q, n: self.search_semantic_scholar(q, max_results=n),
+            "brave": lambda q, n: self.search_brave(q, max_results=max_web),
+            "pubmed": lambda q, n: self.search_pubmed(q, max_results=n),
+            "europe_pmc": lambda q, n: self.search_europe_pmc(q, max_results=n),
+            "core": lambda q, n: self.search_core(q, max_results=n),
+            "crossref": lambda q, n: self.search_crossref(q, max_results=n),
+        }
+
+        local: List[Reference] = []
+        if use_corpus:
+            try:
+                local = self._corpus.search(topic, limit=max_academic)
+            except sqlite3.Error as e:
+                logger.warning("Reference corpus search failed: %s", e)
+        offline = self._academic_count(local) >= max_academic
+        if offline:
+            logger.info("Using %d corpus references for %r", len(local), topic[:60])
+
+        # Fan the topic and its focused sub-queries out across sources (minus
+        # those the prefetched seed already searched)
+        plan = [] if offline else [
+            (api, query) for api, query in allocate_requests(
+                queries, [a for a in selected_apis if a in _api_methods], budget=max_requests,
+                deadline=deadline, per_api_cap={"brave": 1},
+            ) if query not in covered
+        ]
+        if len(queries) > 1:
+            logger.info("Query plan for %r: %d requests over %s", topic[:60], len(plan), queries[1:])
+        sub_query_results = max(2, per_academic // 2)
+
+        tasks: Dict[asyncio.Task, Tuple[str, str]] = {}
+        for api_name, query in plan:
+            limit = per_academic if query == topic else sub_query_results
+            tasks[asyncio.ensure_future(_api_methods[api_name](query, limit))] = (api_name, query)
+
+        # Launch all searches concurrently; stop at the deadline or once enough
+        # academic references have arrived
+        started = time.monotonic()
+        results: Dict[Tuple[str, str], List[Reference]] = {}
+        self.source_latencies = {}
+        pending = set(tasks)
+        while pending:
+            timeout = None if deadline is None else max(0.0, started + deadline - time.monotonic())
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break  # deadline passed
+            for task in done:
+                api_name = tasks[task][0]
+                self.source_latencies[api_name] = time.monotonic() - started
+                if not task.cancelled() and task.exception() is None:
+                    results[tasks[task]] = task.result()
+            if deadline is not None and pending and self._academic_count(
+                    local + [r for (api, _), refs in results.items() if api != "brave" for r in refs]) >= max_academic:
+                break
+
+        if pending:
+            # The searches themselves run in shared tasks (see _single_flight): cancelling our
+            # wait leaves them running, and they warm the reference cache when they land
+            late = sorted({tasks[t][0] for t in pending})
+            for task in pending:
+                task.cancel()
+            logger.info("search_all returned after %.1fs without %s", time.monotonic() - started, ", ".join(late))
+        if self.source_latencies:
+            logger.info("Source latencies for %r: %s", topic[:60], ", ".join(
+                f"{api}={seconds:.2f}s" for api, seconds in sorted(self.source_latencies.items(), key=lambda kv: kv[1])))
+
+        # Merge in a stable order: corpus, prefetched seed, then each source's results per query
+        fetched: List[Reference] = []
+        for api_name in selected_apis:
+            for query in queries:
+                fetched.extend(results.get((api_name, query), []))
+        all_refs: List[Reference] = local + seed + fetched
+
+        if enrich:
+            # Fill in DOI/year/authors so incomplete hits survive the quality filters
+            # (the seed was enriched by its own search)
+            try:
+                enriched = await asyncio.wait_for(self.enrich_references(local + fetched), ENRICH_TIMEOUT_SECONDS)
+                if enriched:
+                    logger.info("Enriched metadata of %d references for %r", enriched, topic[:60])
+            except asyncio.TimeoutError:
+                logger.info("Metadata enrichment timed out for %r", topic[:60])
+
+        unique_refs = self._dedupe_and_filter(all_refs)
+        try:
+            self._corpus.add(unique_refs)
+        except sqlite3.Error as e:
+            logger.warning("Failed to add references to the corpus: %s", e)
+
+        # Deprioritize web sources: put academic refs first, cap web sources.
+        # Within each group keep the most relevant to the topic.
+        academic_refs = rank_references(
+            [r for r in unique_refs if r.doi or r.authors != ["Web Source"]], topic, category, top_k=max_academic)
+        web_refs = rank_references(
+            [r for r in unique_refs if not r.doi and r.authors == ["Web Source"]], topic, category)
         # Keep at most 1 web source when academic sources are sufficient (≥5)
         if len(academic_refs) >= 8:
             max_web_kept = 0
@@ -894,3 +1245,117 @@ class SourceRetriever:
                 lines.append(f"    → About: {ref.summary[:150]}")
 
         return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Speculative prefetch
+# ---------------------------------------------------------------------------
+
+class SourcePrefetcher:
+    """Background ``search_all`` runs started before a workflow needs them.
+
+    The API server starts a prefetch once a topic is classified, while the
+    user is still reviewing the proposed team. When the workflow later calls
+    ``search_all`` with the same search, it gets the finished result (or
+    waits for the in-flight one) instead of querying every API again. A
+    search with research questions uses it as a seed and sends only the
+    extra sub-queries.
+
+    Searches are keyed by normalized topic, selected APIs and result limits.
+    Finished results expire after ``ttl`` seconds; at most ``max_in_flight``
+    prefetches run at once, the oldest being cancelled to make room.
+    """
+
+    def __init__(self, ttl: float = 1800.0, max_entries: int = 64, max_in_flight: int = 4):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_in_flight = max_in_flight
+        self._tasks: Dict[tuple, asyncio.Task] = {}
+        self._results: Dict[tuple, _CacheEntry] = {}
+
+    def key(self, topic: str, category: Optional[dict] = None, max_academic: int = 15, max_web: int = 4) -> tuple:
+        apis = tuple(sorted(SourceRetriever._select_apis(category)))
+        return (normalize_topic(topic), apis, max_academic, max_web)
+
+    def start(self, topic: str, category: Optional[dict] = None,
+              max_academic: int = 15, max_web: int = 4) -> Optional[asyncio.Task]:
+        """Start a background search unless one is cached or already running.
+
+        Must be called from a running event loop.
+        """
+        key = self.key(topic, category, max_academic, max_web)
+        if self._fresh(key) is not None:
+            return None
+        task = self._tasks.get(key)
+        if task is not None and not task.done():
+            return task
+
+        running = [k for k, t in self._tasks.items() if not t.done()]
+        while len(running) >= self.max_in_flight:
+            self._tasks.pop(running.pop(0)).cancel()
+
+        task = asyncio.create_task(SourceRetriever().search_all(
+            topic, max_academic=max_academic, max_web=max_web, category=category, use_prefetch=False,
+        ))
+        self._tasks[key] = task
+        task.add_done_callback(lambda t, key=key: self._finish(key, t))
+        return task
+
+    def _finish(self, key: tuple, task: asyncio.Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._results[key] = _CacheEntry(data=task.result(), expires=time.monotonic() + self.ttl)
+        while len(self._results) > self.max_entries:
+            self._results.pop(next(iter(self._results)))
+
+    def _fresh(self, key: tuple) -> Optional[List[Reference]]:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() > entry.expires:
+            del self._results[key]
+            return None
+        return entry.data
+
+    async def get(self, topic: str, category: Optional[dict] = None,
+                  max_academic: int = 15, max_web: int = 4) -> Optional[List[Reference]]:
+        """Prefetched references for this search (waiting if in flight), else None.
+
+        Returns copies, so callers may renumber or edit them freely.
+        """
+        key = self.key(topic, category, max_academic, max_web)
+        task = self._tasks.get(key)
+        if task is not None:
+            try:
+                # Shielded: cancelling the caller must not cancel the shared search
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise  # the caller itself was cancelled
+            except Exception:
+                pass
+        refs = self._fresh(key)
+        return copy.deepcopy(refs) if refs is not None else None
+
+    def cancel(self, topic: str, category: Optional[dict] = None,
+               max_academic: int = 15, max_web: int = 4) -> bool:
+        """Cancel an in-flight prefetch. Returns True if one was running."""
+        task = self._tasks.pop(self.key(topic, category, max_academic, max_web), None)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    def cancel_all(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    def clear(self):
+        self.cancel_all()
+        self._results.clear()
+
+
+source_prefetcher = SourcePrefetcher()
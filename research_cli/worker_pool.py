@@ -0,0 +1,188 @@
+"""Elastic sizing for the API server's job-worker pool.
+
+The pool grows while jobs are waiting and providers have headroom, and
+shrinks when providers push back (HTTP 429s, slow responses), when the
+process is using too much memory, or when workers sit idle.
+
+Provider signals come from ``provider_health``, which the API server
+registers as an LLM call listener (``research_cli.llm.base.add_call_listener``)
+so it sees the latency and outcome of every call attempt. Decisions are
+kept in a short history so ``/api/queue-status`` can show why the pool has
+its current size.
+"""
+
+import os
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+RATE_LIMIT_MARKERS = ("429", "rate_limit", "rate limit", "ratelimit", "too many requests", "resource_exhausted")
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Best-effort detection of provider rate-limit errors across SDKs."""
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ProviderHealth:
+    """Sliding window of LLM call latencies and rate-limit outcomes per provider."""
+
+    def __init__(self, window_seconds: float = 300.0, max_events: int = 2000):
+        self.window_seconds = window_seconds
+        self.max_events = max_events
+        self._events: Dict[str, Deque[Tuple[float, float, bool]]] = {}
+
+    def record(self, provider: str, latency: float, rate_limited: bool = False, now: Optional[float] = None):
+        now = now if now is not None else time.time()
+        events = self._events.setdefault(provider or "unknown", deque(maxlen=self.max_events))
+        events.append((now, latency, rate_limited))
+
+    def observe_llm_call(self, provider: str, latency: float, error: Optional[BaseException] = None):
+        """LLM call listener: record one attempt, flagging rate-limit errors."""
+        self.record(provider, latency, rate_limited=error is not None and is_rate_limit_error(error))
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, dict]:
+        """Per-provider call count, 429 ratio and latency percentiles in the window."""
+        now = now if now is not None else time.time()
+        cutoff = now - self.window_seconds
+        result = {}
+        for provider, events in self._events.items():
+            while events and events[0][0] < cutoff:
+                events.popleft()
+            if not events:
+                continue
+            latencies = [latency for _, latency, limited in events if not limited]
+            limited = sum(1 for _, _, flag in events if flag)
+            result[provider] = {
+                "calls": len(events),
+                "rate_limited": limited,
+                "rate_limit_ratio": round(limited / len(events), 3),
+                "p50_latency_seconds": _percentile(latencies, 0.5),
+                "p95_latency_seconds": _percentile(latencies, 0.95),
+            }
+        return result
+
+    def clear(self):
+        self._events.clear()
+
+
+provider_health = ProviderHealth()
+
+
+def process_rss_mb() -> Optional[float]:
+    """Current resident set size of this process in MB, if it can be measured."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+@dataclass
+class ScalingDecision:
+    """One pool resize and the signals that triggered it."""
+    at: float
+    previous: int
+    target: int
+    reason: str
+    signals: dict = field(default_factory=dict)
+
+
+class WorkerPoolController:
+    """Decides the worker count from queue depth, provider pressure and memory.
+
+    One step at a time, at most once per ``cooldown_seconds`` (memory
+    pressure ignores the cooldown). The result is always within
+    [min_workers, max_workers].
+    """
+
+    def __init__(
+        self,
+        min_workers: int,
+        max_workers: int,
+        rate_limit_high: float = 0.10,
+        rate_limit_low: float = 0.02,
+        latency_high_seconds: float = 180.0,
+        rss_limit_mb: Optional[float] = None,
+        cooldown_seconds: float = 60.0,
+        history_size: int = 20,
+    ):
+        self.min_workers = min_workers
+        self.max_workers = max(min_workers, max_workers)
+        self.rate_limit_high = rate_limit_high
+        self.rate_limit_low = rate_limit_low
+        self.latency_high_seconds = latency_high_seconds
+        self.rss_limit_mb = rss_limit_mb
+        self.cooldown_seconds = cooldown_seconds
+        self.history: Deque[ScalingDecision] = deque(maxlen=history_size)
+        self.last_signals: dict = {}
+        self._last_change = float("-inf")
+
+    def decide(
+        self,
+        current: int,
+        queue_depth: int,
+        busy: int,
+        provider_stats: Dict[str, dict],
+        rss_mb: Optional[float],
+        now: Optional[float] = None,
+    ) -> Optional[ScalingDecision]:
+        """Return a decision if the pool should change size, else None."""
+        now = now if now is not None else time.time()
+        worst_ratio = max((s["rate_limit_ratio"] for s in provider_stats.values()), default=0.0)
+        worst_p95 = max((s["p95_latency_seconds"] or 0 for s in provider_stats.values()), default=0.0)
+        signals = {
+            "queue_depth": queue_depth,
+            "busy_workers": busy,
+            "rate_limit_ratio": worst_ratio,
+            "p95_latency_seconds": worst_p95,
+            "rss_mb": round(rss_mb, 1) if rss_mb is not None else None,
+        }
+        self.last_signals = signals
+
+        target, reason = current, None
+        if self.rss_limit_mb and rss_mb is not None and rss_mb > self.rss_limit_mb:
+            target, reason = current - 1, f"memory: RSS {rss_mb:.0f} MB over {self.rss_limit_mb:.0f} MB"
+        elif now - self._last_change < self.cooldown_seconds:
+            pass
+        elif worst_ratio >= self.rate_limit_high:
+            target, reason = current - 1, f"provider pressure: {worst_ratio:.0%} of calls rate-limited"
+        elif worst_p95 >= self.latency_high_seconds:
+            target, reason = current - 1, f"provider pressure: p95 latency {worst_p95:.0f}s"
+        elif queue_depth > 0 and busy >= current and worst_ratio <= self.rate_limit_low:
+            target, reason = current + 1, f"backlog: {queue_depth} job(s) waiting, all workers busy"
+        elif queue_depth == 0 and busy < current - 1:
+            target, reason = current - 1, "idle workers"
+
+        target = max(self.min_workers, min(self.max_workers, target))
+        if reason is None or target == current:
+            return None
+        decision = ScalingDecision(at=now, previous=current, target=target, reason=reason, signals=signals)
+        self.history.append(decision)
+        self._last_change = now
+        return decision
+
+    def snapshot(self) -> dict:
+        return {
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "signals": self.last_signals,
+            "decisions": [asdict(d) for d in reversed(self.history)],
+        }
@@ -15,7 +15,8 @@ from ..models.collaborative_research import (
 from ..agents.lead_author import LeadAuthorAgent
 from ..agents.coauthor import CoauthorAgent
 from ..utils.source_retriever import SourceRetriever
-from ..performance import PhaseTimer
+from ..llm.base import report_usage_to
+from ..performance import PerformanceTracker, PhaseTimer
 
 
 console = Console()
@@ -38,6 +39,7 @@ class CollaborativeResearchPhase:
         research_cycles: int = 1,
         status_callback: Optional[Callable] = None,
         category_dict: Optional[dict] = None,
+        tracker: Optional[PerformanceTracker] = None,
     ):
         """Initialize research phase.
 
@@ -49,6 +51,7 @@ class CollaborativeResearchPhase:
             research_cycles: Number of research note iterations (default 1)
             status_callback: Optional callback for status updates
             category_dict: Optional dict with 'major' and 'subfield' for domain-aware source search
+            tracker: Optional tracker (and budget) charged with the phase's LLM usage
         """
         self.topic = topic
         self.category = category
@@ -56,6 +59,7 @@ class CollaborativeResearchPhase:
         self.output_dir = output_dir
         self.research_cycles = research_cycles
         self.status_callback = status_callback
+        self.tracker = tracker
         self.category_dict = category_dict
 
         # Initialize agents
@@ -83,7 +87,10 @@ class CollaborativeResearchPhase:
 
     async def run(self) -> CollaborativeResearchNotes:
         """Run complete research phase with optional cycles."""
+        with report_usage_to(self.tracker.record_collaboration if self.tracker else None):
+            return await self._run()
 
+    async def _run(self) -> CollaborativeResearchNotes:
         self.timer = PhaseTimer("research")
         self.timer.start()
 
@@ -92,21 +99,8 @@ class CollaborativeResearchPhase:
         console.print(f"[bold cyan] ({self.research_cycles} cycle{'s' if self.research_cycles > 1 else ''})[/bold cyan]")
         console.print("[bold]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold]\n")
 
-        # Step 0: Retrieve real academic sources
-        self._update_status("[0/5] Retrieving academic sources...")
-        self.timer.step("source_retrieval")
-        retriever = SourceRetriever()
-        try:
-            self.real_references = await retriever.search_all(
-                self.topic, category=self.category_dict
-            )
-            console.print(f"  ✓ {len(self.real_references)} real references retrieved\n")
-        except Exception as e:
-            console.print(f"  [yellow]⚠ Source retrieval failed: {e}[/yellow]")
-            self.real_references = []
-
-        # Step 1: Lead creates initial research notes
-        self._update_status("[1/5] Lead: Creating initial research notes...")
+        # Step 0: Lead creates initial research notes
+        self._update_status("[0/5] Lead: Creating initial research notes...")
         self.timer.step("lead_initial_notes")
         research_notes = await self.lead_agent.create_initial_research_notes(
             topic=self.topic,
@@ -117,6 +111,20 @@ class CollaborativeResearchPhase:
         console.print(f"  ✓ Hypotheses: {len(research_notes.hypotheses)}")
         console.print(f"  ✓ Open questions: {len(research_notes.open_questions)}\n")
 
+        # Step 1: Retrieve real academic sources, with queries focused by the research questions
+        self._update_status("[1/5] Retrieving academic sources...")
+        self.timer.step("source_retrieval")
+        retriever = SourceRetriever()
+        try:
+            self.real_references = await retriever.search_all(
+                self.topic, category=self.category_dict,
+                research_questions=research_notes.research_questions,
+            )
+            console.print(f"  ✓ {len(self.real_references)} real references retrieved\n")
+        except Exception as e:
+            console.print(f"  [yellow]⚠ Source retrieval failed: {e}[/yellow]")
+            self.real_references = []
+
         # Pre-populate research notes with real references
         if self.real_references:
             for ref in self.real_references:
@@ -252,6 +260,8 @@ class CollaborativeResearchPhase:
 
         contributions = []
         for r in results:
+            if isinstance(r, asyncio.CancelledError):
+                raise r  # Job cancelled or budget stopped, not a failed task
             if isinstance(r, Exception):
                 console.print(f"  [yellow]⚠ Research task failed: {r}[/yellow]")
             else:
@@ -1,5 +1,6 @@
 """Full collaborative research workflow - Research → Writing → Review."""
 
+import asyncio
 from pathlib import Path
 from typing import Optional, Callable
 from rich.console import Console
@@ -7,8 +8,12 @@ from rich.console import Console
 from ..models.author import WriterTeam
 from .collaborative_research import CollaborativeResearchPhase
 from .manuscript_writing import ManuscriptWritingPhase
-from .orchestrator import WorkflowOrchestrator
+from .orchestrator import WorkflowOrchestrator, write_cancellation_marker
+from ..budget import DOWNGRADE_TIER, WorkflowBudget
+from ..cancellation import CancellationToken, check_cancelled, current_token, use_token
+from ..model_config import use_tier
 from ..models.expert import ExpertConfig
+from ..performance import PerformanceTracker
 
 
 console = Console()
@@ -43,6 +48,8 @@ class CollaborativeWorkflowOrchestrator:
         quiet: bool = False,
         secondary_major: Optional[str] = None,
         secondary_subfield: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        budget: Optional[WorkflowBudget] = None,
     ):
         """Initialize collaborative workflow.
 
@@ -63,6 +70,8 @@ class CollaborativeWorkflowOrchestrator:
             audience_level: "beginner", "intermediate", or "professional"
             secondary_major: Optional secondary major field for interdisciplinary topics
             secondary_subfield: Optional secondary subfield
+            cancel_token: Optional token to stop the run; defaults to the caller's current token
+            budget: Optional cost/token budget, charged from the research phase on
         """
         self.topic = topic
         self.major_field = major_field
@@ -81,6 +90,11 @@ class CollaborativeWorkflowOrchestrator:
         self.research_type = research_type
         self.audience_level = audience_level
         self.quiet = quiet
+        self.cancel_token = cancel_token
+        self.budget = budget
+        # Shared by all three phases so the budget sees the whole run
+        self.tracker = PerformanceTracker(budget=budget)
+        self._current_phase = "initializing"
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -91,7 +105,16 @@ class CollaborativeWorkflowOrchestrator:
 
     async def run(self) -> dict:
         """Run complete collaborative workflow."""
-
+        with use_token(self.cancel_token or current_token()):
+            try:
+                return await self._run_impl()
+            except asyncio.CancelledError as e:
+                # The review phase records its own (more precise) stage
+                if self._current_phase != "peer review":
+                    write_cancellation_marker(self.output_dir, self._current_phase, e)
+                raise
+
+    async def _run_impl(self) -> dict:
         console.print("\n[bold green]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold green]")
         console.print("[bold green] Collaborative Research Workflow[/bold green]")
         console.print("[bold green]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold green]\n")
@@ -103,6 +126,7 @@ class CollaborativeWorkflowOrchestrator:
         console.print(f"[bold]Reviewers:[/bold] {len(self.reviewer_configs)} external reviewers\n")
 
         # Phase 1: Collaborative Research
+        self._current_phase = "collaborative research"
         if self.status_callback:
             self.status_callback("research", 0, "Phase 1: Collaborative research in progress...")
 
@@ -120,30 +144,49 @@ class CollaborativeWorkflowOrchestrator:
             research_cycles=self.research_cycles,
             status_callback=self.status_callback,
             category_dict=category_dict,
+            tracker=self.tracker,
         )
 
         research_notes = await research_phase.run()
 
         # Phase 2: Manuscript Writing
+        check_cancelled()
+        self._current_phase = "manuscript writing"
         if self.status_callback:
             self.status_callback("writing_sections", 0, "Phase 2: Writing manuscript sections...")
 
-        writing_phase = ManuscriptWritingPhase(
-            topic=self.topic,
-            category=self.category,
-            writer_team=self.writer_team,
-            research_notes=research_notes,
-            output_dir=self.output_dir,
-            target_length=self.target_manuscript_length,
-            status_callback=self.status_callback,
-            parallel=True,
-            audience_level=self.audience_level,
-            research_type=self.research_type,
-        )
+        def new_writing_phase() -> ManuscriptWritingPhase:
+            return ManuscriptWritingPhase(
+                topic=self.topic,
+                category=self.category,
+                writer_team=self.writer_team,
+                research_notes=research_notes,
+                output_dir=self.output_dir,
+                target_length=self.target_manuscript_length,
+                status_callback=self.status_callback,
+                parallel=True,
+                audience_level=self.audience_level,
+                research_type=self.research_type,
+                tracker=self.tracker,
+            )
+
+        writing_phase = None
+        if self.budget is not None and self.budget.triggered == "downgrade":
+            # The budget ran low during research: write with the cheaper tier
+            try:
+                with use_tier(DOWNGRADE_TIER):
+                    writing_phase = new_writing_phase()
+                console.print(f"[yellow]⚠ Budget {self.budget.describe()}: writing with the {DOWNGRADE_TIER} tier[/yellow]")
+            except ValueError:
+                pass  # No downgrade-tier model available; keep the team's models
+        if writing_phase is None:
+            writing_phase = new_writing_phase()
 
         manuscript = await writing_phase.run()
 
         # Phase 3: Peer Review
+        check_cancelled()
+        self._current_phase = "peer review"
         console.print("\n[bold]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold]")
         console.print("[bold cyan] Phase 3: Peer Review[/bold cyan]")
         console.print("[bold]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/bold]\n")
@@ -182,8 +225,13 @@ class CollaborativeWorkflowOrchestrator:
             audience_level=self.audience_level,
             research_type=self.research_type,
             quiet=self.quiet,
+            cancel_token=self.cancel_token,
+            budget=self.budget,
         )
 
+        # Continue on the tracker the research and writing phases charged
+        review_workflow.tracker = self.tracker
+
         # Pass phase timings to review workflow for inclusion in output
         review_workflow.phase_timings = [
             research_phase.phase_timing,
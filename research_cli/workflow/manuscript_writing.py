@@ -16,7 +16,8 @@ from ..models.manuscript import (
 )
 from ..agents.lead_author import LeadAuthorAgent
 from ..agents.coauthor import CoauthorAgent
-from ..performance import PhaseTimer
+from ..llm.base import report_usage_to
+from ..performance import PerformanceTracker, PhaseTimer
 
 
 console = Console()
@@ -42,6 +43,7 @@ class ManuscriptWritingPhase:
         parallel: bool = False,
         audience_level: str = "professional",
         research_type: str = "survey",
+        tracker: Optional[PerformanceTracker] = None,
     ):
         """Initialize writing phase.
 
@@ -56,6 +58,7 @@ class ManuscriptWritingPhase:
             parallel: If True, write sections in parallel instead of sequentially
             audience_level: "beginner", "intermediate", or "professional"
             research_type: "explainer", "survey", or "original"
+            tracker: Optional tracker (and budget) charged with the phase's LLM usage
         """
         self.topic = topic
         self.category = category
@@ -64,6 +67,7 @@ class ManuscriptWritingPhase:
         self.output_dir = output_dir
         self.target_length = target_length
         self.status_callback = status_callback
+        self.tracker = tracker
         self.parallel = parallel
         self.audience_level = audience_level
         self.research_type = research_type
@@ -93,7 +97,10 @@ class ManuscriptWritingPhase:
 
     async def run(self) -> Manuscript:
         """Run complete manuscript writing phase."""
+        with report_usage_to(self.tracker.record_collaboration if self.tracker else None):
+            return await self._run()
 
+    async def _run(self) -> Manuscript:
         self.timer = PhaseTimer("writing")
         self.timer.start()
 
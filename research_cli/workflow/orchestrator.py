@@ -13,16 +13,21 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from ..model_config import _create_llm
+from ..budget import DOWNGRADE_TIER, WorkflowBudget, resumed_budget
+from ..model_config import _create_llm, get_tier_config, use_tier
 from ..utils.json_repair import repair_json
+from ..utils.normalize_ref import normalize_title
+from ..utils.reference_index import ReferenceIndex, arxiv_id, find_doi
 from ..agents import WriterAgent, ModeratorAgent
 from ..agents.writer import validate_manuscript_completeness
 from ..agents.desk_editor import DeskEditorAgent
 from ..agents.specialist_factory import SpecialistFactory
+from ..cancellation import CancellationToken, check_cancelled, current_token, use_token
 from ..categories import get_domain_description
 from ..models.expert import ExpertConfig
 from ..models.collaborative_research import Reference
 from ..performance import PerformanceTracker
+from ..run_predictor import current_model_tier
 from ..utils.source_retriever import SourceRetriever
 
 console = Console()
@@ -605,8 +610,8 @@ def _strip_ghost_citations(manuscript: str, verified_refs: List[Reference]) -> s
     """Remove fabricated citations from a revised manuscript.
 
     Compares each entry in the ## References section against the verified
-    source list.  Entries that cannot be matched (by normalized title) are
-    removed, and inline ``[N]`` markers are cleaned up and renumbered so
+    source list.  Entries that cannot be matched (by DOI, arXiv ID, or exact
+    or near-identical title) are removed, and inline ``[N]`` markers are cleaned up and renumbered so
     there are no gaps.
 
     Args:
@@ -619,15 +624,7 @@ def _strip_ghost_citations(manuscript: str, verified_refs: List[Reference]) -> s
     if not verified_refs:
         return manuscript
 
-    # Build set of normalised verified titles for fast lookup
-    from ..utils.normalize_ref import normalize_title
-
-    verified_titles = {normalize_title(r.title) for r in verified_refs}
-    # Also include DOI-based lookup
-    verified_dois = set()
-    for r in verified_refs:
-        if r.doi:
-            verified_dois.add(r.doi.lower().strip())
+    index = ReferenceIndex(verified_refs)
 
     # Split manuscript at references heading
     ref_pattern = re.compile(r'^(#{1,3}\s*References)\s*$', re.MULTILINE)
@@ -653,32 +650,18 @@ def _strip_ghost_citations(manuscript: str, verified_refs: List[Reference]) -> s
         old_id = int(entry_match.group(1))
         entry_text = entry_match.group(2).strip()
 
-        # Try to match against verified refs
-        is_verified = False
-
-        # Check DOI presence in entry text
-        doi_match = re.search(r'10\.\d{4,9}/[^\s\]]+', entry_text)
-        if doi_match:
-            doi_candidate = doi_match.group(0).lower().rstrip('.')
-            if doi_candidate in verified_dois:
-                is_verified = True
+        # Match by DOI or arXiv ID in the entry, then by its quoted title
+        title_match = re.search(r'"([^"]+)"', entry_text)
+        is_verified = index.lookup(
+            doi=find_doi(entry_text), arxiv=arxiv_id(entry_text),
+            title=title_match.group(1) if title_match else None,
+        ) is not None
 
-        # Check title match — extract quoted title if present
+        # Fallback: try each sentence before the first URL or DOI as a title
         if not is_verified:
-            title_match = re.search(r'"([^"]+)"', entry_text)
-            if title_match:
-                norm = normalize_title(title_match.group(1))
-                if norm and norm in verified_titles:
-                    is_verified = True
-
-        # Fallback: try normalising the whole entry text as a title
-        if not is_verified:
-            # Take text before first URL or DOI as title candidate
             text_before_url = re.split(r'https?://|doi\.org', entry_text)[0]
-            # Remove author prefix (everything before the first period after a year or a quote)
             for candidate in re.split(r'[.]\s+', text_before_url):
-                norm = normalize_title(candidate)
-                if norm and len(norm) > 10 and norm in verified_titles:
+                if len(normalize_title(candidate)) > 10 and index.lookup(title=candidate) is not None:
                     is_verified = True
                     break
 
@@ -728,6 +711,27 @@ def _strip_ghost_citations(manuscript: str, verified_refs: List[Reference]) -> s
     return result
 
 
+CANCELLED_MARKER = "workflow_cancelled.json"
+
+
+def write_cancellation_marker(output_dir: Path, stage: str, error: BaseException):
+    """Record where a cancelled run stopped. The last checkpoint is kept for resume."""
+    token = current_token()
+    reason = getattr(error, "reason", None) or (token.reason if token else None) or "cancelled"
+    marker = {
+        "stage": stage,
+        "reason": reason,
+        "cancelled_at": datetime.now().isoformat(),
+        "resumable": (output_dir / "workflow_checkpoint.json").exists(),
+    }
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / CANCELLED_MARKER, "w") as f:
+            json.dump(marker, f, indent=2)
+    except OSError:
+        pass
+
+
 class WorkflowOrchestrator:
     """Orchestrates the full research peer review workflow."""
 
@@ -744,6 +748,8 @@ class WorkflowOrchestrator:
         audience_level: str = "professional",
         research_type: str = "survey",
         quiet: bool = False,
+        cancel_token: Optional[CancellationToken] = None,
+        budget: Optional[WorkflowBudget] = None,
     ):
         """Initialize workflow orchestrator.
 
@@ -759,19 +765,23 @@ class WorkflowOrchestrator:
             audience_level: "beginner", "intermediate", or "professional"
             research_type: "survey" or "research" — determines writing/review approach
             quiet: If True, suppress Rich Progress spinners (for parallel execution)
+            cancel_token: Optional token to stop the run; defaults to the caller's current token
+            budget: Optional cost/token budget, charged as usage is recorded
         """
         self.expert_configs = expert_configs
         self.topic = topic
         self.max_rounds = max_rounds
         self.threshold = threshold
         self.output_dir = output_dir or Path("results") / topic.replace(" ", "-").lower()
-        self.tracker = PerformanceTracker()
+        self.tracker = PerformanceTracker(budget=budget)
+        self._budget_applied = False
         self.status_callback = status_callback
         self.category = category
         self.article_length = article_length
         self.audience_level = audience_level
         self.research_type = research_type
         self.quiet = quiet
+        self.cancel_token = cancel_token
         self._current_stage = "initializing"  # Track current pipeline stage for error context
 
         # Compute domain description from category
@@ -811,6 +821,41 @@ class WorkflowOrchestrator:
         # When populated, coauthors analyze reviews and provide revision notes to the writer
         self.coauthor_agents: list = []
 
+    def _apply_budget_policy(self, round_num: int):
+        """Act once on a budget policy that fired (``stop`` is handled by the budget)."""
+        budget = self.tracker.budget
+        if budget is None or budget.triggered is None or self._budget_applied:
+            return
+        self._budget_applied = True
+        if budget.triggered == "downgrade":
+            self._downgrade_models()
+            message = f"Budget {budget.describe()}: remaining roles moved to the {DOWNGRADE_TIER} tier"
+        elif budget.triggered == "cap_rounds":
+            self.max_rounds = min(self.max_rounds, max(round_num, 1))
+            message = f"Budget {budget.describe()}: round {self.max_rounds} will be the last review round"
+        else:
+            return
+        console.print(f"[yellow]⚠ {message}[/yellow]")
+        if self.status_callback:
+            self.status_callback("reviewing", round_num, message)
+
+    def _downgrade_models(self):
+        """Move reviewers and the writer-side agents to the downgrade tier."""
+        try:
+            models = get_tier_config(DOWNGRADE_TIER)
+        except KeyError:
+            return
+        for spec in self.specialists.values():
+            spec["provider"], spec["model"] = models[0].provider, models[0].model
+            spec["fallback"] = [{"provider": m.provider, "model": m.model} for m in models[1:]]
+        try:
+            with use_tier(DOWNGRADE_TIER):
+                self.writer = WriterAgent(role="writer")
+                self.author_response_agent = WriterAgent(role="author_response")
+                self.moderator = ModeratorAgent(role="moderator")
+        except ValueError:
+            pass  # No downgrade-tier model available; keep the current agents
+
     @contextmanager
     def _spinner(self, description: str):
         """Context manager for optional Rich Progress spinner.
@@ -840,11 +885,16 @@ class WorkflowOrchestrator:
         Returns:
             Workflow results dictionary
         """
-        try:
-            return await self._run_impl(initial_manuscript)
-        except Exception as e:
-            stage = getattr(self, '_current_stage', 'unknown')
-            raise type(e)(f"[Stage: {stage}] {e}") from e
+        with use_token(self.cancel_token or current_token()):
+            try:
+                return await self._run_impl(initial_manuscript)
+            except asyncio.CancelledError as e:
+                self._save_budget_to_checkpoint()
+                write_cancellation_marker(self.output_dir, self._current_stage, e)
+                raise
+            except Exception as e:
+                stage = getattr(self, '_current_stage', 'unknown')
+                raise type(e)(f"[Stage: {stage}] {e}") from e
 
     async def _run_impl(self, initial_manuscript: Optional[str] = None) -> dict:
         """Internal implementation of the workflow run."""
@@ -969,6 +1019,8 @@ class WorkflowOrchestrator:
 
         # Iterative review loop
         for round_num in range(1, self.max_rounds + 1):
+            check_cancelled()
+            self._apply_budget_policy(round_num)
             console.print("\n" + "="*80 + "\n")
 
             # Run review
@@ -1077,6 +1129,7 @@ class WorkflowOrchestrator:
             # Generate author response only if revision is needed AND not at max rounds
             author_response = None
             needs_revision = moderator_decision["decision"] != "ACCEPT"
+            self._apply_budget_policy(round_num)
             is_final_round = round_num >= self.max_rounds
 
             if needs_revision and not is_final_round:
@@ -1420,6 +1473,9 @@ Research Type: {self.research_type}
             "category": self.category,
             "audience_level": self.audience_level,
             "research_type": self.research_type,
+            "article_length": self.article_length,
+            "workflow_mode": "collaborative" if self.phase_timings else "standard",
+            "model_tier": current_model_tier(),
             "desk_screening": getattr(self, '_desk_result', {}),
             "expert_team": [config.to_dict() for config in self.expert_configs],
             "rounds": all_rounds,
@@ -1427,6 +1483,7 @@ Research Type: {self.research_type}
             "passed": all_rounds[-1]["passed"],
             "total_rounds": len(all_rounds),
             "performance": metrics.to_dict(),
+            "budget": self.tracker.budget.to_dict() if self.tracker.budget else None,
             "phase_timings": self.phase_timings if self.phase_timings else None,
             "timestamp": datetime.now().isoformat()
         }
@@ -1437,10 +1494,11 @@ Research Type: {self.research_type}
 
         console.print(f"[bold green]✓ Complete workflow saved:[/bold green] {workflow_file}\n")
 
-        # Remove checkpoint file on successful completion
+        # Remove checkpoint file (and any earlier cancellation marker) on successful completion
         checkpoint_file = self.output_dir / "workflow_checkpoint.json"
         if checkpoint_file.exists():
             checkpoint_file.unlink()
+        (self.output_dir / CANCELLED_MARKER).unlink(missing_ok=True)
 
         return workflow_data
 
@@ -1463,7 +1521,10 @@ Research Type: {self.research_type}
             "category": self.category,
             "audience_level": self.audience_level,
             "research_type": self.research_type,
+            "article_length": self.article_length,
+            "workflow_mode": "collaborative" if self.phase_timings else "standard",
             "generated_title": getattr(self, 'generated_title', None),
+            "budget": self.tracker.budget.to_dict() if self.tracker.budget else None,
             "checkpoint_time": datetime.now().isoformat(),
             "status": "in_progress"
         }
@@ -1472,20 +1533,40 @@ Research Type: {self.research_type}
         with open(checkpoint_file, "w") as f:
             json.dump(checkpoint, f, indent=2)
 
+    def _save_budget_to_checkpoint(self):
+        """Record the spend up to a stop in the last checkpoint, so a resume counts it."""
+        budget = self.tracker.budget
+        checkpoint_file = self.output_dir / "workflow_checkpoint.json"
+        if budget is None or not checkpoint_file.exists():
+            return
+        try:
+            with open(checkpoint_file) as f:
+                checkpoint = json.load(f)
+            checkpoint["budget"] = budget.to_dict()
+            with open(checkpoint_file, "w") as f:
+                json.dump(checkpoint, f, indent=2)
+        except (OSError, ValueError):
+            pass
+
     @classmethod
-    async def resume_from_checkpoint(cls, output_dir: Path, status_callback=None) -> dict:
+    async def resume_from_checkpoint(cls, output_dir: Path, status_callback=None,
+                                     cancel_token: Optional[CancellationToken] = None,
+                                     budget: Optional[WorkflowBudget] = None) -> dict:
         """Resume workflow from checkpoint.
 
         Args:
             output_dir: Directory containing checkpoint
             status_callback: Optional status callback function
+            cancel_token: Optional token to stop the resumed run
+            budget: Budget for the resumed run; defaults to the one saved in
+                the checkpoint (see ``resumed_budget``)
 
         Returns:
             Workflow results dictionary
 
         Raises:
             FileNotFoundError: If no checkpoint found
-            ValueError: If checkpoint is invalid
+            ValueError: If checkpoint is invalid or its budget is exhausted
         """
         checkpoint_file = output_dir / "workflow_checkpoint.json"
 
@@ -1502,6 +1583,11 @@ Research Type: {self.research_type}
         from ..models.expert import ExpertConfig
         expert_configs = [ExpertConfig.from_dict(cfg) for cfg in checkpoint["expert_configs"]]
 
+        if budget is None:
+            budget = resumed_budget(checkpoint.get("budget"))
+        if budget is not None and budget.exhausted:
+            raise ValueError(f"Budget exhausted ({budget.describe()}); raise the limit to resume")
+
         # Create orchestrator
         orchestrator = cls(
             expert_configs=expert_configs,
@@ -1513,6 +1599,9 @@ Research Type: {self.research_type}
             category=checkpoint.get("category"),
             audience_level=checkpoint.get("audience_level", "professional"),
             research_type=checkpoint.get("research_type", "survey"),
+            article_length=checkpoint.get("article_length", "full"),
+            cancel_token=cancel_token,
+            budget=budget,
         )
 
         # Restore state
@@ -1542,11 +1631,16 @@ Research Type: {self.research_type}
         all_rounds: List[dict]
     ) -> dict:
         """Continue workflow from a specific round."""
-        try:
-            return await self._resume_workflow_impl(start_round, current_manuscript, all_rounds)
-        except Exception as e:
-            stage = getattr(self, '_current_stage', 'unknown')
-            raise type(e)(f"[Stage: {stage}] {e}") from e
+        with use_token(self.cancel_token or current_token()):
+            try:
+                return await self._resume_workflow_impl(start_round, current_manuscript, all_rounds)
+            except asyncio.CancelledError as e:
+                self._save_budget_to_checkpoint()
+                write_cancellation_marker(self.output_dir, self._current_stage, e)
+                raise
+            except Exception as e:
+                stage = getattr(self, '_current_stage', 'unknown')
+                raise type(e)(f"[Stage: {stage}] {e}") from e
 
     async def _resume_workflow_impl(
         self,
@@ -1646,6 +1740,8 @@ Research Type: {self.research_type}
         previous_manuscript = current_manuscript
 
         for round_num in range(start_round + 1, self.max_rounds + 1):
+            check_cancelled()
+            self._apply_budget_policy(round_num)
             console.print("\n" + "="*80 + "\n")
 
             # Run review
@@ -1837,6 +1933,7 @@ Research Type: {self.research_type}
                 break
 
             # Check if max rounds reached
+            self._apply_budget_policy(round_num)
             if round_num >= self.max_rounds:
                 self._save_checkpoint(round_num, current_manuscript, all_rounds)
 
@@ -0,0 +1,195 @@
+"""Tests for bounded activity logs (ring buffer, JSONL spill, paging, SSE)."""
+
+import asyncio
+import json
+
+import pytest
+
+from research_cli.activity_log import ActivityLog, ActivityLogStore
+
+
+def _fill(log, n, start=0):
+    for i in range(start, start + n):
+        log.append({"level": "info", "message": f"m{i}"})
+
+
+class TestActivityLog:
+
+    def test_ring_buffer_caps_memory_and_spills(self, tmp_path):
+        spill = tmp_path / "p" / "activity_log.jsonl"
+        log = ActivityLog(max_entries=5, spill_path=spill)
+        _fill(log, 12)
+
+        assert len(log) == 5
+        assert [e["seq"] for e in log] == [8, 9, 10, 11, 12]
+        spilled = [json.loads(line) for line in spill.read_text().splitlines()]
+        assert [e["seq"] for e in spilled] == list(range(1, 8))
+
+    def test_newest_page_and_backward_paging_across_spill(self, tmp_path):
+        log = ActivityLog(max_entries=5, spill_path=tmp_path / "a.jsonl")
+        _fill(log, 12)
+
+        assert [e["seq"] for e in log.page(limit=3)] == [10, 11, 12]
+        assert [e["seq"] for e in log.page(limit=4, before_seq=10)] == [6, 7, 8, 9]
+        assert [e["seq"] for e in log.page(limit=10, before_seq=3)] == [1, 2]
+
+    def test_forward_paging(self, tmp_path):
+        log = ActivityLog(max_entries=5, spill_path=tmp_path / "a.jsonl")
+        _fill(log, 12)
+
+        assert [e["seq"] for e in log.page(limit=3, after_seq=2)] == [3, 4, 5]
+        assert [e["seq"] for e in log.page(limit=50, after_seq=10)] == [11, 12]
+        assert log.page(limit=50, after_seq=12) == []
+
+    def test_without_spill_path_old_entries_are_dropped(self):
+        log = ActivityLog(max_entries=3)
+        _fill(log, 5)
+        assert [e["seq"] for e in log.page(limit=10)] == [3, 4, 5]
+        assert log.page(limit=10, before_seq=3) == []
+
+    def test_numbering_continues_after_restart(self, tmp_path):
+        spill = tmp_path / "a.jsonl"
+        _fill(ActivityLog(max_entries=2, spill_path=spill), 6)
+
+        restarted = ActivityLog(max_entries=2, spill_path=spill)
+        entry = restarted.append({"message": "after restart"})
+        assert entry["seq"] == 5
+        assert restarted.oldest_seq == 1
+
+    def test_flush_keeps_numbering_across_restart_without_duplicates(self, tmp_path):
+        spill = tmp_path / "a.jsonl"
+        log = ActivityLog(max_entries=5, spill_path=spill)
+        _fill(log, 3)
+        assert log.flush() == 3
+        assert log.flush() == 0
+        _fill(log, 4, start=3)  # pushes flushed entries out of the ring again
+        log.flush()
+
+        lines = [json.loads(line)["seq"] for line in spill.read_text().splitlines()]
+        assert lines == list(range(1, 8))
+        assert [e["seq"] for e in log.page(limit=50, after_seq=0)] == list(range(1, 8))
+        assert ActivityLog(max_entries=5, spill_path=spill).append({"message": "later"})["seq"] == 8
+
+    def test_wait_for_wakes_on_append(self):
+        async def scenario():
+            log = ActivityLog()
+            waiter = asyncio.ensure_future(log.wait_for(0, timeout=5))
+            await asyncio.sleep(0)
+            log.append({"message": "hi"})
+            return await waiter, await log.wait_for(1, timeout=0.01)
+
+        assert asyncio.new_event_loop().run_until_complete(scenario()) == (True, False)
+
+
+class TestActivityLogStore:
+
+    def test_list_assignment_and_monotonic_reset(self):
+        store = ActivityLogStore(max_entries=10)
+        store["p"] = [{"message": "a"}, {"message": "b"}]
+        assert [e["seq"] for e in store["p"]] == [1, 2]
+
+        store["p"] = [{"message": "reset"}]
+        assert [e["seq"] for e in store["p"]] == [3]
+        assert store.get("missing") is None
+        store.pop("p")
+        assert "p" not in store
+
+    def test_retire_flushes_and_frees_memory(self, tmp_path):
+        store = ActivityLogStore(max_entries=10, spill_path_for=lambda pid: tmp_path / f"{pid}.jsonl")
+        for i in range(3):
+            store.append("p", {"message": f"m{i}"})
+        store.retire("p")
+        assert "p" not in store
+
+        finished = store.load("p")
+        assert [e["seq"] for e in finished.page(limit=10)] == [1, 2, 3]
+        assert "p" not in store  # loading a finished log does not keep it in memory
+        assert store.append("p", {"message": "resumed"})["seq"] == 4
+
+    def test_flush_all(self, tmp_path):
+        store = ActivityLogStore(max_entries=10, spill_path_for=lambda pid: tmp_path / f"{pid}.jsonl")
+        store.append("a", {"message": "x"})
+        store.append("b", {"message": "y"})
+        assert store.flush_all() == 2
+        assert (tmp_path / "a.jsonl").exists() and (tmp_path / "b.jsonl").exists()
+
+
+class TestApiEndpoints:
+
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+        import api_server
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(api_server, "activity_logs",
+                            ActivityLogStore(max_entries=5, spill_path_for=api_server._activity_spill_path))
+        api_server.workflow_status["activity-test"] = {"status": "completed"}
+        for i in range(8):
+            api_server.add_activity_log("activity-test", "info", f"m{i}")
+        yield TestClient(api_server.app)
+        del api_server.workflow_status["activity-test"]
+
+    def test_paginated_activity(self, client, tmp_path):
+        data = client.get("/api/workflow-activity/activity-test?limit=3").json()
+        assert [e["seq"] for e in data["activity"]] == [8, 7, 6]
+        assert data["latest_seq"] == 8
+        assert data["next_before_seq"] == 6
+
+        older = client.get(f"/api/workflow-activity/activity-test?limit=10&before_seq={data['next_before_seq']}").json()
+        assert [e["seq"] for e in older["activity"]] == [5, 4, 3, 2, 1]
+        assert older["next_before_seq"] is None
+        assert (tmp_path / "results" / "activity-test" / "activity_log.jsonl").exists()
+
+    def test_sse_resume_from_last_event_id(self, client):
+        response = client.get("/api/workflow-activity/activity-test/stream",
+                              headers={"Last-Event-ID": "6"})
+        assert response.headers["content-type"].startswith("text/event-stream")
+        ids = [line[4:] for line in response.text.splitlines() if line.startswith("id: ")]
+        assert ids == ["7", "8"]
+        assert "event: end" in response.text
+
+    def test_finished_workflow_served_from_spill_file(self, client):
+        import api_server
+        api_server.activity_logs.retire("activity-test")
+        data = client.get("/api/workflow-activity/activity-test?limit=3").json()
+        assert [e["seq"] for e in data["activity"]] == [8, 7, 6]
+        assert data["latest_seq"] == 8
+        assert "activity-test" not in api_server.activity_logs
+
+    def test_stream_wakes_on_first_live_entry(self, client, monkeypatch):
+        import api_server
+
+        class _Request:
+            headers = {}
+
+            async def is_disconnected(self):
+                return False
+
+        monkeypatch.setitem(api_server.workflow_status, "activity-live", {"status": "queued"})
+        monkeypatch.setattr(api_server, "ACTIVITY_STREAM_HEARTBEAT_SECONDS", 30)
+        reads = []
+        real_read = ActivityLog._read_spilled
+        monkeypatch.setattr(ActivityLog, "_read_spilled", lambda self: reads.append(1) or real_read(self))
+
+        async def scenario():
+            response = await api_server.stream_workflow_activity("activity-live", _Request())
+            events = response.body_iterator
+            first = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0.05)
+            api_server.add_activity_log("activity-live", "info", "started")
+            chunk = await asyncio.wait_for(first, timeout=2)
+            await events.aclose()
+            return chunk
+
+        try:
+            chunk = asyncio.new_event_loop().run_until_complete(scenario())
+        finally:
+            api_server.activity_logs.pop("activity-live", None)
+        assert chunk.startswith("id: 1\n") and "started" in chunk
+        assert len(reads) <= 1  # the spill file is read when the live log is created, not per loop
+
+    def test_submission_spill_path(self):
+        import api_server
+        path = api_server._activity_spill_path("sub-abc123-r2")
+        assert path.as_posix() == "results/submissions/abc123/activity_log-r2.jsonl"
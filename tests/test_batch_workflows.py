@@ -0,0 +1,138 @@
+"""Tests for batch workflow submission and the CLI batch runner helpers."""
+
+import asyncio
+
+import click
+import pytest
+
+import api_server
+from research_cli import db
+from research_cli.cli import _load_batch_topics
+from research_cli.job_scheduler import JobScheduler
+from research_cli.request_dedup import TopicSimilarityIndex
+from research_cli.run_predictor import RunPrediction
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "research.db")
+    monkeypatch.setattr(db._local, "conn", None, raising=False)
+    monkeypatch.setattr(db, "_usage_buffer", [])
+    db.invalidate_api_key_cache(signal=False)
+    db.init_db()
+    monkeypatch.setattr(api_server, "job_queue", JobScheduler())
+    monkeypatch.setattr(api_server, "_running_jobs", {})
+    monkeypatch.setattr(api_server, "_batches", {})
+    monkeypatch.setattr(api_server, "_held_jobs", {})
+    monkeypatch.setattr(api_server, "_topic_index", TopicSimilarityIndex())
+    monkeypatch.setattr(api_server, "project_index", api_server.ProjectIndex(tmp_path / "results", api_server._summarize_project))
+    monkeypatch.setattr(api_server, "ADMIN_API_KEY", "admin-key")
+    monkeypatch.setattr(api_server, "RATE_LIMIT_SECONDS", 0)
+    # Every run is predicted to cost $1 (p50)
+    prediction = RunPrediction(
+        pre_review_seconds=(60, 90, 120), round_seconds=(60, 90, 120), rounds_fraction=1 / 3,
+        base_cost=(0.5, 0.5, 0.5), round_cost=(0.4, 0.5, 0.6), sample_count=5,
+    )
+    monkeypatch.setattr(api_server, "_predict_run", lambda *args: prediction)
+    yield
+    for pid in list(api_server.workflow_status):
+        if pid.startswith("batch-topic"):
+            api_server.workflow_status.pop(pid, None)
+            api_server.activity_logs.pop(pid, None)
+            api_server._run_predictions.pop(pid, None)
+    db._local.conn.close()
+    db._local.conn = None
+
+
+def _batch(*topics, api_key="admin-key", **kwargs):
+    request = api_server.BatchWorkflowRequest(items=[{"topic": t} for t in topics], **kwargs)
+    return _run(api_server.start_workflow_batch(request, api_key=api_key))
+
+
+class TestBatchSubmission:
+
+    def test_items_are_queued_and_grouped(self, server):
+        result = _batch("Batch topic one", "Batch topic two")
+        assert result["queued"] == 2
+        assert api_server.job_queue.qsize() == 2
+        jobs = db.get_batch_jobs(result["batch_id"])
+        assert [j["project_id"] for j in jobs] == [i["project_id"] for i in result["items"]]
+
+        status = _run(api_server.get_workflow_batch(result["batch_id"], api_key="admin-key"))
+        assert [i["status"] for i in status["items"]] == ["queued", "queued"]
+        assert status["done"] is False
+
+    def test_budget_skips_items_past_it(self, server):
+        result = _batch("Batch topic one", "Batch topic two", "Batch topic three", budget_usd=2.5)
+        assert [i["status"] for i in result["items"]] == ["queued", "queued", "skipped"]
+        assert result["estimated_cost"] == pytest.approx(2.0)
+        assert api_server.job_queue.qsize() == 2
+
+    def test_repeated_topic_in_batch_runs_once(self, server):
+        result = _batch("Batch topic one", "batch topic  ONE", on_duplicate="reuse")
+        assert result["queued"] == 1
+        assert result["items"][1]["duplicate"] == "batch"
+        assert result["items"][1]["duplicate_of_item"] == 0
+
+    def test_max_concurrency_holds_and_releases(self, server):
+        result = _batch("Batch topic one", "Batch topic two", "Batch topic three", max_concurrency=1)
+        assert api_server.job_queue.qsize() == 1
+        held_id = result["items"][1]["project_id"]
+        assert api_server._find_held_job(held_id) is not None
+
+        # Finishing the admitted job lets the next held one in
+        api_server.job_queue = JobScheduler()
+        _run(api_server._release_batch(result["batch_id"]))
+        assert api_server.job_queue.find(held_id) is not None
+        assert api_server.job_queue.qsize() == 1
+
+    def test_cancel_admitted_item_releases_next(self, server):
+        result = _batch("Batch topic one", "Batch topic two", "Batch topic three", max_concurrency=1)
+        admitted_id, next_id = result["items"][0]["project_id"], result["items"][1]["project_id"]
+        response = _run(api_server.cancel_workflow(admitted_id, api_key="admin-key"))
+        assert response["status"] == "cancelled"
+        assert api_server.job_queue.find(admitted_id) is None
+        assert api_server.job_queue.find(next_id) is not None
+        assert api_server._find_held_job(result["items"][2]["project_id"]) is not None
+        assert api_server.job_queue.qsize() == 1
+
+    def test_cancel_held_item(self, server):
+        result = _batch("Batch topic one", "Batch topic two", max_concurrency=1)
+        held_id = result["items"][1]["project_id"]
+        response = _run(api_server.cancel_workflow(held_id, api_key="admin-key"))
+        assert response["status"] == "cancelled"
+        assert api_server._find_held_job(held_id) is None
+        assert api_server.workflow_status[held_id]["status"] == "cancelled"
+
+    def test_limits_and_ownership(self, server):
+        with pytest.raises(api_server.HTTPException) as info:
+            _batch(*[f"Batch topic {i}" for i in range(api_server.BATCH_MAX_ITEMS + 1)])
+        assert info.value.status_code == 400
+
+        user_key = db.create_api_key_direct(label="user")["key"]
+        db.update_key_quota(user_key, 1)
+        with pytest.raises(api_server.HTTPException) as info:
+            _batch("Batch topic one", "Batch topic two", api_key=user_key)
+        assert info.value.status_code == 429
+
+        result = _batch("Batch topic one")
+        with pytest.raises(api_server.HTTPException) as info:
+            _run(api_server.get_workflow_batch(result["batch_id"], api_key=user_key))
+        assert info.value.status_code == 403
+
+
+class TestBatchTopicsFile:
+
+    def test_load_jsonl(self, tmp_path):
+        path = tmp_path / "topics.jsonl"
+        path.write_text('# comment\n{"topic": "A", "article_length": "short"}\n\n"B"\n')
+        assert _load_batch_topics(path) == [{"topic": "A", "article_length": "short"}, {"topic": "B"}]
+
+        path.write_text('{"title": "no topic"}\n')
+        with pytest.raises(click.ClickException):
+            _load_batch_topics(path)
@@ -0,0 +1,263 @@
+"""Tests for per-workflow cost/token budgets and their enforcement."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+import api_server
+from research_cli import model_config
+from research_cli.budget import WorkflowBudget, effective_budget, resumed_budget
+from research_cli.cancellation import CancellationToken, OperationCancelled, use_token
+from research_cli.llm.base import LLMResponse, report_usage_to, retry_llm_call
+from research_cli.performance import PerformanceTracker, _model_cost
+from research_cli.workflow.orchestrator import WorkflowOrchestrator
+
+
+class TestWorkflowBudget:
+
+    def test_policy_fires_once_near_limit(self):
+        budget = WorkflowBudget(max_cost_usd=1.0, policy="downgrade")
+        fired = []
+        budget.on_trigger(fired.append)
+        budget.charge(0.5, 1000)
+        assert budget.triggered is None
+        budget.charge(0.35, 1000)
+        budget.charge(0.05, 1000)
+        assert fired == ["downgrade"]
+        assert budget.spent_tokens == 3000
+
+    def test_limit_stops_and_cancels_token(self):
+        budget = WorkflowBudget(max_tokens=1000, policy="cap_rounds")
+        token = CancellationToken()
+        with use_token(token), pytest.raises(OperationCancelled) as info:
+            budget.charge(0.0, 1200)
+        assert token.cancelled
+        assert "Budget exhausted" in info.value.reason
+
+    def test_stop_policy_stops_before_limit(self):
+        budget = WorkflowBudget(max_cost_usd=1.0, policy="stop")
+        with pytest.raises(OperationCancelled) as info:
+            budget.charge(0.9, 0)
+        assert "nearly exhausted" in info.value.reason
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            WorkflowBudget(max_cost_usd=1.0, policy="pray")
+
+    def test_effective_budget_takes_tightest_limit(self):
+        assert effective_budget() is None
+        budget = effective_budget(request_cost=5.0, key_cost=2.0, key_tokens=10_000, policy="stop")
+        assert (budget.max_cost_usd, budget.max_tokens, budget.policy) == (2.0, 10_000, "stop")
+
+
+class TestTrackerCharging:
+
+    def test_tracked_tokens_charge_budget(self):
+        budget = WorkflowBudget(max_cost_usd=100.0)
+        tracker = PerformanceTracker(budget=budget)
+        tracker.record_revision(tokens=3000, input_tokens=2000, output_tokens=1000, model="some-model")
+        assert budget.spent_tokens == 3000
+        assert budget.spent_usd == pytest.approx(_model_cost("some-model", 2000, 1000))
+
+    def test_no_budget_is_unchanged(self):
+        tracker = PerformanceTracker()
+        tracker.record_revision(tokens=10, input_tokens=5, output_tokens=5, model="m")
+        assert tracker.budget is None
+
+
+def _orchestrator(budget, max_rounds=3):
+    orchestrator = WorkflowOrchestrator.__new__(WorkflowOrchestrator)
+    orchestrator.tracker = PerformanceTracker(budget=budget)
+    orchestrator._budget_applied = False
+    orchestrator.max_rounds = max_rounds
+    orchestrator.status_callback = None
+    orchestrator.specialists = {"expert-1": {"name": "E", "provider": "anthropic", "model": "big-model"}}
+    return orchestrator
+
+
+class TestOrchestratorPolicies:
+
+    def test_cap_rounds_makes_current_round_last(self):
+        budget = WorkflowBudget(max_cost_usd=1.0, policy="cap_rounds")
+        orchestrator = _orchestrator(budget)
+        orchestrator._apply_budget_policy(1)
+        assert orchestrator.max_rounds == 3
+        budget.charge(0.85, 0)
+        orchestrator._apply_budget_policy(2)
+        assert orchestrator.max_rounds == 2
+
+    def test_downgrade_moves_reviewers_to_light_tier(self):
+        budget = WorkflowBudget(max_cost_usd=1.0, policy="downgrade")
+        orchestrator = _orchestrator(budget)
+        budget.charge(0.9, 0)
+        orchestrator._apply_budget_policy(1)
+        light = model_config.get_tier_config("light")[0]
+        assert orchestrator.specialists["expert-1"]["model"] == light.model
+
+
+class TestTierOverride:
+
+    def test_use_tier_overrides_tiered_roles(self):
+        default = model_config.get_role_config("writer").primary.model
+        with model_config.use_tier("light"):
+            assert model_config.get_role_config("writer").primary.model == model_config.get_tier_config("light")[0].model
+        assert model_config.get_role_config("writer").primary.model == default
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def _write_checkpoint(output_dir, budget):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = {
+        "topic": "Budget topic", "current_round": 1, "max_rounds": 3, "threshold": 7.0,
+        "current_manuscript": "text", "all_rounds": [], "expert_configs": [],
+        "budget": budget.to_dict(),
+    }
+    (output_dir / "workflow_checkpoint.json").write_text(json.dumps(checkpoint))
+
+
+class TestResumeAfterBudgetStop:
+
+    def test_resumed_budget_carries_spend(self):
+        saved = WorkflowBudget(max_cost_usd=1.0, policy="downgrade", spent_usd=0.9, spent_tokens=500,
+                               triggered="downgrade").to_dict()
+        budget = resumed_budget(saved)
+        assert (budget.max_cost_usd, budget.spent_usd, budget.spent_tokens) == (1.0, 0.9, 500)
+        assert budget.triggered == "downgrade"
+        assert not budget.exhausted
+
+        raised = resumed_budget(saved, request_cost=5.0)
+        assert raised.max_cost_usd == 5.0 and raised.spent_usd == 0.9
+        assert raised.triggered is None  # may fire again near the new limit
+        # The key's own limit still caps a raised one
+        assert resumed_budget(saved, request_cost=5.0, key_cost=0.95).max_cost_usd == 0.95
+        assert resumed_budget(None) is None
+
+    def test_stop_records_spend_in_checkpoint(self, tmp_path):
+        orchestrator = _orchestrator(WorkflowBudget(max_cost_usd=1.0, policy="stop"))
+        orchestrator.output_dir = tmp_path
+        orchestrator.cancel_token = CancellationToken()
+        orchestrator._current_stage = "round 2"
+        _write_checkpoint(tmp_path, orchestrator.tracker.budget)
+
+        async def run_impl(initial_manuscript=None):
+            orchestrator.tracker.budget.charge(1.2, 3000)
+
+        orchestrator._run_impl = run_impl
+        with pytest.raises(OperationCancelled):
+            _run(orchestrator.run())
+        saved = json.loads((tmp_path / "workflow_checkpoint.json").read_text())["budget"]
+        assert (saved["spent_usd"], saved["spent_tokens"]) == (1.2, 3000)
+
+    def test_resume_keeps_budget_or_refuses(self, tmp_path, monkeypatch):
+        created = []
+
+        def fake_init(self, **kwargs):
+            self.tracker = PerformanceTracker(budget=kwargs["budget"])
+            created.append(self)
+
+        async def fake_resume(self, start_round, manuscript, all_rounds):
+            return {"budget": self.tracker.budget}
+
+        monkeypatch.setattr(WorkflowOrchestrator, "__init__", fake_init)
+        monkeypatch.setattr(WorkflowOrchestrator, "_resume_workflow", fake_resume)
+
+        _write_checkpoint(tmp_path, WorkflowBudget(max_cost_usd=1.0, policy="stop", spent_usd=1.1))
+        with pytest.raises(ValueError, match="Budget exhausted"):
+            _run(WorkflowOrchestrator.resume_from_checkpoint(tmp_path))
+        assert created == []
+
+        _write_checkpoint(tmp_path, WorkflowBudget(max_cost_usd=1.0, policy="stop", spent_usd=0.85,
+                                                   triggered="stop"))
+        budget = _run(WorkflowOrchestrator.resume_from_checkpoint(tmp_path))["budget"]
+        assert (budget.max_cost_usd, budget.spent_usd, budget.policy) == (1.0, 0.85, "stop")
+        with pytest.raises(OperationCancelled):
+            budget.charge(0.2, 0)
+
+    def test_resume_endpoint_requires_a_raised_limit(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(api_server, "job_queue", api_server.JobScheduler())
+        enqueued = []
+
+        async def enqueue(fn, job_type, payload, **kwargs):
+            enqueued.append(payload)
+            return await api_server.job_queue.put({"_fn": fn, **payload}, job_id="resume-job", job_type=job_type)
+
+        monkeypatch.setattr(api_server, "_enqueue_job", enqueue)
+        monkeypatch.setattr(api_server.appdb, "get_api_key_cached",
+                            lambda key: {"job_budget_usd": 3.0} if key == "owner" else None)
+        _write_checkpoint(tmp_path / "results" / "budget-resume",
+                          WorkflowBudget(max_cost_usd=1.0, policy="stop", spent_usd=1.1))
+        try:
+            with pytest.raises(HTTPException) as refused:
+                _run(api_server.resume_workflow("budget-resume", api_key="owner"))
+            assert refused.value.status_code == 400
+            assert enqueued == []
+
+            body = api_server.ResumeWorkflowRequest(budget_usd=10.0)
+            _run(api_server.resume_workflow("budget-resume", body, api_key="owner"))
+            # Raised, but capped by the key's per-job limit; spend carries over
+            assert enqueued[0]["budget"]["max_cost_usd"] == 3.0
+            assert enqueued[0]["budget"]["spent_usd"] == 1.1
+        finally:
+            api_server.workflow_status.pop("budget-resume", None)
+            api_server.activity_logs.pop("budget-resume", None)
+
+
+def _llm_call(model="some-model", input_tokens=1000, output_tokens=500):
+    async def call():
+        return LLMResponse(content="ok", model=model, provider="test",
+                           input_tokens=input_tokens, output_tokens=output_tokens)
+    return retry_llm_call(call, max_retries=0)
+
+
+class TestCollaborativePhaseCharging:
+
+    def test_calls_in_block_and_its_tasks_are_reported(self):
+        tracker = PerformanceTracker(budget=WorkflowBudget(max_tokens=100_000))
+
+        async def scenario():
+            await _llm_call()  # outside the block: not reported
+            with report_usage_to(tracker.record_collaboration):
+                await asyncio.gather(_llm_call(), _llm_call())
+
+        _run(scenario())
+        assert tracker.budget.spent_tokens == 3000
+        tracker.start_workflow()
+        metrics = tracker.export_metrics()
+        assert metrics.collaboration_tokens == 3000 and metrics.total_tokens == 3000
+        assert metrics.estimated_cost == pytest.approx(2 * _model_cost("some-model", 1000, 500))
+
+    def test_budget_stops_collaborative_run_before_peer_review(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+        from research_cli.workflow import collaborative_workflow
+
+        class ChattyResearchPhase(collaborative_workflow.CollaborativeResearchPhase):
+            def __init__(self, tracker=None, **kwargs):
+                self.tracker = tracker
+
+            async def _run(self):
+                for _ in range(5):
+                    await _llm_call()
+
+        def no_writing(**kwargs):
+            raise AssertionError("writing phase should not start")
+
+        monkeypatch.setattr(collaborative_workflow, "CollaborativeResearchPhase", ChattyResearchPhase)
+        monkeypatch.setattr(collaborative_workflow, "ManuscriptWritingPhase", no_writing)
+        author = SimpleNamespace(name="Lead", model="m")
+        workflow = collaborative_workflow.CollaborativeWorkflowOrchestrator(
+            topic="Budget topic", major_field="computer_science", subfield="security",
+            writer_team=SimpleNamespace(lead_author=author, coauthors=[]), reviewer_configs=[],
+            output_dir=tmp_path, budget=WorkflowBudget(max_tokens=4000, policy="stop"),
+            cancel_token=CancellationToken(),
+        )
+        with pytest.raises(OperationCancelled):
+            _run(workflow.run())
+        assert workflow.cancel_token.cancelled
+        assert workflow.budget.spent_tokens == 4500  # stopped at the 80% mark, before writing
+        assert json.loads((tmp_path / "workflow_cancelled.json").read_text())["stage"] == "collaborative research"
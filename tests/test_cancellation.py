@@ -0,0 +1,168 @@
+"""Tests for cancellation tokens, the cancel endpoint and worker slot release."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+import api_server
+from research_cli.cancellation import (
+    CancellationToken,
+    OperationCancelled,
+    check_cancelled,
+    current_token,
+    use_token,
+)
+from research_cli.job_scheduler import JobScheduler
+from research_cli.llm.base import retry_llm_call
+from research_cli.workflow.orchestrator import CANCELLED_MARKER, write_cancellation_marker
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+class TestCancellationToken:
+
+    def test_cancel_runs_callbacks_once(self):
+        token = CancellationToken()
+        seen = []
+        token.add_callback(seen.append)
+        assert token.cancel("stop") is True
+        assert token.cancel("again") is False
+        assert seen == ["stop"]
+        assert token.reason == "stop"
+
+        late = []
+        token.add_callback(late.append)
+        assert late == ["stop"]
+
+    def test_cancelled_error_is_not_an_exception(self):
+        token = CancellationToken()
+        token.cancel("stop")
+        with pytest.raises(OperationCancelled) as info:
+            try:
+                token.raise_if_cancelled()
+            except Exception:  # agent-style fallbacks must not swallow it
+                pytest.fail("OperationCancelled was caught as Exception")
+        assert info.value.reason == "stop"
+
+    def test_token_propagates_to_child_tasks(self):
+        async def child():
+            return current_token()
+
+        async def scenario():
+            token = CancellationToken()
+            with use_token(token):
+                inner = await asyncio.create_task(child())
+            return token, inner, current_token()
+
+        token, inner, after = _run(scenario())
+        assert inner is token
+        assert after is None
+
+    def test_check_cancelled_and_llm_retry(self):
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            return "ok"
+
+        token = CancellationToken()
+        with use_token(token):
+            check_cancelled()
+            assert _run(retry_llm_call(factory)) == "ok"
+            token.cancel("stop")
+            with pytest.raises(OperationCancelled):
+                _run(retry_llm_call(factory))
+        assert calls == [1]
+
+    def test_cancellation_marker(self, tmp_path):
+        (tmp_path / "workflow_checkpoint.json").write_text("{}")
+        write_cancellation_marker(tmp_path, "peer review (round 2/3)", OperationCancelled("Cancelled by admin"))
+        marker = json.loads((tmp_path / CANCELLED_MARKER).read_text())
+        assert marker["stage"] == "peer review (round 2/3)"
+        assert marker["reason"] == "Cancelled by admin"
+        assert marker["resumable"] is True
+
+
+class TestCancelEndpoint:
+
+    @pytest.fixture
+    def server(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(api_server, "job_queue", JobScheduler())
+        monkeypatch.setattr(api_server, "_running_jobs", {})
+        monkeypatch.setattr(api_server, "ADMIN_API_KEY", "admin-key")
+        completed = []
+        monkeypatch.setattr(api_server.appdb, "mark_job_running", lambda job_id: None)
+        monkeypatch.setattr(api_server.appdb, "complete_job", lambda job_id, status="completed": completed.append((job_id, status)))
+        for pid in ("cancel-a", "cancel-b"):
+            api_server.workflow_status[pid] = {"status": "queued"}
+        yield completed
+        for pid in ("cancel-a", "cancel-b"):
+            api_server.workflow_status.pop(pid, None)
+            api_server.activity_logs.pop(pid, None)
+
+    def test_running_job_is_cancelled_and_slot_freed(self, server):
+        completed = server
+        started, finished = [], []
+
+        async def slow_job(project_id):
+            started.append(project_id)
+            try:
+                await asyncio.sleep(3600)
+            finally:
+                finished.append(project_id)
+
+        async def quick_job(project_id):
+            finished.append(project_id)
+
+        async def scenario():
+            queue = api_server.job_queue
+            await queue.put({"_fn": slow_job, "project_id": "cancel-a"}, job_id="job-a", job_type="workflow", api_key="owner")
+            await queue.put({"_fn": quick_job, "project_id": "cancel-b"}, job_id="job-b", job_type="workflow", api_key="owner")
+            worker = asyncio.create_task(api_server.job_worker(1))
+            while not started:
+                await asyncio.sleep(0)
+
+            with pytest.raises(HTTPException) as denied:
+                await api_server.cancel_workflow("cancel-a", api_key="someone-else")
+            assert denied.value.status_code == 403
+
+            response = await api_server.cancel_workflow("cancel-a", api_key="owner")
+            assert response["status"] == "cancelling"
+            for _ in range(100):
+                if ("job-b", "completed") in completed:
+                    break
+                await asyncio.sleep(0)
+            running = queue.running_count()
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+            return running
+
+        assert _run(scenario()) == 0
+        assert finished == ["cancel-a", "cancel-b"]
+        assert ("job-a", "cancelled") in completed and ("job-b", "completed") in completed
+        assert api_server.workflow_status["cancel-a"]["status"] == "cancelled"
+        assert api_server.workflow_status["cancel-a"]["can_resume"] is False
+
+    def test_queued_job_is_removed(self, server):
+        completed = server
+
+        async def scenario():
+            await api_server.job_queue.put({"_fn": None, "project_id": "cancel-b"}, job_id="job-b",
+                                           job_type="workflow", api_key="owner")
+            response = await api_server.cancel_workflow("cancel-b", api_key="admin-key")
+            return response
+
+        assert _run(scenario())["status"] == "cancelled"
+        assert api_server.job_queue.qsize() == 0
+        assert completed == [("job-b", "cancelled")]
+        assert api_server.workflow_status["cancel-b"]["status"] == "cancelled"
+
+    def test_unknown_workflow(self, server):
+        with pytest.raises(HTTPException) as info:
+            _run(api_server.cancel_workflow("nope", api_key="admin-key"))
+        assert info.value.status_code == 404
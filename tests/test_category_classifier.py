@@ -20,12 +20,21 @@ from research_cli.categories import (
     suggest_category_llm,
     ACADEMIC_CATEGORIES,
 )
+from research_cli.utils.memo import clear_memo_caches
 
 
 def _run(coro):
     return asyncio.get_event_loop().run_until_complete(coro)
 
 
+@pytest.fixture(autouse=True)
+def _no_memoized_categories():
+    """Each test sees its own mocked LLM, not a classification memoized by an earlier one."""
+    clear_memo_caches()
+    yield
+    clear_memo_caches()
+
+
 # ---------------------------------------------------------------------------
 # Keyword fallback: biology/medicine topics must NOT fall to CS
 # ---------------------------------------------------------------------------
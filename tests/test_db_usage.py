@@ -0,0 +1,183 @@
+"""Tests for usage counters, indexes, write-behind and the API-key cache in research_cli.db."""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from research_cli import db
+
+
+@pytest.fixture
+def fresh_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "research.db")
+    monkeypatch.setattr(db._local, "conn", None, raising=False)
+    monkeypatch.setattr(db, "_usage_buffer", [])
+    db.invalidate_api_key_cache(signal=False)
+    db.init_db()
+    key = db.create_api_key_direct(label="test")["key"]
+    yield key
+    db._local.conn.close()
+    db._local.conn = None
+
+
+class TestIndexes:
+
+    def test_secondary_indexes_exist(self, fresh_db):
+        names = {r["name"] for r in db.get_connection().execute(
+            "SELECT name FROM sqlite_master WHERE type='index'")}
+        assert {"idx_key_usage_key_ts", "idx_job_queue_status_created",
+                "idx_workflow_ownership_key", "idx_submissions_key_created"} <= names
+
+    def test_quota_lookup_uses_primary_key(self, fresh_db):
+        plan = db.get_connection().execute(
+            "EXPLAIN QUERY PLAN SELECT count FROM key_usage_counters WHERE api_key=? AND bucket=?",
+            (fresh_db, "x"),
+        ).fetchall()
+        assert "SCAN" not in " ".join(row[3] for row in plan)
+
+
+class TestCounters:
+
+    def test_record_usage_updates_counters(self, fresh_db):
+        for _ in range(3):
+            db.record_usage(fresh_db, "/api/start-workflow", "p")
+        db.record_usage(fresh_db, "/api/submit-manuscript", "s")
+
+        assert db.get_total_usage(fresh_db) == 3
+        assert db.get_daily_usage(fresh_db) == 4
+        quota = db.check_quota(fresh_db)
+        assert quota == {"allowed": False, "used": 3, "limit": 3}
+        # History rows are still written
+        count = db.get_connection().execute("SELECT COUNT(*) FROM key_usage").fetchone()[0]
+        assert count == 4
+
+    def test_backfill_from_existing_history(self, fresh_db):
+        conn = db.get_connection()
+        old = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+        conn.executemany(
+            "INSERT INTO key_usage (api_key, endpoint, timestamp, project_id) VALUES (?, ?, ?, ?)",
+            [(fresh_db, "/api/start-workflow", old, "a"), (fresh_db, "/api/start-workflow", db._now(), "b")],
+        )
+        conn.execute("DELETE FROM key_usage_counters")
+        conn.commit()
+
+        db.init_db()
+        assert db.get_total_usage(fresh_db) == 2
+        assert db.get_daily_usage(fresh_db) == 1
+
+    def test_backfill_is_idempotent(self, fresh_db):
+        conn = db.get_connection()
+        conn.execute(
+            "INSERT INTO key_usage (api_key, endpoint, timestamp, project_id) VALUES (?, ?, ?, ?)",
+            (fresh_db, "/api/start-workflow", db._now(), "a"),
+        )
+        conn.execute("DELETE FROM key_usage_counters")
+        conn.commit()
+
+        db.init_db()
+        # A second process starting against the same database
+        other = threading.Thread(target=db.init_db)
+        other.start()
+        other.join()
+        db.init_db()
+        assert db.get_total_usage(fresh_db) == 1
+        assert db.get_daily_usage(fresh_db) == 1
+        assert not conn.in_transaction
+
+    def test_prune_old_daily_rows(self, fresh_db):
+        conn = db.get_connection()
+        conn.execute("INSERT INTO key_usage_counters VALUES (?, 'day:2000-01-01', 5)", (fresh_db,))
+        conn.commit()
+        db.record_usage(fresh_db, "/api/start-workflow")
+        assert db.prune_usage_counters() == 1
+        assert db.get_total_usage(fresh_db) == 1
+
+    def test_failed_write_rolls_back(self, fresh_db, monkeypatch):
+        with pytest.raises(sqlite3.Error):
+            db._write_usage([(fresh_db, "/api/start-workflow", db._now(), None),
+                             (None, "/api/start-workflow", db._now(), None)])
+        assert db.get_total_usage(fresh_db) == 0
+
+
+class TestWriteBehind:
+
+    def test_deferred_events_count_before_flush(self, fresh_db, monkeypatch):
+        monkeypatch.setattr(db, "USAGE_FLUSH_INTERVAL", 3600)
+        monkeypatch.setattr(db, "_usage_last_flush", float("inf"))
+        db.record_usage(fresh_db, "/api/start-workflow", defer=True)
+        db.record_usage(fresh_db, "/api/submit-manuscript", defer=True)
+
+        assert db.get_connection().execute("SELECT COUNT(*) FROM key_usage").fetchone()[0] == 0
+        assert db.get_total_usage(fresh_db) == 1
+        assert db.get_daily_usage(fresh_db) == 2
+
+        assert db.flush_usage() == 2
+        assert db.flush_usage() == 0
+        assert db.get_total_usage(fresh_db) == 1
+        assert db.get_daily_usage(fresh_db) == 2
+
+    def test_batch_size_triggers_flush(self, fresh_db, monkeypatch):
+        monkeypatch.setattr(db, "USAGE_BATCH_SIZE", 3)
+        monkeypatch.setattr(db, "USAGE_FLUSH_INTERVAL", 3600)
+        monkeypatch.setattr(db, "_usage_last_flush", float("inf"))
+        for _ in range(3):
+            db.record_usage(fresh_db, "/api/start-workflow", defer=True)
+        assert db._usage_buffer == []
+        assert db.get_connection().execute("SELECT COUNT(*) FROM key_usage").fetchone()[0] == 3
+
+
+class TestApiKeyCache:
+
+    def _count_lookups(self, monkeypatch):
+        calls = []
+        real = db.get_api_key
+        monkeypatch.setattr(db, "get_api_key", lambda key: calls.append(key) or real(key))
+        return calls
+
+    def test_hits_skip_sqlite(self, fresh_db, monkeypatch):
+        calls = self._count_lookups(monkeypatch)
+        for _ in range(5):
+            assert db.get_api_key_cached(fresh_db)["label"] == "test"
+            assert db.get_api_key_cached("bogus") is None
+        assert calls == [fresh_db, "bogus"]
+
+    def test_cached_row_is_a_copy(self, fresh_db):
+        db.get_api_key_cached(fresh_db)["label"] = "mutated"
+        assert db.get_api_key_cached(fresh_db)["label"] == "test"
+
+    def test_revoke_and_quota_update_invalidate(self, fresh_db):
+        assert db.check_quota(fresh_db)["limit"] == 3
+        db.update_key_quota(fresh_db[:8], 7)
+        assert db.check_quota(fresh_db)["limit"] == 7
+
+        db.revoke_api_key(fresh_db[:8])
+        assert db.get_api_key_cached(fresh_db) is None
+
+    def test_new_key_clears_negative_entry(self, fresh_db):
+        assert db.get_api_key_cached("legacy-key") is None
+        db.create_legacy_key("legacy-key", label="legacy")
+        assert db.get_api_key_cached("legacy-key")["label"] == "legacy"
+
+    def test_ttl_expiry(self, fresh_db, monkeypatch):
+        calls = self._count_lookups(monkeypatch)
+        monkeypatch.setattr(db, "AUTH_CACHE_TTL", 0)
+        db.get_api_key_cached(fresh_db)
+        db.get_api_key_cached(fresh_db)
+        assert len(calls) == 2
+
+    def test_cross_process_epoch_signal(self, fresh_db, monkeypatch):
+        """A revocation committed by another process is picked up on the next epoch check."""
+        assert db.get_api_key_cached(fresh_db) is not None
+
+        other = sqlite3.connect(str(db.DB_PATH))
+        other.execute("UPDATE api_keys SET revoked_at = 'now' WHERE key = ?", (fresh_db,))
+        other.execute("UPDATE cache_epochs SET epoch = epoch + 1 WHERE name = 'api_keys'")
+        other.commit()
+        other.close()
+
+        monkeypatch.setattr(db, "AUTH_EPOCH_CHECK_INTERVAL", 3600)
+        assert db.get_api_key_cached(fresh_db) is not None  # within the check interval
+        monkeypatch.setattr(db, "AUTH_EPOCH_CHECK_INTERVAL", 0)
+        assert db.get_api_key_cached(fresh_db) is None
@@ -0,0 +1,135 @@
+"""Tests for ETag / 304 / compression on project endpoints and static files."""
+
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from research_cli.utils import http_cache
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import api_server
+    from research_cli.project_index import ProjectIndex
+
+    project = tmp_path / "results" / "cache-test-20260101-000000"
+    project.mkdir(parents=True)
+    (project / "workflow_complete.json").write_text(json.dumps({
+        "topic": "Caching", "passed": True, "final_score": 8.0, "total_rounds": 1,
+        "rounds": [{"round": 1, "overall_average": 8.0, "passed": True,
+                    "moderator_decision": {"decision": "ACCEPT"}, "reviews": []}],
+        "performance": {"total_duration": 10, "total_tokens": 100, "estimated_cost": 0.1},
+    }))
+    (project / "manuscript_v1.md").write_text("# Caching\n\n" + "Body text. " * 400)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(api_server, "project_index",
+                        ProjectIndex(tmp_path / "results", api_server._summarize_project))
+    http_cache.clear_cache()
+    yield TestClient(api_server.app), project
+    http_cache.clear_cache()
+
+
+PID = "cache-test-20260101-000000"
+
+
+class TestConditionalGet:
+
+    @pytest.mark.parametrize("path", [
+        f"/api/projects/{PID}",
+        f"/api/projects/{PID}/manuscripts",
+        f"/api/projects/{PID}/report",
+        "/api/projects",
+    ])
+    def test_etag_and_304(self, client, path):
+        c, _ = client
+        first = c.get(path)
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        # Editable resources always revalidate; the ETag keeps that cheap
+        assert "no-cache" in first.headers["cache-control"]
+        assert "max-age" not in first.headers["cache-control"]
+        assert "last-modified" in first.headers
+
+        second = c.get(path, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_etag_changes_when_file_changes(self, client):
+        c, project = client
+        path = f"/api/projects/{PID}/manuscripts"
+        etag = c.get(path).headers["etag"]
+
+        manuscript = project / "manuscript_v1.md"
+        manuscript.write_text("# Caching\n\nEdited.")
+        later = time.time() + 5
+        os.utime(manuscript, (later, later))
+
+        response = c.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert "Edited." in response.json()["manuscript_v1"]
+
+    def test_if_modified_since(self, client):
+        c, _ = client
+        path = f"/api/projects/{PID}"
+        last_modified = c.get(path).headers["last-modified"]
+        assert c.get(path, headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    def test_missing_project_still_404(self, client):
+        c, _ = client
+        assert c.get("/api/projects/nope").status_code == 404
+        assert c.get("/api/projects/nope/report").status_code == 404
+
+
+class TestCompression:
+
+    def test_gzip_when_accepted(self, client):
+        c, _ = client
+        path = f"/api/projects/{PID}/manuscripts"
+        raw = c.get(path, headers={"Accept-Encoding": "gzip"})
+        assert raw.headers.get("content-encoding") == "gzip"
+        assert "Body text." in raw.json()["manuscript_v1"]
+        assert "Accept-Encoding" in raw.headers["vary"]
+
+    def test_identity_without_accept_encoding(self, client):
+        c, _ = client
+        response = c.get(f"/api/projects/{PID}/manuscripts", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+
+    def test_compressed_body_built_once_per_etag(self, client, monkeypatch):
+        c, _ = client
+        calls = []
+        real_compress = gzip.compress
+        monkeypatch.setattr(http_cache.gzip, "compress", lambda data, **kw: calls.append(1) or real_compress(data, **kw))
+        for _ in range(3):
+            c.get(f"/api/projects/{PID}/report", headers={"Accept-Encoding": "gzip"})
+        assert len(calls) == 1
+
+
+class TestStaticCacheControl:
+
+    def test_html_and_scripts_revalidate_images_cached(self):
+        from fastapi.testclient import TestClient
+        import api_server
+
+        c = TestClient(api_server.app)
+        html = c.get("/index.html")
+        assert html.status_code == 200
+        assert html.headers["cache-control"] == "no-cache"
+
+        svg = c.get("/favicon.svg")
+        assert svg.status_code == 200
+        assert "max-age" in svg.headers["cache-control"]
+
+        for asset in ("/js/main.js", "/styles/main.css"):
+            response = c.get(asset)
+            assert response.status_code == 200
+            assert response.headers["cache-control"] == "no-cache"
+
+        again = c.get("/index.html", headers={"If-None-Match": html.headers["etag"]})
+        assert again.status_code == 304
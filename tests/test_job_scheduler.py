@@ -0,0 +1,231 @@
+"""Tests for the priority / fair-share job scheduler.
+
+Tests:
+1. Fair share — deficit round-robin across API keys
+2. Priority ordering within a lane
+3. Short vs long lanes and worker lane preferences
+4. Start-time estimates (plan / snapshot)
+5. api_server wiring (queue-status shape, priority clamping, key weights)
+"""
+
+import asyncio
+
+import pytest
+
+from research_cli.job_scheduler import (
+    LONG_LANE,
+    SHORT_LANE,
+    JobScheduler,
+    estimate_job_seconds,
+    lane_for,
+)
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+async def _fill(scheduler, jobs):
+    for job_id, job_type, api_key, priority in jobs:
+        await scheduler.put(
+            {"project_id": job_id}, job_id=job_id, job_type=job_type,
+            api_key=api_key, priority=priority, estimated_seconds=100,
+        )
+
+
+async def _drain(scheduler, worker_id=0):
+    order = []
+    while scheduler.qsize():
+        job = await scheduler.get(worker_id)
+        scheduler.task_done(job)
+        order.append(job.job_id)
+    return order
+
+
+# ---------------------------------------------------------------------------
+# 1. Fair share
+# ---------------------------------------------------------------------------
+
+class TestFairShare:
+
+    def test_heavy_submitter_does_not_starve_others(self):
+        async def scenario():
+            s = JobScheduler()
+            await _fill(s, [(f"a{i}", "workflow", "key-a", 0) for i in range(5)])
+            await _fill(s, [("b0", "workflow", "key-b", 0), ("c0", "workflow", "key-c", 0)])
+            return await _drain(s)
+
+        order = _run(scenario())
+        assert order[:3] == ["a0", "b0", "c0"]
+        assert order[3:] == ["a1", "a2", "a3", "a4"]
+
+    def test_weight_gives_larger_share(self):
+        async def scenario():
+            s = JobScheduler(weights={"key-a": 2})
+            await _fill(s, [(f"a{i}", "workflow", "key-a", 0) for i in range(4)])
+            await _fill(s, [(f"b{i}", "workflow", "key-b", 0) for i in range(4)])
+            return await _drain(s)
+
+        order = _run(scenario())
+        assert order[:6] == ["a0", "a1", "b0", "a2", "a3", "b1"]
+
+    def test_fifo_within_one_key(self):
+        async def scenario():
+            s = JobScheduler()
+            await _fill(s, [(f"a{i}", "workflow", "key-a", 0) for i in range(3)])
+            return await _drain(s)
+
+        assert _run(scenario()) == ["a0", "a1", "a2"]
+
+
+# ---------------------------------------------------------------------------
+# 2. Priority
+# ---------------------------------------------------------------------------
+
+class TestPriority:
+
+    def test_higher_priority_runs_first(self):
+        async def scenario():
+            s = JobScheduler()
+            await _fill(s, [
+                ("low", "workflow", "key-a", -1),
+                ("normal", "workflow", "key-b", 0),
+                ("urgent", "workflow", "key-c", 5),
+            ])
+            return await _drain(s)
+
+        assert _run(scenario()) == ["urgent", "normal", "low"]
+
+    def test_priority_within_one_key(self):
+        async def scenario():
+            s = JobScheduler()
+            await _fill(s, [("a0", "workflow", "key-a", 0), ("a1", "workflow", "key-a", 3)])
+            return await _drain(s)
+
+        assert _run(scenario()) == ["a1", "a0"]
+
+
+# ---------------------------------------------------------------------------
+# 3. Lanes
+# ---------------------------------------------------------------------------
+
+class TestLanes:
+
+    def test_lane_for_job_types(self):
+        assert lane_for("submission_review") == SHORT_LANE
+        assert lane_for("resume") == SHORT_LANE
+        assert lane_for("workflow") == LONG_LANE
+
+    def test_short_worker_skips_long_jobs(self):
+        async def scenario():
+            s = JobScheduler()
+            s.register_worker(0, (SHORT_LANE,))
+            await _fill(s, [("wf", "workflow", "key-a", 0), ("rev", "submission_review", "key-b", 0)])
+            job = await s.get(0)
+            return job.job_id, s.qsize(LONG_LANE)
+
+        assert _run(scenario()) == ("rev", 1)
+
+    def test_general_worker_prefers_long_lane(self):
+        async def scenario():
+            s = JobScheduler()
+            s.register_worker(1, (LONG_LANE, SHORT_LANE))
+            await _fill(s, [("rev", "submission_review", "key-b", 0), ("wf", "workflow", "key-a", 0)])
+            return (await s.get(1)).job_id
+
+        assert _run(scenario()) == "wf"
+
+    def test_get_waits_for_put(self):
+        async def scenario():
+            s = JobScheduler()
+            s.register_worker(0, (SHORT_LANE,))
+            waiter = asyncio.ensure_future(s.get(0))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            await _fill(s, [("rev", "submission_review", "key-a", 0)])
+            return (await asyncio.wait_for(waiter, 1)).job_id
+
+        assert _run(scenario()) == "rev"
+
+    def test_remove_queued_job(self):
+        async def scenario():
+            s = JobScheduler()
+            await _fill(s, [("a0", "workflow", "key-a", 0), ("b0", "workflow", "key-b", 0)])
+            removed = s.remove("a0")
+            return removed.job_id, await _drain(s)
+
+        assert _run(scenario()) == ("a0", ["b0"])
+
+
+# ---------------------------------------------------------------------------
+# 4. Start-time estimates
+# ---------------------------------------------------------------------------
+
+class TestEstimates:
+
+    def test_estimate_job_seconds(self):
+        full = estimate_job_seconds("workflow", {"max_rounds": 3})
+        short = estimate_job_seconds("workflow", {"max_rounds": 3, "article_length": "short"})
+        collab = estimate_job_seconds("workflow", {"max_rounds": 3, "workflow_mode": "collaborative"})
+        assert short < full < collab
+        assert estimate_job_seconds("submission_review") < full
+
+    def test_plan_accounts_for_running_jobs_and_lanes(self):
+        async def scenario():
+            s = JobScheduler()
+            s.register_worker(0, (SHORT_LANE,))
+            s.register_worker(1, (LONG_LANE, SHORT_LANE))
+            await _fill(s, [("wf0", "workflow", "key-a", 0)])
+            await s.get(1)  # wf0 now running on worker 1 for ~100s
+            await _fill(s, [("wf1", "workflow", "key-a", 0), ("rev", "submission_review", "key-b", 0)])
+            return {e["job_id"]: e for e in s.plan()}, s.position("wf1"), s.snapshot()
+
+        plan, position, snapshot = _run(scenario())
+        assert plan["rev"]["estimated_start_in_seconds"] == 0
+        assert 95 <= plan["wf1"]["estimated_start_in_seconds"] <= 100
+        assert position == 2
+        assert snapshot["lanes"][LONG_LANE]["queued"] == 1
+        assert [r["job_id"] for r in snapshot["running"]] == ["wf0"]
+        assert "api_key" not in snapshot["queue"][0]
+
+
+# ---------------------------------------------------------------------------
+# 5. api_server wiring
+# ---------------------------------------------------------------------------
+
+class TestApiServerWiring:
+
+    def test_queue_status_exposes_lanes_and_estimates(self):
+        from fastapi.testclient import TestClient
+        import api_server
+
+        client = TestClient(api_server.app)
+        data = client.get("/api/queue-status").json()
+        assert "queued_jobs" in data
+        assert set(data["lanes"]) == {SHORT_LANE, LONG_LANE}
+        assert isinstance(data["queue"], list)
+
+    def test_only_admin_can_raise_priority(self, monkeypatch):
+        import api_server
+
+        monkeypatch.setattr(api_server, "ADMIN_API_KEY", "admin")
+        assert api_server._job_priority("user", 5) == 0
+        assert api_server._job_priority("user", -3) == -3
+        assert api_server._job_priority("admin", 5) == 5
+        assert api_server._job_priority("admin", 99) == api_server.MAX_JOB_PRIORITY
+
+    def test_enqueue_loads_weight_from_key(self, monkeypatch):
+        import api_server
+
+        scheduler = JobScheduler()
+        monkeypatch.setattr(api_server, "job_queue", scheduler)
+        monkeypatch.setattr(api_server.appdb, "enqueue_job", lambda *a, **kw: None)
+        monkeypatch.setattr(api_server.appdb, "get_api_key_cached",
+                            lambda key: {"key": key, "queue_weight": 3.0 if key == "heavy" else None})
+
+        async def noop(**_):
+            pass
+
+        for key in ("heavy", "light"):
+            _run(api_server._enqueue_job(noop, "workflow", {"project_id": f"p-{key}"}, api_key=key))
+        assert scheduler._weights == {"heavy": 3.0, "light": 1.0}
@@ -184,3 +184,52 @@ class TestProviderConsistency:
         assert pattern.search(source), (
             f"{provider_file}: generate_streaming() should have -> LLMResponse return type"
         )
+
+
+# ── Shared provider clients ──────────────────────────────────────────────────
+
+class TestSharedClients:
+    """LLM objects on one event loop reuse one SDK client per key/base URL."""
+
+    def _in_loop(self, fn):
+        import asyncio
+
+        async def run():
+            return fn()
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+    def test_same_key_shares_client(self):
+        from research_cli.llm.claude import ClaudeLLM
+        from research_cli.llm.openai import OpenAILLM
+
+        def build():
+            return (ClaudeLLM("k1", "m-a"), ClaudeLLM("k1", "m-b"), ClaudeLLM("k2", "m-a"),
+                    OpenAILLM("k1", "m-a"), OpenAILLM("k1", "m-a", base_url="http://proxy"))
+        a, b, other_key, oa, ob = self._in_loop(build)
+        assert a.client is b.client
+        assert other_key.client is not a.client
+        assert oa.client is not a.client
+        assert oa.client is not ob.client
+
+    def test_no_sharing_outside_a_loop_or_across_loops(self):
+        from research_cli.llm.claude import ClaudeLLM
+
+        assert ClaudeLLM("k1").client is not ClaudeLLM("k1").client
+        first = self._in_loop(lambda: ClaudeLLM("k1"))
+        second = self._in_loop(lambda: ClaudeLLM("k1"))
+        assert first.client is not second.client
+
+    def test_discarded_client_is_not_handed_out_again(self):
+        from research_cli.llm.base import discard_shared_client
+        from research_cli.llm.claude import ClaudeLLM
+
+        def build():
+            first = ClaudeLLM("k1")
+            discard_shared_client(first.client)
+            return first, ClaudeLLM("k1")
+        first, second = self._in_loop(build)
+        assert first.client is not second.client
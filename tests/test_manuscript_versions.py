@@ -0,0 +1,107 @@
+"""Tests for per-version manuscript endpoints and filename-based latest resolution."""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+import api_server
+from research_cli.utils import http_cache
+
+PID = "versions-test-20260101-000000"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    project_dir = tmp_path / "results" / PID
+    project_dir.mkdir(parents=True)
+    (project_dir / "workflow_complete.json").write_text(json.dumps({"topic": "Versions"}))
+    for n in (1, 2, 10):
+        (project_dir / f"manuscript_v{n}.md").write_text(f"# Draft {n}\n\n" + "word " * n)
+    monkeypatch.chdir(tmp_path)
+    http_cache.clear_cache()
+    yield project_dir
+    http_cache.clear_cache()
+
+
+@pytest.fixture
+def client(project):
+    from fastapi.testclient import TestClient
+    return TestClient(api_server.app)
+
+
+class TestLatestResolution:
+
+    def test_numeric_not_lexical_ordering(self):
+        keys = ["manuscript_v2", "manuscript_v10", "manuscript_v1", "manuscript_final"]
+        assert api_server._latest_manuscript_key(keys) == "manuscript_v10"
+
+    def test_final_and_fallback(self):
+        assert api_server._latest_manuscript_key(["manuscript_draft", "manuscript_final"]) == "manuscript_final"
+        assert api_server._latest_manuscript_key(["manuscript_b", "manuscript_a"]) == "manuscript_a"
+        assert api_server._latest_manuscript_key([]) is None
+
+    def test_final_wins_tie_regardless_of_order(self):
+        keys = ["manuscript_v3", "manuscript_final_v3", "manuscript_v2"]
+        assert api_server._latest_manuscript_key(keys) == "manuscript_final_v3"
+        assert api_server._latest_manuscript_key(keys[::-1]) == "manuscript_final_v3"
+        assert api_server._latest_manuscript_key(["manuscript_final_v2", "manuscript_v3"]) == "manuscript_v3"
+
+    def test_final_alias_prefers_final_versions(self):
+        assert api_server._resolve_manuscript_key("final", ["manuscript_v4", "manuscript_final_v1", "manuscript_final_v3"]) == "manuscript_final_v3"
+        assert api_server._resolve_manuscript_key("final", ["manuscript_v4"]) is None
+
+    def test_resolve_aliases(self):
+        keys = ["manuscript_v1", "manuscript_v2", "manuscript_final"]
+        assert api_server._resolve_manuscript_key("latest", keys) == "manuscript_v2"
+        assert api_server._resolve_manuscript_key("v1", keys) == "manuscript_v1"
+        assert api_server._resolve_manuscript_key("2", keys) == "manuscript_v2"
+        assert api_server._resolve_manuscript_key("final", keys) == "manuscript_final"
+        assert api_server._resolve_manuscript_key("manuscript_v1", keys) == "manuscript_v1"
+        assert api_server._resolve_manuscript_key("v9", keys) is None
+
+    def test_get_latest_reads_only_latest_file(self, project, monkeypatch):
+        read = []
+        real_read_text = Path.read_text
+
+        def tracking_read_text(self, *args, **kwargs):
+            read.append(self.name)
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", tracking_read_text)
+        text, key = api_server._get_latest_manuscript(project)
+        assert key == "manuscript_v10"
+        assert text.startswith("# Draft 10")
+        assert read == ["manuscript_v10.md"]
+
+
+class TestVersionEndpoints:
+
+    def test_single_version(self, client):
+        data = client.get(f"/api/projects/{PID}/manuscripts/v2").json()
+        assert data["version"] == "manuscript_v2"
+        assert data["content"].startswith("# Draft 2")
+
+        latest = client.get(f"/api/projects/{PID}/manuscripts/latest")
+        assert latest.json()["version"] == "manuscript_v10"
+        again = client.get(f"/api/projects/{PID}/manuscripts/latest",
+                           headers={"If-None-Match": latest.headers["etag"]})
+        assert again.status_code == 304
+
+    def test_missing_version_and_project(self, client):
+        assert client.get(f"/api/projects/{PID}/manuscripts/v7").status_code == 404
+        assert client.get("/api/projects/nope/manuscripts/latest").status_code == 404
+        assert client.get("/api/projects/nope/manuscripts/versions").status_code == 404
+
+    def test_version_listing(self, client, project):
+        data = client.get(f"/api/projects/{PID}/manuscripts/versions").json()
+        assert data["latest"] == "manuscript_v10"
+        assert [v["version"] for v in data["versions"]] == ["manuscript_v1", "manuscript_v2", "manuscript_v10"]
+
+        v10 = data["versions"][-1]
+        raw = (project / "manuscript_v10.md").read_bytes()
+        assert v10["size"] == len(raw)
+        assert v10["word_count"] == 13
+        assert v10["sha256"] == hashlib.sha256(raw).hexdigest()
+        assert "content" not in v10
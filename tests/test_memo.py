@@ -0,0 +1,129 @@
+"""Tests for LLM result memoization (categories, team proposals, reviewer panels)."""
+
+import asyncio
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import api_server
+from research_cli.agents.team_composer import TeamComposerAgent
+from research_cli.agents.writer_team_composer import WriterTeamComposerAgent
+from research_cli.categories import suggest_category_llm
+from research_cli.utils import memo
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+@dataclass
+class FakeResponse:
+    content: str
+    total_tokens: int = 10
+    input_tokens: int = 5
+    output_tokens: int = 5
+
+
+def _fake_llm(content: str):
+    llm = MagicMock()
+    llm.model = "fake-model"
+    llm.generate = AsyncMock(return_value=FakeResponse(content))
+    return llm
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    memo.clear_memo_caches()
+    yield
+    memo.clear_memo_caches()
+
+
+class TestMemoCache:
+
+    def test_lru_and_ttl(self, monkeypatch):
+        cache = memo.MemoCache("t", ttl=60, max_entries=2)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+        assert cache.get("a") == {"v": 1}  # "a" is now most recent
+        cache.put("c", {"v": 3})
+        assert cache.get("b") is None and cache.get("a") == {"v": 1}
+
+        now = memo.time.monotonic()
+        monkeypatch.setattr(memo.time, "monotonic", lambda: now + 120)
+        assert cache.get("a") is None
+        assert cache.info()["hits"] == 2
+
+    def test_values_are_copies(self):
+        cache = memo.MemoCache("t")
+        value = {"experts": [1]}
+        cache.put("k", value)
+        value["experts"].append(2)
+        cache.get("k")["experts"].append(3)
+        assert cache.get("k") == {"experts": [1]}
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(memo, "MEMO_ENABLED", False)
+        cache = memo.MemoCache("t")
+        cache.put("k", 1)
+        assert cache.get("k") is None
+
+
+class TestMemoizedCalls:
+
+    def test_category_keyed_by_normalized_topic(self):
+        llm = _fake_llm("natural_sciences/biology")
+        with patch("research_cli.model_config.create_llm_for_role", return_value=llm):
+            first = _run(suggest_category_llm("CRISPR gene editing"))
+            second = _run(suggest_category_llm("  crispr Gene-Editing "))
+        assert first == second == {"major": "natural_sciences", "subfield": "biology"}
+        assert llm.generate.await_count == 1
+
+    def test_category_fallback_not_memoized(self):
+        llm = _fake_llm("no idea")
+        with patch("research_cli.model_config.create_llm_for_role", return_value=llm):
+            _run(suggest_category_llm("CRISPR gene editing"))
+            _run(suggest_category_llm("CRISPR gene editing"))
+        assert llm.generate.await_count == 2
+
+    def test_team_proposal_and_fresh(self):
+        llm = _fake_llm('{"experts": [{"expert_domain": "Genomics", "rationale": "r", "focus_areas": ["a"]}]}')
+        with patch("research_cli.agents.team_composer.create_llm_for_role", return_value=llm):
+            composer = TeamComposerAgent()
+            first = _run(composer.propose_team("CRISPR", 1))
+            second = _run(composer.propose_team("crispr", 1))
+            assert llm.generate.await_count == 1
+            assert second[0].expert_domain == first[0].expert_domain == "Genomics"
+
+            _run(composer.propose_team("CRISPR", 2))
+            _run(composer.propose_team("CRISPR", 1, fresh=True))
+        assert llm.generate.await_count == 3
+
+    def test_writer_team(self):
+        llm = _fake_llm('{"lead_author": {"name": "Genomics Expert"}, "coauthors": []}')
+        with patch("research_cli.agents.writer_team_composer.create_llm_for_role", return_value=llm):
+            composer = WriterTeamComposerAgent()
+            a = _run(composer.propose_writer_team("CRISPR", "natural_sciences", "biology"))
+            a["lead_author"]["name"] = "mutated"
+            b = _run(composer.propose_writer_team("CRISPR", "natural_sciences", "biology"))
+            _run(composer.propose_writer_team("CRISPR", "natural_sciences", "genetics"))
+        assert b["lead_author"]["name"] == "Genomics Expert"
+        assert llm.generate.await_count == 2
+
+    def test_reviewer_panel_rebuilt_from_cached_list(self, monkeypatch):
+        reviewers = ",".join(f'{{"name": "R{i}", "domain": "D{i}", "focus_areas": []}}' for i in range(3))
+        llm = _fake_llm('{"reviewers": [' + reviewers + ']}')
+        monkeypatch.setattr(api_server, "create_llm_for_role", lambda role: llm)
+        models = [{"provider": "p", "model": "m1"}]
+        monkeypatch.setattr(api_server, "get_reviewer_models", lambda: models)
+        category = {"major": "natural_sciences", "subfield": "biology"}
+
+        first = _run(api_server._generate_reviewers_from_category(category, "CRISPR"))
+        models[:] = [{"provider": "p", "model": "m2"}]
+        second = _run(api_server._generate_reviewers_from_category(category, "crispr"))
+        assert llm.generate.await_count == 1
+        assert [r.name for r in second] == [r.name for r in first] == ["R0", "R1", "R2"]
+        assert second[0].model == "m2"  # models come from current config, not the cache
+
+        _run(api_server._generate_reviewers_from_category(category, "CRISPR", fresh=True))
+        assert llm.generate.await_count == 2
@@ -0,0 +1,166 @@
+"""Tests for the manifest-backed project index and lazy workflow status store."""
+
+import asyncio
+import json
+
+import pytest
+
+from research_cli.project_index import (
+    MANIFEST_NAME,
+    ProjectIndex,
+    WorkflowStatusStore,
+    compact_status,
+)
+
+
+def _write_complete(project_dir, **extra):
+    project_dir.mkdir(parents=True, exist_ok=True)
+    data = {
+        "topic": project_dir.name,
+        "passed": True,
+        "final_score": 8.2,
+        "total_rounds": 1,
+        "rounds": [{"round": 1, "overall_average": 8.2, "passed": True,
+                    "moderator_decision": {"decision": "ACCEPT"}, "word_count": 1200}],
+        "expert_team": [{"id": "expert-1", "name": "Dr. A"}],
+        "performance": {"total_duration": 600, "rounds": [], "total_tokens": 1000, "estimated_cost": 0.5},
+        **extra,
+    }
+    (project_dir / "workflow_complete.json").write_text(json.dumps(data))
+
+
+class _CountingSummarize:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, project_dir, data):
+        self.calls.append(project_dir.name)
+        return {"project": {"id": project_dir.name, "topic": data["topic"]}, "status": {"status": "completed"}}
+
+
+class TestProjectIndex:
+
+    def test_manifest_avoids_reparsing(self, tmp_path):
+        _write_complete(tmp_path / "p1")
+        _write_complete(tmp_path / "p2")
+        summarize = _CountingSummarize()
+
+        records = ProjectIndex(tmp_path, summarize).refresh()
+        assert set(records) == {"p1", "p2"}
+        assert (tmp_path / MANIFEST_NAME).exists()
+
+        # A fresh index (new process) reads the manifest instead of the reports
+        summarize2 = _CountingSummarize()
+        records = ProjectIndex(tmp_path, summarize2).refresh()
+        assert set(records) == {"p1", "p2"}
+        assert summarize2.calls == []
+
+    def test_changed_and_removed_projects(self, tmp_path):
+        _write_complete(tmp_path / "p1")
+        _write_complete(tmp_path / "p2")
+        summarize = _CountingSummarize()
+        index = ProjectIndex(tmp_path, summarize)
+        index.refresh()
+
+        _write_complete(tmp_path / "p1", topic="updated topic with a longer body")
+        (tmp_path / "p2" / "workflow_complete.json").unlink()
+        summarize.calls.clear()
+
+        records = index.refresh()
+        assert summarize.calls == ["p1"]
+        assert records["p1"]["project"]["topic"] == "updated topic with a longer body"
+        assert "p2" not in records
+
+    def test_corrupt_files_are_skipped(self, tmp_path):
+        (tmp_path / "bad").mkdir()
+        (tmp_path / "bad" / "workflow_complete.json").write_text("{oops")
+        (tmp_path / "not-a-project.txt").write_text("x")
+        assert ProjectIndex(tmp_path, _CountingSummarize()).refresh() == {}
+
+
+class TestWorkflowStatusStore:
+
+    def _store(self, max_cached=2):
+        loads = []
+
+        def loader(pid):
+            loads.append(pid)
+            return {"status": "completed", "expert_team": ["full"], "pid": pid}
+
+        store = WorkflowStatusStore(loader, max_cached=max_cached)
+        store.set_summaries({f"done-{i}": {"status": "completed", "pid": f"done-{i}"} for i in range(3)})
+        return store, loads
+
+    def test_listing_does_not_load(self):
+        store, loads = self._store()
+        store["active"] = {"status": "reviewing"}
+        listed = dict(store.items())
+        assert set(listed) == {"active", "done-0", "done-1", "done-2"}
+        assert loads == []
+        assert sum(1 for s in store.values() if s["status"] == "reviewing") == 1
+
+    def test_lazy_load_with_lru_bound(self):
+        store, loads = self._store(max_cached=2)
+        assert store["done-0"]["expert_team"] == ["full"]
+        store["done-0"]
+        assert loads == ["done-0"]
+        store["done-1"]
+        store["done-2"]
+        assert store.cache_info()["cached"] == 2
+        store["done-0"]  # evicted, reloaded
+        assert loads == ["done-0", "done-1", "done-2", "done-0"]
+
+    def test_assignment_makes_entry_active(self):
+        store, loads = self._store()
+        store["done-1"] = {"status": "queued"}
+        assert store["done-1"]["status"] == "queued"
+        assert store.cache_info()["completed"] == 2
+        assert list(store).count("done-1") == 1
+
+    def test_contains_get_and_delete(self):
+        store, _ = self._store()
+        assert "done-0" in store
+        assert "missing" not in store
+        assert store.get("missing") is None
+        del store["done-0"]
+        assert "done-0" not in store
+        with pytest.raises(KeyError):
+            del store["done-0"]
+
+    def test_compact_status_drops_heavy_fields(self):
+        entry = {"status": "completed", "expert_team": [1], "expert_status": [2], "cost_estimate": {}, "rounds": []}
+        assert compact_status(entry) == {"status": "completed", "rounds": []}
+
+
+class TestApiServerStartup:
+
+    def test_scan_indexes_completed_and_loads_interrupted(self, tmp_path, monkeypatch):
+        import api_server
+
+        monkeypatch.chdir(tmp_path)
+        _write_complete(tmp_path / "results" / "done-20260101-000000")
+        interrupted = tmp_path / "results" / "wip-20260101-000000"
+        interrupted.mkdir(parents=True)
+        (interrupted / "workflow_checkpoint.json").write_text(json.dumps(
+            {"topic": "wip", "current_round": 1, "max_rounds": 3, "expert_configs": []}
+        ))
+
+        store = WorkflowStatusStore(api_server._load_completed_status)
+        monkeypatch.setattr(api_server, "workflow_status", store)
+        monkeypatch.setattr(api_server, "project_index",
+                            ProjectIndex(tmp_path / "results", api_server._summarize_project))
+        monkeypatch.setattr(api_server, "activity_logs", {})
+
+        asyncio.new_event_loop().run_until_complete(api_server.scan_interrupted_workflows())
+
+        info = store.cache_info()
+        assert info == {"active": 1, "completed": 1, "cached": 0, "max_cached": 128}
+        assert store["wip-20260101-000000"]["status"] == "interrupted"
+
+        listed = dict(store.items())["done-20260101-000000"]
+        assert listed["final_score"] == 8.2
+        assert "expert_team" not in listed
+
+        full = store["done-20260101-000000"]
+        assert full["expert_team"] == [{"id": "expert-1", "name": "Dr. A"}]
+        assert full["final_decision"] == "ACCEPT"
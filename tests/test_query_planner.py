@@ -0,0 +1,109 @@
+"""Tests for query planning and request fan-out in source retrieval."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from research_cli.models.collaborative_research import Reference
+from research_cli.utils import rate_limit
+from research_cli.utils.query_planner import allocate_requests, condense, plan_queries
+from research_cli.utils.reference_cache import ReferenceCache, set_reference_cache
+from research_cli.utils.reference_corpus import ReferenceCorpus, set_reference_corpus
+from research_cli.utils.source_retriever import SourceRetriever
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters():
+    rate_limit.reset_rate_limiters()
+    yield
+    rate_limit.reset_rate_limiters()
+
+
+class TestPlanQueries:
+
+    def test_short_topic_is_single_query(self):
+        assert plan_queries("machine learning") == ["machine learning"]
+        assert plan_queries("Graph neural networks for drug discovery") == ["Graph neural networks for drug discovery"]
+
+    def test_long_topic_split_into_focused_queries(self):
+        topic = ("The impact of large language models on scientific peer review: bias, "
+                 "reproducibility and the future of open science publishing")
+        queries = plan_queries(topic)
+        assert queries[0] == topic
+        assert "future open science publishing" in queries
+        assert all(len(q.split()) <= 8 for q in queries[1:])
+
+    def test_research_questions_become_queries(self):
+        queries = plan_queries("CRISPR gene editing", [
+            "How do off-target effects limit the clinical use of CRISPR?",
+            "What delivery vectors are most efficient in vivo?",
+            "What are the off-target effects limiting clinical CRISPR use?",  # redundant
+        ])
+        assert queries == ["CRISPR gene editing", "off target limit clinical use crispr",
+                           "delivery vectors most efficient vivo"]
+
+    def test_max_queries(self):
+        questions = ["soil microbial diversity", "ocean acidification rates", "urban heat islands",
+                     "glacier mass balance"]
+        assert len(plan_queries("topic", questions, max_queries=3)) == 3
+
+    def test_condense_drops_filler(self):
+        assert condense("What is the role of microbiota in the gut-brain axis?") == "microbiota gut brain axis"
+
+
+class TestAllocateRequests:
+
+    def test_first_query_to_every_api_then_round_robin(self):
+        plan = allocate_requests(["q1", "q2", "q3"], ["openalex", "crossref"], budget=5)
+        assert plan == [("openalex", "q1"), ("crossref", "q1"), ("openalex", "q2"), ("crossref", "q2"),
+                        ("openalex", "q3")]
+
+    def test_slow_api_gets_fewer_queries_before_deadline(self):
+        plan = allocate_requests(["q1", "q2", "q3"], ["openalex", "core"], budget=20, deadline=8)
+        assert [q for api, q in plan if api == "core"] == ["q1", "q2"]  # one request per 6s
+        assert [q for api, q in plan if api == "openalex"] == ["q1", "q2", "q3"]
+
+    def test_backlog_from_other_workflows_counts(self):
+        for _ in range(3):
+            rate_limit.rate_limiter("arxiv").reserve()  # 9s of arXiv queue already booked
+        plan = allocate_requests(["q1", "q2"], ["arxiv"], deadline=10)
+        assert plan == [("arxiv", "q1")]
+
+    def test_per_api_cap(self):
+        plan = allocate_requests(["q1", "q2"], ["brave", "openalex"], per_api_cap={"brave": 1})
+        assert ("brave", "q2") not in plan and ("openalex", "q2") in plan
+
+
+class TestSearchAllFanOut:
+
+    @pytest.fixture(autouse=True)
+    def _isolated_stores(self):
+        set_reference_cache(ReferenceCache(":memory:"))
+        set_reference_corpus(ReferenceCorpus(":memory:"))
+        yield
+        set_reference_cache(None)
+        set_reference_corpus(None)
+
+    def test_sub_queries_fan_out_and_merge_deduplicated(self):
+        retriever = SourceRetriever()
+
+        async def openalex(query, max_results=5):
+            return [Reference(id=0, authors=["A"], title=f"Paper for {query}", venue="J", year=2022,
+                              doi=f"10.1/{len(query)}"),
+                    Reference(id=0, authors=["A"], title="Shared landmark paper", venue="J", year=2020,
+                              doi="10.1/shared")]
+
+        retriever.search_openalex = AsyncMock(side_effect=openalex)
+        for api in ("arxiv", "semantic_scholar", "brave"):
+            setattr(retriever, f"search_{api}", AsyncMock(return_value=[]))
+
+        refs = asyncio.new_event_loop().run_until_complete(retriever.search_all(
+            "CRISPR gene editing", research_questions=["What delivery vectors are most efficient in vivo?"],
+            use_corpus=False, enrich=False,
+        ))
+        queried = [call.args[0] for call in retriever.search_openalex.call_args_list]
+        assert queried == ["CRISPR gene editing", "delivery vectors most efficient vivo"]
+        assert retriever.search_brave.call_count == 1
+        assert [r.title for r in refs].count("Shared landmark paper") == 1
+        assert len(refs) == 3
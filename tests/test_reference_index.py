@@ -0,0 +1,105 @@
+"""Tests for ReferenceIndex and the dedup/verification sites that use it."""
+
+from research_cli.agents.coauthor import CoauthorAgent
+from research_cli.models.collaborative_research import Reference
+from research_cli.utils.reference_index import ReferenceIndex, arxiv_id, doi_key
+from research_cli.utils.source_retriever import SourceRetriever
+from research_cli.workflow.orchestrator import _strip_ghost_citations
+
+
+def _ref(title: str, doi: str | None = None, url: str | None = None) -> Reference:
+    return Reference(id=0, authors=["A. Author"], title=title, venue="J", year=2022, url=url, doi=doi)
+
+
+class TestIdentifiers:
+
+    def test_doi_key_strips_resolver_and_case(self):
+        assert doi_key("https://doi.org/10.1000/ABC.1.") == "10.1000/abc.1"
+        assert doi_key("n/a") is None
+
+    def test_arxiv_id_forms(self):
+        assert arxiv_id("arXiv:2301.01234v2") == "2301.01234"
+        assert arxiv_id(None, "https://arxiv.org/abs/2301.01234") == "2301.01234"
+        assert arxiv_id("10.48550/arXiv.2301.01234") == "2301.01234"
+        assert arxiv_id("[2301.01234] Some title") == "2301.01234"
+
+
+class TestReferenceIndex:
+
+    def test_exact_keys(self):
+        index = ReferenceIndex([_ref("Graph attention networks", doi="10.1/gat")])
+        assert index.lookup(doi="https://doi.org/10.1/GAT") is not None
+        assert index.lookup(title="Graph Attention Networks!") is not None
+        assert index.lookup(title="Graph networks") is None
+
+    def test_preprint_matches_published_version(self):
+        preprint = _ref("Scaling laws for neural language models", doi="arXiv:2001.08361")
+        index = ReferenceIndex([preprint])
+        published = _ref("Scaling Laws for Neural Language Model", doi="10.5555/scaling")
+        assert index.find(published) is preprint
+        assert index.find(_ref("Other title", url="https://arxiv.org/abs/2001.08361v3")) is preprint
+
+    def test_different_published_dois_stay_distinct(self):
+        index = ReferenceIndex([_ref("Deep learning for fluid dynamics part I", doi="10.1/one")])
+        assert index.find(_ref("Deep learning for fluid dynamics part II", doi="10.1/two")) is None
+
+    def test_short_or_unrelated_titles_not_fuzzy(self):
+        index = ReferenceIndex([_ref("Paper A"), _ref("Attention is all you need")])
+        assert index.lookup(title="Paper B") is None
+        assert index.lookup(title="Attention is all you need in speech separation") is None
+
+    def test_containment_is_opt_in(self):
+        index = ReferenceIndex([_ref("A comprehensive survey of graph neural networks in drug discovery")])
+        truncated = "A comprehensive survey of graph neural networks"
+        assert index.lookup(title=truncated) is None
+        assert index.lookup(title=truncated, containment=True) is not None
+
+    def test_add_returns_existing_duplicate(self):
+        index = ReferenceIndex()
+        first = index.add(_ref("Protein language models", doi="10.1/p"))
+        assert index.add(_ref("Protein Language Models.")) is first
+        assert len(index) == 1
+
+
+class TestCallSites:
+
+    def test_search_all_dedup_drops_subtitle_variant(self):
+        refs = SourceRetriever._dedupe_and_filter([
+            _ref("Denoising diffusion probabilistic models", doi="arXiv:2006.11239"),
+            _ref("Denoising Diffusion Probabilistic Model", doi="10.5555/ddpm"),
+            _ref("Score-based generative modeling", doi="10.5555/sde"),
+        ])
+        assert [r.doi for r in refs] == ["arXiv:2006.11239", "10.5555/sde"]
+
+    def test_filter_verified_references(self):
+        verified = [_ref("Large language models as zero-shot reasoners", doi="10.1/zs")]
+        generated = [
+            _ref("Large language models as zero-shot reasoners: a study"),
+            _ref("Some unrelated invented paper title"),
+            _ref("Different wording", doi="10.1/ZS"),
+        ]
+        kept = CoauthorAgent._filter_verified_references(generated, verified)
+        assert [r.title for r in kept] == [generated[0].title, "Different wording"]
+
+    def test_strip_ghost_citations_matches_arxiv_and_near_titles(self):
+        verified = [
+            _ref("Chain of thought prompting elicits reasoning", doi="arXiv:2201.11903"),
+            _ref("Emergent abilities of large language models"),
+        ]
+        manuscript = (
+            "Body [1] [2] [3].\n\n"
+            "## References\n\n"
+            "[1] Wei J (2022). Chain-of-thought prompting. arXiv:2201.11903\n"
+            '[2] Wei J (2022). "Emergent Abilities of Large Language Model". TMLR.\n'
+            '[3] Nobody (2021). "A paper that does not exist". Nowhere.'
+        )
+        result = _strip_ghost_citations(manuscript, verified)
+        assert "does not exist" not in result
+        assert "[1] Wei J" in result and "[2] Wei J" in result
+
+    def test_filter_verified_references_fills_metadata(self):
+        verified = [Reference(id=3, authors=["Grace Hopper"], title="Compilers for everyone", venue="CACM",
+                              year=1952, doi="10.1/c")]
+        generated = [Reference(id=0, authors=["Unknown"], title="Compilers for everyone", venue="", year=0)]
+        kept = CoauthorAgent._filter_verified_references(generated, verified)
+        assert (kept[0].doi, kept[0].year, kept[0].authors) == ("10.1/c", 1952, ["Grace Hopper"])
@@ -0,0 +1,90 @@
+"""Tests for relevance ranking of retrieved references."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from research_cli.models.collaborative_research import Reference
+from research_cli.utils.reference_cache import ReferenceCache, set_reference_cache
+from research_cli.utils.reference_corpus import ReferenceCorpus, set_reference_corpus
+from research_cli.utils.relevance import bm25_scores, rank_references, relevance_scores
+from research_cli.utils.source_retriever import SourceRetriever
+
+
+def _ref(title: str, year: int = 2020, cited_by_count=None, summary: str = "", doi: str | None = None) -> Reference:
+    return Reference(id=0, authors=["A. Author"], title=title, venue="Journal", year=year,
+                     doi=doi, summary=summary, cited_by_count=cited_by_count)
+
+
+class TestBm25:
+
+    def test_matching_terms_score_higher(self):
+        docs = [["graph", "neural", "network"], ["soil", "chemistry"], ["neural", "network", "pruning"]]
+        scores = bm25_scores({"graph": 1.0, "neural": 1.0, "network": 1.0}, docs)
+        assert scores[0] > scores[2] > scores[1] == 0.0
+
+    def test_empty_inputs(self):
+        assert bm25_scores({}, [["a"]]) == [0.0]
+        assert bm25_scores({"a": 1.0}, []) == []
+
+
+class TestRankReferences:
+
+    def test_topic_match_beats_arrival_order(self):
+        refs = [_ref("Medieval trade routes"), _ref("Transformer models for protein folding")]
+        ranked = rank_references(refs, "protein folding with transformers")
+        assert ranked[0].title.startswith("Transformer")
+
+    def test_citations_and_recency_break_text_ties(self):
+        refs = [_ref("Protein folding", year=1995, cited_by_count=10),
+                _ref("Protein folding", year=2023, cited_by_count=900)]
+        scores = relevance_scores(refs, "protein folding", current_year=2024)
+        assert scores[1] > scores[0]
+
+    def test_category_terms_count(self):
+        refs = [_ref("Deep models survey"), _ref("Deep models in oncology")]
+        ranked = rank_references(refs, "deep models", category={"major": "medicine_health", "subfield": "oncology"})
+        assert ranked[0].title.endswith("oncology")
+
+    def test_top_k_truncates(self):
+        refs = [_ref(f"Paper {i}") for i in range(5)]
+        assert len(rank_references(refs, "paper", top_k=2)) == 2
+
+
+class TestSearchAllRanking:
+
+    @pytest.fixture(autouse=True)
+    def _isolated_stores(self):
+        set_reference_cache(ReferenceCache(":memory:"))
+        set_reference_corpus(ReferenceCorpus(":memory:"))
+        yield
+        set_reference_cache(None)
+        set_reference_corpus(None)
+
+    def test_keeps_most_relevant_academic_refs(self):
+        retriever = SourceRetriever()
+        retriever.search_openalex = AsyncMock(return_value=[
+            _ref("Unrelated survey of bird migration", doi="10.1/a"),
+            _ref("Sparse attention for long documents", doi="10.1/b"),
+        ])
+        retriever.search_arxiv = AsyncMock(return_value=[
+            _ref("Efficient sparse attention transformers", doi="10.1/c"),
+            _ref("Coffee roasting chemistry", doi="10.1/d"),
+        ])
+        retriever.search_semantic_scholar = AsyncMock(return_value=[])
+        retriever.search_brave = AsyncMock(return_value=[])
+
+        refs = asyncio.new_event_loop().run_until_complete(
+            retriever.search_all("sparse attention transformers", max_academic=2, use_corpus=False))
+        assert [r.doi for r in refs] == ["10.1/c", "10.1/b"]
+        assert [r.id for r in refs] == [1, 2]
+
+    def test_sources_are_over_fetched(self):
+        retriever = SourceRetriever()
+        for api in ("openalex", "arxiv", "semantic_scholar", "brave"):
+            setattr(retriever, f"search_{api}", AsyncMock(return_value=[]))
+        asyncio.new_event_loop().run_until_complete(
+            retriever.search_all("topic", max_academic=15, use_corpus=False))
+        # 15 kept across 3 academic APIs, fetched with room to choose
+        assert retriever.search_openalex.call_args.kwargs["max_results"] > 5
@@ -0,0 +1,179 @@
+"""Tests for workflow request fingerprinting, duplicate reuse and near-duplicate topics."""
+
+import asyncio
+import json
+
+import pytest
+
+import api_server
+from research_cli import db
+from research_cli.job_scheduler import JobScheduler
+from research_cli.request_dedup import TopicSimilarityIndex, normalize_topic, workflow_fingerprint
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+class TestFingerprint:
+
+    def test_normalization(self):
+        assert normalize_topic("  Café   Networks:  A Survey! ") == "cafe networks a survey"
+        assert workflow_fingerprint("Graph Neural Networks") == workflow_fingerprint("graph neural  networks.")
+
+    def test_parameters_change_fingerprint(self):
+        base = workflow_fingerprint("GNNs", "full", "professional", "survey", {"major": "cs"}, "standard")
+        assert base == workflow_fingerprint("GNNs", None, None, None, {"major": "cs", "subfield": None}, None)
+        for changed in (
+            workflow_fingerprint("GNNs", "short", "professional", "survey", {"major": "cs"}, "standard"),
+            workflow_fingerprint("GNNs", "full", "beginner", "survey", {"major": "cs"}, "standard"),
+            workflow_fingerprint("GNNs", "full", "professional", "research", {"major": "cs"}, "standard"),
+            workflow_fingerprint("GNNs", "full", "professional", "survey", {"major": "bio"}, "standard"),
+            workflow_fingerprint("GNNs", "full", "professional", "survey", {"major": "cs"}, "collaborative"),
+        ):
+            assert changed != base
+
+
+class TestTopicSimilarity:
+
+    def test_near_duplicates_rank_first(self):
+        index = TopicSimilarityIndex()
+        index.add("a", "Graph neural networks for molecular property prediction")
+        index.add("b", "Quantum error correction with surface codes")
+        index.add("c", "Protein structure prediction with deep learning")
+
+        hits = index.most_similar("Molecular property prediction using graph neural networks")
+        assert [h[0] for h in hits] == ["a"]
+        assert hits[0][2] > 0.9
+        assert index.most_similar("the of and") == []
+
+    def test_exclude_and_remove(self):
+        index = TopicSimilarityIndex()
+        index.add("a", "Surface codes")
+        index.add("b", "Surface codes")
+        assert [h[0] for h in index.most_similar("surface codes", exclude="a")] == ["b"]
+        index.remove("b")
+        assert [h[0] for h in index.most_similar("surface codes")] == ["a"]
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "research.db")
+    monkeypatch.setattr(db._local, "conn", None, raising=False)
+    monkeypatch.setattr(db, "_usage_buffer", [])
+    db.invalidate_api_key_cache(signal=False)
+    db.init_db()
+    monkeypatch.setattr(api_server, "job_queue", JobScheduler())
+    monkeypatch.setattr(api_server, "_running_jobs", {})
+    monkeypatch.setattr(api_server, "_topic_index", TopicSimilarityIndex())
+    monkeypatch.setattr(api_server, "project_index", api_server.ProjectIndex(tmp_path / "results", api_server._summarize_project))
+    monkeypatch.setattr(api_server, "ADMIN_API_KEY", "admin-key")
+    monkeypatch.setattr(api_server, "RATE_LIMIT_SECONDS", 0)
+    yield
+    for pid in list(api_server.workflow_status):
+        if pid.startswith("graph-neural-networks"):
+            api_server.workflow_status.pop(pid, None)
+            api_server.activity_logs.pop(pid, None)
+    db._local.conn.close()
+    db._local.conn = None
+
+
+def _start(topic="Graph Neural Networks", **kwargs):
+    request = api_server.StartWorkflowRequest(topic=topic, experts=[{"expert_domain": "ML"}], **kwargs)
+    return _run(api_server.start_workflow(request, api_key="admin-key"))
+
+
+def _complete(project_id, decision="ACCEPT"):
+    project_dir = api_server.Path("results") / project_id
+    project_dir.mkdir(parents=True)
+    (project_dir / "workflow_complete.json").write_text(json.dumps({
+        "topic": "Graph Neural Networks",
+        "rounds": [{"round": 1, "moderator_decision": {"decision": decision}}],
+    }))
+    api_server.job_queue = JobScheduler()
+    job_id = db.get_original_job(project_id)["id"]
+    db.complete_job(job_id, "completed")
+
+
+class TestDuplicateRequests:
+
+    def test_identical_request_attaches_to_queued_job(self, server):
+        first = _start()
+        second = _start(topic="graph neural  networks", on_duplicate="attach")
+        assert second["project_id"] == first["project_id"]
+        assert second["duplicate"] == "in_flight"
+        assert api_server.job_queue.qsize() == 1
+
+        forced = _start()  # default "new"
+        assert "duplicate" not in forced
+        assert api_server.job_queue.qsize() == 2
+
+    def test_different_parameters_start_fresh(self, server):
+        _start()
+        other = _start(article_length="short", on_duplicate="reuse")
+        assert "duplicate" not in other
+        assert api_server.job_queue.qsize() == 2
+
+    def test_completed_project_is_reused(self, server):
+        first = _start()
+        _complete(first["project_id"])
+
+        reused = _start(on_duplicate="reuse")
+        assert reused == {**reused, "project_id": first["project_id"], "status": "completed", "duplicate": "completed"}
+        assert api_server.job_queue.qsize() == 0
+
+        fresh = _start(on_duplicate="attach")
+        assert "duplicate" not in fresh
+        similar = api_server._similar_topics("Graph neural networks (GNNs)")
+        assert similar[0]["project_id"] == first["project_id"]
+
+    def test_rejected_project_is_not_reused(self, server):
+        first = _start()
+        _complete(first["project_id"], decision="REJECT")
+        assert "duplicate" not in _start(on_duplicate="reuse")
+
+    def test_other_keys_runs_are_not_reused(self, server):
+        first = _start()
+        _complete(first["project_id"])
+        other_key = db.create_api_key_direct(label="other", daily_quota=10)["key"]
+        request = api_server.StartWorkflowRequest(topic="Graph Neural Networks", experts=[{"expert_domain": "ML"}],
+                                                  on_duplicate="reuse")
+        response = _run(api_server.start_workflow(request, api_key=other_key))
+        assert "duplicate" not in response
+        assert response["project_id"] != first["project_id"]
+
+    def test_deleted_project_no_longer_similar(self, server):
+        first = _start()
+        _complete(first["project_id"])
+        api_server.workflow_status.pop(first["project_id"], None)
+        assert api_server._similar_topics("Graph neural networks (GNNs)")[0]["project_id"] == first["project_id"]
+
+        import shutil
+        shutil.rmtree(api_server.Path("results") / first["project_id"])
+        assert api_server._similar_topics("Graph neural networks (GNNs)") == []
+        assert first["project_id"] not in api_server._topic_index
+
+    def test_start_scans_results_once(self, server, monkeypatch):
+        scans = []
+        real_refresh = api_server.project_index.refresh
+        monkeypatch.setattr(api_server.project_index, "refresh", lambda: scans.append(1) or real_refresh())
+        first = _start()
+        _complete(first["project_id"])
+        scans.clear()
+        _start(on_duplicate="attach")
+        assert len(scans) == 1
+
+    def test_invalid_policy(self, server):
+        with pytest.raises(api_server.HTTPException) as info:
+            _start(on_duplicate="sometimes")
+        assert info.value.status_code == 400
+
+    def test_backfill_fingerprints_existing_jobs(self, server):
+        db.enqueue_job("old-job", "old-project", "workflow", {"topic": "Graph Neural Networks"})
+        conn = db.get_connection()
+        conn.execute("UPDATE job_queue SET fingerprint = NULL")
+        conn.commit()
+        db.init_db()
+        jobs = db.find_jobs_by_fingerprint(workflow_fingerprint("graph neural networks"))
+        assert [j["project_id"] for j in jobs] == ["old-project"]
@@ -0,0 +1,129 @@
+"""Tests for the historical ETA / cost predictor."""
+
+import pytest
+
+from research_cli.run_predictor import (
+    DEFAULT_ROUND_SECONDS,
+    RunPredictor,
+    sample_from_workflow,
+)
+
+
+def _workflow(total=1000.0, rounds=(200.0, 200.0), cost=2.0, mode=None, length="full",
+              research_type="survey", tier="model-a", phase_timings=None, max_rounds=3):
+    data = {
+        "max_rounds": max_rounds,
+        "research_type": research_type,
+        "article_length": length,
+        "model_tier": tier,
+        "phase_timings": phase_timings,
+        "performance": {
+            "total_duration": total,
+            "rounds": [
+                {"round_number": i + 1, "review_duration": d * 0.75, "revision_time": d * 0.25, "round_tokens": 1000}
+                for i, d in enumerate(rounds)
+            ],
+            "total_tokens": 4000,
+            "estimated_cost": cost,
+        },
+    }
+    if mode:
+        data["workflow_mode"] = mode
+    return data
+
+
+class TestSampleExtraction:
+
+    def test_splits_pre_review_and_rounds(self):
+        sample = sample_from_workflow(_workflow())
+        assert sample.round_seconds == [200.0, 200.0]
+        assert sample.pre_review_seconds == pytest.approx(600.0)
+        # 2000 of 4000 tokens were spent in review rounds
+        assert sample.base_cost == pytest.approx(1.0)
+        assert sample.round_cost == pytest.approx(0.5)
+
+    def test_collaborative_inferred_from_phase_timings(self):
+        sample = sample_from_workflow(_workflow(phase_timings=[{"total_duration": 500}, {"total_duration": 300}]))
+        assert sample.workflow_mode == "collaborative"
+        assert sample.pre_review_seconds == pytest.approx(1400.0)
+
+    def test_legacy_file_defaults(self):
+        data = _workflow()
+        del data["model_tier"], data["article_length"]
+        sample = sample_from_workflow(data)
+        assert sample.key() == ("standard", "full", "survey", "unknown")
+
+    def test_missing_performance_is_skipped(self):
+        assert sample_from_workflow({"topic": "x"}) is None
+
+
+class TestPrediction:
+
+    def test_prior_without_history(self):
+        prediction = RunPredictor().predict()
+        assert prediction.sample_count == 0
+        assert prediction.round_seconds[1] == DEFAULT_ROUND_SECONDS
+        assert prediction.cost_range(3) is None
+
+    def test_exact_group_preferred_over_backoff(self):
+        samples = [sample_from_workflow(_workflow(total=1000)) for _ in range(3)]
+        samples += [sample_from_workflow(_workflow(total=5000, length="short")) for _ in range(3)]
+        predictor = RunPredictor(samples)
+
+        prediction = predictor.predict("standard", "short", "survey", "model-a")
+        assert prediction.sample_count == 3
+        assert prediction.basis == "standard/short/survey/model-a"
+        assert prediction.pre_review_seconds[1] == pytest.approx(4600.0)
+
+    def test_backs_off_to_coarser_group(self):
+        samples = [sample_from_workflow(_workflow(tier="model-a")) for _ in range(3)]
+        prediction = RunPredictor(samples).predict("standard", "full", "survey", "model-b")
+        assert prediction.basis == "standard/full/survey/*"
+        assert prediction.sample_count == 3
+
+    def test_ranges_are_ordered(self):
+        samples = [sample_from_workflow(_workflow(total=t, cost=c)) for t, c in ((800, 1.0), (1000, 2.0), (1600, 3.0))]
+        prediction = RunPredictor(samples).predict(model_tier="model-a")
+        lo, mid, hi = prediction.duration_range(3)
+        assert lo <= mid <= hi
+        clo, cmid, chi = prediction.cost_range(3)
+        assert clo <= cmid <= chi
+        assert prediction.to_dict(3)["cost_usd"]["expected"] == pytest.approx(cmid, abs=1e-4)
+
+    def test_remaining_seconds_decreases_through_rounds(self):
+        samples = [sample_from_workflow(_workflow()) for _ in range(3)]
+        prediction = RunPredictor(samples).predict(model_tier="model-a")
+        writing = prediction.remaining_seconds("writing", 0, 3, elapsed=100)
+        round1 = prediction.remaining_seconds("reviewing", 1, 3, elapsed=650)
+        round3 = prediction.remaining_seconds("reviewing", 3, 3, elapsed=1100)
+        assert writing > round1 > round3 > 0
+        assert prediction.remaining_seconds("completed", 3, 3, elapsed=1500) == 0
+
+
+class TestApiServerWiring:
+
+    @pytest.fixture
+    def predictor(self, monkeypatch):
+        import api_server
+
+        samples = [sample_from_workflow(_workflow(rounds=(200.0,) * 3, tier=api_server.current_model_tier()))
+                   for _ in range(3)]
+        samples += [sample_from_workflow(_workflow(rounds=(900.0,) * 3, mode="collaborative", length="short",
+                                                   tier=api_server.current_model_tier()))
+                    for _ in range(3)]
+        monkeypatch.setattr(api_server, "_get_run_predictor", lambda: RunPredictor(samples))
+        return api_server
+
+    def test_remaining_rounds_use_checkpoint_settings(self, predictor):
+        checkpoint = {"workflow_mode": "collaborative", "article_length": "short", "research_type": "survey"}
+        assert predictor._remaining_rounds_seconds(2, checkpoint) == pytest.approx(1800, rel=0.01)
+        assert predictor._remaining_rounds_seconds(2, {}) == pytest.approx(400, rel=0.01)
+
+    @pytest.mark.parametrize("status", ["rejected", "interrupted", "cancelled", "failed", "completed"])
+    def test_prediction_dropped_on_terminal_status(self, predictor, status, monkeypatch):
+        api = predictor
+        monkeypatch.setitem(api.workflow_status, "p-eta", {"status": "reviewing", "progress_percentage": 50})
+        monkeypatch.setitem(api.activity_logs, "p-eta", [])
+        api._run_predictions["p-eta"] = api._predict_run(None, None, None)
+        api.update_workflow_status("p-eta", status, 2, 3, "done")
+        assert "p-eta" not in api._run_predictions
@@ -7,6 +7,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from research_cli.models.collaborative_research import Reference
+from research_cli.utils import http_session, rate_limit, source_retriever
+from research_cli.utils.reference_cache import ReferenceCache, set_reference_cache
+from research_cli.utils.reference_corpus import ReferenceCorpus, reference_corpus, set_reference_corpus
 from research_cli.utils.source_retriever import SourceRetriever
 from research_cli.workflow.orchestrator import _strip_ghost_citations
 
@@ -20,6 +23,21 @@ def _run(coro):
     return asyncio.get_event_loop().run_until_complete(coro)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_shared_state():
+    """Each test patches aiohttp.ClientSession, so don't reuse another test's session or results."""
+    http_session._sessions.clear()
+    set_reference_cache(ReferenceCache(":memory:"))
+    set_reference_corpus(ReferenceCorpus(":memory:"))
+    rate_limit.reset_rate_limiters()
+    source_retriever.reset_search_stats()
+    yield
+    http_session._sessions.clear()
+    set_reference_cache(None)
+    set_reference_corpus(None)
+    rate_limit.reset_rate_limiters()
+
+
 def _make_ref(id: int, title: str, doi: str | None = None, year: int = 2023) -> Reference:
     return Reference(
         id=id,
@@ -54,6 +72,8 @@ def _make_aiohttp_response(status: int, payload: dict | str):
 class _FakeSession:
     """Minimal fake for aiohttp.ClientSession that returns canned responses."""
 
+    closed = False
+
     def __init__(self, response_ctx):
         self._response_ctx = response_ctx
 
@@ -426,3 +446,496 @@ class TestSearchAllDomain:
 
         retriever.search_openalex.assert_called_once()
         retriever.search_arxiv.assert_called_once()
+
+
+class TestSearchAllDeadline:
+
+    @staticmethod
+    def _retriever(delays):
+        """Retriever whose default APIs each return two refs after ``delays[api]`` seconds."""
+        retriever = SourceRetriever()
+        for api, delay in delays.items():
+            async def search(query, max_results=5, api=api, delay=delay):
+                await asyncio.sleep(delay)
+                return [_make_ref(0, f"{api} paper {i}", doi=f"10.1/{api}{i}") for i in range(2)]
+            setattr(retriever, f"search_{api}", search)
+        return retriever
+
+    def test_returns_once_quorum_reached(self):
+        retriever = self._retriever({"openalex": 0.01, "semantic_scholar": 0.01, "arxiv": 5.0, "brave": 5.0})
+        refs = _run(asyncio.wait_for(retriever.search_all("topic", max_academic=4, deadline=10), timeout=2))
+        assert len(refs) == 4
+        assert set(retriever.source_latencies) == {"openalex", "semantic_scholar"}
+
+    def test_deadline_returns_partial_results(self):
+        retriever = self._retriever({"openalex": 0.01, "semantic_scholar": 5.0, "arxiv": 5.0, "brave": 5.0})
+        refs = _run(asyncio.wait_for(retriever.search_all("topic", max_academic=15, deadline=0.1), timeout=2))
+        assert [r.title for r in refs] == ["openalex paper 0", "openalex paper 1"]
+
+    def test_no_deadline_waits_for_every_source(self):
+        retriever = self._retriever({"openalex": 0.01, "semantic_scholar": 0.01, "arxiv": 0.05, "brave": 0.05})
+        refs = _run(retriever.search_all("topic", max_academic=8, deadline=None))
+        assert len(refs) == 8
+        assert set(retriever.source_latencies) == {"openalex", "semantic_scholar", "arxiv", "brave"}
+
+
+class TestReferenceCorpus:
+
+    def test_bm25_ranks_title_matches_first(self):
+        corpus = ReferenceCorpus(":memory:")
+        corpus.add([
+            _make_ref(1, "Protein structure prediction with deep learning", doi="10.1/a"),
+            _make_ref(2, "Deep learning for image recognition", doi="10.1/b"),
+            _make_ref(3, "Soil chemistry of river deltas", doi="10.1/c"),
+        ])
+        refs = corpus.search("deep learning protein structure", limit=5)
+        assert [r.doi for r in refs] == ["10.1/a"]
+        assert corpus.search("river delta soil chemistry")[0].doi == "10.1/c"
+
+    def test_add_skips_known_references(self):
+        corpus = ReferenceCorpus(":memory:")
+        assert corpus.add([_make_ref(1, "A paper", doi="10.1/A"), _make_ref(2, "Another paper")]) == 2
+        assert corpus.add([_make_ref(5, "A paper (retitled)", doi="10.1/a"), _make_ref(6, "Another  Paper")]) == 0
+        assert corpus.stats()["entries"] == 2
+
+    def test_index_results_backfills_saved_notes(self, tmp_path):
+        project = tmp_path / "some-project"
+        project.mkdir()
+        notes = {"research_notes": {"references": [_make_ref(1, "Graph neural networks survey", doi="10.1/g").to_dict()]}}
+        (project / "workflow_complete.json").write_text(json.dumps(notes))
+        corpus = ReferenceCorpus(tmp_path / "corpus.db")
+        assert corpus.index_results(str(tmp_path)) == 1
+        assert corpus.index_results(str(tmp_path)) == 0  # unchanged files are skipped
+        assert corpus.search("graph neural networks")[0].title == "Graph neural networks survey"
+
+    def test_search_all_uses_corpus_offline(self):
+        reference_corpus().add([_make_ref(i, f"Quantum error correction codes part {i}", doi=f"10.1/q{i}")
+                                for i in range(4)])
+        retriever = SourceRetriever()
+        for api in ("openalex", "arxiv", "semantic_scholar", "brave"):
+            setattr(retriever, f"search_{api}", AsyncMock(return_value=[]))
+        refs = _run(retriever.search_all("quantum error correction codes", max_academic=3))
+        assert len(refs) == 3 and [r.id for r in refs] == [1, 2, 3]
+        retriever.search_openalex.assert_not_called()
+
+    def test_search_all_grows_corpus(self):
+        retriever = SourceRetriever()
+        retriever.search_openalex = AsyncMock(return_value=[_make_ref(0, "Coral reef bleaching", doi="10.1/r")])
+        for api in ("arxiv", "semantic_scholar", "brave"):
+            setattr(retriever, f"search_{api}", AsyncMock(return_value=[]))
+        _run(retriever.search_all("coral reef bleaching"))
+        assert reference_corpus().search("coral reef bleaching")[0].doi == "10.1/r"
+
+
+class _RoutedSession:
+    """Fake session answering by URL host and recording (url, params) of each request."""
+
+    closed = False
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append((url, params))
+        for host, payload in self.routes.items():
+            if host in url:
+                return _make_aiohttp_response(200, payload(params) if callable(payload) else payload)
+        return _make_aiohttp_response(404, {})
+
+
+def _openalex_work(doi, title, year=2021):
+    return {"title": title, "doi": f"https://doi.org/{doi}", "publication_year": year,
+            "authorships": [{"author": {"display_name": "Ada Lovelace"}}],
+            "primary_location": {"source": {"display_name": "Journal of Tests"}}, "cited_by_count": 12}
+
+
+def _crossref_item(doi, title, year=2020):
+    return {"DOI": doi, "title": [title], "author": [{"family": "Hopper", "given": "Grace"}],
+            "container-title": ["CrossRef Journal"], "published-print": {"date-parts": [[year]]}}
+
+
+class TestMetadataEnrichment:
+
+    def test_dois_resolved_in_batches_and_cached(self):
+        session = _RoutedSession({
+            "openalex.org": {"results": [_openalex_work("10.1/a", "Paper A")]},
+            "crossref.org": {"message": {"items": [_crossref_item("10.1/b", "Paper B")]}},
+        })
+        refs = [_make_ref(0, "Paper A", doi="10.1/A", year=0), _make_ref(0, "Paper B", doi="10.1/b", year=0)]
+        retriever = SourceRetriever(session=session)
+        assert _run(retriever.enrich_references(refs)) == 2
+        assert [r.year for r in refs] == [2021, 2020]
+        assert len(session.requests) == 2
+        assert session.requests[0][1]["filter"] == "doi:10.1/a|10.1/b"
+        assert session.requests[1][1]["filter"] == "doi:10.1/b"
+
+        again = [_make_ref(0, "Paper A", doi="10.1/a", year=0)]
+        _run(SourceRetriever(session=session).enrich_references(again))
+        assert again[0].year == 2021 and len(session.requests) == 2
+
+    def test_batches_are_capped(self, monkeypatch):
+        monkeypatch.setattr(source_retriever, "ENRICH_BATCH_SIZE", 2)
+        session = _RoutedSession({"openalex.org": {"results": []}, "crossref.org": {"message": {"items": []}}})
+        refs = [_make_ref(0, f"P{i}", doi=f"10.1/{i}", year=0) for i in range(3)]
+        _run(SourceRetriever(session=session).enrich_references(refs))
+        assert [len(p["filter"].split("|")) for u, p in session.requests if "openalex" in u] == [2, 1]
+
+    def test_web_result_resolved_by_title(self):
+        title = "Attention based models for protein structure prediction"
+        session = _RoutedSession({"crossref.org": {"message": {"items": [
+            _crossref_item("10.1/unrelated", "Something else entirely"),
+            _crossref_item("10.1/p", title + "."),
+        ]}}})
+        web = Reference(id=0, authors=["Web Source"], title=title, venue="example.org", year=0,
+                        url="https://example.org/post", doi=None)
+        _run(SourceRetriever(session=session).enrich_references([web]))
+        assert (web.doi, web.year, web.authors) == ("10.1/p", 2020, ["Hopper Grace"])
+        assert web.url == "https://example.org/post"
+
+    def test_search_all_keeps_enriched_reference(self):
+        session = _RoutedSession({"openalex.org": {"results": [_openalex_work("10.1/x", "Incomplete hit")]}})
+        retriever = SourceRetriever(session=session)
+        retriever.search_openalex = AsyncMock(side_effect=lambda *args, **kwargs: [
+            Reference(id=0, authors=["Unknown"], title="Incomplete hit", venue="", year=0, doi="10.1/x")])
+        for api in ("arxiv", "semantic_scholar", "brave"):
+            setattr(retriever, f"search_{api}", AsyncMock(return_value=[]))
+        refs = _run(retriever.search_all("incomplete hit"))
+        assert [(r.title, r.year, r.authors) for r in refs] == [("Incomplete hit", 2021, ["Ada Lovelace"])]
+        assert [r.title for r in _run(retriever.search_all("incomplete hit", enrich=False, use_corpus=False))] == []
+
+
+# ---------------------------------------------------------------------------
+# Speculative prefetch
+# ---------------------------------------------------------------------------
+
+class TestSourcePrefetcher:
+
+    @pytest.fixture(autouse=True)
+    def fake_apis(self, monkeypatch):
+        """Every API returns one distinct ref after a short delay; calls are counted."""
+        from research_cli.utils import source_retriever as module
+
+        self.prefetcher = module.SourcePrefetcher(max_in_flight=2)
+        monkeypatch.setattr(module, "source_prefetcher", self.prefetcher)
+        self.calls = []
+        self.queries = []
+
+        def fake(name):
+            async def search(self_, query, max_results=5):
+                self.calls.append(name)
+                self.queries.append(query)
+                await asyncio.sleep(0.01)
+                return [_make_ref(0, f"{name} paper on {query}", doi=f"10.1/{name}-{len(set(self.queries))}")]
+            return search
+
+        for name in ("openalex", "arxiv", "semantic_scholar", "brave", "pubmed", "europe_pmc", "core", "crossref"):
+            monkeypatch.setattr(SourceRetriever, f"search_{name}", fake(name))
+
+    def test_workflow_reuses_finished_prefetch(self):
+        async def scenario():
+            task = self.prefetcher.start("Graph  Neural Networks", category={"major": "computer_science"})
+            await task
+            calls_after_prefetch = len(self.calls)
+            refs = await SourceRetriever().search_all("graph neural networks", category={"major": "computer_science"})
+            refs[0].title = "edited"
+            again = await SourceRetriever().search_all("graph neural networks", category={"major": "computer_science"})
+            return calls_after_prefetch, refs, again
+
+        calls_after_prefetch, refs, again = _run(scenario())
+        assert len(self.calls) == calls_after_prefetch == 4
+        assert [r.id for r in refs] == [1, 2, 3, 4]
+        assert again[0].title != "edited"  # callers get copies
+
+    def test_prefetch_seeds_search_with_research_questions(self):
+        question = "How do message passing models scale to billion edge graphs?"
+
+        async def scenario():
+            await self.prefetcher.start("graph neural networks", category={"major": "computer_science"})
+            calls_after_prefetch = len(self.calls)
+            refs = await SourceRetriever().search_all(
+                "graph neural networks", category={"major": "computer_science"}, research_questions=[question])
+            return calls_after_prefetch, refs
+
+        calls_after_prefetch, refs = _run(scenario())
+        sent = self.queries[calls_after_prefetch:]
+        # Only the question's sub-query goes out; the topic itself comes from the prefetch
+        assert sent and set(sent) == {"message passing models scale billion edge graphs"}
+        titles = [r.title for r in refs]
+        assert any(t.endswith("on graph neural networks") for t in titles)
+        assert any(t.endswith("on message passing models scale billion edge graphs") for t in titles)
+
+    def test_workflow_waits_for_in_flight_prefetch(self):
+        async def scenario():
+            self.prefetcher.start("protein folding")
+            assert self.prefetcher.start("protein folding") is not None  # same task, not a second search
+            return await SourceRetriever().search_all("Protein folding")
+
+        refs = _run(scenario())
+        assert len(refs) == 4
+        assert len(self.calls) == 4
+
+    def test_different_category_searches_live(self):
+        async def scenario():
+            await self.prefetcher.start("CRISPR", category={"major": "computer_science"})
+            return await SourceRetriever().search_all("CRISPR", category={"major": "medicine_health"})
+
+        _run(scenario())
+        assert "pubmed" in self.calls
+
+    def test_cancelled_prefetch_falls_back_to_live_search(self):
+        async def scenario():
+            self.prefetcher.start("quantum codes")
+            await asyncio.sleep(0)
+            assert self.prefetcher.cancel("quantum codes") is True
+            return await SourceRetriever().search_all("quantum codes")
+
+        assert len(_run(scenario())) == 4
+
+    def test_oldest_prefetch_cancelled_when_full(self):
+        async def scenario():
+            first = self.prefetcher.start("topic one")
+            self.prefetcher.start("topic two")
+            self.prefetcher.start("topic three")
+            await asyncio.sleep(0)
+            self.prefetcher.cancel_all()
+            return first
+
+        first = _run(scenario())
+        assert first.cancelled()
+
+    def test_cancelling_a_waiter_keeps_shared_prefetch(self):
+        async def scenario():
+            task = self.prefetcher.start("surface codes")
+            waiter = asyncio.create_task(SourceRetriever().search_all("surface codes"))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            await task
+            return await self.prefetcher.get("surface codes")
+
+        assert len(_run(scenario())) == 4
+
+
+# ---------------------------------------------------------------------------
+# Pooled HTTP sessions
+# ---------------------------------------------------------------------------
+
+class TestSharedSession:
+
+    def test_one_session_per_loop_reused_until_closed(self):
+        async def scenario():
+            first = http_session.shared_session()
+            assert http_session.shared_session() is first
+            assert first.connector.limit_per_host == http_session.HTTP_POOL_LIMIT_PER_HOST
+            await first.close()
+            second = http_session.shared_session()
+            assert second is not first
+            await http_session.close_shared_sessions()
+            assert second.closed
+
+        asyncio.new_event_loop().run_until_complete(scenario())
+
+    def test_retriever_borrows_shared_session(self):
+        async def scenario():
+            retriever = SourceRetriever()
+            async with retriever._session() as session:
+                assert session is http_session.shared_session()
+            assert not session.closed
+            await http_session.close_shared_sessions()
+
+        asyncio.new_event_loop().run_until_complete(scenario())
+
+    def test_private_session_closed_on_exit(self):
+        async def scenario():
+            async with SourceRetriever(private_session=True) as retriever:
+                async with retriever._session() as session:
+                    assert session is not http_session._sessions.get(asyncio.get_running_loop())
+            assert session.closed
+
+        asyncio.new_event_loop().run_until_complete(scenario())
+
+
+# ---------------------------------------------------------------------------
+# Persistent reference cache
+# ---------------------------------------------------------------------------
+
+class TestReferenceCache:
+
+    def test_persists_across_instances_with_normalized_query(self, tmp_path):
+        path = tmp_path / "refs.db"
+        ReferenceCache(path).put("openalex", "Graph Neural Networks", 5, [_make_ref(1, "GNN survey", doi="10.1/x")])
+        refs, fresh = ReferenceCache(path).get("openalex", "graph neural  networks!", 5)
+        assert fresh and refs[0].title == "GNN survey" and refs[0].doi == "10.1/x"
+        assert ReferenceCache(path).get("openalex", "graph neural networks", 10) is None
+
+    def test_stale_entry_served_and_revalidated(self, tmp_path, monkeypatch):
+        cache = ReferenceCache(tmp_path / "refs.db", ttls={"arxiv": 10.0})
+        clock = [1000.0]
+        monkeypatch.setattr("research_cli.utils.reference_cache.time.time", lambda: clock[0])
+        cache.put("arxiv", "q", 5, [_make_ref(1, "Old")])
+        clock[0] += 20  # past TTL, inside the stale window
+
+        async def scenario():
+            fetches = []
+
+            async def fetch():
+                fetches.append(1)
+                return [_make_ref(1, "New")]
+
+            refs = await cache.fetch("arxiv", "q", 5, fetch)
+            assert refs[0].title == "Old"
+            await asyncio.gather(*cache._refreshing.values())
+            refs = await cache.fetch("arxiv", "q", 5, fetch)
+            assert refs[0].title == "New"
+            assert len(fetches) == 1
+
+        asyncio.new_event_loop().run_until_complete(scenario())
+        assert cache.stats()["stale_hits"] == 1
+
+        clock[0] += 10 * 10  # past the stale window
+        assert cache.get("arxiv", "q", 5) is None
+
+    def test_failed_refresh_keeps_results(self, tmp_path):
+        cache = ReferenceCache(tmp_path / "refs.db")
+        cache.put("openalex", "q", 5, [_make_ref(1, "Kept")])
+        cache.put("openalex", "q", 5, [], keep_nonempty=True)
+        assert cache.get("openalex", "q", 5)[0][0].title == "Kept"
+
+    def test_lru_eviction(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("research_cli.utils.reference_cache.EVICT_EVERY_PUTS", 1)
+        cache = ReferenceCache(tmp_path / "refs.db", max_entries=2)
+        cache.put("openalex", "a", 5, [_make_ref(1, "A")])
+        cache.put("openalex", "b", 5, [_make_ref(1, "B")])
+        cache.get("openalex", "a", 5)  # a is now more recent than b
+        cache.put("openalex", "c", 5, [_make_ref(1, "C")])
+        assert cache.get("openalex", "b", 5) is None
+        assert cache.get("openalex", "a", 5) is not None
+
+    def test_retriever_reuses_shared_cache(self):
+        api_response = {"message": {"items": [{"title": ["Cached paper"], "author": [{"family": "Doe"}],
+                                               "container-title": ["J"], "issued": {"date-parts": [[2022]]},
+                                               "DOI": "10.1/c"}]}}
+        fake_session = _FakeSession(_make_aiohttp_response(200, api_response))
+        with patch("aiohttp.ClientSession", return_value=fake_session) as session_cls:
+            first = _run(SourceRetriever().search_crossref("cached topic"))
+            second = _run(SourceRetriever().search_crossref("Cached Topic"))
+        assert [r.title for r in first] == [r.title for r in second] == ["Cached paper"]
+        assert session_cls.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Process-global rate limiters
+# ---------------------------------------------------------------------------
+
+class TestRateLimiter:
+
+    def test_reservations_are_spaced_by_interval(self, monkeypatch):
+        monkeypatch.setattr("research_cli.utils.rate_limit.time.monotonic", lambda: 100.0)
+        limiter = rate_limit.RateLimiter("arxiv", rate=1 / 3.0)
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([0.0, 3.0, 6.0])
+        assert limiter.stats()["max_wait_seconds"] == 6.0
+
+    def test_burst_allows_immediate_requests(self, monkeypatch):
+        monkeypatch.setattr("research_cli.utils.rate_limit.time.monotonic", lambda: 100.0)
+        limiter = rate_limit.RateLimiter("openalex", rate=10.0, burst=3)
+        assert [limiter.reserve() for _ in range(4)] == pytest.approx([0.0, 0.0, 0.0, 0.1])
+
+    def test_registry_shared_across_retrievers(self):
+        assert rate_limit.rate_limiter("core") is rate_limit.rate_limiter("core")
+        assert rate_limit.rate_limiter("core").interval == pytest.approx(6.0)
+
+    def test_concurrent_callers_served_in_arrival_order(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("research_cli.utils.rate_limit.asyncio.sleep", fake_sleep)
+        monkeypatch.setattr("research_cli.utils.rate_limit.time.monotonic", lambda: 50.0)
+        retrievers = [SourceRetriever() for _ in range(3)]
+
+        async def scenario():
+            await asyncio.gather(*(r._throttle("arxiv") for r in retrievers))
+
+        _run(scenario())
+        assert sleeps == pytest.approx([3.0, 6.0])
+        assert [r.rate_limit_waits["arxiv"] for r in retrievers] == pytest.approx([0.0, 3.0, 6.0])
+        assert rate_limit.rate_limit_stats()["arxiv"]["calls"] == 3
+
+    def test_sqlite_store_shared_between_processes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("research_cli.utils.rate_limit.time.time", lambda: 1000.0)
+        path = str(tmp_path / "limits.db")
+        # Two stores on one file stand in for two server processes
+        first = rate_limit.RateLimiter("core", rate=1 / 6.0, store=rate_limit._SharedStore(path))
+        second = rate_limit.RateLimiter("core", rate=1 / 6.0, store=rate_limit._SharedStore(path))
+        assert first.reserve() == 0.0
+        assert second.reserve() == pytest.approx(6.0)
+        assert first.reserve() == pytest.approx(12.0)
+
+
+# ---------------------------------------------------------------------------
+# Single-flight coalescing
+# ---------------------------------------------------------------------------
+
+class TestSingleFlight:
+
+    _RESPONSE = {"message": {"items": [{"title": ["Shared paper"], "author": [{"family": "Doe"}],
+                                        "container-title": ["J"], "issued": {"date-parts": [[2022]]},
+                                        "DOI": "10.1/s"}]}}
+
+    def test_concurrent_identical_searches_share_one_request(self):
+        fake_session = _FakeSession(_make_aiohttp_response(200, self._RESPONSE))
+
+        async def scenario():
+            return await asyncio.gather(
+                SourceRetriever().search_crossref("shared topic"),
+                SourceRetriever().search_crossref("Shared Topic!"),
+                SourceRetriever().search_crossref("shared topic", max_results=5),
+            )
+
+        with patch("aiohttp.ClientSession", return_value=fake_session) as session_cls:
+            results = _run(scenario())
+        assert session_cls.call_count == 1
+        assert [[r.title for r in refs] for refs in results] == [["Shared paper"]] * 3
+        # Joiners get their own copies
+        assert results[0][0] is not results[1][0]
+        stats = source_retriever.search_stats()
+        assert (stats["misses"], stats["coalesced"], stats["in_flight"]) == (1, 2, 0)
+
+    def test_different_limits_are_not_coalesced(self):
+        fake_session = _FakeSession(_make_aiohttp_response(200, self._RESPONSE))
+
+        async def scenario():
+            await asyncio.gather(
+                SourceRetriever().search_crossref("topic", max_results=5),
+                SourceRetriever().search_crossref("topic", max_results=10),
+            )
+
+        with patch("aiohttp.ClientSession", return_value=fake_session):
+            _run(scenario())
+        assert source_retriever.search_stats()["coalesced"] == 0
+        assert source_retriever.search_stats()["misses"] == 2
+
+    def test_cancelling_first_caller_keeps_shared_search(self):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_search(self, query, max_results=5):
+            started.set()
+            await release.wait()
+            return [_make_ref(1, "Slow paper")]
+
+        wrapped = source_retriever._single_flight("openalex")(slow_search)
+
+        async def scenario():
+            first = asyncio.create_task(wrapped(SourceRetriever(), "q"))
+            await started.wait()
+            second = asyncio.create_task(wrapped(SourceRetriever(), "q"))
+            await asyncio.sleep(0)
+            first.cancel()
+            release.set()
+            return await second
+
+        refs = _run(scenario())
+        assert [r.title for r in refs] == ["Slow paper"]
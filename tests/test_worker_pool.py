@@ -0,0 +1,194 @@
+"""Tests for elastic worker-pool sizing and provider health tracking."""
+
+import asyncio
+
+import pytest
+
+import api_server
+from research_cli.job_scheduler import JobScheduler, LONG_LANE, SHORT_LANE
+from research_cli.llm.base import retry_llm_call
+from research_cli.worker_pool import ProviderHealth, WorkerPoolController, is_rate_limit_error
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def _stats(ratio=0.0, p95=10.0):
+    return {"anthropic": {"calls": 50, "rate_limited": int(ratio * 50), "rate_limit_ratio": ratio,
+                          "p50_latency_seconds": p95 / 2, "p95_latency_seconds": p95}}
+
+
+class TestController:
+
+    def test_backlog_scales_up_and_clamps(self):
+        pool = WorkerPoolController(2, 3, cooldown_seconds=0)
+        decision = pool.decide(current=2, queue_depth=4, busy=2, provider_stats=_stats(), rss_mb=100, now=1)
+        assert decision.target == 3 and decision.reason.startswith("backlog")
+        assert pool.decide(current=3, queue_depth=4, busy=3, provider_stats=_stats(), rss_mb=100, now=2) is None
+
+    def test_no_growth_while_providers_push_back(self):
+        pool = WorkerPoolController(2, 6, cooldown_seconds=0)
+        decision = pool.decide(current=4, queue_depth=4, busy=4, provider_stats=_stats(ratio=0.2), rss_mb=100, now=1)
+        assert decision.target == 3 and "rate-limited" in decision.reason
+        decision = pool.decide(current=3, queue_depth=4, busy=3, provider_stats=_stats(p95=400), rss_mb=100, now=2)
+        assert decision.target == 2 and "latency" in decision.reason
+        # Moderate 429s: neither grow nor shrink
+        assert pool.decide(current=2, queue_depth=4, busy=2, provider_stats=_stats(ratio=0.05), rss_mb=100, now=3) is None
+
+    def test_idle_workers_shrink_to_minimum(self):
+        pool = WorkerPoolController(2, 6, cooldown_seconds=0)
+        assert pool.decide(current=4, queue_depth=0, busy=0, provider_stats={}, rss_mb=None, now=1).target == 3
+        assert pool.decide(current=2, queue_depth=0, busy=0, provider_stats={}, rss_mb=None, now=2) is None
+
+    def test_cooldown_except_for_memory(self):
+        pool = WorkerPoolController(1, 6, rss_limit_mb=500, cooldown_seconds=60)
+        assert pool.decide(current=2, queue_depth=3, busy=2, provider_stats={}, rss_mb=100, now=0).target == 3
+        assert pool.decide(current=3, queue_depth=3, busy=3, provider_stats={}, rss_mb=100, now=30) is None
+        decision = pool.decide(current=3, queue_depth=3, busy=3, provider_stats={}, rss_mb=900, now=31)
+        assert decision.target == 2 and decision.reason.startswith("memory")
+
+    def test_snapshot_lists_recent_decisions_first(self):
+        pool = WorkerPoolController(1, 6, cooldown_seconds=0)
+        pool.decide(current=1, queue_depth=1, busy=1, provider_stats={}, rss_mb=None, now=1)
+        pool.decide(current=2, queue_depth=1, busy=2, provider_stats={}, rss_mb=None, now=2)
+        snap = pool.snapshot()
+        assert [d["target"] for d in snap["decisions"]] == [3, 2]
+        assert snap["signals"]["queue_depth"] == 1
+
+
+class TestProviderHealth:
+
+    def test_stats_and_window(self):
+        health = ProviderHealth(window_seconds=60)
+        for i in range(9):
+            health.record("openai", latency=float(i + 1), now=100)
+        health.record("openai", latency=0.1, rate_limited=True, now=100)
+        health.record("gemini", latency=5, now=0)
+
+        stats = health.stats(now=120)
+        assert set(stats) == {"openai"}
+        assert stats["openai"]["calls"] == 10
+        assert stats["openai"]["rate_limit_ratio"] == 0.1
+        assert stats["openai"]["p95_latency_seconds"] == 9.0
+        assert health.stats(now=1000) == {}
+
+    def test_rate_limit_detection(self):
+        assert is_rate_limit_error(Exception("Error code: 429 - too many requests"))
+        assert is_rate_limit_error(type("RateLimitError", (Exception,), {})("slow down"))
+        assert not is_rate_limit_error(ValueError("bad json"))
+
+    def test_retry_llm_call_records_attempts(self, monkeypatch):
+        health = ProviderHealth()
+        monkeypatch.setattr(api_server, "provider_health", health)  # api_server registers the listener
+        attempts = []
+
+        async def factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise Exception("429 rate_limit_error")
+            return "ok"
+
+        assert _run(retry_llm_call(factory, base_delay=0, max_delay=0, provider="anthropic")) == "ok"
+        stats = health.stats()["anthropic"]
+        assert stats["calls"] == 2 and stats["rate_limited"] == 1
+
+    def test_call_listeners_see_each_attempt(self):
+        from research_cli.llm.base import add_call_listener, remove_call_listener
+
+        seen = []
+        listener = lambda provider, latency, error: seen.append((provider, type(error).__name__ if error else None))
+        add_call_listener(listener)
+        calls = []
+
+        async def factory():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("transient")
+            return "ok"
+
+        try:
+            _run(retry_llm_call(factory, base_delay=0, max_delay=0, provider="openai"))
+        finally:
+            remove_call_listener(listener)
+        assert seen == [("openai", "ValueError"), ("openai", None)]
+
+
+class TestServerPool:
+
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        monkeypatch.setattr(api_server, "job_queue", JobScheduler())
+        monkeypatch.setattr(api_server, "_worker_tasks", {})
+        monkeypatch.setattr(api_server, "_retiring_workers", set())
+        monkeypatch.setattr(api_server, "_short_lane_workers", set())
+        monkeypatch.setattr(api_server, "_running_jobs", {})
+        monkeypatch.setattr(api_server, "worker_pool", WorkerPoolController(2, 4, cooldown_seconds=0))
+        monkeypatch.setattr(api_server, "provider_health", ProviderHealth())
+        monkeypatch.setattr(api_server, "process_rss_mb", lambda: 100.0)
+
+    def test_scale_up_then_retire_idle_worker(self, pool, monkeypatch):
+        queue = api_server.job_queue
+
+        async def scenario():
+            for _ in range(2):
+                api_server._start_worker()
+            await asyncio.sleep(0)
+            # Backlog with every worker busy
+            monkeypatch.setattr(queue, "qsize", lambda lane=None: 3)
+            queue._running = {"x": (None, 0, 0), "y": (None, 1, 0)}
+            up = api_server.adjust_worker_pool(now=1)
+            size_after_up = api_server._worker_pool_size()
+
+            # Backlog drained, everyone idle
+            monkeypatch.setattr(queue, "qsize", lambda lane=None: 0)
+            queue._running = {}
+            down = api_server.adjust_worker_pool(now=2)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            remaining = sorted(api_server._worker_tasks)
+            tasks = list(api_server._worker_tasks.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return up, size_after_up, down, remaining
+
+        up, size_after_up, down, remaining = _run(scenario())
+        assert (up.previous, up.target, size_after_up) == (2, 3, 3)
+        assert (down.previous, down.target) == (3, 2)
+        assert remaining == [0, 1]
+
+    def test_busy_worker_finishes_before_retiring(self, pool):
+        api_server._worker_tasks.update({0: None, 1: None, 2: None})
+        api_server._short_lane_workers.add(0)
+        api_server.job_queue._running = {"x": (None, 2, 0)}
+        # Worker 2 is busy, so idle worker 1 is retired instead; short-lane worker 0 never is
+        class _Task:
+            cancelled = False
+            def cancel(self):
+                self.cancelled = True
+        api_server._worker_tasks[1] = _Task()
+        assert api_server._retire_worker() == 1
+        assert api_server._worker_tasks[1].cancelled
+        assert api_server._retire_worker() == 2
+        assert 2 in api_server._retiring_workers
+        assert api_server._retire_worker() is None
+        assert api_server._worker_pool_size() == 0
+
+    def test_reserved_short_lane_worker_is_extra_capacity(self, pool):
+        async def scenario():
+            api_server._start_worker(reserved=True)
+            for _ in range(2):
+                api_server._start_worker()
+            await asyncio.sleep(0)
+            lanes = dict(api_server.job_queue._workers)
+            size = api_server._worker_pool_size()
+            tasks = list(api_server._worker_tasks.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            return lanes, size
+
+        lanes, size = _run(scenario())
+        assert size == 2  # both general workers still serve long jobs
+        assert lanes == {0: (SHORT_LANE,), 1: (LONG_LANE, SHORT_LANE), 2: (LONG_LANE, SHORT_LANE)}